@@ -3,7 +3,8 @@ import typing
 
 from redshift_connector import plugin
 from redshift_connector.config import DEFAULT_PROTOCOL_VERSION, ClientProtocolVersion
-from redshift_connector.core import BINARY, Connection, Cursor
+from redshift_connector.core import BINARY, Connection, ConnectStats, Cursor
+from redshift_connector.endpoints import LOAD_BALANCE_MODES, parse_endpoints
 from redshift_connector.error import (
     ArrayContentNotHomogenousError,
     ArrayContentNotSupportedError,
@@ -20,6 +21,7 @@ from redshift_connector.error import (
     Warning,
 )
 from redshift_connector.iam_helper import IamHelper
+from redshift_connector.loader import LoadMetrics, ParallelLoader
 from redshift_connector.objects import (
     Binary,
     Date,
@@ -37,12 +39,21 @@ from redshift_connector.pg_types import (
     PGTsvector,
     PGVarchar,
 )
+from redshift_connector.pool import ConnectionPool
+from redshift_connector.prepared_statement import PreparedStatement
 from redshift_connector.redshift_property import RedshiftProperty
+from redshift_connector.retry import RetryPolicy
 from redshift_connector.utils import (
     DriverInfo,
     make_divider_block,
     mask_secure_info_in_props,
 )
+from redshift_connector.utils.copy_util import (
+    CopyInSource,
+    CopyOutIterator,
+    CopyOutStream,
+    CopyStats,
+)
 from redshift_connector.utils.type_utils import (
     ABSTIME,
     BIGINT,
@@ -74,6 +85,7 @@ from redshift_connector.utils.type_utils import (
     NULLTYPE,
     NUMBER,
     OID,
+    OIDVECTOR,
     ROWID,
     SMALLINT,
     STRING,
@@ -128,6 +140,90 @@ _logger: logging.Logger = logging.getLogger(__name__)
 __author__ = "Mathieu Fenniak"
 
 
+def _validate_and_authenticate(info: RedshiftProperty) -> None:
+    """
+    Validates the connection properties in ``info`` and, if IAM authentication is used, replaces them with the
+    properties obtained from AWS, such as temporary credentials.
+    """
+    if (info.ssl is False) and (info.iam is True):
+        raise InterfaceError("Invalid connection property setting. SSL must be enabled when using IAM")
+
+    if (info.iam is False) and (info.ssl_insecure is False):
+        raise InterfaceError("Invalid connection property setting. IAM must be enabled when using ssl_insecure")
+
+    if info.endpoints:
+        endpoints: typing.List[typing.Tuple[str, int]] = parse_endpoints(info.endpoints, info.port)
+        info.endpoints = endpoints
+        if not info.host:
+            info.host, info.port = endpoints[0]
+    if info.load_balance not in LOAD_BALANCE_MODES:
+        raise InterfaceError(
+            "Invalid connection property setting. load_balance must be in: {}".format(LOAD_BALANCE_MODES)
+        )
+
+    if info.client_protocol_version not in ClientProtocolVersion.list():
+        raise InterfaceError(
+            "Invalid connection property setting. client_protocol_version must be in: {}".format(
+                ClientProtocolVersion.list()
+            )
+        )
+
+    redshift_native_auth: bool = False
+    if info.iam:
+        if info.credentials_provider == "BasicJwtCredentialsProvider":
+            redshift_native_auth = True
+            _logger.debug("redshift_native_auth enabled")
+
+    if not redshift_native_auth:
+        IamHelper.set_iam_properties(info)
+
+    _logger.debug(make_divider_block())
+    _logger.debug("Connection arguments following validation and IAM auth (if applicable)")
+    _logger.debug(make_divider_block())
+    _logger.debug(mask_secure_info_in_props(info).__str__())
+    _logger.debug(make_divider_block())
+
+
+def _connection_arguments(info: RedshiftProperty) -> typing.Dict[str, typing.Any]:
+    """
+    Returns the keyword arguments of :class:`Connection` given by the connection properties in ``info``.
+    """
+    return {
+        "user": info.user_name,
+        "host": info.host,
+        "database": info.db_name,
+        "port": info.port,
+        "password": info.password,
+        "source_address": info.source_address,
+        "unix_sock": info.unix_sock,
+        "ssl": info.ssl,
+        "sslmode": info.sslmode,
+        "timeout": info.timeout,
+        "max_prepared_statements": info.max_prepared_statements,
+        "tcp_keepalive": info.tcp_keepalive,
+        "application_name": info.application_name,
+        "replication": info.replication,
+        "client_protocol_version": info.client_protocol_version,
+        "database_metadata_current_db_only": info.database_metadata_current_db_only,
+        "credentials_provider": info.credentials_provider,
+        "provider_name": info.provider_name,
+        "web_identity_token": info.web_identity_token,
+        "executemany_page_size": info.executemany_page_size,
+        "max_result_memory": info.max_result_memory,
+        "spill_results": info.spill_results,
+        "lazy": info.lazy,
+        "background_connect": info.background_connect,
+        "endpoints": info.endpoints,
+        "load_balance": info.load_balance,
+        "connect_timeout": info.connect_timeout,
+        "endpoint_cooldown": info.endpoint_cooldown,
+        "dns_ttl": info.dns_ttl,
+        "retry_policy": info.retry_policy,
+        "session_settings": info.session_settings,
+        "thread_safe": info.thread_safe,
+    }
+
+
 def connect(
     user: typing.Optional[str] = None,
     database: typing.Optional[str] = None,
@@ -179,6 +275,19 @@ def connect(
     endpoint_url: typing.Optional[str] = None,
     provider_name: typing.Optional[str] = None,
     scope: typing.Optional[str] = None,
+    executemany_page_size: typing.Optional[int] = None,
+    max_result_memory: typing.Optional[int] = None,
+    spill_results: typing.Optional[bool] = None,
+    lazy: typing.Optional[bool] = None,
+    background_connect: typing.Optional[bool] = None,
+    endpoints: typing.Optional[typing.Sequence[typing.Union[str, typing.Tuple[str, int]]]] = None,
+    load_balance: typing.Optional[str] = None,
+    connect_timeout: typing.Optional[float] = None,
+    endpoint_cooldown: typing.Optional[float] = None,
+    dns_ttl: typing.Optional[float] = None,
+    retry_policy: typing.Optional[RetryPolicy] = None,
+    session_settings: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    thread_safe: typing.Optional[bool] = None,
 ) -> Connection:
     """
     Establishes a :class:`Connection` to an Amazon Redshift cluster. This function validates user input, optionally authenticates using an identity provider plugin, then constructs a :class:`Connection` object.
@@ -272,6 +381,32 @@ def connect(
         The name of the Redshift Native Auth Provider.
     scope: Optional[str]
         Scope for BrowserAzureOauth2CredentialsProvider authentication.
+    executemany_page_size: Optional[int]
+        The maximum number of rows inserted per statement when :meth:`Cursor.executemany` rewrites a single row ``INSERT ... VALUES`` statement into a multi-row statement. A value of 1 disables the rewrite. Default value is 100.
+    max_result_memory: Optional[int]
+        The maximum number of bytes of received rows a :class:`Cursor` holds in memory. By default there is no limit.
+    spill_results: Optional[bool]
+        Whether rows received beyond ``max_result_memory`` are held in a temporary file rather than failing the statement. Default value is ``True``.
+    lazy: Optional[bool]
+        Whether connecting to the server is deferred until the connection is first used. The arguments are validated and any IAM or identity provider credentials are resolved by this function. Default value is ``False``.
+    background_connect: Optional[bool]
+        Whether a ``lazy`` connection starts connecting to the server on a background thread when it is created. Default value is ``False``.
+    endpoints: Optional[Sequence[Union[str, Tuple[str, int]]]]
+        The endpoints of the Amazon Redshift cluster or workgroup, as ``host``, ``host:port`` or ``(host, port)``. The connection is made to the first endpoint which accepts it. ``host`` defaults to the host of the first endpoint, which is used for IAM authentication.
+    load_balance: Optional[str]
+        How the endpoint tried first is chosen, ``round_robin`` or ``least_latency``. Default value is ``round_robin``.
+    connect_timeout: Optional[float]
+        The number of seconds to wait for each endpoint to accept the connection before trying the next. By default ``timeout`` is used.
+    endpoint_cooldown: Optional[float]
+        The number of seconds an endpoint which failed to accept a connection is tried after the other endpoints. Default value is 30.
+    dns_ttl: Optional[float]
+        The number of seconds the resolved addresses of an endpoint are reused by later connections. Default value is 0, which resolves the host of each connection.
+    retry_policy: Optional[:class:`RetryPolicy`]
+        How reads executed outside of a transaction, and the transactions run by :meth:`Connection.run_in_transaction`, are retried when the connection breaks or the transaction is aborted by a serialization conflict. By default they are not retried.
+    session_settings: Optional[Mapping[str, Any]]
+        The run-time parameters of the session, such as ``search_path``, ``query_group``, ``statement_timeout`` or ``timezone``, which are set by the start-up message rather than by statements once connected. By default none are set.
+    thread_safe: Optional[bool]
+        Whether the connection may be shared by threads, each using cursors of its own. The statements of each thread hold a lock of the connection while they run. Default value is ``False``.
     Returns
     -------
     A Connection object associated with the specified Amazon Redshift cluster: :class:`Connection`
@@ -284,16 +419,22 @@ def connect(
     info.put("application_name", application_name)
     info.put("auth_profile", auth_profile)
     info.put("auto_create", auto_create)
+    info.put("background_connect", background_connect)
     info.put("client_id", client_id)
     info.put("client_protocol_version", client_protocol_version)
     info.put("client_secret", client_secret)
+    info.put("connect_timeout", connect_timeout)
     info.put("cluster_identifier", cluster_identifier)
     info.put("credentials_provider", credentials_provider)
     info.put("database_metadata_current_db_only", database_metadata_current_db_only)
     info.put("db_groups", db_groups)
     info.put("db_name", database)
     info.put("db_user", db_user)
+    info.put("dns_ttl", dns_ttl)
+    info.put("endpoint_cooldown", endpoint_cooldown)
     info.put("endpoint_url", endpoint_url)
+    info.put("endpoints", endpoints)
+    info.put("executemany_page_size", executemany_page_size)
     info.put("force_lowercase", force_lowercase)
     info.put("host", host)
     info.put("iam", iam)
@@ -301,9 +442,12 @@ def connect(
     info.put("idp_host", idp_host)
     info.put("idp_response_timeout", idp_response_timeout)
     info.put("idp_tenant", idp_tenant)
+    info.put("lazy", lazy)
     info.put("listen_port", listen_port)
+    info.put("load_balance", load_balance)
     info.put("login_url", login_url)
     info.put("max_prepared_statements", max_prepared_statements)
+    info.put("max_result_memory", max_result_memory)
     info.put("partner_sp_id", partner_sp_id)
     info.put("password", password)
     info.put("port", port)
@@ -313,16 +457,20 @@ def connect(
     info.put("provider_name", provider_name)
     info.put("region", region)
     info.put("replication", replication)
+    info.put("retry_policy", retry_policy)
     info.put("role_arn", role_arn)
     info.put("role_session_name", role_session_name)
     info.put("scope", scope)
     info.put("secret_access_key", secret_access_key)
+    info.put("session_settings", session_settings)
     info.put("session_token", session_token)
     info.put("source_address", source_address)
+    info.put("spill_results", spill_results)
     info.put("ssl", ssl)
     info.put("ssl_insecure", ssl_insecure)
     info.put("sslmode", sslmode)
     info.put("tcp_keepalive", tcp_keepalive)
+    info.put("thread_safe", thread_safe)
     info.put("timeout", timeout)
     info.put("unix_sock", unix_sock)
     info.put("user_name", user)
@@ -334,55 +482,8 @@ def connect(
     _logger.debug(mask_secure_info_in_props(info).__str__())
     _logger.debug(make_divider_block())
 
-    if (info.ssl is False) and (info.iam is True):
-        raise InterfaceError("Invalid connection property setting. SSL must be enabled when using IAM")
-
-    if (info.iam is False) and (info.ssl_insecure is False):
-        raise InterfaceError("Invalid connection property setting. IAM must be enabled when using ssl_insecure")
-
-    if info.client_protocol_version not in ClientProtocolVersion.list():
-        raise InterfaceError(
-            "Invalid connection property setting. client_protocol_version must be in: {}".format(
-                ClientProtocolVersion.list()
-            )
-        )
-
-    redshift_native_auth: bool = False
-    if info.iam:
-        if info.credentials_provider == "BasicJwtCredentialsProvider":
-            redshift_native_auth = True
-            _logger.debug("redshift_native_auth enabled")
-
-    if not redshift_native_auth:
-        IamHelper.set_iam_properties(info)
-
-    _logger.debug(make_divider_block())
-    _logger.debug("Connection arguments following validation and IAM auth (if applicable)")
-    _logger.debug(make_divider_block())
-    _logger.debug(mask_secure_info_in_props(info).__str__())
-    _logger.debug(make_divider_block())
-
-    return Connection(
-        user=info.user_name,
-        host=info.host,
-        database=info.db_name,
-        port=info.port,
-        password=info.password,
-        source_address=info.source_address,
-        unix_sock=info.unix_sock,
-        ssl=info.ssl,
-        sslmode=info.sslmode,
-        timeout=info.timeout,
-        max_prepared_statements=info.max_prepared_statements,
-        tcp_keepalive=info.tcp_keepalive,
-        application_name=info.application_name,
-        replication=info.replication,
-        client_protocol_version=info.client_protocol_version,
-        database_metadata_current_db_only=info.database_metadata_current_db_only,
-        credentials_provider=info.credentials_provider,
-        provider_name=info.provider_name,
-        web_identity_token=info.web_identity_token,
-    )
+    _validate_and_authenticate(info)
+    return Connection(**_connection_arguments(info))
 
 
 apilevel: str = "2.0"
@@ -395,7 +496,9 @@ This property is part of the `DBAPI 2.0 specification
 threadsafety: int = 1
 """Integer constant stating the level of thread safety the DBAPI interface
 supports. This DBAPI module supports sharing of the module only. Connections
-and cursors my not be shared between threads.
+and cursors my not be shared between threads, unless a connection is created
+with ``thread_safe=True``, in which case threads may share it but not its
+cursors.
 
 This property is part of the `DBAPI 2.0 specification
 <http://www.python.org/dev/peps/pep-0249/>`_.
@@ -422,7 +525,17 @@ __all__: typing.Any = [
     "ArrayDimensionsNotConsistentError",
     "ArrayContentNotSupportedError",
     "Connection",
+    "ConnectionPool",
+    "ConnectStats",
+    "RetryPolicy",
     "Cursor",
+    "CopyInSource",
+    "CopyOutIterator",
+    "CopyOutStream",
+    "CopyStats",
+    "LoadMetrics",
+    "ParallelLoader",
+    "PreparedStatement",
     "Binary",
     "Date",
     "DateFromTicks",
@@ -468,6 +581,7 @@ __all__: typing.Any = [
     "NULLTYPE",
     "NUMBER",
     "OID",
+    "OIDVECTOR",
     "ROWID",
     "STRING",
     "SMALLINT",
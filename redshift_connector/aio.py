@@ -0,0 +1,843 @@
+import asyncio
+import inspect
+import logging
+import socket
+import time
+import typing
+
+import redshift_connector
+from redshift_connector import _connection_arguments, _validate_and_authenticate
+from redshift_connector.core import (
+    BIND,
+    CLOSE,
+    COPY_DATA,
+    COPY_DONE_MSG,
+    COPY_IN_RESPONSE,
+    COPY_OUT_RESPONSE,
+    DESCRIBE,
+    ERROR_RESPONSE,
+    PARSE,
+    READY_FOR_QUERY,
+    STATEMENT,
+    SYNC_MSG,
+    TERMINATE_MSG,
+)
+from redshift_connector.core import Connection as _Connection
+from redshift_connector.core import ConnectStats, make_ssl_context
+from redshift_connector.cursor import Cursor as _Cursor
+from redshift_connector.endpoints import Endpoint, endpoint_selector, parse_endpoints
+from redshift_connector.error import InterfaceError, ProgrammingError
+from redshift_connector.protocol import Protocol
+from redshift_connector.redshift_property import RedshiftProperty
+from redshift_connector.utils import ii_pack
+from redshift_connector.utils.copy_util import (
+    DEFAULT_COPY_FRAME_SIZE,
+    CopyInSource,
+    CopyOutStream,
+    CopyStats,
+)
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# the names of the RedshiftProperty attributes set by connect parameters of a different name
+_property_names: typing.Dict[str, str] = {
+    "database": "db_name",
+    "principal_arn": "principal",
+    "user": "user_name",
+}
+
+# the keyword arguments of Connection which configure the transport rather than the protocol state
+_transport_arguments: typing.Tuple[str, ...] = (
+    "host",
+    "port",
+    "source_address",
+    "unix_sock",
+    "ssl",
+    "sslmode",
+    "timeout",
+    "tcp_keepalive",
+    "endpoints",
+    "load_balance",
+    "connect_timeout",
+    "endpoint_cooldown",
+    "dns_ttl",
+)
+
+# the maximum number of bytes read from the stream at once
+_READ_SIZE: int = 65536
+
+# the maximum number of items of an asynchronous iterable serialized together by CopyInSource
+_COPY_BATCH_ITEMS: int = 1000
+
+
+async def connect(**kwargs) -> "Connection":
+    """
+    Establishes an asyncio :class:`Connection` to an Amazon Redshift cluster. The parameters are those of
+    :func:`redshift_connector.connect`.
+
+    The connection is established and used without blocking the event loop. Resolving IAM credentials or
+    authenticating with an identity provider plugin uses blocking AWS and HTTP clients, so it runs in the default
+    executor of the event loop. ``timeout`` limits the time taken to establish the connection.
+
+    Returns
+    -------
+    A Connection object associated with the specified Amazon Redshift cluster: :class:`Connection`
+    """
+    try:
+        bound: inspect.BoundArguments = inspect.signature(redshift_connector.connect).bind(**kwargs)
+    except TypeError as e:
+        raise InterfaceError(str(e))
+    info: RedshiftProperty = RedshiftProperty()
+    for name, value in bound.arguments.items():
+        info.put(_property_names.get(name, name), value)
+
+    loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+    if info.iam or info.credentials_provider is not None or info.auth_profile is not None:
+        await loop.run_in_executor(None, _validate_and_authenticate, info)
+    else:
+        _validate_and_authenticate(info)
+
+    arguments: typing.Dict[str, typing.Any] = _connection_arguments(info)
+    transport: typing.Dict[str, typing.Any] = {name: arguments.pop(name) for name in _transport_arguments}
+    lazy: bool = arguments.pop("lazy")
+    if arguments.pop("background_connect") or lazy:
+        raise InterfaceError("lazy connections are not supported by redshift_connector.aio")
+    if arguments.pop("retry_policy") is not None:
+        raise InterfaceError("retry_policy is not supported by redshift_connector.aio")
+    if arguments.pop("thread_safe"):
+        raise InterfaceError("thread_safe is not supported by redshift_connector.aio")
+    state, init_params = _Connection._for_external_transport(**arguments)
+    conn: Connection = Connection(state)
+    try:
+        if transport["timeout"] is None:
+            await conn._open(init_params, **transport)
+        else:
+            await asyncio.wait_for(conn._open(init_params, **transport), transport["timeout"])
+    except asyncio.TimeoutError:
+        conn._abort()
+        raise InterfaceError("Timed out establishing a connection to the server")
+    except BaseException:
+        conn._abort()
+        raise
+    return conn
+
+
+async def _batched_frames(source: CopyInSource) -> typing.AsyncIterator[typing.Union[bytes, memoryview]]:
+    """
+    Yields the frames of ``source``, whose data may be an asynchronous iterable of the items accepted by
+    :class:`CopyInSource`.
+    """
+    if not hasattr(source.data, "__aiter__"):
+        for frame in source.frames():
+            yield frame
+        return
+
+    batch: typing.List[typing.Any] = []
+    batch_size: int = 0
+    async for item in source.data:
+        batch.append(item)
+        if isinstance(item, (bytes, bytearray, memoryview, str)):
+            batch_size += len(item)
+        if len(batch) < _COPY_BATCH_ITEMS and batch_size < source.frame_size:
+            continue
+        for frame in _serialize_batch(source, batch):
+            yield frame
+        batch, batch_size = [], 0
+    for frame in _serialize_batch(source, batch):
+        yield frame
+
+
+def _serialize_batch(source: CopyInSource, batch: typing.List[typing.Any]) -> typing.Iterator[bytes]:
+    part: CopyInSource = CopyInSource(batch, delimiter=source.delimiter, frame_size=source.frame_size)
+    for frame in part.frames():
+        yield bytes(frame)
+    source.rows += part.rows
+    source.bytes += part.bytes
+
+
+class Connection:
+    """
+    An asyncio connection to Amazon Redshift, returned by :func:`connect`.
+
+    The state of the connection, the message handlers and the type converters are those of a
+    :class:`redshift_connector.Connection` created for an external transport, whose messages are exchanged over
+    asyncio streams. Statements of the
+    cursors of a connection are executed one at a time, while any number of connections can be used concurrently
+    in one event loop.
+    """
+
+    def __init__(self: "Connection", conn: _Connection) -> None:
+        self._conn: _Connection = conn
+        self._reader: typing.Optional[asyncio.StreamReader] = None
+        self._writer: typing.Optional[asyncio.StreamWriter] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # frames the messages exchanged with the server, which the message handlers write to
+        self._protocol: Protocol = conn._protocol
+        # prepared statements closed by the message handlers, which are closed before the next statement
+        self._closing: typing.List[bytes] = typing.cast(typing.List[bytes], conn._closing)
+
+    async def _open(
+        self: "Connection",
+        init_params: typing.Dict[str, typing.Union[str, bytes]],
+        host: typing.Optional[str],
+        port: int,
+        source_address: typing.Optional[str],
+        unix_sock: typing.Optional[str],
+        ssl: bool,
+        sslmode: str,
+        timeout: typing.Optional[int],
+        tcp_keepalive: typing.Optional[bool],
+        endpoints: typing.Optional[typing.Sequence[typing.Union[str, Endpoint]]],
+        load_balance: str,
+        connect_timeout: typing.Optional[float],
+        endpoint_cooldown: float,
+        dns_ttl: float,
+    ) -> None:
+        """
+        Connects to the server and conducts the start-up of the protocol, as done by
+        :func:`redshift_connector.Connection.__init__`.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        start_time: float = time.perf_counter()
+        tls_seconds: float = 0.0
+        if unix_sock is not None:
+            if not hasattr(socket, "AF_UNIX"):
+                raise InterfaceError("attempt to connect to unix socket on unsupported " "platform")
+            sock: socket.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._conn._usock = sock
+            try:
+                sock.setblocking(False)
+                await loop.sock_connect(sock, unix_sock)
+            except OSError as e:
+                raise InterfaceError("communication error", e)
+        elif host is not None or endpoints:
+            sock, (host, port) = await self._connect_endpoint(
+                parse_endpoints(endpoints, port) if endpoints else [(typing.cast(str, host), port)],
+                load_balance,
+                source_address,
+                connect_timeout,
+                endpoint_cooldown,
+                dns_ttl,
+            )
+            self._conn._usock = sock
+        else:
+            raise ProgrammingError("one of host or unix_sock must be provided")
+
+        try:
+            if tcp_keepalive:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+            tls: typing.Dict[str, typing.Any] = {}
+            if ssl is True:
+                # Int32(8) - Message length, including self.
+                # Int32(80877103) - The SSL request code.
+                await loop.sock_sendall(sock, ii_pack(8, 80877103))
+                resp: bytes = await loop.sock_recv(sock, 1)
+                if resp != b"S":
+                    _logger.debug("Server response code when attempting to establish ssl connection: {!r}".format(resp))
+                    raise InterfaceError("Server refuses SSL")
+                # an empty server_hostname disables the host name check of verify-ca
+                tls = {"ssl": make_ssl_context(sslmode), "server_hostname": host if sslmode == "verify-full" else ""}
+
+            tls_start: float = time.perf_counter()
+            self._reader, self._writer = await asyncio.open_connection(sock=sock, **tls)
+            if tls:
+                tls_seconds = time.perf_counter() - tls_start
+        except OSError as e:
+            raise InterfaceError("communication error", e)
+        self._conn._sock = typing.cast(typing.BinaryIO, self._writer)
+
+        conn: _Connection = self._conn
+        conn._write(conn._startup_message(init_params))
+        conn._cursor = conn.cursor()
+
+        code: typing.Optional[bytes] = None
+        conn.error = None
+        _logger.debug("Sending start-up message")
+        while code not in (READY_FOR_QUERY, ERROR_RESPONSE):
+            await self._send()
+            code, data = await self._read_message()
+            conn.message_types[code](data, None)
+        if conn.error is not None:
+            raise conn.error
+
+        try:
+            conn._finish_startup()
+        except InterfaceError:
+            # the session has started, so it is ended on the server before connect closes the transport
+            self._protocol.write(TERMINATE_MSG)
+            try:
+                await self._send()
+            except InterfaceError:
+                pass
+            raise
+
+        # asyncio streams cannot resume a TLS session, but share the SSL context of the other connections
+        ssl_object: typing.Any = self._writer.get_extra_info("ssl_object")
+        conn.connect_stats = ConnectStats(
+            time.perf_counter() - start_time,
+            tls_seconds,
+            bool(getattr(ssl_object, "session_reused", False)),
+            None if unix_sock is not None else (typing.cast(str, host), port),
+        )
+        _logger.debug("Connected %s", conn.connect_stats)
+
+    async def _connect_endpoint(
+        self: "Connection",
+        endpoints: typing.List[Endpoint],
+        load_balance: str,
+        source_address: typing.Optional[str],
+        connect_timeout: typing.Optional[float],
+        cooldown: float,
+        dns_ttl: float,
+    ) -> typing.Tuple[socket.socket, Endpoint]:
+        """
+        Returns a non-blocking TCP socket connected to the first of ``endpoints`` which accepts a connection, as
+        done by :meth:`redshift_connector.endpoints.EndpointSelector.connect`.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        error: typing.Optional[Exception] = None
+        for endpoint in endpoint_selector.candidates(endpoints, load_balance):
+            start_time: float = time.perf_counter()
+            try:
+                addresses: typing.List[typing.Tuple] = (
+                    await loop.run_in_executor(None, endpoint_selector.resolve, endpoint, dns_ttl)
+                    if dns_ttl > 0
+                    else [endpoint]
+                )
+                for address in addresses:
+                    sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    try:
+                        if source_address is not None:
+                            sock.bind((source_address, 0))
+                        sock.setblocking(False)
+                        await asyncio.wait_for(loop.sock_connect(sock, address), connect_timeout)
+                    except (OSError, asyncio.TimeoutError) as e:
+                        sock.close()
+                        error = e
+                        continue
+                    endpoint_selector.connected(endpoint, time.perf_counter() - start_time)
+                    return sock, endpoint
+            except OSError as e:
+                error = e
+            endpoint_selector.failed(endpoint, cooldown)
+        raise InterfaceError("communication error", error)
+
+    def _abort(self: "Connection") -> None:
+        """
+        Closes the transport of a connection which failed to be established, or whose exchange with the server was
+        interrupted. The connection is closed, without sending a Terminate message.
+        """
+        self._conn._sock = None
+        if self._writer is not None:
+            self._writer.close()
+        elif getattr(self._conn, "_usock", None) is not None:
+            self._conn._usock.close()
+
+    @property
+    def autocommit(self: "Connection") -> bool:
+        """
+        Whether statements are executed outside of a transaction, as :attr:`redshift_connector.Connection.autocommit`.
+        """
+        return self._conn.autocommit
+
+    @autocommit.setter
+    def autocommit(self: "Connection", value: bool) -> None:
+        self._conn.autocommit = value
+
+    @property
+    def in_transaction(self: "Connection") -> bool:
+        """
+        Whether a transaction is open on the server.
+        """
+        return self._conn.in_transaction
+
+    @property
+    def closed(self: "Connection") -> bool:
+        """
+        Whether the connection has been closed.
+        """
+        return self._conn._sock is None
+
+    @property
+    def notices(self: "Connection") -> typing.Deque:
+        return self._conn.notices
+
+    @property
+    def parameter_statuses(self: "Connection") -> typing.Deque:
+        return self._conn.parameter_statuses
+
+    @property
+    def connect_stats(self: "Connection") -> ConnectStats:
+        """
+        How the connection was established, as :attr:`redshift_connector.Connection.connect_stats`.
+        """
+        return self._conn.connect_stats
+
+    def cursor(self: "Connection") -> "Cursor":
+        """
+        Creates a :class:`Cursor` bound to this connection.
+
+        Returns
+        -------
+        A Cursor object associated with the current Connection: :class:`Cursor`
+        """
+        return Cursor(self)
+
+    async def _send(self: "Connection") -> None:
+        data: bytearray = self._protocol.data_to_send()
+        if len(data) == 0:
+            return
+        writer: asyncio.StreamWriter = typing.cast(asyncio.StreamWriter, self._writer)
+        writer.write(data)
+        try:
+            await writer.drain()
+        except OSError as e:
+            raise InterfaceError("communication error", e)
+
+    async def _read_message(self: "Connection") -> typing.Tuple[bytes, bytes]:
+        """
+        Returns the code and content of the next message received from the server.
+        """
+        message: typing.Optional[typing.Tuple[bytes, bytes]] = self._protocol.next_message()
+        while message is None:
+            await self._receive()
+            message = self._protocol.next_message()
+        return message
+
+    async def _receive(self: "Connection") -> None:
+        """
+        Reads bytes from the stream into the protocol: the bytes available, or the rest of a message larger than
+        ``_READ_SIZE``.
+        """
+        protocol: Protocol = self._protocol
+        reader: asyncio.StreamReader = typing.cast(asyncio.StreamReader, self._reader)
+        needed: int = protocol.bytes_needed()
+        try:
+            data: bytes = await (reader.readexactly(needed) if needed > _READ_SIZE else reader.read(_READ_SIZE))
+        except (asyncio.IncompleteReadError, OSError) as e:
+            raise InterfaceError("communication error", e)
+        if not data:
+            raise InterfaceError("connection is broken: the server closed the connection")
+        protocol.receive(data)
+
+    async def _handle_messages(self: "Connection", cursor: _Cursor) -> None:
+        """
+        Sends the pending messages and handles the messages received until the server is ready for a new query,
+        as done by :func:`redshift_connector.Connection.handle_messages`.
+        """
+        conn: _Connection = self._conn
+        code: typing.Optional[bytes] = None
+        conn.error = None
+
+        try:
+            await self._send()
+            while code != READY_FOR_QUERY:
+                for code, data in self._protocol.messages():
+                    if code == COPY_IN_RESPONSE:
+                        await self._copy_in(cursor)
+                        continue
+                    conn.message_types[code](data, cursor)
+                    if code == READY_FOR_QUERY:
+                        break
+                    if code == COPY_OUT_RESPONSE and conn._copy_out_pending:
+                        return
+                    if self._protocol.bytes_to_send > 0:
+                        await self._send()
+                else:
+                    await self._receive()
+        except BaseException:
+            # the rest of the response would be read as the response of the next statement, so the connection is
+            # closed when an exchange is interrupted, such as by the cancellation of the task running it
+            self._abort()
+            raise
+
+        if conn.error is not None:
+            raise conn.error
+
+    async def _copy_in(self: "Connection", cursor: _Cursor) -> None:
+        """
+        Sends the COPY data of ``cursor.stream``, as done by :func:`redshift_connector.Connection.handle_COPY_IN_RESPONSE`,
+        waiting for each frame to be accepted by the transport before the next is produced.
+        """
+        stream: typing.Any = getattr(cursor, "stream", None)
+        if stream is None:
+            raise InterfaceError("An input stream is required for the COPY IN response.")
+
+        source: CopyInSource = stream if isinstance(stream, CopyInSource) else CopyInSource(stream)
+        start_time: float = time.perf_counter()
+        async for frame in _batched_frames(source):
+            self._protocol.send_message(COPY_DATA, frame)
+            await self._send()
+
+        self._protocol.write(COPY_DONE_MSG)
+        self._protocol.write(SYNC_MSG)
+        await self._send()
+        cursor.copy_stats = CopyStats(source.rows, source.bytes, time.perf_counter() - start_time)
+        _logger.debug("COPY IN sent %s", cursor.copy_stats)
+
+    async def _copy_out_data(self: "Connection", cursor: _Cursor) -> typing.AsyncIterator[bytes]:
+        """
+        Yields the content of each CopyData message of a ``COPY ... TO STDOUT``, as done by
+        :func:`redshift_connector.Connection.copy_out_data`.
+        """
+        conn: _Connection = self._conn
+        code: typing.Optional[bytes] = None
+        try:
+            while code != READY_FOR_QUERY:
+                code, data = await self._read_message()
+                if code == COPY_DATA:
+                    yield data
+                else:
+                    conn.message_types[code](data, cursor)
+        except GeneratorExit:
+            try:
+                while code != READY_FOR_QUERY:
+                    code, data = await self._read_message()
+                    if code != COPY_DATA:
+                        conn.message_types[code](data, cursor)
+            except BaseException:
+                self._abort()
+                raise
+            raise
+        except BaseException:
+            # the connection is closed when reading the COPY data is interrupted, as done by _handle_messages
+            self._abort()
+            raise
+        finally:
+            conn._copy_out_pending = False
+
+        if conn.error is not None:
+            raise conn.error
+
+    async def _parse_statement(
+        self: "Connection", cursor: _Cursor, ps: typing.Dict[str, typing.Any], statement: str, params
+    ) -> None:
+        """
+        Creates the prepared statement ``ps`` on the server, as done by
+        :func:`redshift_connector.Connection.parse_statement`.
+        """
+        conn: _Connection = self._conn
+        conn._send_message(PARSE, conn.parse_message(ps, statement, params))
+        conn._send_message(DESCRIBE, STATEMENT + ps["statement_name_bin"])
+        conn._write(SYNC_MSG)
+        await self._handle_messages(cursor)
+        conn.describe_complete(ps, params)
+
+    async def _close_statements(self: "Connection") -> None:
+        """
+        Closes the prepared statements evicted from the statement cache, in a single round trip.
+        """
+        if len(self._closing) == 0:
+            return
+        conn: _Connection = self._conn
+        for statement_name_bin in self._closing:
+            conn._send_message(CLOSE, STATEMENT + statement_name_bin)
+        self._closing.clear()
+        conn._write(SYNC_MSG)
+        await self._handle_messages(conn._cursor)
+
+    async def _execute(self: "Connection", cursor: _Cursor, operation: str, vals) -> None:
+        """
+        Executes a database operation, as done by :func:`redshift_connector.Connection.execute`. The lock of the
+        connection must be held.
+        """
+        conn: _Connection = self._conn
+        if conn._sock is None:
+            raise InterfaceError("connection is closed")
+        await self._close_statements()
+        if vals is None:
+            vals = ()
+
+        cache, key, statement, args, params = conn._lookup_statement(cursor, operation, vals)
+        try:
+            ps = cache["ps"][key]
+            cursor.ps = ps
+        except KeyError:
+            ps = conn._new_statement()
+            cursor.ps = ps
+            await self._parse_statement(cursor, ps, statement, params)
+            for statement_name_bin in conn._cache_statement(cache, key, ps):
+                conn.close_prepared_statement(statement_name_bin)
+
+        cursor._cached_rows.clear()
+        cursor._row_count = -1
+        cursor._redshift_row_count = -1
+
+        conn._send_message(BIND, conn.bind_message(ps, args))
+        conn.send_EXECUTE(cursor)
+        conn._write(SYNC_MSG)
+        await self._handle_messages(cursor)
+
+    async def commit(self: "Connection") -> None:
+        """
+        Commits the current database transaction.
+
+        Returns
+        -------
+        None:None
+        """
+        async with self._lock:
+            await self._execute(self._conn._cursor, "commit", None)
+
+    async def rollback(self: "Connection") -> None:
+        """
+        Rolls back the current database transaction.
+
+        Returns
+        -------
+        None:None
+        """
+        async with self._lock:
+            if not self._conn.in_transaction:
+                return
+            await self._execute(self._conn._cursor, "rollback", None)
+
+    async def close(self: "Connection") -> None:
+        """
+        Closes the database connection.
+
+        Returns
+        -------
+        None:None
+        """
+        if self._conn._sock is None:
+            raise InterfaceError("connection is closed")
+        writer: asyncio.StreamWriter = typing.cast(asyncio.StreamWriter, self._writer)
+        self._conn._sock = None
+        try:
+            # Byte1('X') - Identifies the message as a terminate message.
+            # Int32(4) - Message length, including self.
+            writer.write(TERMINATE_MSG)
+            await writer.drain()
+        except OSError:
+            pass
+        finally:
+            writer.close()
+        if hasattr(writer, "wait_closed"):
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    async def __aenter__(self: "Connection") -> "Connection":
+        return self
+
+    async def __aexit__(self: "Connection", exc_type, exc_value, traceback) -> None:
+        if self._conn._sock is not None:
+            await self.close()
+
+
+class Cursor:
+    """
+    A cursor of an asyncio :class:`Connection`, returned by :meth:`Connection.cursor`.
+
+    The rows returned by a statement are received before :meth:`execute` returns, and are converted to Python
+    values as they are fetched, as done by :class:`redshift_connector.Cursor`. Rows can be fetched with the fetch
+    methods or by iterating over the cursor with ``async for``.
+    """
+
+    def __init__(self: "Cursor", connection: Connection, paramstyle: typing.Optional[str] = None) -> None:
+        self._c: typing.Optional[Connection] = connection
+        # holds the state of the executed statement and converts its rows
+        self._cursor: _Cursor = _Cursor(connection._conn, paramstyle)
+
+    @property
+    def connection(self: "Cursor") -> typing.Optional[Connection]:
+        return self._c
+
+    @property
+    def description(self: "Cursor") -> typing.Optional[typing.List[typing.Tuple]]:
+        """
+        The description of the columns of the current result, as :attr:`redshift_connector.Cursor.description`.
+        """
+        return self._cursor.description
+
+    @property
+    def rowcount(self: "Cursor") -> int:
+        """
+        The number of rows the last statement produced or affected, or -1, as :attr:`redshift_connector.Cursor.rowcount`.
+        """
+        return self._cursor.rowcount
+
+    @property
+    def redshift_rowcount(self: "Cursor") -> int:
+        return self._cursor.redshift_rowcount
+
+    @property
+    def copy_stats(self: "Cursor") -> typing.Optional[CopyStats]:
+        """
+        The statistics of the last ``COPY ... FROM STDIN`` executed by the cursor.
+        """
+        return self._cursor.copy_stats
+
+    @property
+    def arraysize(self: "Cursor") -> int:
+        """
+        The number of rows fetched by :meth:`fetchmany` by default.
+        """
+        return self._cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self: "Cursor", value: int) -> None:
+        self._cursor.arraysize = value
+
+    @property
+    def paramstyle(self: "Cursor") -> str:
+        return self._cursor.paramstyle
+
+    @paramstyle.setter
+    def paramstyle(self: "Cursor", value: str) -> None:
+        self._cursor.paramstyle = value
+
+    def _connection(self: "Cursor") -> Connection:
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        if self._c.closed:
+            raise InterfaceError("connection is closed")
+        return self._c
+
+    async def _execute(self: "Cursor", conn: Connection, operation: str, args, stream) -> None:
+        cursor: _Cursor = self._cursor
+        cursor.stream = stream
+        if not conn._conn.in_transaction and not conn._conn.autocommit:
+            await conn._execute(cursor, "begin transaction", None)
+        cursor._prepare_result_buffer()
+        await conn._execute(cursor, operation, args)
+        cursor._check_result_buffer()
+
+    async def execute(self: "Cursor", operation: str, args=None, stream=None) -> "Cursor":
+        """
+        Executes a database operation, as :meth:`redshift_connector.Cursor.execute`. For a ``COPY ... FROM STDIN``
+        `stream` may also be an asynchronous iterable of the items accepted by :class:`CopyInSource`. The connection
+        is closed if the execution is cancelled before the response of the server has been read.
+
+        Parameters
+        ----------
+        operation : str The SQL statement to execute.
+        args : Optional[Union[Sequence, Mapping]] The parameters of the statement, in the format expected by the paramstyle of the cursor.
+        stream : Optional The COPY data of a ``COPY ... FROM STDIN``, or the writable stream receiving the data of a ``COPY ... TO STDOUT``.
+
+        Returns
+        -------
+        The Cursor object used for executing the specified database operation: :class:`Cursor`
+        """
+        conn: Connection = self._connection()
+        async with conn._lock:
+            await self._execute(conn, operation, args, stream)
+        return self
+
+    async def executemany(self: "Cursor", operation: str, param_sets) -> "Cursor":
+        """
+        Executes a database operation once for each set of parameters in ``param_sets``. The row count of the
+        cursor is the sum of the row counts of the executions.
+
+        Parameters
+        ----------
+        operation : str The SQL statement to execute.
+        param_sets : Iterable[Union[Sequence, Mapping]] The parameters of each execution.
+
+        Returns
+        -------
+        The Cursor object used for executing the specified database operation: :class:`Cursor`
+        """
+        conn: Connection = self._connection()
+        rowcounts: typing.List[int] = []
+        async with conn._lock:
+            for parameters in param_sets:
+                await self._execute(conn, operation, parameters, None)
+                rowcounts.append(self._cursor._row_count)
+        self._cursor._row_count = -1 if -1 in rowcounts else sum(rowcounts)
+        self._cursor._redshift_row_count = self._cursor._row_count
+        return self
+
+    async def copy_in(
+        self: "Cursor",
+        operation: str,
+        data: typing.Any,
+        delimiter: str = ",",
+        frame_size: int = DEFAULT_COPY_FRAME_SIZE,
+    ) -> CopyStats:
+        """
+        Executes a ``COPY ... FROM STDIN`` statement, sending ``data`` as the COPY data, as
+        :meth:`redshift_connector.Cursor.copy_in`. Each CopyData message is sent before the next is produced.
+
+        Parameters
+        ----------
+        operation : str The ``COPY ... FROM STDIN`` statement to execute
+        data : Any A readable binary file-like object, or an iterable or asynchronous iterable of ``bytes`` chunks or of rows. ``None`` values of rows are written as NULL
+        delimiter : str The delimiter separating the values of each row. Defaults to ","
+        frame_size : int The approximate size, in bytes, of each CopyData message. Defaults to 1 MiB
+
+        Returns
+        -------
+        The number of rows and bytes copied and the time taken: :class:`CopyStats`
+        """
+        await self.execute(operation, stream=CopyInSource(data, delimiter=delimiter, frame_size=frame_size))
+        stats: CopyStats = typing.cast(CopyStats, self._cursor.copy_stats)
+        if self._cursor._row_count >= 0:
+            stats.rows = self._cursor._row_count
+        return stats
+
+    async def copy_out_chunks(self: "Cursor", operation: str, args=None) -> typing.AsyncIterator[bytes]:
+        """
+        Executes a ``COPY ... TO STDOUT`` statement and yields the content of each CopyData message as it arrives,
+        as :meth:`redshift_connector.Cursor.copy_out_chunks`. The connection is used by the iteration until it is
+        exhausted or closed.
+
+        Parameters
+        ----------
+        operation : str The ``COPY ... TO STDOUT`` statement to execute
+        args : Optional parameters of `operation`. See :meth:`execute`
+
+        Returns
+        -------
+        The COPY data: AsyncIterator[bytes]
+        """
+        conn: Connection = self._connection()
+        async with conn._lock:
+            await self._execute(conn, operation, args, CopyOutStream())
+            if not conn._conn._copy_out_pending:
+                raise InterfaceError("copy_out_chunks requires a COPY ... TO STDOUT statement")
+            async for chunk in conn._copy_out_data(self._cursor):
+                yield chunk
+
+    async def fetchone(self: "Cursor") -> typing.Optional[typing.List]:
+        """
+        Fetches the next row of the result, or ``None`` if no more rows are available.
+        """
+        return self._cursor.fetchone()
+
+    async def fetchmany(self: "Cursor", num: typing.Optional[int] = None) -> typing.Tuple:
+        """
+        Fetches the next ``num`` rows of the result, by default :attr:`arraysize` rows.
+        """
+        return self._cursor.fetchmany(num)
+
+    async def fetchall(self: "Cursor") -> typing.Tuple:
+        """
+        Fetches all remaining rows of the result.
+        """
+        return self._cursor.fetchall()
+
+    def close(self: "Cursor") -> None:
+        """
+        Closes the cursor.
+        """
+        self._cursor.close()
+        self._c = None
+
+    def __aiter__(self: "Cursor") -> "Cursor":
+        return self
+
+    async def __anext__(self: "Cursor") -> typing.List:
+        try:
+            return next(self._cursor)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def __aenter__(self: "Cursor") -> "Cursor":
+        return self
+
+    async def __aexit__(self: "Cursor", exc_type, exc_value, traceback) -> None:
+        self.close()
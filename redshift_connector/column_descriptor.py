@@ -0,0 +1,179 @@
+import typing
+
+from redshift_connector.utils.type_utils import (
+    BIGINT,
+    BOOLEAN,
+    CHAR,
+    DATE,
+    FLOAT,
+    INTEGER,
+    NUMERIC,
+    OID,
+    REAL,
+    SMALLINT,
+    TIME,
+    TIMESTAMP,
+    TIMESTAMPTZ,
+    TIMETZ,
+    VARCHAR,
+)
+
+# type oid -> (display_size, precision, scale) for types whose DB-API
+# description fields do not depend on the column's type modifier
+_fixed_type_description: typing.Dict[int, typing.Tuple[int, int, int]] = {
+    BOOLEAN: (1, 1, 0),
+    SMALLINT: (6, 5, 0),
+    INTEGER: (11, 10, 0),
+    OID: (10, 10, 0),
+    BIGINT: (20, 19, 0),
+    REAL: (15, 8, 8),
+    FLOAT: (25, 17, 17),
+    DATE: (13, 13, 0),
+    TIME: (15, 15, 6),
+    TIMETZ: (21, 21, 6),
+    TIMESTAMP: (29, 29, 6),
+    TIMESTAMPTZ: (35, 35, 6),
+}
+
+
+class ColumnDescriptor:
+    """
+    Metadata describing a single column of a result set, as received in a RowDescription message.
+
+    Instances are created once per prepared statement and shared by every execution of that
+    statement. Attribute access is preferred, though the mapping style access used by previous
+    releases (e.g. ``col["type_oid"]``) remains supported.
+    """
+
+    __slots__ = (
+        "label",
+        "table_oid",
+        "column_attrnum",
+        "type_oid",
+        "type_size",
+        "type_modifier",
+        "format",
+        "schema_name",
+        "table_name",
+        "column_name",
+        "catalog_name",
+        "nullable",
+        "autoincrement",
+        "read_only",
+        "searchable",
+        "pg8000_fc",
+        "func",
+    )
+
+    # only present when the server supports extended result metadata
+    schema_name: bytes
+    table_name: bytes
+    column_name: bytes
+    catalog_name: bytes
+    nullable: int
+    autoincrement: int
+    read_only: int
+    searchable: int
+    # set once the type's conversion function has been resolved
+    pg8000_fc: int
+    func: typing.Callable
+
+    def __init__(
+        self: "ColumnDescriptor",
+        label: bytes,
+        table_oid: int,
+        column_attrnum: int,
+        type_oid: int,
+        type_size: int,
+        type_modifier: int,
+        format: int,
+    ) -> None:
+        self.label: bytes = label
+        self.table_oid: int = table_oid
+        self.column_attrnum: int = column_attrnum
+        self.type_oid: int = type_oid
+        self.type_size: int = type_size
+        self.type_modifier: int = type_modifier
+        self.format: int = format
+
+    def __getitem__(self: "ColumnDescriptor", key: str) -> typing.Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self: "ColumnDescriptor", key: object) -> bool:
+        return isinstance(key, str) and key in self.__slots__ and hasattr(self, key)
+
+    def get(self: "ColumnDescriptor", key: str, default: typing.Any = None) -> typing.Any:
+        return getattr(self, key, default)
+
+    def items(self: "ColumnDescriptor") -> typing.ItemsView[str, typing.Any]:
+        return {k: getattr(self, k) for k in self.__slots__ if hasattr(self, k)}.items()
+
+    def __repr__(self: "ColumnDescriptor") -> str:
+        return "ColumnDescriptor({})".format(", ".join("{}={!r}".format(k, v) for k, v in self.items() if k != "func"))
+
+    @property
+    def precision(self: "ColumnDescriptor") -> typing.Optional[int]:
+        if self.type_oid == NUMERIC:
+            if self.type_modifier == -1:
+                return None
+            return ((self.type_modifier - 4) >> 16) & 0xFFFF
+        elif self.type_oid in (VARCHAR, CHAR):
+            return self.type_modifier - 4 if self.type_modifier != -1 else None
+        elif self.type_oid in _fixed_type_description:
+            return _fixed_type_description[self.type_oid][1]
+        return None
+
+    @property
+    def scale(self: "ColumnDescriptor") -> typing.Optional[int]:
+        if self.type_oid == NUMERIC:
+            if self.type_modifier == -1:
+                return None
+            return (self.type_modifier - 4) & 0xFFFF
+        elif self.type_oid in _fixed_type_description:
+            return _fixed_type_description[self.type_oid][2]
+        return None
+
+    @property
+    def display_size(self: "ColumnDescriptor") -> typing.Optional[int]:
+        if self.type_oid == NUMERIC:
+            precision: typing.Optional[int] = self.precision
+            if precision is None:
+                return None
+            # sign and decimal point
+            return precision + (2 if self.scale else 1)
+        elif self.type_oid in (VARCHAR, CHAR):
+            return self.precision
+        elif self.type_oid in _fixed_type_description:
+            return _fixed_type_description[self.type_oid][0]
+        return None
+
+    @property
+    def internal_size(self: "ColumnDescriptor") -> typing.Optional[int]:
+        if self.type_size >= 0:
+            return self.type_size
+        elif self.type_oid in (VARCHAR, CHAR) and self.type_modifier != -1:
+            return self.type_modifier - 4
+        return None
+
+    @property
+    def null_ok(self: "ColumnDescriptor") -> typing.Optional[bool]:
+        nullable: typing.Optional[int] = getattr(self, "nullable", None)
+        return None if nullable is None else bool(nullable)
+
+    def to_description(self: "ColumnDescriptor") -> typing.Tuple:
+        """
+        Returns the DB-API 2.0 description of this column as a 7-tuple of
+        (name, type_code, display_size, internal_size, precision, scale, null_ok).
+        """
+        return (
+            self.label,
+            self.type_oid,
+            self.display_size,
+            self.internal_size,
+            self.precision,
+            self.scale,
+            self.null_ok,
+        )
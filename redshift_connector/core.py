@@ -1,6 +1,9 @@
 import logging
 import os
+import re
 import socket
+import threading
+import time
 import typing
 from collections import deque
 from copy import deepcopy
@@ -11,12 +14,14 @@ from distutils.version import LooseVersion
 from hashlib import md5
 from itertools import count
 from os import getpid
+from struct import error as StructError
 from struct import pack
 from typing import TYPE_CHECKING
 from warnings import warn
 
 from scramp import ScramClient  # type: ignore
 
+from redshift_connector.column_descriptor import ColumnDescriptor
 from redshift_connector.config import (
     DEFAULT_PROTOCOL_VERSION,
     ClientProtocolVersion,
@@ -31,10 +36,17 @@ from redshift_connector.config import (
     pg_to_py_encodings,
 )
 from redshift_connector.cursor import Cursor
+from redshift_connector.endpoints import (
+    ROUND_ROBIN,
+    Endpoint,
+    endpoint_selector,
+    parse_endpoints,
+)
 from redshift_connector.error import (
     ArrayContentNotHomogenousError,
     ArrayContentNotSupportedError,
     DatabaseError,
+    DataError,
     Error,
     IntegrityError,
     InterfaceError,
@@ -44,6 +56,8 @@ from redshift_connector.error import (
     ProgrammingError,
     Warning,
 )
+from redshift_connector.protocol import ZERO_COPY_SIZE, Protocol
+from redshift_connector.retry import RetryPolicy
 from redshift_connector.utils import (
     FC_BINARY,
     FC_TEXT,
@@ -56,10 +70,10 @@ from redshift_connector.utils import (
     array_flatten,
     array_has_null,
     array_recv_binary,
+    array_recv_binary_1d,
     array_recv_text,
     bh_unpack,
     cccc_unpack,
-    ci_unpack,
     date_in,
     date_recv_binary,
     float_array_recv,
@@ -71,30 +85,42 @@ from redshift_connector.utils import (
     ihihih_unpack,
     ii_pack,
     iii_pack,
+    int2_vector_recv,
     int_array_recv,
+    int_in,
     make_divider_block,
     numeric_in,
     numeric_in_binary,
+    oid_recv,
+    oid_vector_recv,
 )
 from redshift_connector.utils import pg_types as PG_TYPES
 from redshift_connector.utils import py_types as PY_TYPES
 from redshift_connector.utils import (
     q_pack,
+    str_out,
     text_recv,
     time_in,
     time_recv_binary,
     timetz_in,
     timetz_recv_binary,
     varbytehex_recv,
+    vector_in,
     walk_array,
 )
+from redshift_connector.utils.copy_util import CopyInSource, CopyOutStream, CopyStats
+from redshift_connector.utils.lock_util import synchronized
 from redshift_connector.utils.type_utils import (
+    ACLITEM_ARRAY,
     BIGINT,
     DATE,
     GEOGRAPHY,
+    INT2VECTOR,
     INTEGER,
     INTEGER_ARRAY,
     NUMERIC,
+    OID_ARRAY,
+    OIDVECTOR,
     REAL_ARRAY,
     SMALLINT,
     SMALLINT_ARRAY,
@@ -105,10 +131,11 @@ from redshift_connector.utils.type_utils import (
     TIMETZ,
     VARBYTE,
     VARCHAR_ARRAY,
+    XID,
 )
 
 if TYPE_CHECKING:
-    from ssl import SSLSocket
+    from ssl import SSLContext, SSLSession, SSLSocket
 
 # Copyright (c) 2007-2009, Mathieu Fenniak
 # Copyright (c) The Contributors
@@ -142,6 +169,11 @@ __author__ = "Mathieu Fenniak"
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+_T = typing.TypeVar("_T")
+
+# holds the lock of a thread-safe connection while a method of the connection runs
+_synchronized = synchronized(lambda conn: conn)
+
 ZERO: Timedelta = Timedelta(0)
 BINARY: type = bytes
 
@@ -363,9 +395,136 @@ IDLE: bytes = b"I"
 IDLE_IN_TRANSACTION: bytes = b"T"
 IDLE_IN_FAILED_TRANSACTION: bytes = b"E"
 
+# the maximum number of bytes read from the socket at once, unless the rest of a larger message is read, and of
+# messages held by the protocol before they are written to the socket
+READ_SIZE: int = 65536
+
+# the maximum number of buffers sent together by a call to sendmsg, within the IOV_MAX of common platforms
+_MAX_SEND_BUFFERS: int = 1024
+
 arr_trans: typing.Mapping[int, typing.Optional[str]] = dict(zip(map(ord, "[] 'u"), ["{", "}", None, None, None]))
 
 
+# the SSL contexts created by make_ssl_context, by SSL mode and CA bundle, and the TLS sessions last established with
+# each server using them, by SSL mode and address, so later connections resume the session rather than performing a
+# full handshake
+_ssl_contexts: typing.Dict[typing.Tuple[str, str], "SSLContext"] = {}
+_tls_sessions: typing.Dict[typing.Tuple[str, typing.Any], "SSLSession"] = {}
+_ssl_lock: threading.Lock = threading.Lock()
+
+
+def _ca_bundle_path() -> str:
+    path = os.path.abspath(__file__)
+    if os.name == "nt":
+        return "\\".join(path.split("\\")[:-1]) + "\\files\\redshift-ca-bundle.crt"
+    return "/".join(path.split("/")[:-1]) + "/files/redshift-ca-bundle.crt"
+
+
+def make_ssl_context(sslmode: str) -> "SSLContext":
+    """
+    Returns the SSL context used to connect to Amazon Redshift, which verifies the certificate of the server against
+    the default certificates and the Amazon Redshift CA bundle, and also verifies its host name if ``sslmode`` is
+    ``verify-full``.
+
+    The context is created once per process for each ``sslmode``, as loading the certificates takes longer than the
+    handshake it is used for. It must not be modified.
+    """
+    from ssl import CERT_REQUIRED, SSLContext
+
+    key: typing.Tuple[str, str] = (sslmode, _ca_bundle_path())
+    with _ssl_lock:
+        ssl_context: typing.Optional[SSLContext] = _ssl_contexts.get(key)
+        if ssl_context is None:
+            # ssl_context = ssl.create_default_context()
+            ssl_context = SSLContext()
+            ssl_context.verify_mode = CERT_REQUIRED
+            ssl_context.load_default_certs()
+            ssl_context.load_verify_locations(key[1])
+            if sslmode == "verify-full":
+                ssl_context.check_hostname = True
+            _ssl_contexts[key] = ssl_context
+        return ssl_context
+
+
+# the name of a run-time parameter, such as search_path or a custom setting like myapp.tenant
+_SETTING_NAME: typing.Pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_.]*$")
+
+
+def session_options(settings: typing.Mapping[str, typing.Any]) -> str:
+    """
+    Returns the ``options`` parameter of the start-up message which sets the run-time parameters ``settings`` as
+    the server starts the session. Boolean values are given as ``on`` or ``off``.
+    """
+    options: typing.List[str] = []
+    for name, value in settings.items():
+        if not isinstance(name, str) or _SETTING_NAME.match(name) is None:
+            raise InterfaceError("Invalid session setting name {!r}".format(name))
+        # spaces and backslashes in the value are escaped, as the server splits the options on spaces
+        options.append("-c {}={}".format(name, _setting_value(value).replace("\\", "\\\\").replace(" ", "\\ ")))
+    return " ".join(options)
+
+
+def _setting_value(value: typing.Any) -> str:
+    if isinstance(value, bool):
+        return "on" if value else "off"
+    return str(value)
+
+
+def _setting_matches(requested: str, reported: str) -> bool:
+    # the server reports some settings normalized, such as a DateStyle of "iso" as "ISO, MDY"
+    def items(value: str) -> typing.Set[str]:
+        return set(value.lower().replace(" ", "").split(","))
+
+    return items(requested) <= items(reported)
+
+
+def _connection_closed() -> None:
+    raise InterfaceError("connection is closed")
+
+
+# the socket of a lazy connection which hasn't connected to the server, so it isn't considered closed
+_NOT_CONNECTED: typing.BinaryIO = typing.cast(typing.BinaryIO, object())
+
+
+class ConnectStats:
+    """
+    Statistics describing how a :class:`Connection` was established.
+
+    .. attribute:: seconds
+
+        The time spent connecting, from opening the socket until the server was ready for queries.
+
+    .. attribute:: tls_seconds
+
+        The time spent on the TLS handshake, which is 0 if SSL is disabled.
+
+    .. attribute:: tls_session_reused
+
+        Whether the TLS session of an earlier connection to the server was resumed, avoiding a full handshake.
+
+    .. attribute:: endpoint
+
+        The ``(host, port)`` connected to, or None for a Unix domain socket.
+    """
+
+    def __init__(
+        self: "ConnectStats",
+        seconds: float,
+        tls_seconds: float,
+        tls_session_reused: bool,
+        endpoint: typing.Optional[typing.Tuple[str, int]] = None,
+    ) -> None:
+        self.seconds: float = seconds
+        self.tls_seconds: float = tls_seconds
+        self.tls_session_reused: bool = tls_session_reused
+        self.endpoint: typing.Optional[typing.Tuple[str, int]] = endpoint
+
+    def __repr__(self: "ConnectStats") -> str:
+        return "ConnectStats(seconds={:.3f}, tls_seconds={:.3f}, tls_session_reused={}, endpoint={})".format(
+            self.seconds, self.tls_seconds, self.tls_session_reused, self.endpoint
+        )
+
+
 class Connection:
     # DBAPI Extension: supply exceptions as attributes on the connection
     Warning = property(lambda self: self._getError(Warning))
@@ -378,6 +537,19 @@ class Connection:
     ProgrammingError = property(lambda self: self._getError(ProgrammingError))
     NotSupportedError = property(lambda self: self._getError(NotSupportedError))
 
+    # connects a lazy connection to the server before it is first used, or raises if it was closed unused
+    _lazy_open: typing.Optional[typing.Callable[[], None]] = None
+    # the thread connecting a lazy connection in the background
+    _lazy_thread: typing.Optional[threading.Thread] = None
+    # how failed reads and transactions are retried, if they are
+    retry_policy: typing.Optional[RetryPolicy] = None
+    # guards the exchanges of a thread-safe connection with the server
+    _lock: typing.Optional[threading.RLock] = None
+    _copy_out_pending: bool = False
+    # the prepared statements closed by the message handlers of a connection driven by an external transport, which
+    # closes them before its next statement
+    _closing: typing.Optional[typing.List[bytes]] = None
+
     def __enter__(self: "Connection") -> "Connection":
         return self
 
@@ -419,6 +591,19 @@ class Connection:
         credentials_provider: typing.Optional[str] = None,
         provider_name: typing.Optional[str] = None,
         web_identity_token: typing.Optional[str] = None,
+        executemany_page_size: int = 100,
+        max_result_memory: typing.Optional[int] = None,
+        spill_results: bool = True,
+        lazy: bool = False,
+        background_connect: bool = False,
+        endpoints: typing.Optional[typing.Sequence[typing.Union[str, Endpoint]]] = None,
+        load_balance: str = ROUND_ROBIN,
+        connect_timeout: typing.Optional[float] = None,
+        endpoint_cooldown: float = 30.0,
+        dns_ttl: float = 0.0,
+        retry_policy: typing.Optional[RetryPolicy] = None,
+        session_settings: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+        thread_safe: bool = False,
     ):
         """
         Creates a :class:`Connection` to an Amazon Redshift cluster. For more information on establishing a connection to an Amazon Redshift cluster using `federated API access <https://aws.amazon.com/blogs/big-data/federated-api-access-to-amazon-redshift-using-an-amazon-redshift-connector-for-python/>`_ see our examples page.
@@ -461,8 +646,318 @@ class Connection:
             The name of the Redshift Native Auth Provider.
         web_identity_token: Optional[str]
             A web identity token used for authentication via Redshift Native IDP Integration
+        executemany_page_size : int
+            The maximum number of rows inserted per statement when :meth:`Cursor.executemany` rewrites a single row ``INSERT ... VALUES`` statement into a multi-row statement. A value of 1 disables the rewrite. Default value is 100.
+        max_result_memory : Optional[int]
+            The maximum number of bytes of received rows a :class:`Cursor` holds in memory. By default there is no limit. This is the default value of :attr:`Cursor.max_result_memory`.
+        spill_results : bool
+            Whether rows received beyond ``max_result_memory`` are held in a temporary file rather than failing the statement. Default value is ``True``. This is the default value of :attr:`Cursor.spill_results`.
+        lazy : bool
+            Whether connecting to the server is deferred until the connection is first used, such as by executing a statement. Default value is ``False``. If connecting fails, the error is raised when the connection is used, and connecting is attempted again when it is next used.
+        background_connect : bool
+            Whether a ``lazy`` connection starts connecting to the server on a background thread when it is created, so the first use only waits for it to complete. Default value is ``False``.
+        endpoints : Optional[Sequence[Union[str, Tuple[str, int]]]]
+            The endpoints of the Amazon Redshift cluster or workgroup to connect to instead of ``host`` and ``port``, as ``host``, ``host:port`` or ``(host, port)``. Endpoints without a port use ``port``. The connection is made to the first endpoint which accepts it, in the order given by ``load_balance``.
+        load_balance : str
+            How the endpoint tried first is chosen. ``round_robin`` takes each endpoint in turn, and ``least_latency`` the endpoint which has been fastest to connect to. Default value is ``round_robin``.
+        connect_timeout : Optional[float]
+            The number of seconds to wait for each endpoint to accept the connection before trying the next. By default ``timeout`` is used.
+        endpoint_cooldown : float
+            The number of seconds an endpoint which failed to accept a connection is tried after the other endpoints. Default value is 30.
+        dns_ttl : float
+            The number of seconds the addresses of an endpoint are reused by later connections in this process. The addresses are resolved again once an endpoint fails to accept a connection. Default value is 0, which resolves the host of each connection.
+        retry_policy : Optional[:class:`RetryPolicy`]
+            How reads executed outside of a transaction, and the transactions run by :meth:`run_in_transaction`, are retried when the connection breaks or the transaction is aborted by a serialization conflict. By default they are not retried.
+        session_settings : Optional[Mapping[str, Any]]
+            The run-time parameters of the session, such as ``search_path`` or ``statement_timeout``, which are set by the start-up message rather than by statements once connected. Values reported by the server once it is ready are verified. By default none are set.
+        thread_safe : bool
+            Whether the connection may be shared by threads, each using cursors of its own. Each statement, with the exchanges it needs, holds a lock of the connection while it runs, so the statements of other threads wait for it. A transaction is shared by the threads using the connection, unless it is run by :meth:`run_in_transaction`. Default value is ``False``.
+        """
+        init_params: typing.Dict[str, typing.Union[str, bytes]] = self._init_state(
+            user=user,
+            password=password,
+            database=database,
+            max_prepared_statements=max_prepared_statements,
+            application_name=application_name,
+            replication=replication,
+            client_protocol_version=client_protocol_version,
+            database_metadata_current_db_only=database_metadata_current_db_only,
+            credentials_provider=credentials_provider,
+            provider_name=provider_name,
+            web_identity_token=web_identity_token,
+            executemany_page_size=executemany_page_size,
+            max_result_memory=max_result_memory,
+            spill_results=spill_results,
+            session_settings=session_settings,
+        )
+
+        self._cursor: Cursor = self.cursor()
+
+        transport: typing.Dict[str, typing.Any] = {
+            "host": host,
+            "port": port,
+            "source_address": source_address,
+            "unix_sock": unix_sock,
+            "ssl": ssl,
+            "sslmode": sslmode,
+            "timeout": timeout,
+            "tcp_keepalive": tcp_keepalive,
+            "endpoints": endpoints,
+            "load_balance": load_balance,
+            "connect_timeout": connect_timeout,
+            "endpoint_cooldown": endpoint_cooldown,
+            "dns_ttl": dns_ttl,
+        }
+        self.retry_policy = retry_policy
+        if thread_safe:
+            self._lock = threading.RLock()
+        # kept to connect again when a retried operation finds the connection broken
+        self._init_params: typing.Dict[str, typing.Union[str, bytes]] = init_params
+        self._transport: typing.Dict[str, typing.Any] = transport
+        if not lazy:
+            self._open(init_params, **transport)
+            return
+
+        self._sock: typing.Optional[typing.BinaryIO] = _NOT_CONNECTED
+        self._write: typing.Callable = self._write_lazily
+        self._flush: typing.Callable = self._flush_lazily
+        self._read: typing.Callable = self._read_lazily
+        self._lazy_open = lambda: self._open(init_params, **transport)
+        if background_connect:
+            self._open_in_background()
+
+    def _open(
+        self: "Connection",
+        init_params: typing.Dict[str, typing.Union[str, bytes]],
+        host: str,
+        port: int,
+        source_address: typing.Optional[str],
+        unix_sock: typing.Optional[str],
+        ssl: bool,
+        sslmode: str,
+        timeout: typing.Optional[int],
+        tcp_keepalive: typing.Optional[bool],
+        endpoints: typing.Optional[typing.Sequence[typing.Union[str, Endpoint]]] = None,
+        load_balance: str = ROUND_ROBIN,
+        connect_timeout: typing.Optional[float] = None,
+        endpoint_cooldown: float = 30.0,
+        dns_ttl: float = 0.0,
+    ) -> None:
+        """
+        Connects to the server and conducts the start-up of the protocol. See :func:`Connection.__init__` for a
+        description of the parameters.
+        """
+        start_time: float = time.perf_counter()
+        tls_seconds: float = 0.0
+        # discard the messages of an earlier attempt to connect
+        self._protocol: Protocol = Protocol()
+        # Create the TCP/Ip socket and connect to specific database
+        # if there already has a socket, it will not create new connection when run connect again
+        if unix_sock is None and (host is not None or endpoints):
+            # the socket is connected to the first endpoint which accepts the connection
+            self._usock: typing.Union[socket.socket, "SSLSocket"]
+            self._usock, (host, port) = endpoint_selector.connect(
+                parse_endpoints(endpoints, port) if endpoints else [(host, port)],
+                load_balance,
+                source_address,
+                timeout,
+                connect_timeout,
+                endpoint_cooldown,
+                dns_ttl,
+            )
+        session_key: typing.Tuple[str, typing.Any] = (sslmode, (host, port) if unix_sock is None else unix_sock)
+        try:
+            if unix_sock is not None:
+                if not hasattr(socket, "AF_UNIX"):
+                    raise InterfaceError("attempt to connect to unix socket on unsupported " "platform")
+                self._usock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                if timeout is not None:
+                    self._usock.settimeout(timeout)
+                self._usock.connect(unix_sock)
+            elif host is None:
+                raise ProgrammingError("one of host or unix_sock must be provided")
+
+            # For Redshift, we the default ssl approve is True
+            # create ssl connection with Redshift CA certificates and check the hostname
+            if ssl is True:
+                try:
+                    tls_start: float = time.perf_counter()
+                    ssl_context: "SSLContext" = make_ssl_context(sslmode)
+
+                    # Int32(8) - Message length, including self.
+                    # Int32(80877103) - The SSL request code.
+                    self._usock.sendall(ii_pack(8, 80877103))
+                    resp: bytes = self._usock.recv(1)
+                    if resp != b"S":
+                        _logger.debug(
+                            "Server response code when attempting to establish ssl connection: {!r}".format(resp)
+                        )
+                        raise InterfaceError("Server refuses SSL")
+
+                    # resume the TLS session of the last connection to the server, if any
+                    session: typing.Optional["SSLSession"] = _tls_sessions.get(session_key)
+                    if sslmode == "verify-ca":
+                        self._usock = ssl_context.wrap_socket(self._usock, session=session)
+                    elif sslmode == "verify-full":
+                        self._usock = ssl_context.wrap_socket(self._usock, server_hostname=host, session=session)
+                    tls_seconds = time.perf_counter() - tls_start
+
+                except ImportError:
+                    raise InterfaceError("SSL required but ssl module not available in " "this python installation")
+
+            self._sock = self._usock.makefile(mode="rwb")
+            if tcp_keepalive:
+                self._usock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except socket.error as e:
+            self._usock.close()
+            raise InterfaceError("communication error", e)
+        read: typing.Callable = self._sock.read
+        # returns the bytes available, up to the given size, waiting only if none are
+        self._read_some: typing.Optional[typing.Callable] = getattr(self._sock, "read1", None)
+        # buffers are sent together by TCP sockets, while SSL sockets don't support sendmsg
+        self._sendmsg: typing.Optional[typing.Callable] = None
+        if unix_sock is None and not ssl:
+            self._sendmsg = getattr(self._usock, "sendmsg", None)
+        # other threads may use a connection opened in the background, so its I/O methods are only replaced once it
+        # has started up. Until then they wait for the start-up in the lazy I/O methods, which it bypasses.
+        in_background: bool = threading.current_thread() is self._lazy_thread
+        if not in_background:
+            # messages are written to the protocol, and sent to the server when flushed
+            self._read, self._write, self._flush = read, self._write_pending, self._send_pending
+
+        # Conduct start-up communication with database
+        self._write(self._startup_message(init_params))
+        self._flush()
+
+        code = None
+        self.error: typing.Optional[Exception] = None
+        _logger.debug("Sending start-up message")
+        # When driver send the start-up message to database, DB will respond multi messages to driver
+        # whose format is same with the message that driver send to DB.
+        while code not in (READY_FOR_QUERY, ERROR_RESPONSE):
+            # Thus use a loop to process each message
+            code, data = self._read_message()
+            self.message_types[code](data, None)
+        if self.error is not None:
+            raise self.error
+
+        try:
+            self._finish_startup()
+        except InterfaceError:
+            # the session has started, so it is ended rather than left open on the server with the socket
+            try:
+                self._write(TERMINATE_MSG)
+                self._flush()
+                typing.cast(typing.BinaryIO, self._sock).close()
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._usock.close()
+            raise
+
+        # TLS 1.3 session tickets are received after the handshake, so the session is kept once the server is ready
+        session = getattr(self._usock, "session", None)
+        if session is not None:
+            _tls_sessions[session_key] = session
+        self.connect_stats: ConnectStats = ConnectStats(
+            time.perf_counter() - start_time,
+            tls_seconds,
+            bool(getattr(self._usock, "session_reused", False)),
+            None if unix_sock is not None else (host, port),
+        )
+        _logger.debug("Connected %s", self.connect_stats)
+        if in_background:
+            self._read, self._write, self._flush = read, self._write_pending, self._send_pending
+
+    def _open_in_background(self: "Connection") -> None:
+        """
+        Starts connecting a lazy connection to the server on a background thread. The first use of the connection
+        waits for it, and connects again if it failed.
+        """
+        open_connection: typing.Callable[[], None] = typing.cast(typing.Callable[[], None], self._lazy_open)
+        errors: typing.List[Exception] = []
+
+        def run() -> None:
+            try:
+                open_connection()
+            except Exception as e:
+                errors.append(e)
+                return
+            # the connection is no longer lazy once it has started up
+            self._lazy_open = None
+            self._lazy_thread = None
+
+        def wait() -> None:
+            thread.join()
+            self._lazy_thread = None
+            if errors:
+                self._lazy_open = open_connection
+                raise errors[0]
+
+        thread: threading.Thread = threading.Thread(target=run, name="redshift_connector-connect", daemon=True)
+        self._lazy_thread = thread
+        self._lazy_open = wait
+        thread.start()
+
+    def _open_lazily(self: "Connection") -> None:
+        """
+        Connects a lazy connection to the server before it is first used.
+        """
+        lazy_open: typing.Optional[typing.Callable[[], None]] = self._lazy_open
+        try:
+            if lazy_open is not None:
+                lazy_open()
+        except Exception:
+            # the next use connects again
+            self._write, self._flush, self._read = self._write_lazily, self._flush_lazily, self._read_lazily
+            raise
+        self._lazy_open = None
+
+    def _write_lazily(self: "Connection", data: typing.Union[bytes, bytearray, memoryview]) -> None:
+        if threading.current_thread() is self._lazy_thread:
+            # the start-up of a connection opened in the background
+            self._write_pending(data)
+            return
+        self._open_lazily()
+        self._write(data)
+
+    def _flush_lazily(self: "Connection") -> None:
+        if threading.current_thread() is self._lazy_thread:
+            self._send_pending()
+            return
+        self._open_lazily()
+        self._flush()
+
+    def _read_lazily(self: "Connection", size: int) -> bytes:
+        if threading.current_thread() is self._lazy_thread:
+            return typing.cast(typing.BinaryIO, self._sock).read(size)
+        self._open_lazily()
+        return self._read(size)
+
+    def _init_state(
+        self: "Connection",
+        user: str,
+        password: str,
+        database: str,
+        max_prepared_statements: int,
+        application_name: typing.Optional[str],
+        replication: typing.Optional[str],
+        client_protocol_version: int,
+        database_metadata_current_db_only: bool,
+        credentials_provider: typing.Optional[str],
+        provider_name: typing.Optional[str],
+        web_identity_token: typing.Optional[str],
+        executemany_page_size: int,
+        max_result_memory: typing.Optional[int],
+        spill_results: bool,
+        session_settings: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+    ) -> typing.Dict[str, typing.Union[str, bytes]]:
+        """
+        Initializes the state of the connection which doesn't depend on the transport to the server, and returns
+        the parameters of the start-up message. See :func:`Connection.__init__` for a description of the parameters.
         """
         self.merge_socket_read = True
+        self._protocol = Protocol()
 
         _client_encoding = "utf8"
         self._commands_with_count: typing.Tuple[bytes, ...] = (
@@ -478,6 +973,9 @@ class Connection:
         self.notices: deque = deque(maxlen=100)
         self.parameter_statuses: deque = deque(maxlen=100)
         self.max_prepared_statements: int = int(max_prepared_statements)
+        self.executemany_page_size: int = int(executemany_page_size)
+        self.max_result_memory: typing.Optional[int] = None if max_result_memory is None else int(max_result_memory)
+        self.spill_results: bool = spill_results
         self._run_cursor: Cursor = Cursor(self, paramstyle="named")
         self._client_protocol_version: int = client_protocol_version
         self._database = database
@@ -522,6 +1020,12 @@ class Connection:
         if not redshift_native_auth or user:
             init_params["user"] = user
 
+        # the run-time parameters set by the start-up message, rather than by statements once connected
+        self._session_settings: typing.Dict[str, str] = {}
+        if session_settings:
+            init_params["options"] = session_options(session_settings)
+            self._session_settings = {name.lower(): _setting_value(value) for name, value in session_settings.items()}
+
         _logger.debug(make_divider_block())
         _logger.debug("Establishing a connection")
         _logger.debug(init_params)
@@ -546,80 +1050,11 @@ class Connection:
             self.password = password
 
         self.autocommit: bool = False
+        self.in_transaction: bool = False
+        self._copy_out_pending: bool = False
         self._xid = None
 
         self._caches: typing.Dict = {}
-
-        # Create the TCP/Ip socket and connect to specific database
-        # if there already has a socket, it will not create new connection when run connect again
-        try:
-            if unix_sock is None and host is not None:
-                self._usock: typing.Union[socket.socket, "SSLSocket"] = socket.socket(
-                    socket.AF_INET, socket.SOCK_STREAM
-                )
-                if source_address is not None:
-                    self._usock.bind((source_address, 0))
-            elif unix_sock is not None:
-                if not hasattr(socket, "AF_UNIX"):
-                    raise InterfaceError("attempt to connect to unix socket on unsupported " "platform")
-                self._usock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            else:
-                raise ProgrammingError("one of host or unix_sock must be provided")
-            if timeout is not None:
-                self._usock.settimeout(timeout)
-
-            if unix_sock is None and host is not None:
-                self._usock.connect((host, port))
-            elif unix_sock is not None:
-                self._usock.connect(unix_sock)
-
-            # For Redshift, we the default ssl approve is True
-            # create ssl connection with Redshift CA certificates and check the hostname
-            if ssl is True:
-                try:
-                    from ssl import CERT_REQUIRED, SSLContext
-
-                    # ssl_context = ssl.create_default_context()
-
-                    path = os.path.abspath(__file__)
-                    if os.name == "nt":
-                        path = "\\".join(path.split("\\")[:-1]) + "\\files\\redshift-ca-bundle.crt"
-                    else:
-                        path = "/".join(path.split("/")[:-1]) + "/files/redshift-ca-bundle.crt"
-
-                    ssl_context: SSLContext = SSLContext()
-                    ssl_context.verify_mode = CERT_REQUIRED
-                    ssl_context.load_default_certs()
-                    ssl_context.load_verify_locations(path)
-
-                    # Int32(8) - Message length, including self.
-                    # Int32(80877103) - The SSL request code.
-                    self._usock.sendall(ii_pack(8, 80877103))
-                    resp: bytes = self._usock.recv(1)
-                    if resp != b"S":
-                        _logger.debug(
-                            "Server response code when attempting to establish ssl connection: {!r}".format(resp)
-                        )
-                        raise InterfaceError("Server refuses SSL")
-
-                    if sslmode == "verify-ca":
-                        self._usock = ssl_context.wrap_socket(self._usock)
-                    elif sslmode == "verify-full":
-                        ssl_context.check_hostname = True
-                        self._usock = ssl_context.wrap_socket(self._usock, server_hostname=host)
-
-                except ImportError:
-                    raise InterfaceError("SSL required but ssl module not available in " "this python installation")
-
-            self._sock: typing.Optional[typing.BinaryIO] = self._usock.makefile(mode="rwb")
-            if tcp_keepalive:
-                self._usock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-        except socket.error as e:
-            self._usock.close()
-            raise InterfaceError("communication error", e)
-        self._flush: typing.Callable = self._sock.flush
-        self._read: typing.Callable = self._sock.read
-        self._write: typing.Callable = self._sock.write
         self._backend_key_data: typing.Optional[bytes] = None
 
         trans_tab = dict(zip(map(ord, "{}"), "[]"))
@@ -657,14 +1092,18 @@ class Connection:
             COPY_IN_RESPONSE: self.handle_COPY_IN_RESPONSE,
             COPY_OUT_RESPONSE: self.handle_COPY_OUT_RESPONSE,
         }
+        return typing.cast(typing.Dict[str, typing.Union[str, bytes]], init_params)
 
+    def _startup_message(self: "Connection", init_params: typing.Dict[str, typing.Union[str, bytes]]) -> bytes:
+        """
+        Returns the start-up message sent to the server once the transport is established.
+        """
         # Int32 - Message length, including self.
         # Int32(196608) - Protocol version number.  Version 3.0.
         # Any number of key/value pairs, terminated by a zero byte:
         #   String - A parameter name (user, database, or options)
         #   String - Parameter value
 
-        # Conduct start-up communication with database
         # Message's first part is the protocol version - Int32(196608)
         protocol: int = 196608
         val: bytearray = bytearray(i_pack(protocol))
@@ -673,29 +1112,41 @@ class Connection:
         for k, v in init_params.items():
             val.extend(k.encode("ascii") + NULL_BYTE + typing.cast(bytes, v) + NULL_BYTE)
         val.append(0)
-        # Use write and flush function to write the content of the buffer
-        # and then send the message to the database
-        self._write(i_pack(len(val) + 4))
-        self._write(val)
-        self._flush()
+        return i_pack(len(val) + 4) + val
+
+    @classmethod
+    def _for_external_transport(
+        cls: typing.Type["Connection"], **kwargs
+    ) -> typing.Tuple["Connection", typing.Dict[str, typing.Union[str, bytes]]]:
+        """
+        Creates a connection whose messages are exchanged by a transport other than a socket of its own, such as the
+        streams of :class:`redshift_connector.aio.Connection`, and returns it with the parameters of its start-up
+        message. See :func:`Connection.__init__` for a description of the parameters.
+
+        The message handlers write to the :class:`Protocol` of the connection, whose pending messages the transport
+        sends, and the transport passes the bytes it receives to the protocol and dispatches the messages to
+        ``message_types``. The connection never flushes or reads a socket itself, and the prepared statements closed
+        by its handlers are queued in ``_closing`` for the transport to close before its next statement. ``_sock``
+        is set by the transport while it is open.
+        """
+        conn: "Connection" = cls.__new__(cls)
+        init_params: typing.Dict[str, typing.Union[str, bytes]] = conn._init_state(**kwargs)
+        conn._sock = None
+        conn._closing = []
+        conn._write, conn._flush, conn._read = conn._protocol.write, conn._flush_external, conn._read_external
+        return conn, init_params
+
+    def _flush_external(self: "Connection") -> None:
+        # the pending messages are sent by the external transport
+        pass
 
-        self._cursor: Cursor = self.cursor()
-
-        code = None
-        self.error: typing.Optional[Exception] = None
-        _logger.debug("Sending start-up message")
-        # When driver send the start-up message to database, DB will respond multi messages to driver
-        # whose format is same with the message that driver send to DB.
-        while code not in (READY_FOR_QUERY, ERROR_RESPONSE):
-            # Thus use a loop to process each message
-            # Each time will read 5 bytes, the first byte, the code, inform the type of message
-            # following 4 bytes inform the message's length
-            # then can use this length to minus 4 to get the real data.
-            code, data_len = ci_unpack(self._read(5))
-            self.message_types[code](self._read(data_len - 4), None)
-        if self.error is not None:
-            raise self.error
+    def _read_external(self: "Connection", size: int) -> bytes:
+        raise InterfaceError("A connection driven by an external transport cannot be read synchronously")
 
+    def _finish_startup(self: "Connection") -> None:
+        """
+        Completes the state of the connection once the server is ready for queries following the start-up message.
+        """
         # if we didn't receive a server_protocol_version from the server, default to
         # using BASE_SERVER as the server is likely lacking this functionality due to
         # being out of date
@@ -707,7 +1158,42 @@ class Connection:
             self._client_protocol_version = ClientProtocolVersion.BASE_SERVER
             self._enable_protocol_based_conversion_funcs()
 
+        # the server rejects invalid settings, and reports the value of those it reports changes of
+        reported: typing.Dict[str, str] = {
+            key.decode("ascii").lower(): value.decode(_client_encoding) for key, value in self.parameter_statuses
+        }
+        for name, value in self._session_settings.items():
+            if name not in reported:
+                _logger.debug("Session setting %s was not reported by the server", name)
+            elif not _setting_matches(value, reported[name]):
+                raise InterfaceError(
+                    "The server set session setting {} to {!r} rather than {!r}".format(name, reported[name], value)
+                )
+
+    def _reconnect(self: "Connection") -> None:
+        """
+        Replaces the broken connection to the server with a new one, which authenticates with the credentials the
+        connection was created with. The transaction and prepared statements of the broken connection are lost.
+        If connecting fails, the connection connects again when it is next used.
+        """
+        if self._lazy_open is not None:
+            # a lazy connection which failed to connect connects again when it is next used
+            return
+        try:
+            self._usock.close()
+        except Exception:
+            pass
+        self._caches = {}
         self.in_transaction = False
+        self._copy_out_pending = False
+        try:
+            self._open(self._init_params, **self._transport)
+        except Exception:
+            # like a lazy connection which failed to connect, the connection connects again when it is next used
+            self._sock = _NOT_CONNECTED
+            self._write, self._flush, self._read = self._write_lazily, self._flush_lazily, self._read_lazily
+            self._lazy_open = lambda: self._open(self._init_params, **self._transport)
+            raise
 
     def _enable_protocol_based_conversion_funcs(self: "Connection"):
         if self._client_protocol_version >= ClientProtocolVersion.BINARY.value:
@@ -722,8 +1208,11 @@ class Connection:
             self.pg_types[TEXT_ARRAY] = (FC_BINARY, array_recv_binary)  # TEXT[]
             self.pg_types[VARCHAR_ARRAY] = (FC_BINARY, array_recv_binary)  # VARCHAR[]
             self.pg_types[REAL_ARRAY] = (FC_BINARY, array_recv_binary)  # FLOAT4[]
-            self.pg_types[1028] = (FC_BINARY, array_recv_binary)  # OID[]
-            self.pg_types[1034] = (FC_BINARY, array_recv_binary)  # ACLITEM[]
+            self.pg_types[OID_ARRAY] = (FC_BINARY, oid_vector_recv)  # OID[]
+            self.pg_types[ACLITEM_ARRAY] = (FC_BINARY, array_recv_binary_1d)  # ACLITEM[]
+            self.pg_types[INT2VECTOR] = (FC_BINARY, int2_vector_recv)  # INT2VECTOR
+            self.pg_types[OIDVECTOR] = (FC_BINARY, oid_vector_recv)  # OIDVECTOR
+            self.pg_types[XID] = (FC_BINARY, oid_recv)  # XID, an unsigned 32-bit integer
             self.pg_types[VARBYTE] = (FC_TEXT, text_recv)  # VARBYTE
         else:  # text protocol
             self.pg_types[NUMERIC] = (FC_TEXT, numeric_in)
@@ -737,12 +1226,17 @@ class Connection:
             self.pg_types[TEXT_ARRAY] = (FC_TEXT, array_recv_text)  # TEXT[]
             self.pg_types[VARCHAR_ARRAY] = (FC_TEXT, array_recv_text)  # VARCHAR[]
             self.pg_types[REAL_ARRAY] = (FC_TEXT, float_array_recv)  # FLOAT4[]
-            self.pg_types[1028] = (FC_TEXT, int_array_recv)  # OID[]
-            self.pg_types[1034] = (FC_TEXT, array_recv_text)  # ACLITEM[]
+            self.pg_types[OID_ARRAY] = (FC_TEXT, int_array_recv)  # OID[]
+            self.pg_types[ACLITEM_ARRAY] = (FC_TEXT, array_recv_text)  # ACLITEM[]
+            self.pg_types[INT2VECTOR] = (FC_TEXT, vector_in)  # INT2VECTOR
+            self.pg_types[OIDVECTOR] = (FC_TEXT, vector_in)  # OIDVECTOR
+            self.pg_types[XID] = (FC_TEXT, int_in)  # XID
             self.pg_types[VARBYTE] = (FC_TEXT, varbytehex_recv)  # VARBYTE
 
     @property
     def _is_multi_databases_catalog_enable_in_server(self: "Connection") -> bool:
+        if self._lazy_open is not None:
+            self._open_lazily()
         if (b"datashare_enabled", str("on").encode()) in self.parameter_statuses:
             return True
         else:
@@ -1017,6 +1511,8 @@ class Connection:
         # column_formats = unpack_from('!' + 'h' * num_cols, data, 3)
         if ps.stream is None:
             raise InterfaceError("An output stream is required for the COPY OUT response.")
+        # the CopyData messages which follow are read by iterating over copy_out_data
+        self._copy_out_pending = isinstance(ps.stream, CopyOutStream)
 
     def handle_COPY_DATA(self: "Connection", data, ps) -> None:
         """
@@ -1083,14 +1579,12 @@ class Connection:
         if ps.stream is None:
             raise InterfaceError("An input stream is required for the COPY IN response.")
 
-        bffr: bytearray = bytearray(8192)
-        while True:
-            bytes_read = ps.stream.readinto(bffr)
-            if bytes_read == 0:
-                break
-            self._write(COPY_DATA + i_pack(bytes_read + 4))
-            self._write(bffr[:bytes_read])
-            self._flush()
+        source: CopyInSource = ps.stream if isinstance(ps.stream, CopyInSource) else CopyInSource(ps.stream)
+        start_time: float = time.perf_counter()
+        # frames are written to the buffered socket without flushing, so large frames are sent by few system calls
+        for frame in source.frames():
+            self._write(COPY_DATA + i_pack(len(frame) + 4))
+            self._write(frame)
 
         # Send CopyDone
         # Byte1('c') - Identifier.
@@ -1098,6 +1592,8 @@ class Connection:
         self._write(COPY_DONE_MSG)
         self._write(SYNC_MSG)
         self._flush()
+        ps.copy_stats = CopyStats(source.rows, source.bytes, time.perf_counter() - start_time)
+        _logger.debug("COPY IN sent %s", ps.copy_stats)
 
     def handle_NOTIFICATION_RESPONSE(self: "Connection", data, ps):
         """
@@ -1158,6 +1654,7 @@ class Connection:
     def description(self: "Connection") -> typing.Optional[typing.List]:
         return self._run_cursor._getDescription()
 
+    @_synchronized
     def run(self: "Connection", sql, stream=None, **params) -> typing.Tuple[typing.Any, ...]:
         """
         Executes an sql statement, and returns the results as a `tuple`.
@@ -1167,8 +1664,9 @@ class Connection:
         Result of executing an sql statement:tuple[Any, ...]
         """
         self._run_cursor.execute(sql, params, stream=stream)
-        return tuple(self._run_cursor._cached_rows)
+        return tuple(map(self._run_cursor._decode_row, self._run_cursor._cached_rows))
 
+    @_synchronized
     def commit(self: "Connection") -> None:
         """Commits the current database transaction.
 
@@ -1181,6 +1679,7 @@ class Connection:
         """
         self.execute(self._cursor, "commit", None)
 
+    @_synchronized
     def rollback(self: "Connection") -> None:
         """Rolls back the current database transaction.
 
@@ -1195,6 +1694,69 @@ class Connection:
             return
         self.execute(self._cursor, "rollback", None)
 
+    @_synchronized
+    def run_in_transaction(self: "Connection", func: typing.Callable[["Connection"], _T]) -> _T:
+        """
+        Runs ``func`` in a transaction of its own, and returns its result. The transaction is committed if ``func``
+        returns, and rolled back if it raises.
+
+        With a :attr:`retry_policy`, the whole transaction is run again when the connection breaks or the
+        transaction is aborted by a serialization conflict, so ``func`` should only affect the database, through
+        the connection it is given. A transaction whose commit is interrupted by the connection breaking may have
+        been committed, and is run again.
+
+        Parameters
+        ----------
+        func : Callable[[:class:`Connection`], Any] Executes the statements of the transaction on the connection it is given.
+
+        Returns
+        -------
+        The result of ``func``: Any
+        """
+        if self.in_transaction:
+            raise InterfaceError("run_in_transaction cannot be called during a transaction")
+
+        def run() -> _T:
+            self.execute(self._cursor, "begin transaction", None)
+            try:
+                result: _T = func(self)
+                self.commit()
+            except Exception:
+                if self.in_transaction:
+                    try:
+                        self.rollback()
+                    except Exception:
+                        # the error of the transaction is raised rather than that of its rollback
+                        pass
+                raise
+            return result
+
+        if self.retry_policy is None:
+            return run()
+        return self.retry_policy.run(self, run)
+
+    @_synchronized
+    def ping(self: "Connection") -> None:
+        """Checks the connection is usable by sending a Sync message, which
+        the server answers with ReadyForQuery without executing a statement.
+
+        Raises :class:`InterfaceError` if the connection is closed or broken.
+
+        Returns
+        -------
+        None:None
+        """
+        self._check_copy_out_done()
+        try:
+            self._write(SYNC_MSG)
+            self._flush()
+            self.handle_messages(self._cursor)
+        except (AttributeError, ValueError):
+            raise InterfaceError("connection is closed")
+        except (socket.error, StructError) as e:
+            raise InterfaceError("connection is broken: {}".format(e))
+
+    @_synchronized
     def close(self: "Connection") -> None:
         """Closes the database connection.
 
@@ -1205,6 +1767,21 @@ class Connection:
         -------
         None:None
         """
+        if self._lazy_open is not None:
+            # a lazy connection which wasn't used is only connected to the server if it connected in the background
+            connected: bool = False
+            if self._lazy_thread is not None:
+                try:
+                    self._open_lazily()
+                    connected = True
+                except Exception:
+                    pass
+            if not connected:
+                self._sock = None
+                lazy_open, self._lazy_open = self._lazy_open, _connection_closed
+                if lazy_open is _connection_closed:
+                    raise InterfaceError("connection is closed")
+                return
         try:
             # Byte1('X') - Identifies the message as a terminate message.
             # Int32(4) - Message length, including self.
@@ -1434,9 +2011,13 @@ class Connection:
             return self.py_types[BIGINT]
         return self.py_types[Decimal]
 
-    def make_params(self: "Connection", values):
+    def make_params(self: "Connection", values, oids: typing.Optional[typing.Sequence[typing.Optional[int]]] = None):
         params = []
-        for value in values:
+        for idx, value in enumerate(values):
+            if oids is not None and idx < len(oids) and oids[idx] is not None:
+                # the parameter type was given by Cursor.setinputsizes, so the value is sent as text
+                params.append((oids[idx], FC_TEXT, str_out))
+                continue
             typ = type(value)
             try:
                 params.append(self.py_types[typ])
@@ -1528,37 +2109,42 @@ class Connection:
 
         count: int = h_unpack(data)[0]
         _logger.debug("field count={}".format(count))
+        row_desc: typing.List[ColumnDescriptor] = cursor.ps["row_desc"]
+        extended_metadata: bool = self._client_protocol_version >= ClientProtocolVersion.EXTENDED_RESULT_METADATA
         idx = 2
         for i in range(count):
-            column_label = data[idx : data.find(NULL_BYTE, idx)]
-            idx += len(column_label) + 1
-
-            field: typing.Dict = dict(
-                zip(
-                    ("table_oid", "column_attrnum", "type_oid", "type_size", "type_modifier", "format"),
-                    ihihih_unpack(data, idx),
-                )
-            )
-            field["label"] = column_label
-            idx += 18
-
-            if self._client_protocol_version >= ClientProtocolVersion.EXTENDED_RESULT_METADATA:
-                for entry in ("schema_name", "table_name", "column_name", "catalog_name"):
-                    field[entry] = data[idx : data.find(NULL_BYTE, idx)]
-                    idx += len(field[entry]) + 1
+            null_idx: int = data.find(NULL_BYTE, idx)
+            field: ColumnDescriptor = ColumnDescriptor(data[idx:null_idx], *ihihih_unpack(data, null_idx + 1))
+            idx = null_idx + 19
+
+            if extended_metadata:
+                # schema_name, table_name, column_name, catalog_name are sent as consecutive strings
+                null_idx = data.find(NULL_BYTE, idx)
+                field.schema_name = data[idx:null_idx]
+                idx = null_idx + 1
+                null_idx = data.find(NULL_BYTE, idx)
+                field.table_name = data[idx:null_idx]
+                idx = null_idx + 1
+                null_idx = data.find(NULL_BYTE, idx)
+                field.column_name = data[idx:null_idx]
+                idx = null_idx + 1
+                null_idx = data.find(NULL_BYTE, idx)
+                field.catalog_name = data[idx:null_idx]
+                idx = null_idx + 1
 
                 temp: int = h_unpack(data, idx)[0]
-                field["nullable"] = temp & 0x1
-                field["autoincrement"] = (temp >> 4) & 0x1
-                field["read_only"] = (temp >> 8) & 0x1
-                field["searchable"] = (temp >> 12) & 0x1
+                field.nullable = temp & 0x1
+                field.autoincrement = (temp >> 4) & 0x1
+                field.read_only = (temp >> 8) & 0x1
+                field.searchable = (temp >> 12) & 0x1
                 idx += 2
 
-            cursor.ps["row_desc"].append(field)
-            field["pg8000_fc"], field["func"] = self.pg_types[field["type_oid"]]
+            field.pg8000_fc, field.func = self.pg_types[field.type_oid]
+            row_desc.append(field)
 
         _logger.debug(cursor.ps["row_desc"])
 
+    @_synchronized
     def execute(self: "Connection", cursor: Cursor, operation: str, vals) -> None:
         """
         Executes a database operation. Parameters may be provided as a sequence, or as a mapping, depending upon the value of `redshift_connector.paramstyle`.
@@ -1573,9 +2159,91 @@ class Connection:
         -------
         None:None
         """
+        self._send_execution(cursor, operation, vals)
+        # handle multi messages including BIND_COMPLETE, DATA_ROW, COMMAND_COMPLETE
+        # READY_FOR_QUERY
+        if self.merge_socket_read:
+            self.handle_messages_merge_socket_read(cursor)
+        else:
+            self.handle_messages(cursor)
+
+    def execute_streamed(self: "Connection", cursor: Cursor, operation: str, vals) -> typing.Iterator[bytes]:
+        """
+        Executes a query as :func:`Connection.execute` does, yielding the content of each DataRow message of its
+        result as it is read from the socket rather than holding the result in ``cursor``. The statement is sent
+        when the first row is requested. The remaining messages are read and discarded if the iteration is
+        abandoned, so the connection can be reused. The lock of a thread-safe connection must be held until the
+        iteration ends.
+
+        Parameters
+        ----------
+        cursor : :class:`Cursor`
+        operation : str The SQL statement to execute.
+        vals : The parameters of the statement. See :func:`Connection.execute`
+
+        Returns
+        -------
+        The content of each DataRow message: Iterator[bytes]
+        """
+        self._send_execution(cursor, operation, vals)
+        code: typing.Optional[bytes] = None
+        self.error = None
+        try:
+            while code != READY_FOR_QUERY:
+                code, data = self._read_message()
+                if code == DATA_ROW:
+                    yield data
+                else:
+                    self.message_types[code](data, cursor)
+        except GeneratorExit:
+            while code != READY_FOR_QUERY:
+                code, data = self._read_message()
+                if code != DATA_ROW:
+                    self.message_types[code](data, cursor)
+            raise
+
+        if self.error is not None:
+            raise self.error
+
+    def _send_execution(self: "Connection", cursor: Cursor, operation: str, vals) -> None:
+        """
+        Parses ``operation`` if it isn't in the statement cache, and sends the messages executing it.
+        """
+        self._check_copy_out_done()
         if vals is None:
             vals = ()
 
+        cache, key, statement, args, params = self._lookup_statement(cursor, operation, vals)
+        try:
+            ps = cache["ps"][key]
+            cursor.ps = ps
+        except KeyError:
+            ps = self._new_statement()
+            cursor.ps = ps
+            self.parse_statement(cursor, ps, statement, params)
+            for statement_name_bin in self._cache_statement(cache, key, ps):
+                self.close_prepared_statement(statement_name_bin)
+
+        cursor._cached_rows.clear()
+        cursor._row_count = -1
+        cursor._redshift_row_count = -1
+
+        # send BIND message which includes name of parepared statement,
+        # name of destination portal and the value of placeholders in prepared statement.
+        # these parameters need to match the prepared statements
+        self._send_message(BIND, self.bind_parts(ps, args))
+        self.send_EXECUTE(cursor)
+        self._write(SYNC_MSG)
+        self._flush()
+
+    def _lookup_statement(
+        self: "Connection", cursor: Cursor, operation: str, vals
+    ) -> typing.Tuple[typing.Dict, typing.Tuple, str, typing.Any, typing.Tuple]:
+        """
+        Returns the statement cache of the cursor's paramstyle, the key of ``operation`` executed with ``vals`` in
+        the cache, the statement converted to the ``$n`` format, the positional parameters and the type oid, format
+        code and send function of each parameter.
+        """
         # get the process ID of the calling process.
         pid: int = getpid()
         # multi dimensional dictionary to store the data
@@ -1604,124 +2272,178 @@ class Connection:
         args = make_args(vals)
         # change the args to the format that the DB will identify
         # take reference from self.py_types
-        params = self.make_params(args)
+        params = self.make_params(args, cursor._input_oids)
         key = operation, params
+        return cache, key, statement, args, params
 
-        try:
-            ps = cache["ps"][key]
-            cursor.ps = ps
-        except KeyError:
-            statement_nums: typing.List[int] = [0]
-            for style_cache in self._caches.values():
-                try:
-                    pid_cache = style_cache[pid]
-                    for csh in pid_cache["ps"].values():
-                        statement_nums.append(csh["statement_num"])
-                except KeyError:
-                    pass
+    def _new_statement(self: "Connection") -> typing.Dict[str, typing.Any]:
+        """
+        Returns a new prepared statement, named after the process and the statements cached by the connection.
+        """
+        pid: int = getpid()
+        statement_nums: typing.List[int] = [0]
+        for style_cache in self._caches.values():
+            try:
+                pid_cache = style_cache[pid]
+                for csh in pid_cache["ps"].values():
+                    statement_nums.append(csh["statement_num"])
+            except KeyError:
+                pass
+
+        # statement_num is the id of statement increasing from 1
+        statement_num: int = sorted(statement_nums)[-1] + 1
+        # consist of "redshift_connector", statement, process id and statement number.
+        # e.g redshift_connector_statement_11432_2
+        statement_name: str = "_".join(("redshift_connector", "statement", str(pid), str(statement_num)))
+        statement_name_bin: bytes = statement_name.encode("ascii") + NULL_BYTE
+        # row_desc: list that used to store metadata of rows from DB
+        ps: typing.Dict[str, typing.Any] = {
+            "statement_name_bin": statement_name_bin,
+            "pid": pid,
+            "statement_num": statement_num,
+            "row_desc": [],
+        }
+        return ps
 
-            # statement_num is the id of statement increasing from 1
-            statement_num: int = sorted(statement_nums)[-1] + 1
-            # consist of "redshift_connector", statement, process id and statement number.
-            # e.g redshift_connector_statement_11432_2
-            statement_name: str = "_".join(("redshift_connector", "statement", str(pid), str(statement_num)))
-            statement_name_bin: bytes = statement_name.encode("ascii") + NULL_BYTE
-            # row_desc: list that used to store metadata of rows from DB
-            # param_funcs: type transform function
-            ps = {
-                "statement_name_bin": statement_name_bin,
-                "pid": pid,
-                "statement_num": statement_num,
-                "row_desc": [],
-                "param_funcs": tuple(x[2] for x in params),
-            }
-            cursor.ps = ps
+    def _cache_statement(
+        self: "Connection", cache: typing.Dict, key: typing.Tuple, ps: typing.Dict[str, typing.Any]
+    ) -> typing.List[bytes]:
+        """
+        Stores ``ps`` in ``cache``, first evicting every cached statement if the cache is full. Returns the names of
+        the evicted statements, which must be closed.
+        """
+        evicted: typing.List[bytes] = []
+        if len(cache["ps"]) > self.max_prepared_statements:
+            evicted = [p["statement_name_bin"] for p in cache["ps"].values()]
+            cache["ps"].clear()
+        cache["ps"][key] = ps
+        return evicted
 
-            param_fcs = tuple(x[1] for x in params)
-
-            # Byte1('P') - Identifies the message as a Parse command.
-            # Int32 -   Message length, including self.
-            # String -  Prepared statement name. An empty string selects the
-            #           unnamed prepared statement.
-            # String -  The query string.
-            # Int16 -   Number of parameter data types specified (can be zero).
-            # For each parameter:
-            #   Int32 - The OID of the parameter data type.
-            val: typing.Union[bytes, bytearray] = bytearray(statement_name_bin)
-            typing.cast(bytearray, val).extend(statement.encode(_client_encoding) + NULL_BYTE)
-            typing.cast(bytearray, val).extend(h_pack(len(params)))
-            for oid, fc, send_func in params:
-                # Parse message doesn't seem to handle the -1 type_oid for NULL
-                # values that other messages handle.  So we'll provide type_oid
-                # 705, the PG "unknown" type.
-                typing.cast(bytearray, val).extend(i_pack(705 if oid == -1 else oid))
-
-            # Byte1('D') - Identifies the message as a describe command.
-            # Int32 - Message length, including self.
-            # Byte1 - 'S' for prepared statement, 'P' for portal.
-            # String - The name of the item to describe.
-
-            # PARSE message will notify database to create a prepared statement object
-            self._send_message(PARSE, val)
-            # DESCRIBE message will specify the name of the existing prepared statement
-            # the response will be a parameterDescribing message describe the parameters needed
-            # and a RowDescription message describe the rows will be return(nodata message when no return rows)
-            self._send_message(DESCRIBE, STATEMENT + statement_name_bin)
-            # at completion of query message, driver issue a sync message
-            self._write(SYNC_MSG)
+    @_synchronized
+    def parse_statement(
+        self: "Connection", cursor: Cursor, ps: typing.Dict[str, typing.Any], statement: str, params
+    ) -> None:
+        """
+        Creates the prepared statement named by ``ps["statement_name_bin"]`` on the server, and stores in ``ps`` the
+        row description of its result, the functions decoding its rows and the fixed parts of its Bind message.
 
-            try:
-                self._flush()
-            except AttributeError as e:
-                if self._sock is None:
-                    raise InterfaceError("connection is closed")
-                else:
-                    raise e
+        Parameters
+        ----------
+        cursor : :class:`Cursor`
+        ps : Dict[str, Any] The prepared statement, holding at least its name and an empty row description.
+        statement : str The SQL statement, with parameters in the ``$n`` format.
+        params : The type oid, format code and send function of each parameter, as returned by :func:`Connection.make_params`.
 
-            self.handle_messages(cursor)
+        Returns
+        -------
+        None:None
+        """
+        self._check_copy_out_done()
+        statement_name_bin: bytes = ps["statement_name_bin"]
+        val: bytearray = self.parse_message(ps, statement, params)
 
-            # We've got row_desc that allows us to identify what we're
-            # going to get back from this statement.
-            output_fc = tuple(self.pg_types[f["type_oid"]][0] for f in ps["row_desc"])
-
-            ps["input_funcs"] = tuple(f["func"] for f in ps["row_desc"])
-            # Byte1('B') - Identifies the Bind command.
-            # Int32 - Message length, including self.
-            # String - Name of the destination portal.
-            # String - Name of the source prepared statement.
-            # Int16 - Number of parameter format codes.
-            # For each parameter format code:
-            #   Int16 - The parameter format code.
-            # Int16 - Number of parameter values.
-            # For each parameter value:
-            #   Int32 - The length of the parameter value, in bytes, not
-            #           including this length.  -1 indicates a NULL parameter
-            #           value, in which no value bytes follow.
-            #   Byte[n] - Value of the parameter.
-            # Int16 - The number of result-column format codes.
-            # For each result-column format code:
-            #   Int16 - The format code.
-            ps["bind_1"] = (
-                NULL_BYTE
-                + statement_name_bin
-                + h_pack(len(params))
-                + pack("!" + "h" * len(param_fcs), *param_fcs)
-                + h_pack(len(params))
-            )
+        # Byte1('D') - Identifies the message as a describe command.
+        # Int32 - Message length, including self.
+        # Byte1 - 'S' for prepared statement, 'P' for portal.
+        # String - The name of the item to describe.
+
+        # PARSE message will notify database to create a prepared statement object
+        self._send_message(PARSE, val)
+        # DESCRIBE message will specify the name of the existing prepared statement
+        # the response will be a parameterDescribing message describe the parameters needed
+        # and a RowDescription message describe the rows will be return(nodata message when no return rows)
+        self._send_message(DESCRIBE, STATEMENT + statement_name_bin)
+        # at completion of query message, driver issue a sync message
+        self._write(SYNC_MSG)
 
-            ps["bind_2"] = h_pack(len(output_fc)) + pack("!" + "h" * len(output_fc), *output_fc)
+        try:
+            self._flush()
+        except AttributeError as e:
+            if self._sock is None:
+                raise InterfaceError("connection is closed")
+            else:
+                raise e
 
-            if len(cache["ps"]) > self.max_prepared_statements:
-                for p in cache["ps"].values():
-                    self.close_prepared_statement(p["statement_name_bin"])
-                cache["ps"].clear()
+        self.handle_messages(cursor)
+        self.describe_complete(ps, params)
+
+    def parse_message(self: "Connection", ps: typing.Dict[str, typing.Any], statement: str, params) -> bytearray:
+        """
+        Returns the content of the Parse message creating the prepared statement ``ps``, and stores the send
+        function of each parameter in ``ps``.
+        """
+        ps["param_funcs"] = tuple(x[2] for x in params)
+
+        # Byte1('P') - Identifies the message as a Parse command.
+        # Int32 -   Message length, including self.
+        # String -  Prepared statement name. An empty string selects the
+        #           unnamed prepared statement.
+        # String -  The query string.
+        # Int16 -   Number of parameter data types specified (can be zero).
+        # For each parameter:
+        #   Int32 - The OID of the parameter data type.
+        val: bytearray = bytearray(ps["statement_name_bin"])
+        val.extend(statement.encode(_client_encoding) + NULL_BYTE)
+        val.extend(h_pack(len(params)))
+        for oid, fc, send_func in params:
+            # Parse message doesn't seem to handle the -1 type_oid for NULL
+            # values that other messages handle.  So we'll provide type_oid
+            # 705, the PG "unknown" type.
+            val.extend(i_pack(705 if oid == -1 else oid))
+        return val
+
+    def describe_complete(self: "Connection", ps: typing.Dict[str, typing.Any], params) -> None:
+        """
+        Stores in ``ps`` the functions decoding the rows of its result and the fixed parts of its Bind message, once
+        its row description has been received.
+        """
+        # We've got row_desc that allows us to identify what we're
+        # going to get back from this statement.
+        output_fc = tuple(f.pg8000_fc for f in ps["row_desc"])
+
+        ps["input_funcs"] = tuple(f.func for f in ps["row_desc"])
+        # the decoders used by handle_DATA_ROW and the DB-API description only depend on
+        # the row description, so they are built once here and reused on cache hits.
+        ps["row_decoders"] = self._build_row_decoders(ps["row_desc"])
+        ps["description"] = [f.to_description() for f in ps["row_desc"]] or None
+        # Byte1('B') - Identifies the Bind command.
+        # Int32 - Message length, including self.
+        # String - Name of the destination portal.
+        # String - Name of the source prepared statement.
+        # Int16 - Number of parameter format codes.
+        # For each parameter format code:
+        #   Int16 - The parameter format code.
+        # Int16 - Number of parameter values.
+        # For each parameter value:
+        #   Int32 - The length of the parameter value, in bytes, not
+        #           including this length.  -1 indicates a NULL parameter
+        #           value, in which no value bytes follow.
+        #   Byte[n] - Value of the parameter.
+        # Int16 - The number of result-column format codes.
+        # For each result-column format code:
+        #   Int16 - The format code.
+        param_fcs = tuple(x[1] for x in params)
+        ps["bind_1"] = (
+            NULL_BYTE
+            + ps["statement_name_bin"]
+            + h_pack(len(params))
+            + pack("!" + "h" * len(param_fcs), *param_fcs)
+            + h_pack(len(params))
+        )
 
-            cache["ps"][key] = ps
+        ps["bind_2"] = h_pack(len(output_fc)) + pack("!" + "h" * len(output_fc), *output_fc)
 
-        cursor._cached_rows.clear()
-        cursor._row_count = -1
-        cursor._redshift_row_count = -1
+    def bind_message(self: "Connection", ps: typing.Dict[str, typing.Any], args) -> bytes:
+        """
+        Returns the content of the Bind message binding ``args`` to the prepared statement ``ps``.
+        """
+        return b"".join(self.bind_parts(ps, args))
 
+    def bind_parts(self: "Connection", ps: typing.Dict[str, typing.Any], args) -> typing.List[bytes]:
+        """
+        Returns the parts of the content of the Bind message binding ``args`` to the prepared statement ``ps``, so
+        it is built without copying the parameter values more than once.
+        """
         # Byte1('B') - Identifies the Bind command.
         # Int32 - Message length, including self.
         # String - Name of the destination portal.
@@ -1738,36 +2460,126 @@ class Connection:
         # Int16 - The number of result-column format codes.
         # For each result-column format code:
         #   Int16 - The format code.
-        retval: bytearray = bytearray(ps["bind_1"])
-        for value, send_func in zip(args, ps["param_funcs"]):
+        if len(args) != len(ps["param_funcs"]):
+            # the Bind message declares the number of parameters of the statement, so it can't hold a different number
+            raise ProgrammingError(
+                "the statement takes {} parameters, but {} were given".format(len(ps["param_funcs"]), len(args))
+            )
+        parts: typing.List[bytes] = [ps["bind_1"]]
+        for idx, (value, send_func) in enumerate(zip(args, ps["param_funcs"])):
             if value is None:
-                val = NULL
+                parts.append(NULL)
             else:
-                val = send_func(value)
-                retval.extend(i_pack(len(val)))
-            retval.extend(val)
-        retval.extend(ps["bind_2"])
+                try:
+                    val = send_func(value)
+                except (StructError, OverflowError, TypeError, ValueError) as e:
+                    raise DataError("parameter {} can't be sent as the type of the statement: {}".format(idx + 1, e))
+                parts.append(i_pack(len(val)))
+                parts.append(val)
+        parts.append(ps["bind_2"])
+        return parts
+
+    @_synchronized
+    def execute_prepared(
+        self: "Connection",
+        cursor: Cursor,
+        ps: typing.Dict[str, typing.Any],
+        param_sets: typing.Iterable[typing.Sequence],
+        pipeline_depth: int = 1000,
+    ) -> None:
+        """
+        Executes the prepared statement ``ps`` once for each sequence of parameters in ``param_sets``. Bind and
+        Execute messages for up to ``pipeline_depth`` executions are sent together, followed by a single Sync, so
+        a batch costs one round trip. The rows returned and the row counts of all executions are accumulated in
+        ``cursor``.
 
-        # send BIND message which includes name of parepared statement,
-        # name of destination portal and the value of placeholders in prepared statement.
-        # these parameters need to match the prepared statements
-        self._send_message(BIND, retval)
-        self.send_EXECUTE(cursor)
-        self._write(SYNC_MSG)
-        self._flush()
-        # handle multi messages including BIND_COMPLETE, DATA_ROW, COMMAND_COMPLETE
-        # READY_FOR_QUERY
-        if self.merge_socket_read:
-            self.handle_messages_merge_socket_read(cursor)
-        else:
-            self.handle_messages(cursor)
+        Parameters
+        ----------
+        cursor : :class:`Cursor`
+        ps : Dict[str, Any] A prepared statement created by :func:`Connection.parse_statement`.
+        param_sets : Iterable[Sequence] The positional parameters of each execution.
+        pipeline_depth : int The maximum number of executions sent before their responses are read.
 
-    def _send_message(self: "Connection", code: bytes, data: bytes) -> None:
+        Returns
+        -------
+        None:None
+        """
+        self._check_copy_out_done()
+        cursor.ps = ps
+        cursor._cached_rows.clear()
+        cursor._row_count = -1
+        cursor._redshift_row_count = -1
+
+        batch: bytearray = bytearray()
+        pending: int = 0
+        for args in param_sets:
+            # the messages of a batch are only sent once they have all been built, so a value which can't be
+            # sent leaves no executions pending on the server
+            bind: bytes = self.bind_message(ps, args)
+            batch.extend(BIND)
+            batch.extend(i_pack(len(bind) + 4))
+            batch.extend(bind)
+            batch.extend(EXECUTE_MSG)
+            pending += 1
+            if pending == pipeline_depth:
+                self._sync_prepared(cursor, batch)
+                batch = bytearray()
+                pending = 0
+        if pending > 0:
+            self._sync_prepared(cursor, batch)
+
+    def _sync_prepared(self: "Connection", cursor: Cursor, batch: bytearray) -> None:
+        batch.extend(SYNC_MSG)
         try:
-            self._write(code)
-            self._write(i_pack(len(data) + 4))
-            self._write(data)
-            self._write(FLUSH_MSG)
+            self._write(batch)
+            self._flush()
+        except AttributeError:
+            raise InterfaceError("connection is closed")
+        self.handle_messages(cursor)
+
+    def _build_row_decoders(
+        self: "Connection", row_desc: typing.List[ColumnDescriptor]
+    ) -> typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]]:
+        """
+        Returns the conversion function used for each column of ``row_desc``, paired with the column scale
+        for NUMERIC values received in binary format.
+        """
+        decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]] = []
+        is_binary: bool = self._client_protocol_version == ClientProtocolVersion.BINARY
+        for col in row_desc:
+            if is_binary and col.type_oid == NUMERIC:
+                if col.type_modifier != -1:
+                    scale: int = (col.type_modifier - 4) & 0xFFFF
+                else:
+                    scale = -4 & 0xFFFF
+                decoders.append((col.func, scale))
+            else:
+                decoders.append((col.func,))
+        return decoders
+
+    def _send_message(
+        self: "Connection", code: bytes, data: typing.Union[bytes, bytearray, typing.List[bytes]]
+    ) -> None:
+        """
+        Writes a message whose content is ``data``, or the concatenation of its parts if it is a list. Parts of at
+        least ``ZERO_COPY_SIZE`` bytes are written as they are, so they are sent without being copied, while the
+        others are joined.
+
+        No Flush message follows: each exchange ends with a Sync, which also makes the server send its responses.
+        """
+        try:
+            if not isinstance(data, list):
+                self._write(code + i_pack(len(data) + 4))
+                self._write(data)
+                return
+            self._write(code + i_pack(sum(map(len, data)) + 4))
+            start: int = 0
+            for i, part in enumerate(data):
+                if len(part) >= ZERO_COPY_SIZE:
+                    self._write(b"".join(data[start:i]))
+                    self._write(part)
+                    start = i + 1
+            self._write(b"".join(data[start:]))
         except ValueError as e:
             if str(e) == "write to closed file":
                 raise InterfaceError("connection is closed")
@@ -1803,7 +2615,6 @@ class Connection:
         None:None
         """
         self._write(EXECUTE_MSG)
-        self._write(FLUSH_MSG)
 
     def handle_NO_DATA(self: "Connection", msg, ps) -> None:
         """
@@ -1889,17 +2700,29 @@ class Connection:
 
     def handle_DATA_ROW(self: "Connection", data: bytes, cursor: Cursor) -> None:
         """
-        Handler for DataRow message received via Amazon Redshift wire protocol, represented by b'D' code. Processes
-        incoming data rows from Amazon Redshift into Python data types, storing the transformed row in the cursor
-        object's `_cached_rows`.
+        Handler for DataRow message received via Amazon Redshift wire protocol, represented by b'D' code. Stores the
+        raw message content in the cursor object's `_cached_rows`. Conversion into Python data types is deferred
+        until the row is fetched, see :func:`Cursor._decode_row`, so that columnar fetch methods can decode the
+        payloads directly.
 
-        NoData (B)
-            Byte1('n')
-                Identifies the message as a no-data indicator.
+        DataRow (B)
+            Byte1('D')
+                Identifies the message as a data row.
 
-            Int32(4)
+            Int32
                 Length of message contents in bytes, including self.
 
+            Int16
+                The number of column values that follow (possibly zero).
+
+                Next, the following pair of fields appear for each column:
+
+            Int32
+                The length of the column value, in bytes (this count does not include itself). Can be zero. As a special case, -1 indicates a NULL column value. No value bytes follow in the NULL case.
+
+            Byten
+                The value of the column, in the format indicated by the associated format code. n is the above length.
+
         Parameters
         ----------
         :param data: bytes:
@@ -1911,20 +2734,93 @@ class Connection:
         -------
         None:None
         """
-        data_idx: int = 2
-        row: typing.List = []
-        for desc in cursor.truncated_row_desc():
-            vlen: int = i_unpack(data, data_idx)[0]
-            data_idx += 4
-            if vlen == -1:
-                row.append(None)
-            elif desc[0] == numeric_in_binary:
-                row.append(desc[0](data, data_idx, vlen, desc[1]))
-                data_idx += vlen
-            else:
-                row.append(desc[0](data, data_idx, vlen))
-                data_idx += vlen
-        cursor._cached_rows.append(row)
+        cursor._cached_rows.append(data)
+
+    def _read_message(self: "Connection", read_ahead: bool = False) -> typing.Tuple[bytes, bytes]:
+        """
+        Returns the code and content of the next message received from the server, reading from the socket until
+        the protocol has received it.
+
+        Parameters
+        ----------
+        :param read_ahead: bool
+            Also read the header of the message which follows when reading the exact size of a message, saving a
+            read per message.
+
+        Returns
+        -------
+        The code and content of the message: typing.Tuple[bytes, bytes]
+        """
+        protocol: Protocol = self._get_protocol()
+        message: typing.Optional[typing.Tuple[bytes, bytes]] = protocol.next_message()
+        while message is None:
+            self._receive(read_ahead)
+            message = protocol.next_message()
+        return message
+
+    def _receive(self: "Connection", read_ahead: bool = False) -> None:
+        """
+        Reads bytes from the socket into the protocol: the bytes available, or the rest of a message larger than
+        ``READ_SIZE``.
+        """
+        protocol: Protocol = self._get_protocol()
+        needed: int = protocol.bytes_needed(read_ahead)
+        read_some: typing.Optional[typing.Callable] = getattr(self, "_read_some", None)
+        if read_some is not None and needed <= READ_SIZE:
+            # the messages which have arrived are read together, and framed by the protocol
+            data: bytes = read_some(READ_SIZE)
+        else:
+            data = self._read(needed)
+        if not data:
+            raise InterfaceError("connection is broken: the server closed the connection")
+        protocol.receive(data)
+
+    def _write_pending(self: "Connection", data: typing.Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Writes ``data`` to the protocol, passing the pending messages to the socket once they exceed ``READ_SIZE``
+        so large messages, such as COPY data, aren't held in memory until the socket is flushed.
+        """
+        protocol: Protocol = self._get_protocol()
+        protocol.write(data)
+        if protocol.bytes_to_send > READ_SIZE:
+            self._send_buffers(protocol.buffers_to_send())
+
+    def _send_pending(self: "Connection") -> None:
+        """
+        Sends the messages written to the protocol to the server.
+        """
+        self._send_buffers(self._get_protocol().buffers_to_send())
+        typing.cast(typing.BinaryIO, self._sock).flush()
+
+    def _send_buffers(self: "Connection", buffers: typing.List[typing.Union[bytes, bytearray]]) -> None:
+        """
+        Passes ``buffers`` to the socket. Several buffers are sent together with ``sendmsg`` where the socket
+        supports it, rather than copied into the buffer of the socket file.
+        """
+        sock: typing.BinaryIO = typing.cast(typing.BinaryIO, self._sock)
+        sendmsg: typing.Optional[typing.Callable] = getattr(self, "_sendmsg", None)
+        if sendmsg is None or len(buffers) < 2:
+            for data in buffers:
+                sock.write(data)
+            return
+        # the bytes already written to the socket file are sent first
+        sock.flush()
+        views: typing.List[memoryview] = [memoryview(data) for data in buffers]
+        start: int = 0
+        while start < len(views):
+            sent: int = sendmsg(views[start : start + _MAX_SEND_BUFFERS])
+            while start < len(views) and sent >= len(views[start]):
+                sent -= len(views[start])
+                start += 1
+            if sent > 0:
+                views[start] = views[start][sent:]
+
+    def _get_protocol(self: "Connection") -> Protocol:
+        try:
+            return self._protocol
+        except AttributeError:
+            self._protocol = Protocol()
+            return self._protocol
 
     def handle_messages(self: "Connection", cursor: Cursor) -> None:
         """
@@ -1939,15 +2835,55 @@ class Connection:
         -------
         None:None
         """
-        code = self.error = None
+        self._dispatch_messages(cursor)
 
-        while code != READY_FOR_QUERY:
-            code, data_len = ci_unpack(self._read(5))
-            self.message_types[code](self._read(data_len - 4), cursor)
+    def copy_out_data(self: "Connection", cursor: Cursor) -> typing.Iterator[bytes]:
+        """
+        Yields the content of each CopyData message of a ``COPY ... TO STDOUT`` executed with a
+        :class:`CopyOutStream`, reading each message from the socket only when the next value is requested. The
+        remaining messages are read and discarded if the iteration is abandoned, so the connection can be reused.
+
+        Parameters
+        ----------
+        :param cursor: `Cursor`
+            The `Cursor` object which executed the statement.
+
+        Returns
+        -------
+        The content of each CopyData message, typically a single row: Iterator[bytes]
+        """
+        if not self._copy_out_pending:
+            return
+        code = None
+        try:
+            while code != READY_FOR_QUERY:
+                code, data = self._read_message()
+                if code == COPY_DATA:
+                    yield data
+                else:
+                    self.message_types[code](data, cursor)
+        except GeneratorExit:
+            while code != READY_FOR_QUERY:
+                code, data = self._read_message()
+                if code != COPY_DATA:
+                    self.message_types[code](data, cursor)
+            raise
+        finally:
+            self._copy_out_pending = False
 
         if self.error is not None:
             raise self.error
 
+    def _check_copy_out_done(self: "Connection") -> None:
+        """
+        Raises :class:`InterfaceError` while the data of a ``COPY ... TO STDOUT`` read by
+        :func:`Connection.copy_out_data` is pending, as the server only answers another message once it is all sent.
+        """
+        if self._copy_out_pending:
+            raise InterfaceError(
+                "the data of a COPY ... TO STDOUT is pending, read or close its iterator before using the connection"
+            )
+
     def handle_messages_merge_socket_read(self: "Connection", cursor: Cursor):
         """
         An optimized version of :func:`Connection.handle_messages` which reduces reads.
@@ -1961,25 +2897,32 @@ class Connection:
         -------
         None:None
         """
+        # when the socket is read by exact sizes, the body of each message is read together with the header of the
+        # message which follows
+        self._dispatch_messages(cursor, read_ahead=True)
+
+    def _dispatch_messages(self: "Connection", cursor: Cursor, read_ahead: bool = False) -> None:
+        """
+        Passes each message received to its handler until the server is ready for a new query, or a
+        ``COPY ... TO STDOUT`` whose data is read by :func:`Connection.copy_out_data` starts.
+        """
         code = self.error = None
-        # read 5 bytes of message firstly
-        code, data_len = ci_unpack(self._read(5))
-
-        while True:
-            if code == READY_FOR_QUERY:
-                # for last message
-                self.message_types[code](self._read(data_len - 4), cursor)
-                break
+        protocol: Protocol = self._get_protocol()
+
+        while code != READY_FOR_QUERY:
+            for code, data in protocol.messages():
+                self.message_types[code](data, cursor)
+                if code == READY_FOR_QUERY:
+                    break
+                if code == COPY_OUT_RESPONSE and self._copy_out_pending:
+                    return
             else:
-                # read data body of last message and read next 5 bytes of next message
-                data = self._read(data_len - 4 + 5)
-                last_message_body = data[0:-5]
-                self.message_types[code](last_message_body, cursor)
-                code, data_len = ci_unpack(data[-5:])
+                self._receive(read_ahead)
 
         if self.error is not None:
             raise self.error
 
+    @_synchronized
     def close_prepared_statement(self: "Connection", statement_name_bin: bytes) -> None:
         """
         Handler for Close message received via Amazon Redshift wire protocol, represented by b'C' code. Clears attributes
@@ -2007,6 +2950,11 @@ class Connection:
         -------
         None:None
         """
+        if self._closing is not None:
+            # the external transport closes the statement before it executes the next one
+            self._closing.append(statement_name_bin)
+            return
+        self._check_copy_out_done()
         self._send_message(CLOSE, STATEMENT + statement_name_bin)
         self._write(SYNC_MSG)
         self._flush()
@@ -2204,6 +3152,7 @@ class Connection:
         """
         return (format_id, global_transaction_id, branch_qualifier)
 
+    @_synchronized
     def tpc_begin(self: "Connection", xid) -> None:
         """Begins a TPC transaction with the given transaction ID xid.
 
@@ -2225,6 +3174,7 @@ class Connection:
         if self.autocommit:
             self.execute(self._cursor, "begin transaction", None)
 
+    @_synchronized
     def tpc_prepare(self: "Connection") -> None:
         """Performs the first phase of a transaction started with .tpc_begin().
         A ProgrammingError is be raised if this method is called outside of a
@@ -2246,6 +3196,7 @@ class Connection:
         q: str = "PREPARE TRANSACTION '%s';" % (self._xid[1],)
         self.execute(self._cursor, q, None)
 
+    @_synchronized
     def tpc_commit(self: "Connection", xid=None) -> None:
         """When called with no arguments, .tpc_commit() commits a TPC
         transaction previously prepared with .tpc_prepare().
@@ -2286,6 +3237,7 @@ class Connection:
             self.autocommit = previous_autocommit_mode
         self._xid = None
 
+    @_synchronized
     def tpc_rollback(self: "Connection", xid=None) -> None:
         """When called with no arguments, .tpc_rollback() rolls back a TPC
         transaction. It may be called before or after .tpc_prepare().
@@ -2323,6 +3275,7 @@ class Connection:
             self.autocommit = previous_autocommit_mode
         self._xid = None
 
+    @_synchronized
     def tpc_recover(self: "Connection") -> typing.List[typing.Tuple[typing.Any, ...]]:
         """Returns a list of pending transaction IDs suitable for use with
         .tpc_commit(xid) or .tpc_rollback(xid).
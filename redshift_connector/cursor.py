@@ -1,31 +1,70 @@
-import functools
 import logging
+import os
 import re
+import time
 import typing
+import uuid
 from collections import deque
-from itertools import count, islice
+from itertools import chain, count, islice
 from typing import TYPE_CHECKING
 from warnings import warn
 
 import redshift_connector
-from redshift_connector.config import ClientProtocolVersion, table_type_clauses
+from redshift_connector.config import _client_encoding, table_type_clauses
 from redshift_connector.error import (
     MISSING_MODULE_ERROR_MSG,
     InterfaceError,
     ProgrammingError,
 )
+from redshift_connector.prepared_statement import PreparedStatement
+from redshift_connector.retry import RetryPolicy, is_idempotent_read
+from redshift_connector.utils import i_unpack, numeric_in_binary
+from redshift_connector.utils.columnar import take_rows
+from redshift_connector.utils.copy_util import (
+    DEFAULT_COPY_FRAME_SIZE,
+    CopyInSource,
+    CopyOutIterator,
+    CopyOutStream,
+    CopyStats,
+    text_copy_fields,
+)
+from redshift_connector.utils.insert_util import (
+    DEFAULT_MAX_BATCH_BYTES,
+    MAX_BIND_PARAMETERS,
+    MultiRowInsert,
+    batch_shape,
+    declared_type_oid,
+    text_coercer,
+    upsert_statements,
+)
+from redshift_connector.utils.lock_util import (
+    connection_lock,
+    synchronized,
+)
+from redshift_connector.utils.result_buffer import ResultBuffer
+from redshift_connector.utils.type_utils import type_oids_by_name
 
 if TYPE_CHECKING:
+    from redshift_connector.column_descriptor import ColumnDescriptor
     from redshift_connector.core import Connection
 
     try:
         import numpy  # type: ignore
         import pandas  # type: ignore
+        import pyarrow  # type: ignore
     except:
         pass
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# a single row INSERT ... VALUES statement whose values are all parameters, after conversion by convert_paramstyle
+_single_row_insert_re: typing.Pattern = re.compile(
+    r"^\s*(insert\s+into\s+.+?\s+values)\s*(\(\s*\$\d+(?:\s*,\s*\$\d+)*\s*\))\s*;?\s*$", re.IGNORECASE | re.DOTALL
+)
+
+# holds the lock of a thread-safe connection while a method of one of its cursors runs
+_synchronized = synchronized(lambda cursor: cursor._c)
+
 
 class Cursor:
     """A cursor object is returned by the :meth:`~Connection.cursor` method of
@@ -72,11 +111,31 @@ class Cursor:
         This read-only attribute is a sequence of 7-item sequences.  Each value
         contains information describing one result column.  The 7 items
         returned for each column are (name, type_code, display_size,
-        internal_size, precision, scale, null_ok).  Only the first two values
-        are provided by the current implementation.
+        internal_size, precision, scale, null_ok).  Values which cannot be
+        determined for a column's type are ``None``. ``null_ok`` is only
+        provided when the server supports extended result metadata.
 
         This attribute is part of the `DBAPI 2.0 specification
         <http://www.python.org/dev/peps/pep-0249/>`_.
+
+    .. attribute:: max_result_memory
+
+        The maximum number of bytes of received rows held in memory for the
+        result of a statement, or ``None`` if there is no limit. Defaults to
+        the ``max_result_memory`` of the connection.
+
+    .. attribute:: spill_results
+
+        Whether rows received beyond :attr:`max_result_memory` are held in a
+        temporary file and read back as they are fetched. If ``False`` the
+        statement fails instead, once all of its rows have been received.
+        Defaults to the ``spill_results`` of the connection.
+
+    .. attribute:: copy_stats
+
+        This read-only attribute holds a :class:`CopyStats` describing the
+        data sent by the last ``COPY ... FROM STDIN`` executed by the cursor,
+        or ``None``.
     """
 
     def __init__(self: "Cursor", connection: "Connection", paramstyle=None) -> None:
@@ -95,7 +154,11 @@ class Cursor:
         self.ps: typing.Optional[typing.Dict[str, typing.Any]] = None
         self._row_count: int = -1
         self._redshift_row_count: int = -1
-        self._cached_rows: deque = deque()
+        self._cached_rows: typing.Union[deque, ResultBuffer] = deque()
+        self._input_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]] = None
+        self.copy_stats: typing.Optional[CopyStats] = None
+        self.max_result_memory: typing.Optional[int] = connection.max_result_memory
+        self.spill_results: bool = connection.spill_results
         if paramstyle is None:
             self.paramstyle: str = redshift_connector.paramstyle
         else:
@@ -138,46 +201,39 @@ class Cursor:
         """
         return self._redshift_row_count
 
-    @typing.no_type_check
-    @functools.lru_cache()
-    def truncated_row_desc(self: "Cursor"):
-        _data: typing.List[
-            typing.Optional[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]]
-        ] = []
-
-        for cidx in range(len(self.ps["row_desc"])):
-            if self._c._client_protocol_version == ClientProtocolVersion.BINARY and self.ps["row_desc"][cidx][
-                "type_oid"
-            ] in (1700,):
-                scale: int
-                if self.ps["row_desc"][cidx]["type_modifier"] != -1:
-                    scale = (self.ps["row_desc"][cidx]["type_modifier"] - 4) & 0xFFFF
-                else:
-                    scale = -4 & 0xFFFF
-                _data.append((self.ps["input_funcs"][cidx], scale))
-            else:
-                _data.append((self.ps["input_funcs"][cidx],))
-
-        return _data
+    def truncated_row_desc(
+        self: "Cursor",
+    ) -> typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]]:
+        """
+        Returns the conversion function, and scale for binary NUMERIC columns, of each column in the
+        current result. This is computed once per prepared statement and stored alongside it.
+        """
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        try:
+            return ps["row_decoders"]
+        except KeyError:
+            ps["row_decoders"] = typing.cast("Connection", self._c)._build_row_decoders(ps["row_desc"])
+            return ps["row_decoders"]
 
     description = property(lambda self: self._getDescription())
 
-    def _getDescription(self: "Cursor") -> typing.Optional[typing.List[typing.Optional[typing.Tuple]]]:
+    def _getDescription(self: "Cursor") -> typing.Optional[typing.List[typing.Tuple]]:
         if self.ps is None:
             return None
-        row_desc: typing.List[typing.Dict[str, typing.Union[bytes, int, typing.Callable]]] = self.ps["row_desc"]
-        if len(row_desc) == 0:
-            return None
-        columns: typing.List[typing.Optional[typing.Tuple]] = []
-        for col in row_desc:
-            columns.append((col["label"], col["type_oid"], None, None, None, None, None))
-        return columns
+        try:
+            return self.ps["description"]
+        except KeyError:
+            pass
+        row_desc: typing.List["ColumnDescriptor"] = self.ps["row_desc"]
+        self.ps["description"] = [col.to_description() for col in row_desc] or None
+        return self.ps["description"]
 
     ##
     # Executes a database operation.  Parameters may be provided as a sequence
     # or mapping and will be bound to variables in the operation.
     # <p>
     # Stability: Part of the DBAPI 2.0 specification.
+    @_synchronized
     def execute(self: "Cursor", operation, args=None, stream=None, merge_socket_read=False) -> "Cursor":
         """Executes a database operation.  Parameters may be provided as a
         sequence, or as a mapping, depending upon the value of
@@ -201,7 +257,8 @@ class Cursor:
             `COPY
             <https://docs.aws.amazon.com/redshift/latest/dg/r_COPY.html>`_
             command. For a COPY FROM the parameter must be a readable file-like
-            object, and for COPY TO it must be writable.
+            object, an iterable of ``bytes`` chunks or of rows, or a
+            :class:`CopyInSource`. For COPY TO it must be writable.
 
             .. versionadded:: 1.9.11
 
@@ -215,24 +272,127 @@ class Cursor:
         if self._c._sock is None:
             raise InterfaceError("connection is closed")
 
+        # a read which starts a transaction is executed again if the connection breaks or its transaction is aborted
+        retry_policy: typing.Optional[RetryPolicy] = None
+        if stream is None and not self._c.in_transaction and is_idempotent_read(operation):
+            retry_policy = self._c.retry_policy
         try:
-            self.stream = stream
+            if isinstance(retry_policy, RetryPolicy):
+                connection: "Connection" = self._c
+                retry_policy.run(
+                    connection, lambda: self.__execute(connection, operation, args, stream, merge_socket_read)
+                )
+            else:
+                self.__execute(self._c, operation, args, stream, merge_socket_read)
+        finally:
+            # the parameter types declared by setinputsizes only apply to this operation
+            self._input_oids = None
+        self._check_result_buffer()
+        return self
 
-            # a miniaturized version of the row description is cached to speed up
-            # processing data from server. It needs to be cleared with each statement
-            # execution.
-            self.truncated_row_desc.cache_clear()
+    def __execute(self: "Cursor", connection: "Connection", operation, args, stream, merge_socket_read: bool) -> None:
+        try:
+            self.stream = stream
 
             # For Redshift, we need to begin transaction and then to process query
             # In the end we can use commit or rollback to end the transaction
-            if not self._c.in_transaction and not self._c.autocommit:
-                self._c.execute(self, "begin transaction", None)
-            self._c.merge_socket_read = merge_socket_read
-            self._c.execute(self, operation, args)
+            if not connection.in_transaction and not connection.autocommit:
+                connection.execute(self, "begin transaction", None)
+            connection.merge_socket_read = merge_socket_read
+            self._prepare_result_buffer()
+            connection.execute(self, operation, args)
         except AttributeError as e:
             raise e
+
+    def prepare(self: "Cursor", operation: str, types: typing.Optional[typing.Sequence] = None) -> PreparedStatement:
+        """
+        Prepares a statement on the server, returning a handle which executes it with different parameters without
+        converting the statement, looking up the statement cache of the connection or inferring the parameter
+        types on each execution. The handle should be closed once it is no longer needed.
+
+        Parameters
+        ----------
+        operation : str The SQL statement, in the paramstyle of the cursor.
+        types : Optional[Sequence] For each parameter, in order, either the type oid of the parameter, a Python type mapped to an Amazon Redshift type, or ``None`` if the type should be inferred from the value of the first execution. If unspecified, the type of every parameter is inferred.
+
+        Returns
+        -------
+        The prepared statement: :class:`PreparedStatement`
+        """
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        if self._c._sock is None:
+            raise InterfaceError("connection is closed")
+        from redshift_connector.core import convert_paramstyle
+
+        statement, make_args = convert_paramstyle(self.paramstyle, operation)
+        if self.paramstyle in ("numeric", "qmark", "format"):
+            make_args = None
+        param_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]] = (
+            self.__type_oids(types) if types is not None else None
+        )
+        return PreparedStatement(self, operation, statement, make_args, param_oids)
+
+    @_synchronized
+    def _execute_prepared(
+        self: "Cursor",
+        parse: typing.Callable[[typing.Sequence], typing.Dict[str, typing.Any]],
+        param_sets: typing.Iterable[typing.Sequence],
+    ) -> "Cursor":
+        """
+        Executes a :class:`PreparedStatement` once for each set of positional parameters in ``param_sets``.
+        ``parse`` returns the prepared statement, creating it from the values of the first set if needed.
+        """
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        if self._c._sock is None:
+            raise InterfaceError("connection is closed")
+
+        if not self._c.in_transaction and not self._c.autocommit:
+            self._c.execute(self, "begin transaction", None)
+        self._prepare_result_buffer()
+        param_sets = iter(param_sets)
+        first: typing.Optional[typing.Sequence] = next(param_sets, None)
+        if first is None:
+            self._cached_rows.clear()
+            self._row_count = self._redshift_row_count = 0
+            return self
+        self._c.execute_prepared(self, parse(first), chain((first,), param_sets))
+        self._check_result_buffer()
         return self
 
+    def _check_result_buffer(self: "Cursor") -> None:
+        """
+        Raises :class:`InterfaceError` if rows of the last result were discarded because it exceeded
+        ``max_result_memory``.
+        """
+        rows: typing.Any = getattr(self, "_cached_rows", None)
+        if isinstance(rows, ResultBuffer) and rows.overflowed:
+            rows.clear()
+            raise InterfaceError(
+                "The result of the statement exceeds max_result_memory of {} bytes. Enable spill_results to hold "
+                "the rows beyond it in a temporary file, or reduce the number of rows selected".format(
+                    self.max_result_memory
+                )
+            )
+
+    def _prepare_result_buffer(self: "Cursor") -> None:
+        """
+        Uses a :class:`ResultBuffer` to hold the rows of the next result if the memory held by results is limited.
+        """
+        max_result_memory: typing.Optional[int] = getattr(self, "max_result_memory", None)
+        rows: typing.Any = getattr(self, "_cached_rows", None)
+        if max_result_memory is None:
+            if isinstance(rows, ResultBuffer):
+                rows.close()
+                self._cached_rows = deque()
+            return
+        if not isinstance(rows, ResultBuffer):
+            rows = self._cached_rows = ResultBuffer(max_result_memory)
+        rows.max_memory = max_result_memory
+        rows.spill = self.spill_results
+
+    @_synchronized
     def executemany(self: "Cursor", operation, param_sets) -> "Cursor":
         """Prepare a database operation, and then execute it against all
         parameter sequences or mappings provided.
@@ -247,21 +407,246 @@ class Cursor:
             in the sequence should be sequences or mappings of parameters, the
             same as the args argument of the :meth:`execute` method.
 
+        A single row ``INSERT ... VALUES`` statement whose values are all
+        parameters is rewritten into statements inserting up to
+        :attr:`Connection.executemany_page_size` rows each, rather than being
+        executed once per parameter set. Only consecutive parameter sets
+        whose values are bound with the same types are inserted by the same
+        statement, so each value is sent as it would be by :meth:`execute`.
+
         Returns
         -------
         The Cursor object used for executing the specified database operation: :class:`Cursor`
         """
+        # the parameter types declared by setinputsizes apply to each parameter set
+        input_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]] = getattr(self, "_input_oids", None)
+        page_size: int = getattr(self._c, "executemany_page_size", 1)
+        if page_size > 1:
+            single_row_insert = self.__parse_single_row_insert(operation)
+            if single_row_insert is not None:
+                return self.__executemany_multirow(*single_row_insert, param_sets, page_size, input_oids)
+
         rowcounts: typing.List[int] = []
         redshift_rowcounts: typing.List[int] = []
-        for parameters in param_sets:
-            self.execute(operation, parameters)
-            rowcounts.append(self._row_count)
-            redshift_rowcounts.append(self._redshift_row_count)
+        try:
+            for parameters in param_sets:
+                self._input_oids = input_oids
+                self.execute(operation, parameters)
+                rowcounts.append(self._row_count)
+                redshift_rowcounts.append(self._redshift_row_count)
+        finally:
+            self._input_oids = None
 
         self._row_count = -1 if -1 in rowcounts else sum(rowcounts)
         self._redshift_row_count = -1 if -1 in redshift_rowcounts else sum(rowcounts)
         return self
 
+    def __parse_single_row_insert(
+        self: "Cursor", operation: str
+    ) -> typing.Optional[typing.Tuple[str, typing.List[int], typing.Callable]]:
+        """
+        Returns the statement up to and including ``VALUES``, the parameter numbers in the row of values and the
+        function ordering a parameter set if `operation` is a single row ``INSERT ... VALUES`` statement whose
+        values are all parameters, otherwise None.
+        """
+        from redshift_connector.core import convert_paramstyle
+
+        statement, make_args = convert_paramstyle(self.paramstyle, operation)
+        if "--" in statement or "/*" in statement:
+            return None
+        match: typing.Optional[typing.Match] = _single_row_insert_re.match(statement)
+        if match is None or "$" in match.group(1):
+            return None
+        placeholders: typing.List[int] = [int(p) for p in re.findall(r"\$(\d+)", match.group(2))]
+        return match.group(1), placeholders, make_args
+
+    def __executemany_multirow(
+        self: "Cursor",
+        prefix: str,
+        placeholders: typing.List[int],
+        make_args: typing.Callable,
+        param_sets,
+        page_size: int,
+        input_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]],
+    ) -> "Cursor":
+        num_params: int = max(placeholders)
+        if input_oids is not None:
+            input_oids = (input_oids + (None,) * num_params)[:num_params]
+        page_size = max(1, min(page_size, MAX_BIND_PARAMETERS // num_params))
+        statements: typing.Dict[int, str] = {}
+        row_count: int = 0
+        redshift_row_count: int = 0
+
+        def insert(rows: typing.List[typing.Sequence]) -> None:
+            nonlocal row_count, redshift_row_count
+            start: int = 0
+            while start < len(rows):
+                num_rows: int = batch_shape(len(rows) - start, page_size)
+                if num_rows not in statements:
+                    statements[num_rows] = (
+                        prefix
+                        + " "
+                        + ", ".join(
+                            "(" + ", ".join("$" + str(row * num_params + p) for p in placeholders) + ")"
+                            for row in range(num_rows)
+                        )
+                    )
+                args: typing.List = [v for row_args in rows[start : start + num_rows] for v in row_args]
+                self._input_oids = input_oids * num_rows if input_oids is not None else None
+                self.execute(statements[num_rows], args)
+                row_count = -1 if -1 in (row_count, self._row_count) else row_count + self._row_count
+                redshift_row_count = (
+                    -1
+                    if -1 in (redshift_row_count, self._redshift_row_count)
+                    else redshift_row_count + self._redshift_row_count
+                )
+                start += num_rows
+
+        temp = self.paramstyle
+        # the statement is built from parameters already numbered by convert_paramstyle
+        self.paramstyle = "numeric"
+        try:
+            # consecutive rows whose parameters have the same types, so they are bound as they would be by
+            # executing the statement once per row
+            run: typing.List[typing.Sequence] = []
+            run_types: typing.Optional[typing.Tuple] = None
+            for parameters in param_sets:
+                row_args = make_args(parameters)
+                if len(row_args) != num_params:
+                    raise InterfaceError(
+                        "executemany parameter set has {} values but the statement has {} parameters".format(
+                            len(row_args), num_params
+                        )
+                    )
+                row_types: typing.Tuple = tuple(
+                    param[0] for param in typing.cast("Connection", self._c).make_params(row_args, input_oids)
+                )
+                if len(run) > 0 and (row_types != run_types or len(run) == page_size):
+                    insert(run)
+                    run = []
+                run.append(row_args)
+                run_types = row_types
+            insert(run)
+        finally:
+            # reset paramstyle to it's original value
+            self.paramstyle = temp
+            self._input_oids = None
+
+        self._row_count = row_count
+        self._redshift_row_count = redshift_row_count
+        return self
+
+    def copy_in(
+        self: "Cursor",
+        operation: str,
+        data: typing.Any,
+        delimiter: str = ",",
+        frame_size: int = DEFAULT_COPY_FRAME_SIZE,
+    ) -> CopyStats:
+        """
+        Executes a ``COPY ... FROM STDIN`` statement, sending ``data`` as the COPY data.
+        This method is native to redshift_connector.
+
+        Rows are serialized in the ``CSV`` format as they are read, so `operation` must specify the ``CSV`` format
+        and `delimiter` when `data` holds rows. The data is sent in CopyData messages of about `frame_size` bytes
+        each, which are only flushed to the network once all the data is sent.
+
+        Parameters
+        ----------
+        operation : str The ``COPY ... FROM STDIN`` statement to execute
+        data : Any A readable binary file-like object, or an iterable of ``bytes`` chunks or of rows. ``None`` values of rows are written as NULL
+        delimiter : str The delimiter separating the values of each row. Defaults to ","
+        frame_size : int The approximate size, in bytes, of each CopyData message. Defaults to 1 MiB
+
+        Returns
+        -------
+        The number of rows and bytes copied and the time taken: :class:`CopyStats`
+        """
+        self.execute(operation, stream=CopyInSource(data, delimiter=delimiter, frame_size=frame_size))
+        stats: CopyStats = typing.cast(CopyStats, self.copy_stats)
+        if self._row_count >= 0:
+            # the number of rows loaded as reported by the server, as chunks of data are not split into rows
+            stats.rows = self._row_count
+        return stats
+
+    def copy_out_chunks(self: "Cursor", operation: str, args=None) -> CopyOutIterator:
+        """
+        Executes a ``COPY ... TO STDOUT`` statement and returns an iterator over the COPY data, yielding the content
+        of each CopyData message, typically one row, as it arrives. Data is only read from the connection as the
+        iterator is consumed. Using the connection for another statement raises :class:`InterfaceError` until the
+        iterator is exhausted or closed, in which case the remaining data is discarded, even if no data was read
+        yet. An iterator which is garbage collected is closed. On a thread-safe connection, the statements of other
+        threads wait until then, and the iterator must be consumed and closed by the thread which created it.
+        This method is native to redshift_connector.
+
+        Parameters
+        ----------
+        operation : str The ``COPY ... TO STDOUT`` statement to execute
+        args : Optional parameters of `operation`. See :meth:`execute`
+
+        Returns
+        -------
+        The COPY data: :class:`CopyOutIterator`
+        """
+        lock: typing.Optional[typing.Any] = connection_lock(self._c)
+        if lock is None:
+            return CopyOutIterator(self.__copy_out_chunks(operation, args))
+        # a thread-safe connection is held by the thread reading the COPY data until it has all been read
+        lock.acquire()
+        try:
+            chunks: typing.Iterator[bytes] = self.__copy_out_chunks(operation, args)
+        except BaseException:
+            lock.release()
+            raise
+        return CopyOutIterator(chunks, lock=lock)
+
+    def __copy_out_chunks(self: "Cursor", operation: str, args) -> typing.Iterator[bytes]:
+        self.execute(operation, args, stream=CopyOutStream())
+        conn: "Connection" = typing.cast("Connection", self._c)
+        if not conn._copy_out_pending:
+            raise InterfaceError("copy_out_chunks requires a COPY ... TO STDOUT statement")
+        return conn.copy_out_data(self)
+
+    def copy_out_rows(
+        self: "Cursor",
+        operation: str,
+        args=None,
+        csv: bool = False,
+        delimiter: typing.Optional[str] = None,
+        null: str = "\\N",
+    ) -> CopyOutIterator:
+        """
+        Executes a ``COPY ... TO STDOUT`` statement and returns an iterator over the rows of the COPY data, each a list
+        of the text values of the row, decoded as each row arrives. See :meth:`copy_out_chunks`.
+        This method is native to redshift_connector.
+
+        Parameters
+        ----------
+        operation : str The ``COPY ... TO STDOUT`` statement to execute
+        args : Optional parameters of `operation`. See :meth:`execute`
+        csv : bool Whether `operation` uses the ``CSV`` format rather than the text format. Defaults to False
+        delimiter : Optional[str] The delimiter used by `operation`. Defaults to a tab in the text format and a comma in the ``CSV`` format
+        null : str The representation of NULL values used by `operation` in the text format. Defaults to "\\N"
+
+        Returns
+        -------
+        The rows of the COPY data. NULL values are ``None`` in the text format and empty strings in the ``CSV`` format: :class:`CopyOutIterator`
+        """
+
+        def rows(chunks: typing.Iterator[bytes]) -> typing.Iterator[typing.List[typing.Optional[str]]]:
+            lines: typing.Iterator[str] = (chunk.decode(_client_encoding) for chunk in chunks)
+            if csv:
+                import csv as csv_module
+
+                yield from csv_module.reader(lines, delimiter=delimiter or ",")
+            else:
+                text_delimiter: str = delimiter or "\t"
+                for line in lines:
+                    yield text_copy_fields(line, text_delimiter, null)
+
+        # closing the rows closes the chunks, which discards the remaining data
+        return CopyOutIterator(self.copy_out_chunks(operation, args), convert=rows)
+
     def insert_data_bulk(
         self: "Cursor",
         filename: str,
@@ -270,10 +655,16 @@ class Cursor:
         column_names: typing.List[str],
         delimiter: str,
         batch_size: int = 1,
+        progress: typing.Optional[typing.Callable[[int, float], None]] = None,
     ) -> "Cursor":
-
         """runs a single bulk insert statement into the database.
         This method is native to redshift_connector.
+
+        The file is read as rows are inserted. Values are validated against
+        the declared types of the target columns as they are read, and empty
+        values of non-character columns are inserted as NULL. Rows are sent
+        using one prepared statement holding ``batch_size`` rows, with the
+        remaining rows sent in batches holding a power of two number of rows.
          :param filename: str
              The name of the file to read from.
          :param table_name: str
@@ -286,80 +677,101 @@ class Cursor:
              The delimiter to use when reading the file.
         :param batch_size: int
             The number of rows to insert per insert statement. Minimum allowed value is 1.
+        :param progress: Optional[Callable[[int, float], None]]
+            Called after each batch of rows is inserted with the number of rows inserted so far and the
+            number of rows inserted per second.
          Returns
          -------
          The Cursor object used for executing the specified database operation: :class:`Cursor`
         """
         if batch_size < 1:
             raise InterfaceError("batch_size must be greater than 1")
+        if len(column_names) != len(parameter_indices):
+            raise InterfaceError("Column names and parameter indexes must be the same length")
         if not self.__is_valid_table(table_name):
             raise InterfaceError("Invalid table name passed to insert_data_bulk: {}".format(table_name))
-        if not self.__has_valid_columns(table_name, column_names):
-            raise InterfaceError("Invalid column names passed to insert_data_bulk: {}".format(table_name))
-        orig_paramstyle = self.paramstyle
+        data_types: typing.List[str] = self.__get_column_data_types(table_name, column_names)
         import csv
 
-        if len(column_names) != len(parameter_indices):
-            raise InterfaceError("Column names and parameter indexes must be the same length")
-        base_stmt = f"INSERT INTO  {table_name} ("
-        base_stmt += ", ".join(column_names)
-        base_stmt += ") VALUES "
-        sql_param_list_template = "(" + ", ".join(["%s"] * len(parameter_indices)) + ")"
+        coercers: typing.List[typing.Callable[[str], typing.Optional[str]]] = [text_coercer(t) for t in data_types]
+        writer: MultiRowInsert = MultiRowInsert(
+            self,
+            table_name,
+            column_names,
+            len(column_names),
+            max_rows=batch_size,
+            param_oids=[declared_type_oid(t) for t in data_types],
+        )
+        start_time: float = time.perf_counter()
+
+        def report(rows_sent: int) -> None:
+            elapsed: float = time.perf_counter() - start_time
+            rows_per_second: float = rows_sent / elapsed if elapsed > 0 else 0.0
+            _logger.debug("insert_data_bulk inserted %s rows (%.1f rows/s)", rows_sent, rows_per_second)
+            if progress is not None:
+                progress(rows_sent, rows_per_second)
+
         try:
             with open(filename) as csv_file:
                 reader = csv.reader(csv_file, delimiter=delimiter)
                 next(reader)
-                values_list: typing.List[str] = []
-                row_count = 0
-                for row in reader:
-                    if row_count == batch_size:
-                        sql_param_lists = [sql_param_list_template] * row_count
-                        insert_stmt = base_stmt + ", ".join(sql_param_lists) + ";"
-                        self.execute(insert_stmt, values_list)
-                        row_count = 0
-                        values_list.clear()
-
-                    for column_index in parameter_indices:
-                        values_list.append(row[column_index])
-
-                    row_count += 1
-
-                if row_count:
-                    sql_param_lists = [sql_param_list_template] * row_count
-                    insert_stmt = base_stmt + ", ".join(sql_param_lists) + ";"
-                    self.execute(insert_stmt, values_list)
 
+                def rows() -> typing.Iterator[typing.List[typing.Optional[str]]]:
+                    for row in reader:
+                        values: typing.List[typing.Optional[str]] = []
+                        for coerce, column_index, data_type in zip(coercers, parameter_indices, data_types):
+                            try:
+                                values.append(coerce(row[column_index]))
+                            except (ValueError, ArithmeticError):
+                                raise InterfaceError(
+                                    "Invalid {} value {!r} on line {} of {}".format(
+                                        data_type, row[column_index], reader.line_num, filename
+                                    )
+                                )
+                        yield values
+
+                self._row_count = writer.execute(rows(), report)
         except Exception as e:
             raise InterfaceError(e)
-        finally:
-            # reset paramstyle to it's original value
-            self.paramstyle = orig_paramstyle
 
         return self
 
-    def __has_valid_columns(self: "Cursor", table: str, columns: typing.List[str]) -> bool:
+    def _check_table_columns(self: "Cursor", table: str, columns: typing.Sequence[str], caller: str) -> None:
+        """
+        Raises :class:`InterfaceError` unless ``table`` and each of ``columns`` are found in the catalog, so their
+        names can be part of statements built by ``caller``.
+        """
+        if not self.__is_valid_table(table):
+            raise InterfaceError("Invalid table name passed to {}: {}".format(caller, table))
+        self.__get_column_data_types(table, list(columns))
+
+    def __get_column_data_types(self: "Cursor", table: str, columns: typing.List[str]) -> typing.List[str]:
+        """
+        Returns the ``information_schema.columns.data_type`` of each of ``columns`` in ``table``, retrieved
+        using a single catalog query.
+        """
         split_table_name: typing.List[str] = table.split(".")
-        q: str = "select 1 from information_schema.columns where table_name = ? and column_name = ?"
+        q: str = "select column_name, data_type from information_schema.columns where table_name = ?"
         if len(split_table_name) == 2:
             q += " and table_schema = ?"
-            param_list = [[split_table_name[1], c, split_table_name[0]] for c in columns]
+            params: typing.List[str] = [split_table_name[1], split_table_name[0]]
         else:
-            param_list = [[split_table_name[0], c] for c in columns]
+            params = [split_table_name[0]]
         temp = self.paramstyle
         self.paramstyle = "qmark"
         try:
-            for params in param_list:
-                self.execute(q, params)
-                res = self.fetchone()
-                if typing.cast(typing.List[int], res)[0] != 1:
-                    raise InterfaceError("Invalid column name: {} specified for table: {}".format(params[1], table))
+            self.execute(q, params)
+            declared: typing.Dict[str, str] = {row[0]: row[1] for row in self.fetchall()}
         except:
             raise
         finally:
             # reset paramstyle to it's original value
             self.paramstyle = temp
 
-        return True
+        for column in columns:
+            if column not in declared:
+                raise InterfaceError("Invalid column name: {} specified for table: {}".format(column, table))
+        return [declared[column] for column in columns]
 
     def callproc(self, procname, parameters=None):
         args = [] if parameters is None else parameters
@@ -450,6 +862,10 @@ class Cursor:
         -------
         None:None
         """
+        rows: typing.Any = getattr(self, "_cached_rows", None)
+        if isinstance(rows, ResultBuffer):
+            # removes the temporary file holding spilled rows
+            rows.close()
         self._c = None
 
     def __iter__(self: "Cursor") -> "Cursor":
@@ -459,12 +875,62 @@ class Cursor:
         """
         return self
 
-    def setinputsizes(self: "Cursor", *sizes):
-        """This method is part of the `DBAPI 2.0 specification
-        <http://www.python.org/dev/peps/pep-0249/>`_, however, it is not
-        implemented.
+    def setinputsizes(self: "Cursor", *sizes) -> None:
+        """Declares the types of the parameters of the next call to
+        :meth:`execute` or :meth:`executemany`.
+
+        This method is part of the `DBAPI 2.0 specification
+        <http://www.python.org/dev/peps/pep-0249/>`_.
+
+        Parameters with a declared type are sent in text format, as the
+        text of their value, with binary values such as ``bytes`` sent as
+        the hexadecimal input of VARBYTE, and NULL values of such
+        parameters keep the declared type. Statements executed with the
+        same declared types therefore reuse the same prepared statement
+        regardless of which values are NULL. The declaration is cleared
+        once the next operation has been executed.
+
+        :param sizes:
+            A sequence, or the arguments, holding for each parameter, in
+            order, either the name of an Amazon Redshift type, such as
+            ``"integer"`` or ``"timestamptz"``, a Python type mapped to an
+            Amazon Redshift type, or ``None`` if the type should be
+            inferred from the value. As allowed by the specification, an
+            ``int``, which declares the maximum size of the parameter, is
+            ignored and the type is inferred. Calling this method without
+            arguments clears the declared types.
+
+        Returns
+        -------
+        None:None
         """
-        pass
+        if len(sizes) == 1 and isinstance(sizes[0], (list, tuple)):
+            # the sizes were given as one sequence, as in the specification
+            sizes = tuple(sizes[0])
+        oids: typing.Tuple[typing.Optional[int], ...] = self.__type_oids(
+            [None if isinstance(size, int) else size for size in sizes]
+        )
+        self._input_oids = oids if any(oid is not None for oid in oids) else None
+
+    def __type_oids(self: "Cursor", sizes: typing.Sequence) -> typing.Tuple[typing.Optional[int], ...]:
+        """
+        Returns the type oid of each parameter declared by a type oid, a type name, a Python type or ``None``.
+        """
+        oids: typing.List[typing.Optional[int]] = []
+        for size in sizes:
+            if size is None or isinstance(size, int):
+                oids.append(size)
+            elif isinstance(size, str):
+                try:
+                    oids.append(type_oids_by_name[size.strip().lower()])
+                except KeyError:
+                    raise InterfaceError("{} is not an Amazon Redshift type name".format(size))
+            else:
+                try:
+                    oids.append(typing.cast("Connection", self._c).py_types[size][0])
+                except KeyError:
+                    raise InterfaceError("type {} is not mapped to an Amazon Redshift type".format(size))
+        return tuple(oids)
 
     def setoutputsize(self: "Cursor", size, column=None):
         """This method is part of the `DBAPI 2.0 specification
@@ -473,9 +939,28 @@ class Cursor:
         """
         pass
 
+    def _decode_row(self: "Cursor", data: bytes) -> typing.List:
+        """
+        Converts the content of a DataRow message into a row of Python values.
+        """
+        data_idx: int = 2
+        row: typing.List = []
+        for desc in self.truncated_row_desc():
+            vlen: int = i_unpack(data, data_idx)[0]
+            data_idx += 4
+            if vlen == -1:
+                row.append(None)
+            elif desc[0] == numeric_in_binary:
+                row.append(desc[0](data, data_idx, vlen, typing.cast(typing.Tuple[typing.Callable, int], desc)[1]))
+                data_idx += vlen
+            else:
+                row.append(desc[0](data, data_idx, vlen))
+                data_idx += vlen
+        return row
+
     def __next__(self: "Cursor") -> typing.List:
         try:
-            return self._cached_rows.popleft()
+            data: bytes = self._cached_rows.popleft()
         except IndexError:
             if self.ps is None:
                 raise ProgrammingError("A query hasn't been issued.")
@@ -483,11 +968,40 @@ class Cursor:
                 raise ProgrammingError("no result set")
             else:
                 raise StopIteration()
+        return self._decode_row(data)
+
+    def _get_column_labels(self: "Cursor") -> typing.Optional[typing.List[typing.Union[str, bytes]]]:
+        """
+        Returns the lower-cased column labels of the current result, decoded when possible. Successfully
+        decoded labels are stored with the prepared statement so they are only decoded once.
+        """
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = getattr(self, "ps", None)
+        if ps is not None and "column_labels" in ps:
+            return ps["column_labels"]
+
+        columns: typing.Optional[typing.List[typing.Union[str, bytes]]] = None
+        try:
+            columns = [column[0].decode().lower() for column in self.description]
+            if ps is not None:
+                ps["column_labels"] = columns
+        except UnicodeError:
+            warn(
+                "Unable to decode column names. Byte values will be used for pandas dataframe column labels.",
+                stacklevel=3,
+            )
+            columns = [column[0].lower() for column in self.description]
+        except:
+            warn("No row description was found. pandas dataframe will be missing column labels.", stacklevel=3)
+        return columns
 
     def fetch_dataframe(self: "Cursor", num: typing.Optional[int] = None) -> typing.Optional["pandas.DataFrame"]:
         """
         Fetches a user defined number of rows of a query result as a :class:`pandas.DataFrame`.
 
+        Column dtypes are derived from the row description of the result, e.g. ``INTEGER`` columns use the
+        nullable ``Int64`` dtype and ``TIMESTAMPTZ`` columns ``datetime64[us, UTC]``. Values are decoded column
+        by column rather than row by row.
+
         Parameters
         ----------
         num : Optional[int] The number of rows to retrieve. If unspecified, all rows will be retrieved
@@ -501,27 +1015,64 @@ class Cursor:
         except ModuleNotFoundError:
             raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pandas"))
 
-        columns: typing.Optional[typing.List[typing.Union[str, bytes]]] = None
-        try:
-            columns = [column[0].decode().lower() for column in self.description]
-        except UnicodeError as e:
-            warn(
-                "Unable to decode column names. Byte values will be used for pandas dataframe column labels.",
-                stacklevel=2,
-            )
-            columns = [column[0].lower() for column in self.description]
-        except:
-            warn("No row description was found. pandas dataframe will be missing column labels.", stacklevel=2)
+        columns: typing.Optional[typing.List[typing.Union[str, bytes]]] = self._get_column_labels()
 
-        if num:
-            fetcheddata: tuple = self.fetchmany(num)
-        else:
-            fetcheddata = self.fetchall()
+        if not self.__has_result_set():
+            # defer to fetchmany/fetchall, which report why no rows can be fetched
+            if num:
+                fetcheddata: tuple = self.fetchmany(num)
+            else:
+                fetcheddata = self.fetchall()
+
+            result: typing.List = [tuple(column for column in rows) for rows in fetcheddata]
+            if len(result) == 0:
+                return None
+            return pandas.DataFrame(result, columns=columns)
 
-        result: typing.List = [tuple(column for column in rows) for rows in fetcheddata]
-        if len(result) == 0:
+        rows: typing.List[bytes] = take_rows(self._cached_rows, num or None)
+        if len(rows) == 0:
             return None
-        return pandas.DataFrame(result, columns=columns)
+        return self.__dataframe_from_rows(rows, columns)
+
+    def fetch_dataframe_batches(self: "Cursor", chunksize: int = 100000) -> typing.Iterator["pandas.DataFrame"]:
+        """
+        Fetches the remaining rows of a query result as an iterator of :class:`pandas.DataFrame`.
+
+        Rows are consumed from the cursor as each `pandas.DataFrame` is produced, so a large result can be
+        processed without materializing all of it in pandas at once. Column dtypes are those used by
+        :meth:`fetch_dataframe`.
+
+        Parameters
+        ----------
+        chunksize : int The maximum number of rows in each `pandas.DataFrame`. Defaults to 100000
+
+        Returns
+        -------
+        An iterator of `pandas.DataFrame` sharing the column labels and dtypes of the result: typing.Iterator["pandas.DataFrame"]
+        """
+        try:
+            import pandas
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pandas"))
+
+        if chunksize < 1:
+            raise InterfaceError("chunksize must be a positive integer")
+        self.__check_result_set()
+        columns: typing.Optional[typing.List[typing.Union[str, bytes]]] = self._get_column_labels()
+
+        def batches() -> typing.Iterator["pandas.DataFrame"]:
+            while len(self._cached_rows) > 0:
+                yield self.__dataframe_from_rows(take_rows(self._cached_rows, chunksize), columns)
+
+        return batches()
+
+    def __dataframe_from_rows(
+        self: "Cursor", rows: typing.List[bytes], columns: typing.Optional[typing.List[typing.Union[str, bytes]]]
+    ) -> "pandas.DataFrame":
+        from redshift_connector.utils.pandas_util import dataframe_from_rows
+
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        return dataframe_from_rows(rows, ps["row_desc"], self.truncated_row_desc(), columns)
 
     def __is_valid_table(self: "Cursor", table: str) -> bool:
         split_table_name: typing.List[str] = table.split(".")
@@ -550,14 +1101,26 @@ class Cursor:
 
         return result[0] == 1 if result is not None else False
 
-    def write_dataframe(self: "Cursor", df: "pandas.DataFrame", table: str) -> None:
+    def write_dataframe(
+        self: "Cursor",
+        df: "pandas.DataFrame",
+        table: str,
+        batch_size: int = 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    ) -> None:
         """
         Inserts a :class:`pandas.DataFrame` into an table within the current database.
 
+        Rows are inserted using ``INSERT`` statements holding up to ``batch_size`` rows each. Values are converted
+        to text column by column according to the dtypes of `df`, and NaN, NaT and ``pandas.NA`` values are
+        inserted as NULL.
+
         Parameters
         ----------
         df : :class:`pandas.DataFrame` Contains row values to insert into `table`
         table : str Name of an existing table in the current Amazon Redshift database to insert the values in `df`
+        batch_size : int The maximum number of rows inserted per statement. Defaults to 1000
+        max_batch_bytes : int The approximate maximum size, in bytes, of the values inserted per statement. Defaults to 8 MB
 
         Returns
         -------
@@ -567,27 +1130,177 @@ class Cursor:
             import pandas
         except ModuleNotFoundError:
             raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pandas"))
+        from redshift_connector.utils.pandas_util import dataframe_text_columns
 
+        if batch_size < 1:
+            raise InterfaceError("batch_size must be greater than 0")
         if not self.__is_valid_table(table):
             raise InterfaceError("Invalid table name passed to write_dataframe: {}".format(table))
         sanitized_table_name: str = self.__sanitize_str(table)
-        arrays: "numpy.ndarray" = df.values
-        placeholder: str = ", ".join(["%s"] * len(arrays[0]))
-        sql: str = "insert into {table} values ({placeholder})".format(
-            table=sanitized_table_name, placeholder=placeholder
+        if len(df.index) == 0 or len(df.columns) == 0:
+            return
+
+        writer: MultiRowInsert = MultiRowInsert(
+            self,
+            sanitized_table_name,
+            None,
+            len(df.columns),
+            max_rows=batch_size,
+            max_batch_bytes=max_batch_bytes,
+        )
+        self._row_count = writer.execute(zip(*dataframe_text_columns(df)))
+
+    def upsert_rows(
+        self: "Cursor",
+        rows: typing.Iterable[typing.Sequence],
+        table: str,
+        key_columns: typing.List[str],
+        columns: typing.Optional[typing.List[str]] = None,
+        use_merge: bool = True,
+        batch_size: int = 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    ) -> None:
+        """
+        Inserts or updates rows of a table within the current database, matching rows on ``key_columns``.
+
+        The rows are inserted into a temporary table created ``LIKE`` `table` using ``INSERT`` statements holding
+        up to ``batch_size`` rows each, then applied to `table` by a ``MERGE`` statement, or by a ``DELETE`` and an
+        ``INSERT`` if `use_merge` is False. All statements are executed in one transaction, which is committed if
+        the connection is in autocommit mode. Key values should be unique within `rows`. `table` and the columns
+        must be found in the catalog, otherwise :class:`InterfaceError` is raised before any row is sent.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence] The rows to upsert. Values are sent as text and converted to the types of the columns of `table`
+        table : str Name of an existing table in the current Amazon Redshift database
+        key_columns : List[str] The columns identifying the row of `table` replaced by each row
+        columns : Optional[List[str]] The columns of `table` receiving the values of each row. If unspecified, rows hold a value for every column of `table`
+        use_merge : bool Apply the rows with a ``MERGE`` statement rather than a ``DELETE`` and an ``INSERT``. Defaults to True
+        batch_size : int The maximum number of rows inserted per statement. Defaults to 1000
+        max_batch_bytes : int The approximate maximum size, in bytes, of the values inserted per statement. Defaults to 8 MB
+
+        Returns
+        -------
+        None: None
+        """
+        if batch_size < 1:
+            raise InterfaceError("batch_size must be greater than 0")
+        if len(key_columns) == 0:
+            raise InterfaceError("At least one key column must be specified")
+        if columns is not None:
+            for key_column in key_columns:
+                if key_column not in columns:
+                    raise InterfaceError("Key column {} is not one of the columns: {}".format(key_column, columns))
+        if not self.__is_valid_table(table):
+            raise InterfaceError("Invalid table name passed to upsert_rows: {}".format(table))
+        # the names of the columns are part of the statements, so they must be columns of the table
+        self.__get_column_data_types(table, list(dict.fromkeys(list(columns or []) + list(key_columns))))
+
+        row_iter: typing.Iterator[typing.Sequence] = iter(rows)
+        first_row: typing.Optional[typing.Sequence] = next(row_iter, None)
+        if first_row is None:
+            return
+        self.__upsert(
+            chain((first_row,), row_iter),
+            self.__sanitize_str(table),
+            key_columns,
+            columns,
+            len(columns) if columns else len(first_row),
+            use_merge,
+            batch_size,
+            max_batch_bytes,
         )
-        if len(arrays) == 1:
-            self.execute(sql, arrays[0])
-        elif len(arrays) > 1:
-            self.executemany(sql, arrays)
 
-    def fetch_numpy_array(self: "Cursor", num: typing.Optional[int] = None) -> "numpy.ndarray":
+    def upsert_dataframe(
+        self: "Cursor",
+        df: "pandas.DataFrame",
+        table: str,
+        key_columns: typing.List[str],
+        use_merge: bool = True,
+        batch_size: int = 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+    ) -> None:
+        """
+        Inserts or updates rows of a table within the current database with the rows of a :class:`pandas.DataFrame`,
+        matching rows on ``key_columns``. The labels of `df` are the names of the columns of `table` receiving its
+        values. See :meth:`upsert_rows`.
+
+        Parameters
+        ----------
+        df : :class:`pandas.DataFrame` Contains row values to upsert into `table`
+        table : str Name of an existing table in the current Amazon Redshift database
+        key_columns : List[str] The columns identifying the row of `table` replaced by each row of `df`
+        use_merge : bool Apply the rows with a ``MERGE`` statement rather than a ``DELETE`` and an ``INSERT``. Defaults to True
+        batch_size : int The maximum number of rows inserted per statement. Defaults to 1000
+        max_batch_bytes : int The approximate maximum size, in bytes, of the values inserted per statement. Defaults to 8 MB
+
+        Returns
+        -------
+        None: None
+        """
+        try:
+            import pandas
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pandas"))
+        from redshift_connector.utils.pandas_util import dataframe_text_columns
+
+        if len(df.index) == 0 or len(df.columns) == 0:
+            return
+        self.upsert_rows(
+            zip(*dataframe_text_columns(df)),
+            table,
+            key_columns,
+            columns=[str(c) for c in df.columns],
+            use_merge=use_merge,
+            batch_size=batch_size,
+            max_batch_bytes=max_batch_bytes,
+        )
+
+    @_synchronized
+    def __upsert(
+        self: "Cursor",
+        rows: typing.Iterator[typing.Sequence],
+        table: str,
+        key_columns: typing.List[str],
+        columns: typing.Optional[typing.List[str]],
+        num_columns: int,
+        use_merge: bool,
+        batch_size: int,
+        max_batch_bytes: int,
+    ) -> None:
+        conn: "Connection" = typing.cast("Connection", self._c)
+        stage: str = "upsert_stage_{}".format(uuid.uuid4().hex)
+        # outside of autocommit mode the statements belong to the current transaction, committed by the caller
+        explicit_transaction: bool = conn.autocommit
+        if explicit_transaction:
+            self.execute("begin transaction")
+        try:
+            self.execute("CREATE TEMP TABLE {} (LIKE {})".format(stage, table))
+            writer: MultiRowInsert = MultiRowInsert(
+                self, stage, columns, num_columns, max_rows=batch_size, max_batch_bytes=max_batch_bytes
+            )
+            upserted: int = writer.execute(rows)
+            for statement in upsert_statements(table, stage, key_columns, columns, use_merge):
+                self.execute(statement)
+            self.execute("DROP TABLE {}".format(stage))
+            if explicit_transaction:
+                self.execute("commit")
+        except:
+            if explicit_transaction:
+                conn.rollback()
+            raise
+        self._row_count = upserted
+
+    def fetch_numpy_array(
+        self: "Cursor", num: typing.Optional[int] = None, structured: bool = False
+    ) -> typing.Union["numpy.ndarray", "numpy.ma.MaskedArray"]:
         """
         Fetches a user defined number of rows of a query result as a :class:`numpy.ndarray`.
 
         Parameters
         ----------
         num : int The number of rows to retrieve from the result set.
+        structured : bool If True, a structured :class:`numpy.ma.MaskedArray` is returned which holds one field per column, typed according to the row description of the result. NULL values are masked. Defaults to False
 
         Returns
         -------
@@ -598,6 +1311,18 @@ class Cursor:
         except ModuleNotFoundError:
             raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="numpy"))
 
+        if structured:
+            from redshift_connector.utils.numpy_util import (
+                field_names,
+                structured_from_rows,
+            )
+
+            self.__check_result_set()
+            ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+            names: typing.List[str] = field_names([col.label for col in ps["row_desc"]])
+            rows: typing.List[bytes] = take_rows(self._cached_rows, num or None)
+            return structured_from_rows(rows, ps["row_desc"], self.truncated_row_desc(), names)
+
         if num:
             fetched: typing.Tuple = self.fetchmany(num)
         else:
@@ -605,6 +1330,274 @@ class Cursor:
 
         return numpy.array(fetched)
 
+    def fetch_into(
+        self: "Cursor",
+        buffers: typing.Sequence["numpy.ndarray"],
+        masks: typing.Optional[typing.Sequence["numpy.ndarray"]] = None,
+    ) -> int:
+        """
+        Fetches rows of a query result into preallocated arrays, one per column, in place. Rows are written
+        from the start of each array until either the arrays are full or no rows remain.
+
+        Parameters
+        ----------
+        buffers : Sequence[numpy.ndarray] A one-dimensional array for each column of the result, in column order
+        masks : Optional[Sequence[numpy.ndarray]] A boolean array for each column of the result which is set to True where a value is NULL. If unspecified, NULL values are stored as NaN, NaT or None, and a NULL value in an integer or boolean column raises an :exc:`InterfaceError`
+
+        Returns
+        -------
+        The number of rows written to each array: int
+        """
+        try:
+            import numpy
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="numpy"))
+        from redshift_connector.utils.numpy_util import (
+            decode_numpy_columns,
+            field_names,
+        )
+
+        self.__check_result_set()
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        if len(buffers) != len(ps["row_desc"]):
+            raise InterfaceError(
+                "fetch_into requires {} buffers, one per column, but {} were given".format(
+                    len(ps["row_desc"]), len(buffers)
+                )
+            )
+        if masks is not None and len(masks) != len(buffers):
+            raise InterfaceError("fetch_into requires one mask per buffer")
+
+        capacity: int = min(len(arr) for arr in [*buffers, *(masks or [])])
+        # rows are only consumed from the cursor once they are known to fit
+        rows: typing.List[bytes] = list(islice(self._cached_rows, capacity))
+        names: typing.List[str] = field_names([col.label for col in ps["row_desc"]])
+        _, arrays, nulls = decode_numpy_columns(rows, ps["row_desc"], self.truncated_row_desc(), names)
+
+        for idx, (arr, col_nulls) in enumerate(zip(arrays, nulls)):
+            if masks is not None:
+                masks[idx][: len(rows)] = False if col_nulls is None else col_nulls
+            elif col_nulls is not None and arr.dtype.kind in "biu":
+                raise InterfaceError(
+                    "Column {} contains NULL values which cannot be stored in a {} array without a mask".format(
+                        names[idx], arr.dtype
+                    )
+                )
+        for buf, arr in zip(buffers, arrays):
+            buf[: len(rows)] = arr
+
+        for _ in range(len(rows)):
+            self._cached_rows.popleft()
+        return len(rows)
+
+    def __has_result_set(self: "Cursor") -> bool:
+        ps: typing.Optional[typing.Dict[str, typing.Any]] = getattr(self, "ps", None)
+        return ps is not None and len(ps["row_desc"]) > 0
+
+    def __check_result_set(self: "Cursor") -> None:
+        if self.ps is None:
+            raise ProgrammingError("A query hasn't been issued.")
+        elif len(self.ps["row_desc"]) == 0:
+            raise ProgrammingError("no result set")
+
+    def fetch_arrow_batches(self: "Cursor", batch_size: int = 65536) -> typing.Iterator["pyarrow.RecordBatch"]:
+        """
+        Fetches the remaining rows of a query result as an iterator of :class:`pyarrow.RecordBatch`.
+
+        Row data is decoded column by column directly from the received DataRow messages, without
+        building an intermediate Python row per record. Rows are consumed from the cursor as batches
+        are produced.
+
+        Parameters
+        ----------
+        batch_size : int The maximum number of rows in each record batch. Defaults to 65536
+
+        Returns
+        -------
+        An iterator of `pyarrow.RecordBatch` sharing the schema derived from the row description of the result: typing.Iterator["pyarrow.RecordBatch"]
+        """
+        try:
+            import pyarrow  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+        from redshift_connector.utils.arrow_util import arrow_record_batches
+
+        if batch_size < 1:
+            raise InterfaceError("batch_size must be a positive integer")
+        self.__check_result_set()
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+
+        def chunks() -> typing.Iterator[typing.List[bytes]]:
+            while len(self._cached_rows) > 0:
+                yield take_rows(self._cached_rows, batch_size)
+
+        return arrow_record_batches(chunks(), ps["row_desc"], self.truncated_row_desc())
+
+    def fetch_arrow_table(self: "Cursor", num: typing.Optional[int] = None) -> "pyarrow.Table":
+        """
+        Fetches a user defined number of rows of a query result as a :class:`pyarrow.Table`.
+
+        Parameters
+        ----------
+        num : Optional[int] The number of rows to retrieve. If unspecified, all rows will be retrieved
+
+        Returns
+        -------
+        A `pyarrow.Table` whose schema is derived from the row description of the result. The table is empty if no rows remain: "pyarrow.Table"
+        """
+        try:
+            import pyarrow  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+        from redshift_connector.utils.arrow_util import (
+            arrow_record_batches,
+            arrow_schema,
+        )
+        from redshift_connector.utils.columnar import column_plan
+
+        self.__check_result_set()
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        row_decoders = self.truncated_row_desc()
+        schema: "pyarrow.Schema" = arrow_schema(ps["row_desc"], column_plan(ps["row_desc"], row_decoders))
+
+        rows: typing.List[bytes] = take_rows(self._cached_rows, num or None)
+        batches: typing.List["pyarrow.RecordBatch"] = list(
+            arrow_record_batches(iter([rows] if rows else []), ps["row_desc"], row_decoders)
+        )
+        return pyarrow.Table.from_batches(batches, schema=schema)
+
+    def export(
+        self: "Cursor",
+        path: typing.Union[str, "os.PathLike"],
+        format: str = "csv",
+        compression: typing.Optional[str] = None,
+        chunk_size: int = 10000,
+        delimiter: str = ",",
+        header: bool = True,
+        null: str = "",
+        operation: typing.Optional[str] = None,
+        args=None,
+    ) -> int:
+        """
+        Writes the rows of a query result to a file in the ``CSV``, JSON Lines or Parquet format.
+
+        If `operation` is given, the query is executed and its rows are written while they are received from the
+        server, `chunk_size` rows at a time, so the result is never held in memory as a whole. Otherwise the
+        remaining rows of the current result, which has already been received by :meth:`execute`, are consumed
+        from the cursor and written `chunk_size` rows at a time.
+
+        ``CSV`` and JSON Lines files are written through a large buffer and can be compressed with gzip or, using
+        the optional ``zstandard`` module, zstd. Parquet files are written with pyarrow, with one row group per
+        chunk, and `compression` selects the Parquet codec.
+
+        Parameters
+        ----------
+        path : Union[str, os.PathLike] The path of the file to write
+        format : str One of ``csv``, ``jsonl`` or ``parquet``. Defaults to ``csv``
+        compression : Optional[str] ``gzip`` or ``zstd``, or a Parquet codec for the ``parquet`` format. Defaults to no compression, or ``snappy`` for the ``parquet`` format
+        chunk_size : int The maximum number of rows decoded at once. Defaults to 10000
+        delimiter : str The delimiter of the ``CSV`` format. Defaults to ","
+        header : bool Whether the ``CSV`` file starts with a row of column labels. Defaults to True
+        null : str The text written for NULL values in the ``CSV`` format, such as ``\\N``. Defaults to an empty field, which is also how empty strings are written
+        operation : Optional[str] The query whose rows are written as they are received. Defaults to writing the current result
+        args : Optional parameters of `operation`. See :meth:`execute`
+
+        Returns
+        -------
+        The number of rows written: int
+        """
+        from redshift_connector.utils.export_util import EXPORT_FORMATS
+
+        if format not in EXPORT_FORMATS:
+            raise InterfaceError(
+                "Invalid export format {!r}. Supported formats are: {}".format(format, ", ".join(EXPORT_FORMATS))
+            )
+        if chunk_size < 1:
+            raise InterfaceError("chunk_size must be a positive integer")
+
+        def write(raw_chunks: typing.Iterator[typing.List[bytes]]) -> int:
+            return self.__write_export(raw_chunks, path, format, compression, delimiter, header, null)
+
+        if operation is not None:
+            return self.__export_streamed(operation, args, chunk_size, write)
+
+        self.__check_result_set()
+
+        def raw_chunks() -> typing.Iterator[typing.List[bytes]]:
+            while len(self._cached_rows) > 0:
+                yield take_rows(self._cached_rows, chunk_size)
+
+        return write(raw_chunks())
+
+    @_synchronized
+    def __export_streamed(
+        self: "Cursor",
+        operation: str,
+        args,
+        chunk_size: int,
+        write: typing.Callable[[typing.Iterator[typing.List[bytes]]], int],
+    ) -> int:
+        if self._c is None:
+            raise InterfaceError("Cursor closed")
+        if self._c._sock is None:
+            raise InterfaceError("connection is closed")
+        conn: "Connection" = self._c
+        self.stream = None
+        if not conn.in_transaction and not conn.autocommit:
+            conn.execute(self, "begin transaction", None)
+
+        rows: typing.Generator[bytes, None, None] = typing.cast(
+            typing.Generator[bytes, None, None], conn.execute_streamed(self, operation, args)
+        )
+        try:
+            # executes the statement, so the prepared statement of the cursor describes its result
+            first_row: typing.Optional[bytes] = next(rows, None)
+            self.__check_result_set()
+            received: typing.Iterator[bytes] = iter(()) if first_row is None else chain((first_row,), rows)
+
+            def raw_chunks() -> typing.Iterator[typing.List[bytes]]:
+                while True:
+                    chunk: typing.List[bytes] = list(islice(received, chunk_size))
+                    if len(chunk) == 0:
+                        return
+                    yield chunk
+
+            return write(raw_chunks())
+        finally:
+            # discards the rows which weren't written if writing failed
+            rows.close()
+
+    def __write_export(
+        self: "Cursor",
+        raw_chunks: typing.Iterator[typing.List[bytes]],
+        path: typing.Union[str, "os.PathLike"],
+        format: str,
+        compression: typing.Optional[str],
+        delimiter: str,
+        header: bool,
+        null: str,
+    ) -> int:
+        from redshift_connector.utils.export_util import (
+            open_export_file,
+            write_csv,
+            write_jsonl,
+            write_parquet,
+        )
+        from redshift_connector.utils.numpy_util import field_names
+
+        ps: typing.Dict[str, typing.Any] = typing.cast(typing.Dict[str, typing.Any], self.ps)
+        if format == "parquet":
+            return write_parquet(path, raw_chunks, ps["row_desc"], self.truncated_row_desc(), compression)
+
+        names: typing.List[str] = field_names([col.label for col in ps["row_desc"]])
+        chunks: typing.Iterator[typing.List[typing.List]] = (
+            [self._decode_row(data) for data in rows] for rows in raw_chunks
+        )
+        with open_export_file(path, compression) as output:
+            if format == "csv":
+                return write_csv(output, chunks, names, delimiter=delimiter, header=header, null=null)
+            return write_jsonl(output, chunks, names)
+
     def get_procedures(
         self: "Cursor",
         catalog: typing.Optional[str] = None,
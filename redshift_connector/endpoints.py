@@ -0,0 +1,179 @@
+import logging
+import socket
+import threading
+import time
+import typing
+
+from redshift_connector.error import InterfaceError
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# the ways EndpointSelector.candidates orders the endpoints of a connection
+ROUND_ROBIN: str = "round_robin"
+LEAST_LATENCY: str = "least_latency"
+LOAD_BALANCE_MODES: typing.Tuple[str, ...] = (ROUND_ROBIN, LEAST_LATENCY)
+
+# the weight of the latest connect time in the average latency of an endpoint
+_LATENCY_WEIGHT: float = 0.3
+
+Endpoint = typing.Tuple[str, int]
+
+
+def parse_endpoints(endpoints: typing.Sequence[typing.Union[str, Endpoint]], port: int) -> typing.List[Endpoint]:
+    """
+    Returns the ``(host, port)`` of each of ``endpoints``, which are given as ``(host, port)`` pairs or as
+    ``host`` or ``host:port`` strings, using ``port`` for those without one.
+    """
+    parsed: typing.List[Endpoint] = []
+    for endpoint in endpoints:
+        if isinstance(endpoint, str):
+            host, _, endpoint_port = endpoint.rpartition(":")
+            if not host:
+                host, endpoint_port = endpoint, ""
+            try:
+                parsed.append((host, int(endpoint_port) if endpoint_port else int(port)))
+            except ValueError:
+                raise InterfaceError("Invalid endpoint {!r}: the port must be an integer".format(endpoint))
+        elif isinstance(endpoint, (tuple, list)) and len(endpoint) == 2:
+            parsed.append((str(endpoint[0]), int(endpoint[1])))
+        else:
+            raise InterfaceError("Invalid endpoint {!r}: expected 'host', 'host:port' or (host, port)".format(endpoint))
+    if not parsed:
+        raise InterfaceError("At least one endpoint must be provided")
+    return parsed
+
+
+class EndpointSelector:
+    """
+    Chooses the endpoint each connection tries first, and remembers the outcome of earlier connections in this
+    process: the addresses of each host, how long connecting to each endpoint took, and which endpoints recently
+    failed to connect.
+
+    The state is shared by all connections, as :data:`endpoint_selector`, and may be used by several threads.
+    """
+
+    def __init__(self: "EndpointSelector") -> None:
+        self._lock: threading.Lock = threading.Lock()
+        # the addresses of each endpoint and the time until which they are used
+        self._addresses: typing.Dict[Endpoint, typing.Tuple[typing.List[typing.Tuple], float]] = {}
+        # the time until which an endpoint which failed to connect is tried after the others
+        self._unhealthy_until: typing.Dict[Endpoint, float] = {}
+        self._latency: typing.Dict[Endpoint, float] = {}
+        self._next: typing.Dict[typing.Tuple[Endpoint, ...], int] = {}
+
+    def candidates(
+        self: "EndpointSelector", endpoints: typing.Sequence[Endpoint], load_balance: str
+    ) -> typing.List[Endpoint]:
+        """
+        Returns ``endpoints`` in the order a connection tries them. Healthy endpoints are tried first, starting at
+        the next endpoint in turn for ``round_robin`` or at the fastest to connect to for ``least_latency``.
+        Endpoints which failed to connect during their cooldown are tried last, the soonest to recover first.
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            if load_balance == LEAST_LATENCY:
+                # endpoints not connected to yet are tried first, so their latency is measured
+                ordered: typing.List[Endpoint] = sorted(endpoints, key=lambda e: self._latency.get(e, 0.0))
+            else:
+                key: typing.Tuple[Endpoint, ...] = tuple(endpoints)
+                start: int = self._next.get(key, 0) % len(key)
+                self._next[key] = start + 1
+                ordered = list(key[start:] + key[:start])
+            healthy: typing.List[Endpoint] = [e for e in ordered if self._unhealthy_until.get(e, 0.0) <= now]
+            unhealthy: typing.List[Endpoint] = sorted(
+                (e for e in ordered if self._unhealthy_until.get(e, 0.0) > now), key=self._unhealthy_until.__getitem__
+            )
+        return healthy + unhealthy
+
+    def resolve(self: "EndpointSelector", endpoint: Endpoint, dns_ttl: float) -> typing.List[typing.Tuple]:
+        """
+        Returns the socket addresses of ``endpoint``, resolved at most once every ``dns_ttl`` seconds. If
+        ``dns_ttl`` is 0, the endpoint itself is returned, so its host is resolved when the socket connects.
+        """
+        if dns_ttl <= 0:
+            return [endpoint]
+        now: float = time.monotonic()
+        with self._lock:
+            cached: typing.Optional[typing.Tuple[typing.List[typing.Tuple], float]] = self._addresses.get(endpoint)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        addresses: typing.List[typing.Tuple] = [
+            info[4] for info in socket.getaddrinfo(endpoint[0], endpoint[1], socket.AF_INET, socket.SOCK_STREAM)
+        ]
+        with self._lock:
+            self._addresses[endpoint] = (addresses, now + dns_ttl)
+        return addresses
+
+    def connected(self: "EndpointSelector", endpoint: Endpoint, seconds: float) -> None:
+        """
+        Records that connecting to ``endpoint`` took ``seconds``.
+        """
+        with self._lock:
+            self._unhealthy_until.pop(endpoint, None)
+            latency: typing.Optional[float] = self._latency.get(endpoint)
+            self._latency[endpoint] = seconds if latency is None else latency + _LATENCY_WEIGHT * (seconds - latency)
+
+    def failed(self: "EndpointSelector", endpoint: Endpoint, cooldown: float) -> None:
+        """
+        Records that connecting to ``endpoint`` failed, so it is tried after the other endpoints for ``cooldown``
+        seconds, and its addresses are resolved again.
+        """
+        _logger.debug("Failed to connect to endpoint %s:%s", endpoint[0], endpoint[1])
+        with self._lock:
+            self._unhealthy_until[endpoint] = time.monotonic() + cooldown
+            self._addresses.pop(endpoint, None)
+
+    def clear(self: "EndpointSelector") -> None:
+        """
+        Forgets the outcome of earlier connections.
+        """
+        with self._lock:
+            self._addresses.clear()
+            self._unhealthy_until.clear()
+            self._latency.clear()
+            self._next.clear()
+
+    def connect(
+        self: "EndpointSelector",
+        endpoints: typing.Sequence[Endpoint],
+        load_balance: str,
+        source_address: typing.Optional[str],
+        timeout: typing.Optional[float],
+        connect_timeout: typing.Optional[float],
+        cooldown: float,
+        dns_ttl: float,
+    ) -> typing.Tuple[socket.socket, Endpoint]:
+        """
+        Returns a TCP socket connected to the first of ``endpoints`` which accepts a connection within
+        ``connect_timeout`` seconds, or ``timeout`` seconds if it is None, and the endpoint it is connected to.
+        The socket then uses ``timeout``.
+
+        Raises
+        ------
+        InterfaceError: If no endpoint accepts a connection.
+        """
+        error: typing.Optional[Exception] = None
+        for endpoint in self.candidates(endpoints, load_balance):
+            start_time: float = time.perf_counter()
+            try:
+                for address in self.resolve(endpoint, dns_ttl):
+                    sock: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    try:
+                        if source_address is not None:
+                            sock.bind((source_address, 0))
+                        sock.settimeout(connect_timeout if connect_timeout is not None else timeout)
+                        sock.connect(address)
+                        sock.settimeout(timeout)
+                    except socket.error as e:
+                        sock.close()
+                        error = e
+                        continue
+                    self.connected(endpoint, time.perf_counter() - start_time)
+                    return sock, endpoint
+            except socket.error as e:
+                error = e
+            self.failed(endpoint, cooldown)
+        raise InterfaceError("communication error", error)
+
+
+endpoint_selector: EndpointSelector = EndpointSelector()
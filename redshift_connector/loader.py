@@ -0,0 +1,366 @@
+import csv
+import logging
+import os
+import queue
+import threading
+import time
+import typing
+import uuid
+from itertools import chain, islice
+
+import redshift_connector
+from redshift_connector.error import InterfaceError
+from redshift_connector.utils.insert_util import DEFAULT_MAX_BATCH_BYTES, MultiRowInsert
+
+if typing.TYPE_CHECKING:
+    import pandas  # type: ignore
+
+    from redshift_connector.core import Connection
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+# the number of seconds waited on the queues of a load before checking the workers are still running
+_QUEUE_TIMEOUT: float = 1.0
+
+
+class LoadMetrics:
+    """
+    Metrics describing a load performed by :class:`ParallelLoader`.
+
+    .. attribute:: rows
+
+        The number of rows inserted into the target table.
+
+    .. attribute:: seconds
+
+        The wall clock duration of the load, including any final merge.
+
+    .. attribute:: worker_rows
+
+        The number of rows inserted by each worker.
+
+    .. attribute:: worker_seconds
+
+        The time each worker spent inserting rows.
+    """
+
+    def __init__(
+        self: "LoadMetrics",
+        rows: int,
+        seconds: float,
+        worker_rows: typing.List[int],
+        worker_seconds: typing.List[float],
+    ) -> None:
+        self.rows: int = rows
+        self.seconds: float = seconds
+        self.worker_rows: typing.List[int] = worker_rows
+        self.worker_seconds: typing.List[float] = worker_seconds
+
+    @property
+    def rows_per_second(self: "LoadMetrics") -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self: "LoadMetrics") -> str:
+        return "LoadMetrics(rows={}, seconds={:.3f}, rows_per_second={:.1f}, workers={})".format(
+            self.rows, self.seconds, self.rows_per_second, len(self.worker_rows)
+        )
+
+
+def _load_worker(
+    connect_kwargs: typing.Dict[str, typing.Any],
+    table: str,
+    columns: typing.Optional[typing.List[str]],
+    num_columns: int,
+    batch_size: int,
+    max_batch_bytes: int,
+    chunks,
+    results,
+    worker_id: int,
+) -> None:
+    """
+    Inserts the chunks of rows read from ``chunks`` into ``table`` using a dedicated connection, until a None
+    chunk is read. The number of rows inserted, the time taken and the error raised, if any, are put in
+    ``results``. After an error the remaining chunks are read and discarded, so producers are never blocked.
+    """
+    start: float = time.perf_counter()
+    finished: bool = False
+    inserted: int = 0
+    error: typing.Optional[str] = None
+
+    def rows() -> typing.Iterator[typing.Sequence]:
+        nonlocal finished
+        while True:
+            chunk: typing.Optional[typing.List[typing.Sequence]] = chunks.get()
+            if chunk is None:
+                finished = True
+                return
+            yield from chunk
+
+    conn: typing.Optional["Connection"] = None
+    try:
+        conn = redshift_connector.connect(**connect_kwargs)
+        writer: MultiRowInsert = MultiRowInsert(
+            conn.cursor(), table, columns, num_columns, max_rows=batch_size, max_batch_bytes=max_batch_bytes
+        )
+        inserted = writer.execute(rows())
+        conn.commit()
+    except Exception as e:
+        _logger.debug("Parallel load worker %s failed: %s", worker_id, e)
+        error = "{}: {}".format(type(e).__name__, e)
+        while not finished:
+            if chunks.get() is None:
+                finished = True
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    results.put((worker_id, inserted, time.perf_counter() - start, error))
+
+
+def _put_chunk(chunks, chunk: typing.Optional[typing.List[typing.Sequence]], workers: typing.List[typing.Any]) -> None:
+    """
+    Puts ``chunk`` in the bounded queue ``chunks``, raising :class:`InterfaceError` if it is full while a worker
+    has exited. A worker only exits after reading its None chunk, and the queue has room for a None chunk per
+    worker, so a full queue and an exited worker mean a worker died.
+    """
+    while True:
+        try:
+            chunks.put(chunk, timeout=_QUEUE_TIMEOUT)
+            return
+        except queue.Full:
+            for idx, worker in enumerate(workers):
+                if not worker.is_alive():
+                    raise InterfaceError("Parallel load worker {} exited before reading all rows".format(idx))
+
+
+class ParallelLoader:
+    """
+    Loads rows into an Amazon Redshift table using several connections at once.
+
+    Rows are read from the source by the calling thread and distributed in chunks of ``batch_size`` rows through
+    a bounded queue to ``workers`` workers, each inserting the chunks it receives through its own connection with
+    multi-row ``INSERT`` statements. Workers are threads, or processes if ``use_processes`` is True, in which case
+    ``connect_kwargs`` and the rows must be picklable.
+
+    By default each worker inserts into the target table and commits its share of the rows independently. With
+    ``staging=True`` each worker inserts into its own staging table created ``LIKE`` the target table, and the
+    staged rows are moved into the target table by a single ``INSERT ... SELECT`` in one transaction once every
+    worker has succeeded, so either all rows or none are loaded.
+
+    The table and the columns are looked up in the catalog before any row is sent. A worker which exits without
+    reporting its result, such as a process which is killed, fails the load rather than blocking it.
+    """
+
+    def __init__(
+        self: "ParallelLoader",
+        connect_kwargs: typing.Dict[str, typing.Any],
+        workers: int = 4,
+        use_processes: bool = False,
+        batch_size: int = 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        queue_depth: int = 2,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        connect_kwargs : Dict[str, Any] The keyword arguments passed to :func:`redshift_connector.connect` to open each connection
+        workers : int The number of worker connections. Defaults to 4
+        use_processes : bool Run workers in processes rather than threads. Defaults to False
+        batch_size : int The maximum number of rows inserted per statement. Defaults to 1000
+        max_batch_bytes : int The approximate maximum size, in bytes, of the values inserted per statement. Defaults to 8 MB
+        queue_depth : int The number of chunks of rows queued per worker. Defaults to 2
+        """
+        if workers < 1:
+            raise InterfaceError("workers must be greater than 0")
+        if batch_size < 1:
+            raise InterfaceError("batch_size must be greater than 0")
+        self.connect_kwargs: typing.Dict[str, typing.Any] = connect_kwargs
+        self.workers: int = workers
+        self.use_processes: bool = use_processes
+        self.batch_size: int = batch_size
+        self.max_batch_bytes: int = max_batch_bytes
+        self.queue_depth: int = max(1, queue_depth)
+
+    def _rows(
+        self: "ParallelLoader",
+        source: typing.Union[str, "os.PathLike", typing.Iterable[typing.Sequence], "pandas.DataFrame"],
+        delimiter: str,
+        header: bool,
+    ) -> typing.Iterator[typing.Sequence]:
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, newline="") as csv_file:
+                reader = csv.reader(csv_file, delimiter=delimiter)
+                if header:
+                    next(reader, None)
+                yield from reader
+        elif hasattr(source, "columns") and hasattr(source, "items"):
+            from redshift_connector.utils.pandas_util import dataframe_text_columns
+
+            yield from zip(*dataframe_text_columns(typing.cast("pandas.DataFrame", source)))
+        else:
+            yield from typing.cast(typing.Iterable[typing.Sequence], source)
+
+    def load(
+        self: "ParallelLoader",
+        source: typing.Union[str, "os.PathLike", typing.Iterable[typing.Sequence], "pandas.DataFrame"],
+        table: str,
+        columns: typing.Optional[typing.List[str]] = None,
+        staging: bool = False,
+        delimiter: str = ",",
+        header: bool = True,
+    ) -> LoadMetrics:
+        """
+        Loads the rows of ``source`` into ``table``.
+
+        Parameters
+        ----------
+        source : Union[str, os.PathLike, Iterable[Sequence], pandas.DataFrame] The path of a CSV file, an iterable of rows or a :class:`pandas.DataFrame`. Values of rows are sent as text
+        table : str The name of an existing table
+        columns : Optional[List[str]] The columns of ``table`` receiving the values of each row. If unspecified, rows hold a value for every column of ``table``
+        staging : bool Load through per-worker staging tables merged into ``table`` in one transaction. Defaults to False
+        delimiter : str The delimiter used by the CSV file. Defaults to ","
+        header : bool Whether the first line of the CSV file is a header to skip. Defaults to True
+
+        Returns
+        -------
+        Metrics describing the load: :class:`LoadMetrics`
+        """
+        start: float = time.perf_counter()
+        rows: typing.Iterator[typing.Sequence] = iter(self._rows(source, delimiter, header))
+        first_row: typing.Optional[typing.Sequence] = next(rows, None)
+        if first_row is None:
+            return LoadMetrics(0, time.perf_counter() - start, [], [])
+        num_columns: int = len(columns) if columns else len(first_row)
+        rows = chain((first_row,), rows)
+
+        targets: typing.List[str] = [table] * self.workers
+        if staging:
+            token: str = uuid.uuid4().hex[:8]
+            targets = ["{}_stage_{}_{}".format(table, token, idx) for idx in range(self.workers)]
+        coordinator: "Connection" = redshift_connector.connect(**self.connect_kwargs)
+        try:
+            with coordinator.cursor() as cursor:
+                # the names of the table and of the columns are part of the statements, so they must be in the catalog
+                cursor._check_table_columns(table, columns or [], "ParallelLoader.load")
+        except BaseException:
+            coordinator.close()
+            raise
+
+        try:
+            if staging:
+                with coordinator.cursor() as cursor:
+                    for target in targets:
+                        cursor.execute("CREATE TABLE {} (LIKE {})".format(target, table))
+                coordinator.commit()
+
+            worker_rows, worker_seconds, errors = self._run_workers(rows, targets, columns, num_columns)
+            if errors:
+                raise InterfaceError("Parallel load into {} failed: {}".format(table, "; ".join(errors)))
+
+            inserted: int = sum(worker_rows)
+            if staging:
+                column_list: str = ", ".join(columns) if columns else "*"
+                with coordinator.cursor() as cursor:
+                    cursor.execute(
+                        "INSERT INTO {} {}{}".format(
+                            table,
+                            "({}) ".format(column_list) if columns else "",
+                            " UNION ALL ".join("SELECT {} FROM {}".format(column_list, t) for t in targets),
+                        )
+                    )
+                    inserted = cursor.rowcount
+                coordinator.commit()
+        finally:
+            try:
+                coordinator.rollback()
+                if staging:
+                    with coordinator.cursor() as cursor:
+                        for target in targets:
+                            cursor.execute("DROP TABLE IF EXISTS {}".format(target))
+                    coordinator.commit()
+            finally:
+                coordinator.close()
+
+        metrics: LoadMetrics = LoadMetrics(inserted, time.perf_counter() - start, worker_rows, worker_seconds)
+        _logger.debug("Loaded %s into %s", metrics, table)
+        return metrics
+
+    def _run_workers(
+        self: "ParallelLoader",
+        rows: typing.Iterator[typing.Sequence],
+        targets: typing.List[str],
+        columns: typing.Optional[typing.List[str]],
+        num_columns: int,
+    ) -> typing.Tuple[typing.List[int], typing.List[float], typing.List[str]]:
+        chunks: typing.Any
+        results: typing.Any
+        worker_type: typing.Any
+        if self.use_processes:
+            import multiprocessing
+
+            chunks = multiprocessing.Queue(maxsize=self.workers * self.queue_depth)
+            results = multiprocessing.Queue()
+            worker_type = multiprocessing.Process
+        else:
+            chunks = queue.Queue(maxsize=self.workers * self.queue_depth)
+            results = queue.Queue()
+            worker_type = threading.Thread
+
+        workers: typing.List[typing.Any] = [
+            worker_type(
+                target=_load_worker,
+                args=(
+                    self.connect_kwargs,
+                    target,
+                    columns,
+                    num_columns,
+                    self.batch_size,
+                    self.max_batch_bytes,
+                    chunks,
+                    results,
+                    idx,
+                ),
+                daemon=True,
+            )
+            for idx, target in enumerate(targets)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            while True:
+                chunk: typing.List[typing.Sequence] = list(islice(rows, self.batch_size))
+                if len(chunk) == 0:
+                    break
+                _put_chunk(chunks, chunk, workers)
+        finally:
+            try:
+                for _ in workers:
+                    _put_chunk(chunks, None, workers)
+            except InterfaceError:
+                # the workers which died are reported below as not having reported their result
+                pass
+
+        worker_rows: typing.List[int] = [0] * len(workers)
+        worker_seconds: typing.List[float] = [0.0] * len(workers)
+        errors: typing.List[str] = []
+        pending: typing.Set[int] = set(range(len(workers)))
+        while pending:
+            # a worker which exited before the wait has already put its result, if it put one
+            exited: typing.Set[int] = {idx for idx in pending if not workers[idx].is_alive()}
+            try:
+                worker_id, inserted, seconds, error = results.get(timeout=_QUEUE_TIMEOUT)
+            except queue.Empty:
+                for idx in sorted(exited):
+                    errors.append("worker {}: exited without reporting its result".format(idx))
+                pending -= exited
+                continue
+            pending.discard(worker_id)
+            worker_rows[worker_id] = inserted
+            worker_seconds[worker_id] = seconds
+            if error is not None:
+                errors.append("worker {}: {}".format(worker_id, error))
+        for worker in workers:
+            worker.join()
+        return worker_rows, worker_seconds, errors
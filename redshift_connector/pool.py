@@ -0,0 +1,316 @@
+import logging
+import threading
+import time
+import typing
+from collections import deque
+from contextlib import contextmanager
+
+import redshift_connector
+from redshift_connector.error import InterfaceError
+from redshift_connector.iam_helper import IamHelper
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.core import Connection
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+
+class _PoolEntry:
+    """
+    A connection opened by a :class:`ConnectionPool`, with the times it was opened and last returned to the pool.
+    """
+
+    def __init__(self: "_PoolEntry", conn: "Connection") -> None:
+        self.conn: "Connection" = conn
+        self.created: float = time.monotonic()
+        self.last_used: float = self.created
+        self.autocommit: bool = conn.autocommit
+
+
+def _is_authentication_error(error: Exception) -> bool:
+    details: typing.Any = error.args[0] if len(error.args) > 0 else None
+    # the SQLSTATE of the ErrorResponse, 28000 or 28P01 when the credentials are rejected
+    return isinstance(details, dict) and str(details.get("C", "")).startswith("28")
+
+
+class ConnectionPool:
+    """
+    A thread-safe pool of connections to Amazon Redshift, which avoids the cost of the connection handshake and
+    authentication on each use.
+
+    Connections are opened with :func:`redshift_connector.connect` as they are needed, up to ``max_size``, and
+    ``min_size`` connections are opened when the pool is created. :meth:`getconn` waits up to ``timeout`` seconds
+    for a connection once ``max_size`` connections are in use.
+
+    A connection is closed instead of being reused once it has been open for ``max_lifetime`` seconds. Connections
+    beyond ``min_size`` are closed once they have been idle in the pool for ``max_idle`` seconds. A connection idle
+    for more than ``ping_after`` seconds is checked with :meth:`Connection.ping` before it is handed out, and
+    replaced if it is broken.
+
+    When a connection is returned, an open transaction is rolled back and ``autocommit`` is restored. With
+    ``reset_session=True`` the session parameters are also reset with ``RESET ALL``.
+
+    New connections using IAM authentication whose cached temporary credentials are rejected by the server are
+    retried once with new credentials.
+    """
+
+    def __init__(
+        self: "ConnectionPool",
+        connect_kwargs: typing.Dict[str, typing.Any],
+        min_size: int = 0,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_lifetime: typing.Optional[float] = 3600.0,
+        max_idle: typing.Optional[float] = 600.0,
+        ping_after: float = 5.0,
+        reset_session: bool = False,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        connect_kwargs : Dict[str, Any] The keyword arguments passed to :func:`redshift_connector.connect` to open each connection
+        min_size : int The number of connections kept open. Defaults to 0
+        max_size : int The maximum number of open connections. Defaults to 10
+        timeout : float The number of seconds :meth:`getconn` waits for a connection. Defaults to 30
+        max_lifetime : Optional[float] The number of seconds after which a connection is closed rather than reused. Defaults to 3600. None disables the limit
+        max_idle : Optional[float] The number of seconds after which an idle connection beyond ``min_size`` is closed. Defaults to 600. None disables the limit
+        ping_after : float The number of seconds a connection can be idle before it is checked when handed out. Defaults to 5
+        reset_session : bool Reset the session parameters of connections returned to the pool. Defaults to False
+        """
+        if max_size < 1:
+            raise InterfaceError("max_size must be greater than 0")
+        if min_size < 0 or min_size > max_size:
+            raise InterfaceError("min_size must be between 0 and max_size")
+        self.connect_kwargs: typing.Dict[str, typing.Any] = connect_kwargs
+        self.min_size: int = min_size
+        self.max_size: int = max_size
+        self.timeout: float = timeout
+        self.max_lifetime: typing.Optional[float] = max_lifetime
+        self.max_idle: typing.Optional[float] = max_idle
+        self.ping_after: float = ping_after
+        self.reset_session: bool = reset_session
+
+        self._lock: threading.Condition = threading.Condition()
+        # idle connections, the most recently returned last
+        self._idle: typing.Deque[_PoolEntry] = deque()
+        self._in_use: typing.Dict[int, _PoolEntry] = {}
+        # the number of open connections, including those being opened
+        self._size: int = 0
+        self._closed: bool = False
+
+        for _ in range(min_size):
+            self._size += 1
+            try:
+                self._idle.append(_PoolEntry(self._connect()))
+            except Exception:
+                self._size -= 1
+                self.close()
+                raise
+
+    @property
+    def size(self: "ConnectionPool") -> int:
+        """
+        The number of open connections, idle or in use.
+        """
+        return self._size
+
+    @property
+    def idle(self: "ConnectionPool") -> int:
+        """
+        The number of idle connections in the pool.
+        """
+        return len(self._idle)
+
+    def _connect(self: "ConnectionPool") -> "Connection":
+        try:
+            return redshift_connector.connect(**self.connect_kwargs)
+        except Exception as e:
+            if not self.connect_kwargs.get("iam", False) or not _is_authentication_error(e):
+                raise
+            _logger.debug("Temporary credentials were rejected, connecting again with new credentials")
+            IamHelper.credentials_cache.clear()
+            return redshift_connector.connect(**self.connect_kwargs)
+
+    def _expired(self: "ConnectionPool", entry: _PoolEntry, now: float) -> bool:
+        return entry.conn._sock is None or (self.max_lifetime is not None and now - entry.created >= self.max_lifetime)
+
+    def _close_entry(self: "ConnectionPool", entry: _PoolEntry) -> None:
+        with self._lock:
+            self._size -= 1
+            self._lock.notify()
+        self._close_connection(entry.conn)
+
+    @staticmethod
+    def _close_connection(conn: "Connection") -> None:
+        try:
+            conn.close()
+        except Exception as e:
+            _logger.debug("Failed to close pooled connection: %s", e)
+
+    def _evict_idle(self: "ConnectionPool", now: float) -> typing.List[_PoolEntry]:
+        """
+        Removes the connections idle for longer than ``max_idle`` beyond ``min_size`` from the pool, which must be
+        locked, and returns them to be closed.
+        """
+        evicted: typing.List[_PoolEntry] = []
+        if self.max_idle is None:
+            return evicted
+        while len(self._idle) > 0 and self._size > self.min_size:
+            if now - self._idle[0].last_used < self.max_idle:
+                break
+            evicted.append(self._idle.popleft())
+            self._size -= 1
+        return evicted
+
+    def getconn(self: "ConnectionPool", timeout: typing.Optional[float] = None) -> "Connection":
+        """
+        Returns a connection from the pool, opening one if none is idle and fewer than ``max_size`` are open. The
+        connection must be returned with :meth:`putconn`.
+
+        Parameters
+        ----------
+        timeout : Optional[float] The number of seconds to wait for a connection. Defaults to the ``timeout`` of the pool
+
+        Returns
+        -------
+        A connection: :class:`Connection`
+        """
+        deadline: float = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            entry: typing.Optional[_PoolEntry] = None
+            evicted: typing.List[_PoolEntry] = []
+            with self._lock:
+                while True:
+                    if self._closed:
+                        raise InterfaceError("connection pool is closed")
+                    evicted.extend(self._evict_idle(time.monotonic()))
+                    if len(self._idle) > 0:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        break
+                    remaining: float = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise InterfaceError(
+                            "Timed out waiting for a connection from the pool of {} connections".format(self.max_size)
+                        )
+                    self._lock.wait(remaining)
+            for stale in evicted:
+                self._close_connection(stale.conn)
+
+            if entry is None:
+                try:
+                    entry = _PoolEntry(self._connect())
+                except Exception:
+                    with self._lock:
+                        self._size -= 1
+                        self._lock.notify()
+                    raise
+            else:
+                now: float = time.monotonic()
+                if self._expired(entry, now):
+                    self._close_entry(entry)
+                    continue
+                if now - entry.last_used > self.ping_after:
+                    try:
+                        entry.conn.ping()
+                    except Exception as e:
+                        _logger.debug("Discarding broken pooled connection: %s", e)
+                        self._close_entry(entry)
+                        continue
+
+            with self._lock:
+                self._in_use[id(entry.conn)] = entry
+            return entry.conn
+
+    def _reset(self: "ConnectionPool", entry: _PoolEntry) -> None:
+        conn: "Connection" = entry.conn
+        if conn.in_transaction:
+            conn.rollback()
+        conn.autocommit = entry.autocommit
+        if self.reset_session:
+            with conn.cursor() as cursor:
+                cursor.execute("RESET ALL")
+            if conn.in_transaction:
+                conn.commit()
+
+    def putconn(self: "ConnectionPool", conn: "Connection", discard: bool = False) -> None:
+        """
+        Returns a connection obtained from :meth:`getconn` to the pool. An open transaction is rolled back.
+
+        Parameters
+        ----------
+        conn : :class:`Connection` The connection
+        discard : bool Close the connection rather than keeping it in the pool. Defaults to False
+
+        Returns
+        -------
+        None:None
+        """
+        with self._lock:
+            entry: typing.Optional[_PoolEntry] = self._in_use.pop(id(conn), None)
+        if entry is None or entry.conn is not conn:
+            raise InterfaceError("The connection does not belong to the pool")
+
+        now: float = time.monotonic()
+        if not discard and not self._closed and not self._expired(entry, now):
+            try:
+                self._reset(entry)
+            except Exception as e:
+                _logger.debug("Discarding pooled connection which could not be reset: %s", e)
+                discard = True
+        else:
+            discard = True
+
+        if discard:
+            self._close_entry(entry)
+            return
+        entry.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(entry)
+            evicted: typing.List[_PoolEntry] = self._evict_idle(entry.last_used)
+            self._lock.notify()
+        for stale in evicted:
+            self._close_connection(stale.conn)
+
+    @contextmanager
+    def connection(self: "ConnectionPool", timeout: typing.Optional[float] = None) -> typing.Iterator["Connection"]:
+        """
+        Returns a context manager providing a connection from the pool, which is returned to the pool on exit.
+
+        Parameters
+        ----------
+        timeout : Optional[float] The number of seconds to wait for a connection. Defaults to the ``timeout`` of the pool
+
+        Returns
+        -------
+        A context manager providing a connection: Iterator[:class:`Connection`]
+        """
+        conn: "Connection" = self.getconn(timeout)
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def close(self: "ConnectionPool") -> None:
+        """
+        Closes the idle connections and the pool. Connections in use are closed when they are returned.
+
+        Returns
+        -------
+        None:None
+        """
+        with self._lock:
+            self._closed = True
+            idle: typing.List[_PoolEntry] = list(self._idle)
+            self._idle.clear()
+            self._lock.notify_all()
+        for entry in idle:
+            self._close_entry(entry)
+
+    def __enter__(self: "ConnectionPool") -> "ConnectionPool":
+        return self
+
+    def __exit__(self: "ConnectionPool", exc_type, exc_value, traceback) -> None:
+        self.close()
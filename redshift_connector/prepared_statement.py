@@ -0,0 +1,169 @@
+import typing
+from itertools import count
+from os import getpid
+
+from redshift_connector.error import InterfaceError
+from redshift_connector.utils import NULL_BYTE
+from redshift_connector.utils.type_utils import (
+    BIGINT,
+    FC_TEXT,
+    INTEGER,
+    SMALLINT,
+    UNKNOWN,
+    str_out,
+)
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.core import Connection
+    from redshift_connector.cursor import Cursor
+
+# numbers the statements created by PreparedStatement, whose names are distinct from those cached by Connection.execute
+_statement_nums: typing.Iterator[int] = count(1)
+
+
+class PreparedStatement:
+    """
+    A statement prepared on the server by :meth:`Cursor.prepare`, which can be executed many times with different
+    parameters.
+
+    The SQL statement is converted from the cursor's paramstyle once, and the server-side statement, the parameter
+    send functions, the row decoders and the fixed parts of the Bind message are built once, so each execution only
+    sends the Bind and Execute messages. Executions don't use the statement cache of the connection.
+
+    The type of each parameter is fixed when the statement is parsed by the server: when it is created if a type is
+    given for every parameter, otherwise on the first execution, using the types of its values. Parameters whose
+    type is given or whose first value is NULL are sent as the ``str`` of their value, and parameters whose first
+    value is an ``int`` of up to 64 bits are sent as ``bigint``. Later values must be of the same type as the first
+    values, or NULL. A value which can't be sent as the type of its parameter raises :exc:`DataError`, and a
+    sequence of values whose length isn't the number of parameters raises :exc:`ProgrammingError`.
+
+    .. attribute:: operation
+
+        The SQL statement, in the paramstyle of the cursor.
+
+    .. attribute:: closed
+
+        Whether the statement has been closed.
+    """
+
+    def __init__(
+        self: "PreparedStatement",
+        cursor: "Cursor",
+        operation: str,
+        statement: str,
+        make_args: typing.Optional[typing.Callable],
+        param_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]] = None,
+    ) -> None:
+        self.cursor: "Cursor" = cursor
+        self.operation: str = operation
+        self.closed: bool = False
+        self._statement: str = statement
+        # None when parameters are given as sequences in the order of the statement
+        self._make_args: typing.Optional[typing.Callable] = make_args
+        self._param_oids: typing.Optional[typing.Tuple[typing.Optional[int], ...]] = param_oids
+        self._ps: typing.Optional[typing.Dict[str, typing.Any]] = None
+
+        if param_oids is not None and None not in param_oids:
+            self._parse((None,) * len(param_oids))
+
+    @property
+    def description(self: "PreparedStatement") -> typing.Optional[typing.List[typing.Tuple]]:
+        """
+        The description of the columns returned by the statement, in the format of :attr:`Cursor.description`, or
+        None if the statement returns no rows or hasn't been parsed yet.
+        """
+        if self._ps is None:
+            return None
+        return self._ps["description"]
+
+    def _connection(self: "PreparedStatement") -> "Connection":
+        if self.closed:
+            raise InterfaceError("prepared statement is closed")
+        conn: typing.Optional["Connection"] = self.cursor._c
+        if conn is None:
+            raise InterfaceError("Cursor closed")
+        if conn._sock is None:
+            raise InterfaceError("connection is closed")
+        return conn
+
+    def _parse(self: "PreparedStatement", args: typing.Sequence) -> typing.Dict[str, typing.Any]:
+        """
+        Returns the prepared statement, creating it on the server using the types of ``args`` if it doesn't exist.
+        """
+        if self._ps is not None:
+            return self._ps
+        conn: "Connection" = self._connection()
+        declared: typing.Tuple[typing.Optional[int], ...] = self._param_oids or ()
+        params: typing.List[typing.Tuple[int, int, typing.Callable]] = []
+        for idx, param in enumerate(conn.make_params(args, self._param_oids)):
+            if idx < len(declared) and declared[idx] is not None:
+                params.append(param)
+            elif param[0] == -1:
+                params.append((UNKNOWN, FC_TEXT, str_out))
+            elif param[0] in (SMALLINT, INTEGER):
+                # later values may not fit the smallest integer type holding the first value
+                params.append(conn.py_types[BIGINT])
+            else:
+                params.append(param)
+        statement_name: str = "_".join(("redshift_connector", "prepared", str(getpid()), str(next(_statement_nums))))
+        ps: typing.Dict[str, typing.Any] = {
+            "statement_name_bin": statement_name.encode("ascii") + NULL_BYTE,
+            "row_desc": [],
+        }
+        self.cursor.ps = ps
+        conn.parse_statement(self.cursor, ps, self._statement, params)
+        self._ps = ps
+        return ps
+
+    def execute(self: "PreparedStatement", params: typing.Any = ()) -> "Cursor":
+        """
+        Executes the statement with ``params``. The rows returned are fetched from the cursor.
+
+        Parameters
+        ----------
+        params : Union[Sequence, Mapping] The parameters of the statement, in the format expected by the paramstyle of the cursor.
+
+        Returns
+        -------
+        The Cursor which executed the statement: :class:`Cursor`
+        """
+        return self.executemany((params,))
+
+    def executemany(self: "PreparedStatement", rows: typing.Iterable) -> "Cursor":
+        """
+        Executes the statement once for each set of parameters in ``rows``. Executions are sent to the server in
+        batches, each answered in a single round trip. The row count of the cursor is the sum of the row counts of
+        the executions, and the rows returned by every execution are fetched from the cursor. If an execution fails,
+        the remaining executions of its batch are not performed.
+
+        Parameters
+        ----------
+        rows : Iterable[Union[Sequence, Mapping]] The parameters of each execution, in the format expected by the paramstyle of the cursor.
+
+        Returns
+        -------
+        The Cursor which executed the statement: :class:`Cursor`
+        """
+        self._connection()
+        param_sets: typing.Iterable[typing.Sequence] = rows
+        if self._make_args is not None:
+            param_sets = map(self._make_args, rows)
+        return self.cursor._execute_prepared(self._parse, param_sets)
+
+    def close(self: "PreparedStatement") -> None:
+        """
+        Closes the statement on the server. Closing a closed statement has no effect.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        conn: typing.Optional["Connection"] = self.cursor._c
+        if self._ps is not None and conn is not None and conn._sock is not None:
+            conn.close_prepared_statement(self._ps["statement_name_bin"])
+        self._ps = None
+
+    def __enter__(self: "PreparedStatement") -> "PreparedStatement":
+        return self
+
+    def __exit__(self: "PreparedStatement", exc_type, exc_value, traceback) -> None:
+        self.close()
@@ -0,0 +1,205 @@
+import typing
+
+from redshift_connector.utils.type_utils import ci_unpack, i_pack
+
+# the messages after which the server may wait for the client, so no further bytes should be read ahead of them:
+# ReadyForQuery, CopyInResponse and AuthenticationRequest
+_AWAITING_CLIENT: typing.Tuple[bytes, ...] = (b"Z", b"G", b"R")
+
+# the size of the message code and length which precede the content of each message received
+HEADER_SIZE: int = 5
+
+# the size from which bytes written are kept as they are, rather than copied into the buffer of the protocol
+ZERO_COPY_SIZE: int = 16384
+
+
+class Protocol:
+    """
+    The framing of the messages exchanged with Amazon Redshift, independent of the transport carrying them.
+
+    Bytes received from the server are given to :meth:`receive`, and the messages they complete are returned by
+    :meth:`next_message` as ``(code, content)`` pairs, which are dispatched to the message handlers of
+    :class:`Connection`. :meth:`bytes_needed` tells a blocking transport how many bytes to read to complete the
+    next message, so it never reads past the messages the server has sent.
+
+    Messages written by the client are accumulated by :meth:`write` and :meth:`send_message`, and returned by
+    :meth:`data_to_send` so the transport sends them in as few writes as possible. Written ``bytes`` of at least
+    ``ZERO_COPY_SIZE`` bytes, such as large parameter values, are not copied, and are returned separately by
+    :meth:`buffers_to_send` for a transport with scatter I/O.
+
+    Only the framing is independent of the transport. The message handlers, and the state of the session they
+    update, belong to :class:`Connection`, which drives the protocol over its socket. Another transport creates the
+    connection with ``Connection._for_external_transport``, sends the messages its handlers write here, and
+    dispatches the messages it receives to them, as the asyncio connection does.
+    """
+
+    def __init__(self: "Protocol") -> None:
+        # received bytes which have not been returned as messages, starting at _pos
+        self._in: bytes = b""
+        self._pos: int = 0
+        # the code and content length of the message being received, once its header is complete
+        self._code: typing.Optional[bytes] = None
+        self._length: int = 0
+        self._out: bytearray = bytearray()
+        # the buffers written before _out, which are either large bytes or earlier contents of _out
+        self._buffers: typing.List[typing.Union[bytes, bytearray]] = []
+        self._buffered_out: int = 0
+
+    def receive(self: "Protocol", data: bytes) -> None:
+        """
+        Adds bytes received from the server.
+        """
+        if self._pos == len(self._in):
+            # the received bytes are used without copying them when no bytes are pending
+            self._in = data
+        else:
+            self._in = self._in[self._pos :] + data
+        self._pos = 0
+
+    @property
+    def buffered(self: "Protocol") -> int:
+        """
+        The number of received bytes which have not been returned as messages.
+        """
+        return len(self._in) - self._pos
+
+    def bytes_needed(self: "Protocol", read_ahead: bool = False) -> int:
+        """
+        Returns the number of bytes which complete the next message, or 0 if it is complete.
+
+        Parameters
+        ----------
+        read_ahead : bool Also count the header of the message which follows, unless the server may wait for the client after the next message.
+
+        Returns
+        -------
+        The number of bytes to receive: int
+        """
+        available: int = len(self._in) - self._pos
+        if self._code is None:
+            if available < HEADER_SIZE:
+                return HEADER_SIZE - available
+            self._read_header()
+        needed: int = self._length - (len(self._in) - self._pos)
+        if needed <= 0:
+            return 0
+        if read_ahead and self._code not in _AWAITING_CLIENT:
+            needed += HEADER_SIZE
+        return needed
+
+    def _read_header(self: "Protocol") -> None:
+        code, length = ci_unpack(self._in, self._pos)
+        self._code = code
+        self._length = length - 4
+        self._pos += HEADER_SIZE
+
+    def next_message(self: "Protocol") -> typing.Optional[typing.Tuple[bytes, bytes]]:
+        """
+        Returns the code and content of the next message received, or None if it isn't complete.
+        """
+        data: bytes = self._in
+        pos: int = self._pos
+        code: typing.Optional[bytes] = self._code
+        if code is None:
+            if len(data) - pos < HEADER_SIZE:
+                return None
+            code, length = ci_unpack(data, pos)
+            pos += HEADER_SIZE
+            length -= 4
+        else:
+            length = self._length
+        end: int = pos + length
+        if end > len(data):
+            self._code, self._length, self._pos = code, length, pos
+            return None
+        self._code = None
+        self._pos = end
+        if pos == 0 and end == len(data):
+            return code, data
+        return code, data[pos:end]
+
+    def messages(self: "Protocol") -> typing.Iterator[typing.Tuple[bytes, bytes]]:
+        """
+        Yields the code and content of each complete message received, as :meth:`next_message` would return them.
+        Each message is removed from the protocol as it is yielded, so the iteration can be abandoned, but no bytes
+        may be received until it is.
+        """
+        data: bytes = self._in
+        size: int = len(data)
+        pos: int = self._pos
+        while True:
+            code: typing.Optional[bytes] = self._code
+            if code is None:
+                if size - pos < HEADER_SIZE:
+                    return
+                code, length = ci_unpack(data, pos)
+                pos += HEADER_SIZE
+                length -= 4
+            else:
+                length = self._length
+                self._code = None
+            end: int = pos + length
+            if end > size:
+                self._code, self._length, self._pos = code, length, pos
+                return
+            self._pos = end
+            if pos == 0 and end == size:
+                yield code, data
+            else:
+                yield code, data[pos:end]
+            pos = end
+
+    def write(self: "Protocol", data: typing.Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Adds bytes to be sent to the server.
+        """
+        if len(data) >= ZERO_COPY_SIZE and isinstance(data, bytes):
+            # bytes are immutable, so they are kept until they are sent rather than copied
+            if self._out:
+                self._buffers.append(self._out)
+                self._buffered_out += len(self._out)
+                self._out = bytearray()
+            self._buffers.append(data)
+            self._buffered_out += len(data)
+        else:
+            self._out += data
+
+    def send_message(self: "Protocol", code: bytes, data: typing.Union[bytes, bytearray, memoryview] = b"") -> None:
+        """
+        Adds a message to be sent to the server.
+        """
+        self._out += code
+        self._out += i_pack(len(data) + 4)
+        self.write(data)
+
+    @property
+    def bytes_to_send(self: "Protocol") -> int:
+        """
+        The number of bytes to be sent to the server.
+        """
+        return self._buffered_out + len(self._out)
+
+    def data_to_send(self: "Protocol") -> bytearray:
+        """
+        Returns the bytes to be sent to the server, and removes them from the protocol.
+        """
+        data: bytearray = self._out
+        if self._buffers:
+            data = bytearray().join(self._buffers + [data])
+            self._buffers = []
+            self._buffered_out = 0
+        self._out = bytearray()
+        return data
+
+    def buffers_to_send(self: "Protocol") -> typing.List[typing.Union[bytes, bytearray]]:
+        """
+        Returns the buffers holding the bytes to be sent to the server, in order and without copying them, and
+        removes them from the protocol.
+        """
+        buffers: typing.List[typing.Union[bytes, bytearray]] = self._buffers
+        if self._out:
+            buffers.append(self._out)
+            self._out = bytearray()
+        self._buffers = []
+        self._buffered_out = 0
+        return buffers
@@ -2,6 +2,7 @@ import typing
 
 from redshift_connector.config import DEFAULT_PROTOCOL_VERSION
 from redshift_connector.error import ProgrammingError
+from redshift_connector.retry import RetryPolicy
 
 SERVERLESS_HOST_PATTERN: str = r"(.+)\.(.+).redshift-serverless(-dev)?\.amazonaws\.com(.)*"
 
@@ -25,6 +26,8 @@ class RedshiftProperty:
             self.auth_profile: typing.Optional[str] = None
             # Indicates whether the user should be created if it does not already exist.
             self.auto_create: bool = False
+            # start connecting a lazy connection on a background thread when it is created
+            self.background_connect: bool = False
             # The client ID associated with the user name in the Azure AD portal. Only used for Azure AD.
             self.client_id: typing.Optional[str] = None
             # client's requested transfer protocol version. See config.py for supported protocols
@@ -33,6 +36,8 @@ class RedshiftProperty:
             self.client_secret: typing.Optional[str] = None
             # The name of the Redshift Cluster to use.
             self.cluster_identifier: typing.Optional[str] = None
+            # the number of seconds to wait for each endpoint to accept the connection, by default timeout
+            self.connect_timeout: typing.Optional[float] = None
             # The class path to a specific credentials provider plugin class.
             self.credentials_provider: typing.Optional[str] = None
             # Boolean indicating if application supports multidatabase datashare catalogs.
@@ -46,9 +51,17 @@ class RedshiftProperty:
             self.db_name: str = ""
             # The user name.
             self.db_user: typing.Optional[str] = None
+            # the time the addresses of an endpoint are reused by later connections
+            self.dns_ttl: float = 0.0
             # The length of time, in seconds
             self.duration: int = 900
+            # the time an endpoint which failed to accept a connection is tried after the other endpoints
+            self.endpoint_cooldown: float = 30.0
             self.endpoint_url: typing.Optional[str] = None
+            # the endpoints connected to instead of host and port
+            self.endpoints: typing.Optional[typing.Sequence[typing.Union[str, typing.Tuple[str, int]]]] = None
+            # max number of rows per statement when executemany rewrites single row inserts
+            self.executemany_page_size: int = 100
             # Forces the database group names to be lower case.
             self.force_lowercase: bool = False
             # The host to connect to.
@@ -63,10 +76,16 @@ class RedshiftProperty:
             self.idp_tenant: typing.Optional[str] = None
             # The port used by an IdP (identity provider).
             self.idpPort: int = 443
+            # defer connecting to the server until the connection is first used
+            self.lazy: bool = False
             self.listen_port: int = 7890
+            # how the endpoint tried first is chosen, round_robin or least_latency
+            self.load_balance: str = "round_robin"
             self.login_url: typing.Optional[str] = None
             # max number of prepared statements
             self.max_prepared_statements: int = 1000
+            # max number of bytes of received rows a cursor holds in memory, unlimited if None
+            self.max_result_memory: typing.Optional[int] = None
             # parameter for PingIdentity
             self.partner_sp_id: typing.Optional[str] = None
             # The password.
@@ -84,15 +103,21 @@ class RedshiftProperty:
             # Used to run in streaming replication mode. If your server character encoding is not ascii or utf8,
             # then you need to provide values as bytes
             self.replication: typing.Optional[str] = None
+            # how failed reads and transactions are retried, not at all if None
+            self.retry_policy: typing.Optional[RetryPolicy] = None
             self.role_arn: typing.Optional[str] = None
             self.role_session_name: typing.Optional[str] = None
             # The secret access key for the IAM role or IAM user configured for IAM database authentication
             self.secret_access_key: typing.Optional[str] = None
+            # run-time parameters of the session set by the start-up message
+            self.session_settings: typing.Optional[typing.Mapping[str, typing.Any]] = None
             # session_token is required only for an IAM role with temporary credentials.
             # session_token is not used for an IAM user.
             self.session_token: typing.Optional[str] = None
             # The source IP address which initiates the connection to the Amazon Redshift server.
             self.source_address: typing.Optional[str] = None
+            # hold rows received beyond max_result_memory in a temporary file rather than failing the statement
+            self.spill_results: bool = True
             # if SSL authentication will be used
             self.ssl: bool = True
             # This property indicates whether the IDP hosts server certificate should be verified.
@@ -101,6 +126,8 @@ class RedshiftProperty:
             self.sslmode: str = "verify-ca"
             # Use this property to enable or disable TCP keepalives.
             self.tcp_keepalive: bool = True
+            # share the connection between threads, each statement holding a lock of the connection
+            self.thread_safe: bool = False
             # This is the time in seconds before the connection to the server will time out.
             self.timeout: typing.Optional[int] = None
             # The path to the UNIX socket to access the database through
@@ -0,0 +1,208 @@
+import logging
+import random
+import re
+import threading
+import time
+import typing
+
+from redshift_connector.error import InterfaceError
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.core import Connection
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+_T = typing.TypeVar("_T")
+
+# the SQLSTATE of a transaction aborted by a serialization conflict with a concurrent transaction
+SERIALIZATION_FAILURE: str = "40001"
+
+# statements which only read, unless they contain a keyword which writes
+_READ_STATEMENT: typing.Pattern = re.compile(r"^\s*(select|with|show)\b", re.IGNORECASE)
+_WRITE_KEYWORD: typing.Pattern = re.compile(
+    r"\b(into|insert|update|delete|merge|create|drop|alter|truncate|grant|revoke|call)\b", re.IGNORECASE
+)
+
+
+def is_idempotent_read(operation: typing.Any) -> bool:
+    """
+    Returns whether ``operation`` only reads, so executing it again after a failure has no other effect.
+    """
+    if not isinstance(operation, str):
+        return False
+    return _READ_STATEMENT.match(operation) is not None and _WRITE_KEYWORD.search(operation) is None
+
+
+def is_connection_error(error: BaseException) -> bool:
+    """
+    Returns whether ``error`` was raised because the connection to the server failed or broke.
+    """
+    if isinstance(error, OSError):
+        return True
+    message: typing.Any = error.args[0] if isinstance(error, InterfaceError) and len(error.args) > 0 else None
+    return isinstance(message, str) and message.startswith(("communication error", "connection is broken"))
+
+
+def is_serialization_failure(error: BaseException) -> bool:
+    """
+    Returns whether ``error`` is the ErrorResponse of a transaction aborted by a serialization conflict.
+    """
+    details: typing.Any = error.args[0] if len(error.args) > 0 else None
+    return isinstance(details, dict) and details.get("C") == SERIALIZATION_FAILURE
+
+
+class RetryPolicy:
+    """
+    How a :class:`Connection` retries operations which fail transiently: idempotent reads executed outside of a
+    transaction, and the transactions run by :meth:`Connection.run_in_transaction`.
+
+    An operation is retried when the connection breaks, after connecting to the server again, or when its
+    transaction is aborted by a serialization conflict (SQLSTATE 40001), after rolling it back. It is attempted at
+    most ``max_attempts`` times, waiting a random time of up to ``initial_backoff`` seconds before the first retry,
+    and up to ``multiplier`` times longer before each following retry, but no longer than ``max_backoff`` seconds.
+    Failing to connect again or to roll back is a failed attempt, retried in the same way.
+
+    Retries are limited by a budget shared by the connections using the policy, so an outage doesn't multiply the
+    load on the server: each retry spends one token of ``budget``, and each operation which succeeds earns
+    ``budget_ratio`` tokens back. Once the budget is spent, failures are raised without being retried.
+
+    The counters of the policy, such as :attr:`retries`, can be monitored through :attr:`counters`.
+
+    .. attribute:: attempts
+
+        The number of times an operation was attempted.
+
+    .. attribute:: retries
+
+        The number of times an operation was retried.
+
+    .. attribute:: reconnects
+
+        The number of times a broken connection was replaced to retry an operation.
+
+    .. attribute:: serialization_failures
+
+        The number of times an operation failed with a serialization conflict.
+
+    .. attribute:: exhausted
+
+        The number of failures which weren't retried because the budget was spent.
+
+    .. attribute:: gave_up
+
+        The number of operations which failed transiently on each of their ``max_attempts`` attempts.
+    """
+
+    def __init__(
+        self: "RetryPolicy",
+        max_attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        multiplier: float = 2.0,
+        budget: float = 10.0,
+        budget_ratio: float = 0.1,
+    ) -> None:
+        if max_attempts < 1:
+            raise InterfaceError("max_attempts must be at least 1")
+        self.max_attempts: int = max_attempts
+        self.initial_backoff: float = initial_backoff
+        self.max_backoff: float = max_backoff
+        self.multiplier: float = multiplier
+        self.budget: float = budget
+        self.budget_ratio: float = budget_ratio
+
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = budget
+        self.attempts: int = 0
+        self.retries: int = 0
+        self.reconnects: int = 0
+        self.serialization_failures: int = 0
+        self.exhausted: int = 0
+        self.gave_up: int = 0
+
+    def __deepcopy__(self: "RetryPolicy", memo: typing.Dict) -> "RetryPolicy":
+        # copies of the connection properties share the budget and counters of the policy
+        return self
+
+    @property
+    def counters(self: "RetryPolicy") -> typing.Dict[str, int]:
+        """
+        The counters of the policy, by name.
+        """
+        with self._lock:
+            return {
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "reconnects": self.reconnects,
+                "serialization_failures": self.serialization_failures,
+                "exhausted": self.exhausted,
+                "gave_up": self.gave_up,
+            }
+
+    def backoff(self: "RetryPolicy", retry: int) -> float:
+        """
+        Returns the number of seconds to wait before the ``retry``-th retry of an operation.
+        """
+        return random.uniform(0, min(self.max_backoff, self.initial_backoff * self.multiplier ** (retry - 1)))
+
+    def _should_retry(self: "RetryPolicy", error: BaseException, attempt: int) -> bool:
+        connection_error: bool = is_connection_error(error)
+        serialization_failure: bool = is_serialization_failure(error)
+        if not connection_error and not serialization_failure:
+            return False
+        with self._lock:
+            if serialization_failure:
+                self.serialization_failures += 1
+            if attempt >= self.max_attempts:
+                self.gave_up += 1
+                return False
+            if self._tokens < 1:
+                self.exhausted += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def run(self: "RetryPolicy", conn: "Connection", operation: typing.Callable[[], _T]) -> _T:
+        """
+        Returns the result of ``operation``, retrying it on ``conn`` while it fails transiently.
+        """
+        attempt: int = 1
+        # the error of the last attempt, which conn is recovered from before the next attempt
+        failure: typing.Optional[BaseException] = None
+        while True:
+            with self._lock:
+                self.attempts += 1
+            try:
+                if failure is not None:
+                    # failing to recover, such as when connecting again fails, is a failed attempt
+                    self._recover(conn, failure)
+                result: _T = operation()
+            except Exception as e:
+                if not self._should_retry(e, attempt):
+                    raise
+                delay: float = self.backoff(attempt)
+                _logger.debug("Retrying in %.3fs after attempt %s failed: %s", delay, attempt, e)
+                time.sleep(delay)
+                failure = e
+                attempt += 1
+                continue
+            with self._lock:
+                self._tokens = min(self.budget, self._tokens + self.budget_ratio)
+            return result
+
+    def _recover(self: "RetryPolicy", conn: "Connection", error: BaseException) -> None:
+        """
+        Prepares ``conn`` to retry an operation which failed with ``error``.
+        """
+        if not is_connection_error(error):
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+                return
+            except Exception as e:
+                if not is_connection_error(e):
+                    raise
+        conn._reconnect()
+        with self._lock:
+            self.reconnects += 1
@@ -14,6 +14,7 @@ from .type_utils import (
     NULL,
     NULL_BYTE,
     array_recv_binary,
+    array_recv_binary_1d,
     array_recv_text,
     bh_unpack,
     cccc_unpack,
@@ -29,16 +30,23 @@ from .type_utils import (
     ihihih_unpack,
     ii_pack,
     iii_pack,
+    int2_vector_recv,
     int_array_recv,
+    int_in,
     numeric_in,
     numeric_in_binary,
+    oid_recv,
+    oid_vector_recv,
     pg_types,
     py_types,
     q_pack,
+    str_out,
     text_recv,
+    text_value,
     time_in,
     time_recv_binary,
     timetz_in,
     timetz_recv_binary,
     varbytehex_recv,
+    vector_in,
 )
@@ -0,0 +1,128 @@
+import typing
+
+from redshift_connector.utils.columnar import ColumnKind, column_plan, decode_columns
+from redshift_connector.utils.type_utils import (
+    BIGINT,
+    BIGINT_ARRAY,
+    BOOLEAN,
+    CHAR_ARRAY,
+    DATE,
+    FLOAT,
+    FLOAT_ARRAY,
+    INT2VECTOR,
+    INTEGER,
+    INTEGER_ARRAY,
+    NAME_ARRAY,
+    NUMERIC,
+    OID_ARRAY,
+    OIDVECTOR,
+    REAL,
+    REAL_ARRAY,
+    SMALLINT,
+    SMALLINT_ARRAY,
+    TEXT_ARRAY,
+    TIME,
+    TIMESTAMP,
+    TIMESTAMPTZ,
+    TIMETZ,
+    VARCHAR_ARRAY,
+)
+
+if typing.TYPE_CHECKING:
+    import pyarrow  # type: ignore
+
+    from redshift_connector.column_descriptor import ColumnDescriptor
+
+
+def _arrow_type(pa, col: "ColumnDescriptor") -> typing.Optional["pyarrow.DataType"]:
+    """
+    Returns the Arrow type used for a result column, or None if values should be converted to strings.
+    """
+    oid: int = col.type_oid
+    if oid == SMALLINT:
+        return pa.int16()
+    elif oid == INTEGER:
+        return pa.int32()
+    elif oid == BIGINT:
+        return pa.int64()
+    elif oid == REAL:
+        return pa.float32()
+    elif oid == FLOAT:
+        return pa.float64()
+    elif oid == BOOLEAN:
+        return pa.bool_()
+    elif oid == NUMERIC:
+        # without a type modifier the precision and scale are unknown, so values are converted to strings
+        if not col.precision:
+            return None
+        return pa.decimal128(col.precision, col.scale or 0)
+    elif oid == TIMESTAMP:
+        return pa.timestamp("us")
+    elif oid == TIMESTAMPTZ:
+        return pa.timestamp("us", tz="UTC")
+    elif oid == DATE:
+        return pa.date32()
+    elif oid in (TIME, TIMETZ):
+        return pa.time64("us")
+    elif oid in (SMALLINT_ARRAY, INT2VECTOR):
+        return pa.list_(pa.int16())
+    elif oid == INTEGER_ARRAY:
+        return pa.list_(pa.int32())
+    elif oid in (BIGINT_ARRAY, OID_ARRAY, OIDVECTOR):
+        return pa.list_(pa.int64())
+    elif oid == REAL_ARRAY:
+        return pa.list_(pa.float32())
+    elif oid == FLOAT_ARRAY:
+        return pa.list_(pa.float64())
+    elif oid in (TEXT_ARRAY, VARCHAR_ARRAY, CHAR_ARRAY, NAME_ARRAY):
+        return pa.list_(pa.string())
+    return None
+
+
+def arrow_schema(
+    row_desc: typing.List["ColumnDescriptor"], plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]]
+) -> "pyarrow.Schema":
+    """
+    Returns the :class:`pyarrow.Schema` of a result set, derived from its row description.
+    """
+    import pyarrow as pa  # type: ignore
+
+    fields: typing.List["pyarrow.Field"] = []
+    for col, (kind, _) in zip(row_desc, plan):
+        typ: typing.Optional["pyarrow.DataType"] = _arrow_type(pa, col)
+        if kind == ColumnKind.TEXT or typ is None:
+            typ = pa.string()
+        fields.append(pa.field(col.label.decode("utf8", errors="backslashreplace"), typ, nullable=True))
+    return pa.schema(fields)
+
+
+def _to_arrow_array(pa, values: typing.List, kind: ColumnKind, typ: "pyarrow.DataType") -> "pyarrow.Array":
+    if kind == ColumnKind.TEXT:
+        # values are utf-8 encoded bytes, which Arrow validates rather than decoding each value in Python
+        return pa.array(values, type=pa.binary()).cast(typ)
+    elif typ == pa.string():
+        # values of types without an Arrow type, such as NUMERIC without a precision, are converted to strings
+        return pa.array([v if v is None or isinstance(v, str) else str(v) for v in values], type=typ)
+    # timestamp and date values are integers relative to the Unix epoch, in the unit of the Arrow type
+    return pa.array(values, type=typ)
+
+
+def arrow_record_batches(
+    rows: typing.Iterator[typing.List[bytes]],
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+) -> typing.Iterator["pyarrow.RecordBatch"]:
+    """
+    Decodes chunks of DataRow payloads into :class:`pyarrow.RecordBatch` objects, one per chunk.
+    """
+    import pyarrow as pa  # type: ignore
+
+    plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]] = column_plan(row_desc, row_decoders)
+    schema: "pyarrow.Schema" = arrow_schema(row_desc, plan)
+
+    for chunk in rows:
+        columns: typing.List[typing.List] = decode_columns(chunk, plan)
+        arrays: typing.List["pyarrow.Array"] = [
+            _to_arrow_array(pa, values, kind, field.type) for values, (kind, _), field in zip(columns, plan, schema)
+        ]
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
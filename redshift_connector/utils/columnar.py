@@ -0,0 +1,182 @@
+import typing
+from enum import Enum
+
+from redshift_connector.config import EPOCH_SECONDS, _client_encoding
+from redshift_connector.utils.result_buffer import ResultBuffer
+from redshift_connector.utils.type_utils import (
+    BIGINT,
+    BOOLEAN,
+    DATE,
+    FLOAT,
+    INTEGER,
+    NUMERIC,
+    OID,
+    REAL,
+    SMALLINT,
+    TIMESTAMP,
+    TIMESTAMPTZ,
+    XID,
+    bool_recv,
+    date_in,
+    date_recv_binary,
+    float4_recv,
+    float8_recv,
+    i_unpack,
+    int2_recv,
+    int4_recv,
+    int8_recv,
+    int_in,
+    numeric_in,
+    numeric_in_binary,
+    oid_recv,
+    q_unpack,
+    text_recv,
+    timestamp_recv_integer,
+    timestamptz_recv_integer,
+)
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.column_descriptor import ColumnDescriptor
+
+# offsets between 1970-01-01 and 2000-01-01, the epoch used by Amazon Redshift
+UNIX_EPOCH_OFFSET_DAYS: int = EPOCH_SECONDS // 86400
+UNIX_EPOCH_OFFSET_MICROS: int = EPOCH_SECONDS * 1000000
+# the ordinal of 1970-01-01
+UNIX_EPOCH_ORDINAL: int = 719163
+
+
+class ColumnKind(Enum):
+    """
+    The representation of a result column's values produced by :func:`decode_columns`.
+    """
+
+    INTEGER = 1  # int
+    FLOAT = 2  # float
+    BOOLEAN = 3  # bool
+    TIMESTAMP = 4  # int, microseconds since 1970-01-01
+    TIMESTAMPTZ = 5  # int, microseconds since 1970-01-01 UTC
+    DATE = 6  # int, days since 1970-01-01
+    TEXT = 7  # bytes, encoded with the client encoding
+    DECIMAL = 8  # decimal.Decimal
+    OBJECT = 9  # value returned by the column's conversion function
+
+
+def timestamp_recv_micros(data: bytes, offset: int, length: int) -> int:
+    # Amazon Redshift sends microseconds since 2000-01-01
+    return q_unpack(data, offset)[0] + UNIX_EPOCH_OFFSET_MICROS
+
+
+def date_recv_days(data: bytes, offset: int, length: int) -> int:
+    return i_unpack(data, offset)[0] + UNIX_EPOCH_OFFSET_DAYS
+
+
+def date_in_days(data: bytes, offset: int, length: int) -> int:
+    # dates are received as text by the text protocol
+    return date_in(data, offset, length).toordinal() - UNIX_EPOCH_ORDINAL
+
+
+def text_recv_bytes(data: bytes, offset: int, length: int) -> bytes:
+    return data[offset : offset + length]
+
+
+# the kind of the values of each type, whichever protocol its values are received in, so a result has the same
+# representation over the text and the binary protocol
+_kind_by_oid: typing.Dict[int, ColumnKind] = {
+    SMALLINT: ColumnKind.INTEGER,
+    INTEGER: ColumnKind.INTEGER,
+    BIGINT: ColumnKind.INTEGER,
+    OID: ColumnKind.INTEGER,
+    XID: ColumnKind.INTEGER,
+    REAL: ColumnKind.FLOAT,
+    FLOAT: ColumnKind.FLOAT,
+    BOOLEAN: ColumnKind.BOOLEAN,
+    TIMESTAMP: ColumnKind.TIMESTAMP,
+    TIMESTAMPTZ: ColumnKind.TIMESTAMPTZ,
+    DATE: ColumnKind.DATE,
+    NUMERIC: ColumnKind.DECIMAL,
+}
+
+_kind_by_func: typing.Dict[typing.Callable, typing.Tuple[ColumnKind, typing.Callable]] = {
+    int2_recv: (ColumnKind.INTEGER, int2_recv),
+    int4_recv: (ColumnKind.INTEGER, int4_recv),
+    int8_recv: (ColumnKind.INTEGER, int8_recv),
+    oid_recv: (ColumnKind.INTEGER, oid_recv),
+    float4_recv: (ColumnKind.FLOAT, float4_recv),
+    float8_recv: (ColumnKind.FLOAT, float8_recv),
+    bool_recv: (ColumnKind.BOOLEAN, bool_recv),
+    timestamp_recv_integer: (ColumnKind.TIMESTAMP, timestamp_recv_micros),
+    timestamptz_recv_integer: (ColumnKind.TIMESTAMPTZ, timestamp_recv_micros),
+    date_recv_binary: (ColumnKind.DATE, date_recv_days),
+    numeric_in: (ColumnKind.DECIMAL, numeric_in),
+    # the conversion functions of the text protocol
+    int_in: (ColumnKind.INTEGER, int_in),
+    date_in: (ColumnKind.DATE, date_in_days),
+}
+
+
+def column_plan(
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+) -> typing.List[typing.Tuple[ColumnKind, typing.Callable]]:
+    """
+    Returns, for each result column, the :class:`ColumnKind` of its values and the function extracting a value
+    from a DataRow payload. Timestamps and dates are kept as integers relative to the Unix epoch and text as
+    encoded bytes, so columnar consumers do not need to build an intermediate Python object per value.
+
+    The kind of a column of a known type is chosen by its type oid rather than its conversion function, so the
+    kind doesn't depend on the protocol the result was received in. A column whose conversion function doesn't
+    produce the values of that kind, such as one registered by the application, holds the values it returns.
+    """
+    plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]] = []
+    text_as_bytes: bool = _client_encoding.replace("-", "").lower() == "utf8"
+    for col, decoder in zip(row_desc, row_decoders):
+        func: typing.Callable = decoder[0]
+        kind: typing.Optional[ColumnKind] = _kind_by_oid.get(col.type_oid)
+        if func is numeric_in_binary:
+            scale: int = typing.cast(typing.Tuple[typing.Callable, int], decoder)[1]
+            plan.append((ColumnKind.DECIMAL, lambda d, o, l, s=scale: numeric_in_binary(d, o, l, s)))
+        elif kind is not None:
+            planned: typing.Optional[typing.Tuple[ColumnKind, typing.Callable]] = _kind_by_func.get(func)
+            plan.append(planned if planned is not None and planned[0] == kind else (ColumnKind.OBJECT, func))
+        elif func is text_recv and text_as_bytes:
+            plan.append((ColumnKind.TEXT, text_recv_bytes))
+        elif func in _kind_by_func:
+            plan.append(_kind_by_func[func])
+        else:
+            plan.append((ColumnKind.OBJECT, func))
+    return plan
+
+
+def decode_columns(
+    rows: typing.Iterable[bytes], plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]]
+) -> typing.List[typing.List]:
+    """
+    Decodes DataRow payloads into one list of values per column. NULL values are represented by ``None``.
+    """
+    extractors: typing.List[typing.Callable] = [extract for _, extract in plan]
+    columns: typing.List[typing.List] = [[] for _ in plan]
+    appenders: typing.List[typing.Callable] = [c.append for c in columns]
+    pairs: typing.List[typing.Tuple[typing.Callable, typing.Callable]] = list(zip(appenders, extractors))
+
+    for data in rows:
+        data_idx: int = 2
+        for append, extract in pairs:
+            vlen: int = i_unpack(data, data_idx)[0]
+            data_idx += 4
+            if vlen == -1:
+                append(None)
+            else:
+                append(extract(data, data_idx, vlen))
+                data_idx += vlen
+    return columns
+
+
+def take_rows(rows: typing.Union[typing.Deque[bytes], ResultBuffer], num: typing.Optional[int]) -> typing.List[bytes]:
+    """
+    Removes and returns up to ``num`` DataRow payloads from the front of ``rows``, or all of them if ``num`` is None.
+    """
+    if num is None or num >= len(rows):
+        taken: typing.List[bytes] = list(rows)
+        rows.clear()
+        return taken
+    return [rows.popleft() for _ in range(num)]
@@ -0,0 +1,249 @@
+import inspect
+import re
+import types
+import typing
+
+from redshift_connector.config import _client_encoding
+from redshift_connector.utils.type_utils import text_value
+
+# COPY data is sent in CopyData messages of about this size
+DEFAULT_COPY_FRAME_SIZE: int = 1024 * 1024
+
+
+class CopyStats:
+    """
+    Statistics describing a completed ``COPY``.
+
+    .. attribute:: rows
+
+        The number of rows copied.
+
+    .. attribute:: bytes
+
+        The number of bytes of COPY data transferred.
+
+    .. attribute:: seconds
+
+        The time spent transferring COPY data.
+    """
+
+    def __init__(self: "CopyStats", rows: int, bytes: int, seconds: float) -> None:
+        self.rows: int = rows
+        self.bytes: int = bytes
+        self.seconds: float = seconds
+
+    @property
+    def rows_per_second(self: "CopyStats") -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def bytes_per_second(self: "CopyStats") -> float:
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def __repr__(self: "CopyStats") -> str:
+        return "CopyStats(rows={}, bytes={}, seconds={:.3f}, rows_per_second={:.1f}, bytes_per_second={:.1f})".format(
+            self.rows, self.bytes, self.seconds, self.rows_per_second, self.bytes_per_second
+        )
+
+
+class CopyOutStream:
+    """
+    Used in place of a writable stream when executing a ``COPY ... TO STDOUT`` whose data is read by iterating over
+    the CopyData messages as they arrive, rather than written to a file-like object.
+    """
+
+
+class CopyOutIterator:
+    """
+    Iterates over the values of the COPY data of a ``COPY ... TO STDOUT``, as returned by
+    :meth:`Cursor.copy_out_chunks` and :meth:`Cursor.copy_out_rows`.
+
+    The remaining COPY data is discarded when the iterator is closed, or garbage collected, before it is exhausted.
+    The lock of a thread-safe connection held while the data is read is then released, even if no value was read.
+    """
+
+    def __init__(
+        self: "CopyOutIterator",
+        chunks: typing.Iterator,
+        convert: typing.Optional[typing.Callable[[typing.Iterator], typing.Iterator]] = None,
+        lock: typing.Optional[typing.Any] = None,
+    ) -> None:
+        self._chunks: typing.Iterator = chunks
+        self._values: typing.Iterator = chunks if convert is None else convert(chunks)
+        self._lock: typing.Optional[typing.Any] = lock
+        self._closed: bool = False
+
+    def __iter__(self: "CopyOutIterator") -> "CopyOutIterator":
+        return self
+
+    def __next__(self: "CopyOutIterator") -> typing.Any:
+        if self._closed:
+            raise StopIteration
+        try:
+            return next(self._values)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self: "CopyOutIterator") -> None:
+        """
+        Discards the remaining COPY data and releases the connection. Does nothing if the iterator is closed.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if (
+                isinstance(self._chunks, types.GeneratorType)
+                and inspect.getgeneratorstate(self._chunks) == inspect.GEN_CREATED
+            ):
+                # a generator which hasn't started doesn't run its clean up when closed, so it's started first
+                next(self._chunks, None)
+            close: typing.Optional[typing.Callable[[], None]] = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+        finally:
+            if self._lock is not None:
+                self._lock.release()
+
+    def __del__(self: "CopyOutIterator") -> None:
+        if not getattr(self, "_closed", True):
+            self.close()
+
+
+# backslash escape sequences of the text COPY format
+_text_escape_re: typing.Pattern = re.compile(r"\\(?:([0-7]{1,3})|x([0-9a-fA-F]{1,2})|(.))", re.DOTALL)
+_text_escapes: typing.Dict[str, str] = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+
+
+def _unescape_text(match: typing.Match) -> str:
+    octal, hexadecimal, char = match.groups()
+    if octal is not None:
+        return chr(int(octal, 8))
+    elif hexadecimal is not None:
+        return chr(int(hexadecimal, 16))
+    return _text_escapes.get(char, char)
+
+
+def text_copy_fields(line: str, delimiter: str = "\t", null: str = "\\N") -> typing.List[typing.Optional[str]]:
+    """
+    Returns the values of a row in the text ``COPY`` format, in which values are separated by ``delimiter``,
+    NULL values are written as ``null`` and special characters are escaped with a backslash.
+    """
+    if line.endswith("\n"):
+        line = line[:-1]
+    if "\\" not in line:
+        return [None if raw == null else raw for raw in line.split(delimiter)]
+
+    # an escaped delimiter is part of a value, so values are split by scanning the row
+    raw_fields: typing.List[str] = []
+    start: int = 0
+    idx: int = 0
+    while idx < len(line):
+        char: str = line[idx]
+        if char == "\\":
+            idx += 2
+            continue
+        if char == delimiter:
+            raw_fields.append(line[start:idx])
+            start = idx + 1
+        idx += 1
+    raw_fields.append(line[start:])
+    return [None if raw == null else _text_escape_re.sub(_unescape_text, raw) for raw in raw_fields]
+
+
+class CopyInSource:
+    """
+    The data sent by the client during a ``COPY ... FROM STDIN``, produced as frames of about ``frame_size`` bytes.
+
+    ``data`` is either a readable binary file-like object or an iterable whose items are ``bytes`` chunks, ``str``
+    chunks, or rows. Rows are sequences of values serialized in the ``CSV`` format using ``delimiter``. ``None``
+    values are written as unquoted empty fields, which ``COPY`` loads as NULL, while empty strings are quoted.
+    """
+
+    def __init__(
+        self: "CopyInSource",
+        data: typing.Any,
+        delimiter: str = ",",
+        frame_size: int = DEFAULT_COPY_FRAME_SIZE,
+    ) -> None:
+        self.data: typing.Any = data
+        self.delimiter: str = delimiter
+        self.frame_size: int = max(1, frame_size)
+        self.rows: int = 0
+        self.bytes: int = 0
+        self._needs_quotes: typing.Pattern = re.compile('[{}"\r\n]'.format(re.escape(delimiter)))
+
+    def _csv_field(self: "CopyInSource", value: typing.Any) -> str:
+        if value is None:
+            return ""
+        text: str = text_value(value)
+        if text == "" or self._needs_quotes.search(text) is not None:
+            return '"' + text.replace('"', '""') + '"'
+        return text
+
+    def _file_frames(self: "CopyInSource") -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        if not hasattr(self.data, "readinto"):
+            while True:
+                chunk: bytes = self.data.read(self.frame_size)
+                if not chunk:
+                    return
+                self.bytes += len(chunk)
+                yield chunk
+        bffr: bytearray = bytearray(self.frame_size)
+        view: memoryview = memoryview(bffr)
+        while True:
+            bytes_read: int = self.data.readinto(bffr)
+            if not bytes_read:
+                return
+            self.bytes += bytes_read
+            # the frame is sent before the buffer is reused
+            yield view[:bytes_read]
+
+    def frames(self: "CopyInSource") -> typing.Iterator[typing.Union[bytes, memoryview]]:
+        """
+        Yields the COPY data in frames of about ``frame_size`` bytes. A frame may only be used until the next
+        frame is requested.
+        """
+        if hasattr(self.data, "readinto") or hasattr(self.data, "read"):
+            yield from self._file_frames()
+            return
+
+        pending: typing.List[bytes] = []
+        lines: typing.List[str] = []
+        pending_size: int = 0
+        delimiter: str = self.delimiter
+        csv_field: typing.Callable[[typing.Any], str] = self._csv_field
+        for item in self.data:
+            if isinstance(item, (bytes, bytearray, memoryview)):
+                chunk: bytes = bytes(item)
+            elif isinstance(item, str):
+                chunk = item.encode(_client_encoding)
+            else:
+                line: str = delimiter.join([csv_field(v) for v in item]) + "\n"
+                self.rows += 1
+                lines.append(line)
+                pending_size += len(line)
+                if pending_size >= self.frame_size:
+                    frame: bytes = b"".join(pending) + "".join(lines).encode(_client_encoding)
+                    pending, lines, pending_size = [], [], 0
+                    self.bytes += len(frame)
+                    yield frame
+                continue
+            if lines:
+                pending.append("".join(lines).encode(_client_encoding))
+                lines = []
+            pending.append(chunk)
+            pending_size += len(chunk)
+            if pending_size >= self.frame_size:
+                frame = b"".join(pending)
+                pending, pending_size = [], 0
+                self.bytes += len(frame)
+                yield frame
+
+        if lines:
+            pending.append("".join(lines).encode(_client_encoding))
+        if pending:
+            frame = b"".join(pending)
+            self.bytes += len(frame)
+            yield frame
@@ -0,0 +1,122 @@
+import csv
+import io
+import json
+import os
+import typing
+from datetime import date, datetime, time, timedelta
+
+from redshift_connector.error import MISSING_MODULE_ERROR_MSG, InterfaceError
+from redshift_connector.utils.type_utils import text_value
+
+if typing.TYPE_CHECKING:
+    import pyarrow  # type: ignore
+
+    from redshift_connector.column_descriptor import ColumnDescriptor
+
+EXPORT_FORMATS: typing.Tuple[str, ...] = ("csv", "jsonl", "parquet")
+EXPORT_COMPRESSIONS: typing.Tuple[str, ...] = ("gzip", "zstd")
+# size of the buffer holding encoded rows before they are written to the file
+EXPORT_BUFFER_SIZE: int = 1024 * 1024
+
+
+def _json_default(value: typing.Any) -> typing.Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    elif isinstance(value, (bytes, bytearray)):
+        return value.hex()
+    elif isinstance(value, timedelta):
+        return value.total_seconds()
+    # includes Decimal, whose precision would be lost as a float
+    return text_value(value)
+
+
+def open_export_file(path: typing.Union[str, "os.PathLike"], compression: typing.Optional[str]) -> typing.BinaryIO:
+    """
+    Opens ``path`` for writing through a large buffer, compressing the data written with ``compression`` if it is
+    not None. ``zstd`` compression requires the optional ``zstandard`` module.
+    """
+    if compression is None:
+        return typing.cast(typing.BinaryIO, open(path, "wb", buffering=EXPORT_BUFFER_SIZE))
+    elif compression == "gzip":
+        import gzip
+
+        return typing.cast(typing.BinaryIO, gzip.open(path, "wb", compresslevel=6))
+    elif compression == "zstd":
+        try:
+            import zstandard  # type: ignore
+        except ModuleNotFoundError:
+            raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="zstandard"))
+        raw: typing.BinaryIO = typing.cast(typing.BinaryIO, open(path, "wb", buffering=EXPORT_BUFFER_SIZE))
+        return typing.cast(typing.BinaryIO, zstandard.ZstdCompressor().stream_writer(raw, closefd=True))
+    raise InterfaceError(
+        "Invalid compression {!r}. Supported compressions are: {}".format(compression, ", ".join(EXPORT_COMPRESSIONS))
+    )
+
+
+def write_csv(
+    output: typing.BinaryIO,
+    chunks: typing.Iterable[typing.List[typing.List]],
+    names: typing.List[str],
+    delimiter: str = ",",
+    header: bool = True,
+    null: str = "",
+) -> int:
+    """
+    Writes the rows of each chunk to ``output`` in the ``CSV`` format, with NULL values written as ``null``.
+    Returns the number of rows written.
+    """
+    text: io.TextIOWrapper = io.TextIOWrapper(output, encoding="utf-8", newline="", write_through=False)
+    writer = csv.writer(text, delimiter=delimiter, lineterminator="\n")
+    if header:
+        writer.writerow(names)
+    num_rows: int = 0
+    for rows in chunks:
+        writer.writerows([[null if v is None else text_value(v) for v in row] for row in rows])
+        num_rows += len(rows)
+    text.flush()
+    # the wrapper must not close output, which is closed by the caller
+    text.detach()
+    return num_rows
+
+
+def write_jsonl(
+    output: typing.BinaryIO, chunks: typing.Iterable[typing.List[typing.List]], names: typing.List[str]
+) -> int:
+    """
+    Writes each row of each chunk to ``output`` as a JSON object on its own line, keyed by ``names``. Returns the
+    number of rows written.
+    """
+    encoder: json.JSONEncoder = json.JSONEncoder(ensure_ascii=False, default=_json_default)
+    num_rows: int = 0
+    for rows in chunks:
+        output.write("".join([encoder.encode(dict(zip(names, row))) + "\n" for row in rows]).encode("utf-8"))
+        num_rows += len(rows)
+    return num_rows
+
+
+def write_parquet(
+    path: typing.Union[str, "os.PathLike"],
+    chunks: typing.Iterable[typing.List[bytes]],
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+    compression: typing.Optional[str],
+) -> int:
+    """
+    Writes chunks of DataRow payloads to a Parquet file at ``path``, one row group per chunk, using the schema
+    derived from the row description. ``compression`` is the Parquet compression codec, ``snappy`` by default.
+    Returns the number of rows written.
+    """
+    try:
+        import pyarrow.parquet as pq  # type: ignore
+    except ModuleNotFoundError:
+        raise ModuleNotFoundError(MISSING_MODULE_ERROR_MSG.format(module="pyarrow"))
+    from redshift_connector.utils.arrow_util import arrow_record_batches, arrow_schema
+    from redshift_connector.utils.columnar import column_plan
+
+    schema: "pyarrow.Schema" = arrow_schema(row_desc, column_plan(row_desc, row_decoders))
+    num_rows: int = 0
+    with pq.ParquetWriter(path, schema, compression=compression or "snappy") as writer:
+        for batch in arrow_record_batches(iter(chunks), row_desc, row_decoders):
+            writer.write_batch(batch)
+            num_rows += batch.num_rows
+    return num_rows
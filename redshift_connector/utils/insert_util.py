@@ -0,0 +1,260 @@
+import typing
+from decimal import Decimal
+
+from redshift_connector.utils.type_utils import (
+    BIGINT,
+    BOOLEAN,
+    DATE,
+    FLOAT,
+    INTEGER,
+    NUMERIC,
+    REAL,
+    SMALLINT,
+    TIMESTAMP,
+    TIMESTAMPTZ,
+    UNKNOWN,
+)
+
+if typing.TYPE_CHECKING:
+    from redshift_connector.cursor import Cursor
+
+# the number of parameter values in a Bind message is an Int16
+MAX_BIND_PARAMETERS: int = 32767
+# Amazon Redshift rejects statements larger than 16 MB. The parameter values of a batch are kept well below it.
+DEFAULT_MAX_BATCH_BYTES: int = 8 * 1024 * 1024
+
+
+# information_schema.columns.data_type -> type oid of parameters holding values of that type
+_declared_type_oids: typing.Dict[str, int] = {
+    "smallint": SMALLINT,
+    "integer": INTEGER,
+    "bigint": BIGINT,
+    "numeric": NUMERIC,
+    "real": REAL,
+    "double precision": FLOAT,
+    "boolean": BOOLEAN,
+    "date": DATE,
+    "timestamp without time zone": TIMESTAMP,
+    "timestamp with time zone": TIMESTAMPTZ,
+}
+
+_true_values: typing.FrozenSet[str] = frozenset(("t", "true", "y", "yes", "on", "1"))
+_false_values: typing.FrozenSet[str] = frozenset(("f", "false", "n", "no", "off", "0"))
+
+
+def _boolean_text(value: str) -> str:
+    lowered: str = value.lower()
+    if lowered in _true_values:
+        return "true"
+    elif lowered in _false_values:
+        return "false"
+    raise ValueError("invalid boolean value")
+
+
+# information_schema.columns.data_type -> function validating and normalizing a non-empty text value
+_text_coercers: typing.Dict[str, typing.Callable[[str], str]] = {
+    "smallint": lambda v: str(int(v)),
+    "integer": lambda v: str(int(v)),
+    "bigint": lambda v: str(int(v)),
+    "numeric": lambda v: str(Decimal(v)),
+    "real": lambda v: repr(float(v)),
+    "double precision": lambda v: repr(float(v)),
+    "boolean": _boolean_text,
+}
+
+
+def declared_type_oid(data_type: str) -> int:
+    """
+    Returns the type oid used to send values of a column whose ``information_schema.columns.data_type`` is
+    ``data_type``. Types without a dedicated oid use the unknown type, which Amazon Redshift resolves from the
+    target column.
+    """
+    return _declared_type_oids.get(data_type, UNKNOWN)
+
+
+def text_coercer(data_type: str) -> typing.Callable[[str], typing.Optional[str]]:
+    """
+    Returns a function converting a text value read from a file to the text representation of a value of a
+    column whose ``information_schema.columns.data_type`` is ``data_type``. Malformed values raise a
+    :exc:`ValueError` or :exc:`decimal.InvalidOperation` when the value is read rather than when the batch
+    holding it is executed. Empty values of non-character columns are converted to NULL.
+    """
+    if data_type in _text_coercers:
+        coerce: typing.Callable[[str], str] = _text_coercers[data_type]
+        return lambda v: coerce(v.strip()) if v and not v.isspace() else None
+    elif data_type in _declared_type_oids:
+        return lambda v: v.strip() if v and not v.isspace() else None
+    return lambda v: v
+
+
+def batch_shape(num_rows: int, max_rows: int) -> int:
+    """
+    Returns the number of rows to send in the next batch given ``num_rows`` rows are ready to be sent. Batches
+    hold either ``max_rows`` rows or a power of two number of rows, so a bounded set of statements is prepared.
+    """
+    if num_rows >= max_rows:
+        return max_rows
+    return 1 << (num_rows.bit_length() - 1)
+
+
+class MultiRowInsert:
+    """
+    Inserts rows into a table using ``INSERT ... VALUES`` statements holding many rows each.
+
+    Rows are sequences of parameter values, typically strings, which are sent in text format and converted by
+    Amazon Redshift to the types of the target columns. Each batch holds at most ``max_rows`` rows and, unless a
+    single row exceeds it, at most ``max_batch_bytes`` bytes of values. Batches smaller than ``max_rows`` hold a
+    power of two number of rows and parameter types do not depend on which values are NULL, so the statements
+    prepared for a load stay cached on the connection.
+    """
+
+    def __init__(
+        self: "MultiRowInsert",
+        cursor: "Cursor",
+        table: str,
+        columns: typing.Optional[typing.Sequence[str]],
+        num_columns: int,
+        max_rows: int = 1000,
+        max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+        param_oids: typing.Optional[typing.Sequence[int]] = None,
+    ) -> None:
+        self.cursor: "Cursor" = cursor
+        self.num_columns: int = num_columns
+        self.max_rows: int = max(1, min(max_rows, MAX_BIND_PARAMETERS // num_columns))
+        self.max_batch_bytes: int = max_batch_bytes
+        self.param_oids: typing.Tuple[int, ...] = tuple(param_oids) if param_oids else (UNKNOWN,) * num_columns
+        self.prefix: str = "INSERT INTO {} {}VALUES ".format(
+            table, "({}) ".format(", ".join(columns)) if columns else ""
+        )
+        self.row_placeholder: str = "(" + ", ".join(["%s"] * num_columns) + ")"
+        self.statements: typing.Dict[int, str] = {}
+        self.rowcount: int = 0
+
+    def statement(self: "MultiRowInsert", num_rows: int) -> str:
+        try:
+            return self.statements[num_rows]
+        except KeyError:
+            stmt: str = self.prefix + ", ".join([self.row_placeholder] * num_rows)
+            self.statements[num_rows] = stmt
+            return stmt
+
+    def _row_size(self: "MultiRowInsert", row: typing.Sequence) -> int:
+        # an estimate, the length of each value plus the length prefix sent in the Bind message
+        return sum(4 if v is None else 4 + len(v) if isinstance(v, (str, bytes)) else 12 for v in row)
+
+    def _execute_batch(self: "MultiRowInsert", rows: typing.List[typing.Sequence]) -> None:
+        values: typing.List = [v for row in rows for v in row]
+        self.cursor._input_oids = self.param_oids * len(rows)
+        self.cursor.execute(self.statement(len(rows)), values)
+        rowcount: int = getattr(self.cursor, "_row_count", -1)
+        if rowcount > 0:
+            self.rowcount += rowcount
+
+    def _send(self: "MultiRowInsert", rows: typing.List[typing.Sequence], sizes: typing.List[int], final: bool) -> int:
+        """
+        Sends the leading rows of ``rows`` in batches and returns the number of rows sent. Unless ``final`` is
+        True, rows which do not fill a batch are left for a later call.
+        """
+        start: int = 0
+        while start < len(rows):
+            fit: int = 0
+            batch_bytes: int = 0
+            while start + fit < len(rows) and fit < self.max_rows:
+                batch_bytes += sizes[start + fit]
+                if fit > 0 and batch_bytes > self.max_batch_bytes:
+                    break
+                fit += 1
+            if not final and start + fit == len(rows) and fit < self.max_rows:
+                break
+            num: int = batch_shape(fit, self.max_rows)
+            self._execute_batch(rows[start : start + num])
+            start += num
+        return start
+
+    def execute(
+        self: "MultiRowInsert",
+        rows: typing.Iterable[typing.Sequence],
+        progress: typing.Optional[typing.Callable[[int], None]] = None,
+    ) -> int:
+        """
+        Inserts ``rows``, reading them from the iterable as batches are filled.
+
+        Parameters
+        ----------
+        rows : Iterable[Sequence] The rows to insert. Each row holds one value per column
+        progress : Optional[Callable[[int], None]] Called with the total number of rows sent after each batch of rows is sent
+
+        Returns
+        -------
+        The number of rows inserted: int
+        """
+        orig_paramstyle: str = self.cursor.paramstyle
+        orig_input_oids = getattr(self.cursor, "_input_oids", None)
+        self.cursor.paramstyle = "format"
+        buffer: typing.List[typing.Sequence] = []
+        sizes: typing.List[int] = []
+        buffered_bytes: int = 0
+        sent: int = 0
+        try:
+            for row in rows:
+                size: int = self._row_size(row)
+                buffer.append(row)
+                sizes.append(size)
+                buffered_bytes += size
+                if len(buffer) >= self.max_rows or buffered_bytes > self.max_batch_bytes:
+                    num: int = self._send(buffer, sizes, False)
+                    del buffer[:num]
+                    del sizes[:num]
+                    buffered_bytes = sum(sizes)
+                    sent += num
+                    if progress is not None:
+                        progress(sent)
+            if buffer:
+                sent += self._send(buffer, sizes, True)
+                if progress is not None:
+                    progress(sent)
+        finally:
+            # reset paramstyle and parameter types to their original values
+            self.cursor.paramstyle = orig_paramstyle
+            self.cursor._input_oids = orig_input_oids
+        return self.rowcount
+
+
+def upsert_statements(
+    table: str,
+    stage: str,
+    key_columns: typing.Sequence[str],
+    columns: typing.Optional[typing.Sequence[str]],
+    use_merge: bool = True,
+) -> typing.List[str]:
+    """
+    Returns the statements applying the rows of ``stage`` to ``table``. Rows of ``table`` whose ``key_columns``
+    match a row of ``stage`` are replaced by it, and the remaining rows of ``stage`` are inserted. If ``columns``
+    is None, ``stage`` holds every column of ``table`` in the same order.
+
+    With ``use_merge`` a single ``MERGE`` statement is returned, otherwise a ``DELETE`` of the matching rows of
+    ``table`` followed by an ``INSERT ... SELECT``, which must be executed in one transaction.
+    """
+    condition: str = " AND ".join("{0}.{2} = {1}.{2}".format(table, stage, k) for k in key_columns)
+    if use_merge:
+        if columns is None:
+            return ["MERGE INTO {} USING {} ON {} REMOVE DUPLICATES".format(table, stage, condition)]
+        # WHEN MATCHED requires an assignment, so keys are assigned to themselves when every column is a key
+        assignments: str = ", ".join(
+            "{0} = {1}.{0}".format(c, stage) for c in [c for c in columns if c not in key_columns] or key_columns
+        )
+        return [
+            "MERGE INTO {} USING {} ON {} WHEN MATCHED THEN UPDATE SET {} WHEN NOT MATCHED THEN INSERT ({}) VALUES ({})".format(
+                table,
+                stage,
+                condition,
+                assignments,
+                ", ".join(columns),
+                ", ".join("{}.{}".format(stage, c) for c in columns),
+            )
+        ]
+    column_list: str = "({}) ".format(", ".join(columns)) if columns else ""
+    return [
+        "DELETE FROM {} USING {} WHERE {}".format(table, stage, condition),
+        "INSERT INTO {} {}SELECT {} FROM {}".format(table, column_list, ", ".join(columns) if columns else "*", stage),
+    ]
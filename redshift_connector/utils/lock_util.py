@@ -0,0 +1,37 @@
+import functools
+import threading
+import typing
+
+_F = typing.TypeVar("_F", bound=typing.Callable[..., typing.Any])
+
+# the type of the locks of thread-safe connections
+RLockType: type = type(threading.RLock())
+
+
+def connection_lock(conn: typing.Any) -> typing.Optional[typing.Any]:
+    """
+    Returns the lock guarding the exchanges of ``conn`` with the server, or None if it isn't thread-safe.
+    """
+    lock: typing.Any = getattr(conn, "_lock", None)
+    return lock if isinstance(lock, RLockType) else None
+
+
+def synchronized(connection: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable[[_F], _F]:
+    """
+    Returns a decorator of methods which hold the lock of a thread-safe connection while they run, so their
+    exchanges with the server aren't interleaved with those of other threads. ``connection`` returns the connection
+    of the object the method is called on. Methods of other connections run without locking.
+    """
+
+    def decorator(method: _F) -> _F:
+        @functools.wraps(method)
+        def wrapper(self: typing.Any, *args: typing.Any, **kwargs: typing.Any) -> typing.Any:
+            lock: typing.Optional[typing.Any] = connection_lock(connection(self))
+            if lock is None:
+                return method(self, *args, **kwargs)
+            with lock:
+                return method(self, *args, **kwargs)
+
+        return typing.cast(_F, wrapper)
+
+    return decorator
@@ -0,0 +1,199 @@
+import typing
+
+from redshift_connector.config import _client_encoding
+from redshift_connector.utils.columnar import (
+    UNIX_EPOCH_OFFSET_DAYS,
+    UNIX_EPOCH_OFFSET_MICROS,
+    ColumnKind,
+    column_plan,
+    date_recv_days,
+    decode_columns,
+    timestamp_recv_micros,
+)
+from redshift_connector.utils.type_utils import (
+    bool_recv,
+    float4_recv,
+    float8_recv,
+    int2_recv,
+    int4_recv,
+    int8_recv,
+    oid_recv,
+)
+
+if typing.TYPE_CHECKING:
+    import numpy  # type: ignore
+
+    from redshift_connector.column_descriptor import ColumnDescriptor
+
+# wire format of column values with a fixed width in the binary transfer format
+_wire_format: typing.Dict[typing.Callable, str] = {
+    int2_recv: ">i2",
+    int4_recv: ">i4",
+    int8_recv: ">i8",
+    oid_recv: ">u4",
+    float4_recv: ">f4",
+    float8_recv: ">f8",
+    bool_recv: "?",
+    timestamp_recv_micros: ">i8",
+    date_recv_days: ">i4",
+}
+
+# numpy's representation of NaT for datetime64 values stored as int64
+_NAT: int = -(2**63)
+
+
+def _field_dtype(kind: ColumnKind, extract: typing.Callable) -> str:
+    if kind in (ColumnKind.TIMESTAMP, ColumnKind.TIMESTAMPTZ):
+        return "datetime64[us]"
+    elif kind == ColumnKind.DATE:
+        return "datetime64[D]"
+    elif extract in _wire_format:
+        return _wire_format[extract].lstrip(">")
+    return "O"
+
+
+def field_names(labels: typing.Sequence[typing.Union[str, bytes]]) -> typing.List[str]:
+    """
+    Returns unique field names for a structured :class:`numpy.dtype` given the column labels of a result.
+    Labels which cannot be decoded or which repeat an earlier label are replaced by ``f<column index>``.
+    """
+    names: typing.List[str] = []
+    for idx, label in enumerate(labels):
+        if isinstance(label, bytes):
+            try:
+                label = label.decode(_client_encoding)
+            except UnicodeError:
+                label = ""
+        names.append(label if label and label not in names else "f{}".format(idx))
+    return names
+
+
+def structured_dtype(
+    names: typing.List[str], plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]]
+) -> "numpy.dtype":
+    """
+    Returns the structured :class:`numpy.dtype` of a result. Fixed width numeric and boolean columns use the
+    matching numpy type, timestamps ``datetime64[us]`` (in UTC for ``TIMESTAMPTZ``) and dates ``datetime64[D]``.
+    All other columns hold Python objects.
+    """
+    import numpy  # type: ignore
+
+    return numpy.dtype([(name, _field_dtype(kind, extract)) for name, (kind, extract) in zip(names, plan)])
+
+
+def _columns_frombuffer(numpy, rows: typing.List[bytes], plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]]):
+    """
+    Returns one array per column by viewing the concatenated DataRow payloads through a numpy dtype
+    describing the row layout, or None if a column is not fixed width or a NULL value is present.
+    """
+    formats: typing.List[typing.Optional[str]] = [_wire_format.get(extract) for _, extract in plan]
+    if len(rows) == 0 or None in formats:
+        return None
+
+    layout: typing.List[typing.Tuple[str, str]] = [("count", ">i2")]
+    for idx, fmt in enumerate(formats):
+        layout.append(("l{}".format(idx), ">i4"))
+        layout.append(("v{}".format(idx), typing.cast(str, fmt)))
+    row_dtype: "numpy.dtype" = numpy.dtype(layout)
+
+    data: bytes = b"".join(rows)
+    # a NULL value shortens its row, as no value follows its length
+    if len(data) != row_dtype.itemsize * len(rows):
+        return None
+    raw = numpy.frombuffer(data, dtype=row_dtype)
+
+    columns: typing.List = []
+    for idx, (kind, _) in enumerate(plan):
+        values = raw["v{}".format(idx)]
+        if kind in (ColumnKind.TIMESTAMP, ColumnKind.TIMESTAMPTZ):
+            values = (values.astype(numpy.int64) + UNIX_EPOCH_OFFSET_MICROS).view("datetime64[us]")
+        elif kind == ColumnKind.DATE:
+            values = (values.astype(numpy.int64) + UNIX_EPOCH_OFFSET_DAYS).view("datetime64[D]")
+        else:
+            values = values.astype(values.dtype.newbyteorder("="))
+        columns.append(values)
+    return columns
+
+
+def _column_array(numpy, values: typing.List, kind: ColumnKind, dtype: "numpy.dtype"):
+    """
+    Returns the values of a result column as an array of ``dtype`` together with a boolean array marking
+    NULL values, or None if there are no NULL values. NULL values are stored as NaN, NaT, zero or None
+    depending on ``dtype``.
+    """
+    nulls: typing.Optional[typing.Any] = None
+    if None in values:
+        nulls = numpy.fromiter((v is None for v in values), dtype=bool, count=len(values))
+
+    if kind == ColumnKind.TEXT:
+        values = [None if v is None else v.decode(_client_encoding) for v in values]
+
+    if dtype.kind == "O":
+        arr = numpy.empty(len(values), dtype=object)
+        # element-wise assignment keeps list values, such as arrays, as single objects
+        for idx, value in enumerate(values):
+            arr[idx] = value
+        return arr, nulls
+    elif dtype.kind == "M":
+        # values are integers relative to the Unix epoch, in the unit of dtype
+        ints = numpy.array(values if nulls is None else [_NAT if v is None else v for v in values], dtype=numpy.int64)
+        return ints.view(dtype), nulls
+    elif dtype.kind == "f":
+        return numpy.array(values, dtype=dtype), nulls
+    return numpy.array(values if nulls is None else [0 if v is None else v for v in values], dtype=dtype), nulls
+
+
+def decode_numpy_columns(
+    rows: typing.List[bytes],
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+    names: typing.List[str],
+) -> typing.Tuple["numpy.dtype", typing.List, typing.List]:
+    """
+    Decodes DataRow payloads into one typed array per column.
+
+    When every column has a fixed width and no NULL values are present the arrays are produced with
+    :func:`numpy.frombuffer`, without a Python call per value.
+
+    Returns
+    -------
+    The structured dtype of the result, the array of each column and the NULL mask of each column, which is None for columns without NULL values: Tuple[numpy.dtype, List[numpy.ndarray], List[Optional[numpy.ndarray]]]
+    """
+    import numpy  # type: ignore
+
+    plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]] = column_plan(row_desc, row_decoders)
+    dtype: "numpy.dtype" = structured_dtype(names, plan)
+
+    columns = _columns_frombuffer(numpy, rows, plan)
+    if columns is not None:
+        return dtype, columns, [None] * len(columns)
+
+    arrays: typing.List = []
+    masks: typing.List = []
+    for values, (kind, _), name in zip(decode_columns(rows, plan), plan, names):
+        arr, nulls = _column_array(numpy, values, kind, dtype[name])
+        arrays.append(arr)
+        masks.append(nulls)
+    return dtype, arrays, masks
+
+
+def structured_from_rows(
+    rows: typing.List[bytes],
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+    names: typing.List[str],
+) -> "numpy.ma.MaskedArray":
+    """
+    Decodes DataRow payloads into a structured :class:`numpy.ma.MaskedArray` in which NULL values are masked.
+    """
+    import numpy  # type: ignore
+
+    dtype, arrays, masks = decode_numpy_columns(rows, row_desc, row_decoders, names)
+    fields: typing.Tuple[str, ...] = typing.cast(typing.Tuple[str, ...], dtype.names)
+    data = numpy.empty(len(rows), dtype=dtype)
+    mask = numpy.zeros(len(rows), dtype=[(name, bool) for name in fields])
+    for name, arr, nulls in zip(fields, arrays, masks):
+        data[name] = arr
+        if nulls is not None:
+            mask[name] = nulls
+    return numpy.ma.MaskedArray(data, mask=mask)
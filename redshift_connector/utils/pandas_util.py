@@ -0,0 +1,120 @@
+import typing
+
+from redshift_connector.config import _client_encoding
+from redshift_connector.utils.columnar import ColumnKind, column_plan, decode_columns
+from redshift_connector.utils.type_utils import CHAR, text_value
+
+if typing.TYPE_CHECKING:
+    import pandas  # type: ignore
+
+    from redshift_connector.column_descriptor import ColumnDescriptor
+
+# numpy's representation of NaT for datetime64 values stored as int64
+_NAT: int = -(2**63)
+
+
+def _int64_with_nat(numpy, values: typing.List[typing.Optional[int]]):
+    if None in values:
+        values = [_NAT if v is None else v for v in values]
+    return numpy.array(values, dtype=numpy.int64)
+
+
+def _decode_text(values: typing.List[typing.Optional[bytes]]) -> typing.List[typing.Optional[str]]:
+    return [None if v is None else v.decode(_client_encoding) for v in values]
+
+
+def _column_values(pandas, numpy, values: typing.List, kind: ColumnKind, col: "ColumnDescriptor") -> typing.Any:
+    """
+    Returns the values of a result column as a typed array suitable for a :class:`pandas.DataFrame`.
+    """
+    if kind == ColumnKind.INTEGER:
+        return pandas.array(values, dtype="Int64")
+    elif kind == ColumnKind.FLOAT:
+        # NULL values become NaN
+        return numpy.array(values, dtype=numpy.float64)
+    elif kind == ColumnKind.BOOLEAN:
+        return pandas.array(values, dtype="boolean")
+    elif kind == ColumnKind.TIMESTAMP:
+        return _int64_with_nat(numpy, values).view("datetime64[us]")
+    elif kind == ColumnKind.TIMESTAMPTZ:
+        return pandas.Series(_int64_with_nat(numpy, values).view("datetime64[us]")).dt.tz_localize("UTC")
+    elif kind == ColumnKind.DATE:
+        return _int64_with_nat(numpy, values).view("datetime64[D]").astype("datetime64[s]")
+    elif kind == ColumnKind.TEXT:
+        if col.type_oid == CHAR:
+            # fixed width character columns typically hold a small set of codes
+            return pandas.Categorical(_decode_text(values))
+        return pandas.array(_decode_text(values), dtype="string")
+    return pandas.Series(values, dtype=object)
+
+
+def dataframe_from_rows(
+    rows: typing.List[bytes],
+    row_desc: typing.List["ColumnDescriptor"],
+    row_decoders: typing.List[typing.Union[typing.Tuple[typing.Callable, int], typing.Tuple[typing.Callable]]],
+    columns: typing.Optional[typing.List[typing.Union[str, bytes]]],
+) -> "pandas.DataFrame":
+    """
+    Decodes DataRow payloads column by column into a :class:`pandas.DataFrame` whose dtypes are derived from
+    the type oids of the row description, so they are the same over the text and the binary protocol.
+
+    Integers use the nullable ``Int64`` dtype, floating point numbers ``float64``, booleans the nullable
+    ``boolean`` dtype, timestamps ``datetime64[us]`` (``datetime64[us, UTC]`` for ``TIMESTAMPTZ``), dates
+    ``datetime64[s]``, ``CHAR`` columns ``category`` and other character columns ``string``. Remaining
+    types hold the Python values returned by :meth:`Cursor.fetchall` in ``object`` columns.
+
+    Parameters
+    ----------
+    rows : List[bytes] DataRow payloads
+    row_desc : List[ColumnDescriptor] The row description of the result
+    row_decoders : List[Tuple] The conversion function of each column, as returned by :meth:`Cursor.truncated_row_desc`
+    columns : Optional[List[Union[str, bytes]]] Column labels of the resulting `pandas.DataFrame`
+
+    Returns
+    -------
+    A `pandas.DataFrame` holding the decoded rows: pandas.DataFrame
+    """
+    import numpy  # type: ignore
+    import pandas  # type: ignore
+
+    plan: typing.List[typing.Tuple[ColumnKind, typing.Callable]] = column_plan(row_desc, row_decoders)
+    data: typing.Dict[int, typing.Any] = {
+        idx: _column_values(pandas, numpy, values, kind, col)
+        for idx, (values, (kind, _), col) in enumerate(zip(decode_columns(rows, plan), plan, row_desc))
+    }
+    # positional keys are used as result sets may contain duplicate column labels
+    df: "pandas.DataFrame" = pandas.DataFrame(data, copy=False)
+    if columns is not None:
+        df.columns = columns
+    return df
+
+
+def dataframe_text_columns(df: "pandas.DataFrame") -> typing.List[typing.List[typing.Optional[str]]]:
+    """
+    Returns the values of each column of ``df`` in the text format accepted by Amazon Redshift, with ``None``
+    in place of missing values such as NaN, NaT and ``pandas.NA``. Columns with numeric, boolean or datetime
+    dtypes are converted with vectorized operations rather than value by value.
+    """
+    import numpy  # type: ignore
+    import pandas  # type: ignore
+
+    columns: typing.List[typing.List[typing.Optional[str]]] = []
+    for _, series in df.items():
+        nulls = series.isna().to_numpy()
+        dtype = series.dtype
+        values: typing.List[typing.Optional[str]]
+        if pandas.api.types.is_bool_dtype(dtype):
+            values = numpy.where(series.to_numpy(dtype=bool, na_value=False), "true", "false").tolist()
+        elif pandas.api.types.is_numeric_dtype(dtype):
+            values = series.astype(str).tolist()
+        elif isinstance(dtype, pandas.DatetimeTZDtype):
+            values = series.dt.tz_convert("UTC").dt.strftime("%Y-%m-%d %H:%M:%S.%f+00:00").tolist()
+        elif pandas.api.types.is_datetime64_dtype(dtype):
+            values = series.dt.strftime("%Y-%m-%d %H:%M:%S.%f").tolist()
+        else:
+            values = [None if null else text_value(v) for v, null in zip(series.tolist(), nulls)]
+        if nulls.any():
+            for idx in numpy.flatnonzero(nulls):
+                values[idx] = None
+        columns.append(values)
+    return columns
@@ -0,0 +1,132 @@
+import tempfile
+import typing
+from collections import deque
+
+from redshift_connector.utils.type_utils import i_pack, i_unpack
+
+# approximate memory used to hold a DataRow payload in addition to its length, for the bytes object and deque slot
+ROW_OVERHEAD_BYTES: int = 48
+
+
+class ResultBuffer:
+    """
+    A first-in first-out buffer of the DataRow payloads of a query result, used in place of a :class:`collections.deque`
+    when the memory held by a result is limited.
+
+    Up to ``max_memory`` bytes of payloads are kept in memory. If ``spill`` is True the following payloads are
+    appended to an anonymous temporary file, and read back in order once the payloads held in memory have been
+    consumed. Otherwise the following payloads are discarded and :attr:`overflowed` is set, so the statement can
+    fail once all of its messages have been read.
+    """
+
+    def __init__(self: "ResultBuffer", max_memory: int, spill: bool = True) -> None:
+        self.max_memory: int = max_memory
+        self.spill: bool = spill
+        self.overflowed: bool = False
+        self._rows: deque = deque()
+        self._memory: int = 0
+        self._file: typing.Optional[typing.BinaryIO] = None
+        # the number of payloads in the file which have not been consumed
+        self._spilled: int = 0
+        self._read_offset: int = 0
+        self._write_offset: int = 0
+        # whether the file position is at _write_offset, at _read_offset, or unknown
+        self._file_position: typing.Optional[str] = None
+
+    @property
+    def spilled(self: "ResultBuffer") -> bool:
+        """
+        Whether payloads are held in a temporary file.
+        """
+        return self._file is not None
+
+    def append(self: "ResultBuffer", data: bytes) -> None:
+        if self._file is None:
+            size: int = len(data) + ROW_OVERHEAD_BYTES
+            if self._memory + size <= self.max_memory:
+                self._rows.append(data)
+                self._memory += size
+                return
+            if not self.spill:
+                self.overflowed = True
+                return
+            self._file = typing.cast(typing.BinaryIO, tempfile.TemporaryFile())
+            self._file_position = "write"
+
+        # once payloads are spilled all later payloads are spilled, which keeps them in order
+        if self._file_position != "write":
+            self._file.seek(self._write_offset)
+            self._file_position = "write"
+        self._file.write(i_pack(len(data)))
+        self._file.write(data)
+        self._write_offset += 4 + len(data)
+        self._spilled += 1
+
+    def _read_spilled(self: "ResultBuffer") -> bytes:
+        f: typing.BinaryIO = typing.cast(typing.BinaryIO, self._file)
+        size: int = i_unpack(f.read(4))[0]
+        data: bytes = f.read(size)
+        return data
+
+    def popleft(self: "ResultBuffer") -> bytes:
+        if len(self._rows) > 0:
+            data: bytes = self._rows.popleft()
+            self._memory -= len(data) + ROW_OVERHEAD_BYTES
+            return data
+        if self._spilled == 0:
+            raise IndexError("pop from an empty ResultBuffer")
+
+        f: typing.BinaryIO = typing.cast(typing.BinaryIO, self._file)
+        if self._file_position != "read":
+            f.flush()
+            f.seek(self._read_offset)
+            self._file_position = "read"
+        data = self._read_spilled()
+        self._read_offset += 4 + len(data)
+        self._spilled -= 1
+        if self._spilled == 0:
+            # the file is reused for later payloads
+            f.seek(0)
+            f.truncate()
+            self._read_offset = self._write_offset = 0
+            self._file_position = "write"
+        return data
+
+    def clear(self: "ResultBuffer") -> None:
+        self._rows.clear()
+        self._memory = 0
+        self.overflowed = False
+        self.close()
+
+    def close(self: "ResultBuffer") -> None:
+        """
+        Discards spilled payloads and removes the temporary file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._spilled = 0
+        self._read_offset = self._write_offset = 0
+        self._file_position = None
+
+    def __len__(self: "ResultBuffer") -> int:
+        return len(self._rows) + self._spilled
+
+    def __bool__(self: "ResultBuffer") -> bool:
+        return len(self) > 0
+
+    def __iter__(self: "ResultBuffer") -> typing.Iterator[bytes]:
+        """
+        Iterates over the payloads without consuming them.
+        """
+        yield from self._rows
+        if self._spilled > 0:
+            f: typing.BinaryIO = typing.cast(typing.BinaryIO, self._file)
+            f.flush()
+            offset: int = self._read_offset
+            for _ in range(self._spilled):
+                f.seek(offset)
+                self._file_position = None
+                data: bytes = self._read_spilled()
+                offset += 4 + len(data)
+                yield data
@@ -34,6 +34,8 @@ from redshift_connector.pg_types import (
 
 ANY_ARRAY = 2277
 ABSTIME = 702
+ACLITEM = 1033
+ACLITEM_ARRAY = 1034
 BIGINT = 20
 BIGINT_ARRAY = 1016
 BOOLEAN = 16
@@ -61,6 +63,8 @@ INTEGER_ARRAY = 1007
 INTERVAL = 1186
 INTERVAL_ARRAY = 1187
 OID = 26
+OID_ARRAY = 1028
+OIDVECTOR = 30
 JSON = 114
 JSON_ARRAY = 199
 JSONB = 3802
@@ -150,8 +154,9 @@ def int2_recv(data: bytes, offset: int, length: int) -> int:
     return h_unpack(data, offset)[0]
 
 
-def vector_in(data: bytes, idx: int, length: int) -> typing.List:
-    return eval("[" + data[idx : idx + length].decode(_client_encoding).replace(" ", ",") + "]")
+# int2vector and oidvector are sent as space separated integers in text format
+def vector_in(data: bytes, idx: int, length: int) -> typing.List[int]:
+    return [int(v) for v in data[idx : idx + length].split()]
 
 
 def int4_recv(data: bytes, offset: int, length: int) -> int:
@@ -489,7 +494,19 @@ def _array_in(adapter: typing.Optional[typing.Callable] = None):
 
 
 array_recv_text: typing.Callable = _array_in()
-int_array_recv: typing.Callable = _array_in(lambda data: int(data))
+_int_array_recv_text: typing.Callable = _array_in(lambda data: int(data))
+
+
+def int_array_recv(data: bytes, offset: int, length: int) -> typing.List:
+    # one dimensional integer arrays e.g. {23,1043,NULL} are split directly rather than parsed per character
+    inner: bytes = data[offset + 1 : offset + length - 1]
+    if data[offset : offset + 1] != b"{" or b"{" in inner:
+        return _int_array_recv_text(data, offset, length)
+    if len(inner) == 0:
+        return []
+    return [None if v == b"NULL" else int(v) for v in inner.split(b",")]
+
+
 float_array_recv: typing.Callable = _array_in(lambda data: float(data))
 
 
@@ -526,6 +543,55 @@ def array_recv_binary(data: bytes, idx: int, length: int) -> typing.List:
     return values
 
 
+def _vector_recv_binary(element_fmt: str) -> typing.Callable:
+    """
+    Returns a decoder for binary arrays of a fixed width element type e.g. int2vector, oidvector, OID[].
+    One dimensional arrays without NULL elements, which covers all values of the catalog vector types,
+    are unpacked in a single pass. Anything else is handled by :func:`array_recv_binary`.
+    """
+    element: Struct = Struct("!i" + element_fmt)
+
+    def f(data: bytes, idx: int, length: int) -> typing.List:
+        dim, hasnull, typeoid = iii_unpack(data, idx)
+        if dim == 0:
+            return []
+        if dim != 1 or hasnull:
+            return array_recv_binary(data, idx, length)
+        # skip the array header and the single (dimension length, lower bound) pair
+        return [v for _, v in element.iter_unpack(memoryview(data)[idx + 20 : idx + length])]
+
+    return f
+
+
+int2_vector_recv: typing.Callable = _vector_recv_binary("h")
+oid_vector_recv: typing.Callable = _vector_recv_binary("I")
+
+
+def array_recv_binary_1d(data: bytes, idx: int, length: int) -> typing.List:
+    """
+    Decodes binary arrays of variable width elements, such as ACLITEM[], using a fast path for one dimensional arrays.
+    """
+    dim, hasnull, typeoid = iii_unpack(data, idx)
+    if dim == 0:
+        return []
+    if dim != 1:
+        return array_recv_binary(data, idx, length)
+
+    conversion: typing.Callable = pg_types[typeoid][1]
+    final_idx: int = idx + length
+    idx += 20
+    values: typing.List = []
+    while idx < final_idx:
+        (element_len,) = i_unpack(data, idx)
+        idx += 4
+        if element_len == -1:
+            values.append(None)
+        else:
+            values.append(conversion(data, idx, element_len))
+            idx += element_len
+    return values
+
+
 ascii_invalid_value: int = 0x7F
 
 
@@ -634,6 +700,7 @@ pg_types: typing.DefaultDict[int, typing.Tuple[int, typing.Callable]] = defaultd
         TEXT: (FC_BINARY, text_recv),  # TEXT type
         OID: (FC_BINARY, oid_recv),  # oid
         XID: (FC_TEXT, int_in),  # xid
+        OIDVECTOR: (FC_TEXT, vector_in),  # oidvector
         JSON: (FC_TEXT, json_in),  # json
         REAL: (FC_BINARY, float4_recv),  # float4
         FLOAT: (FC_BINARY, float8_recv),  # float8
@@ -647,9 +714,9 @@ pg_types: typing.DefaultDict[int, typing.Tuple[int, typing.Callable]] = defaultd
         TEXT_ARRAY: (FC_BINARY, array_recv_binary),  # TEXT[]
         1002: (FC_BINARY, array_recv_binary),  # CHAR[]
         # 1014: (FC_BINARY, array_recv_text),  # BPCHAR[]
-        1028: (FC_BINARY, int_array_recv),  # OID[]
-        1033: (FC_BINARY, text_recv),  # ACLITEM
-        1034: (FC_BINARY, array_recv_binary),  # ACLITEM[]
+        OID_ARRAY: (FC_BINARY, oid_vector_recv),  # OID[]
+        ACLITEM: (FC_BINARY, text_recv),  # ACLITEM
+        ACLITEM_ARRAY: (FC_BINARY, array_recv_binary_1d),  # ACLITEM[]
         VARCHAR_ARRAY: (FC_BINARY, array_recv_binary),  # VARCHAR[]
         # 1016: (FC_BINARY, array_recv),  # INT8[]
         REAL_ARRAY: (FC_BINARY, array_recv_binary),  # FLOAT4[]
@@ -681,6 +748,30 @@ def text_out(v: typing.Union[PGText, PGVarchar, PGJson, PGJsonb, PGTsvector, str
     return v.encode(_client_encoding)
 
 
+def str_out(v: typing.Any) -> bytes:
+    return text_value(v).encode(_client_encoding)
+
+
+def text_value(v: typing.Any) -> str:
+    """
+    Returns the text representation of a Python value accepted by Amazon Redshift as input for a column of the
+    matching type.
+    """
+    if isinstance(v, str):
+        return v
+    elif isinstance(v, bool):
+        return "true" if v else "false"
+    elif isinstance(v, Datetime):
+        # includes pandas.Timestamp
+        return v.isoformat(" ")
+    elif isinstance(v, (date, time)):
+        return v.isoformat()
+    elif isinstance(v, (bytes, bytearray, memoryview)):
+        # binary values are VARBYTE, whose input is hexadecimal as sent by varbyte_send
+        return v.hex()
+    return str(v)
+
+
 def enum_out(v: typing.Union[PGEnum, enum.Enum]) -> bytes:
     return str(v.value).encode(_client_encoding)
 
@@ -736,3 +827,43 @@ py_types: typing.Dict[typing.Union[type, int], typing.Tuple[int, int, typing.Cal
     # IPv4Network: (869, FC_TEXT, inet_out),  # inet
     # IPv6Network: (869, FC_TEXT, inet_out)  # inet
 }
+
+# Amazon Redshift type name -> type oid, for parameters whose type is declared by name
+type_oids_by_name: typing.Dict[str, int] = {
+    "smallint": SMALLINT,
+    "int2": SMALLINT,
+    "integer": INTEGER,
+    "int": INTEGER,
+    "int4": INTEGER,
+    "bigint": BIGINT,
+    "int8": BIGINT,
+    "numeric": NUMERIC,
+    "decimal": NUMERIC,
+    "real": REAL,
+    "float4": REAL,
+    "double precision": FLOAT,
+    "float8": FLOAT,
+    "float": FLOAT,
+    "boolean": BOOLEAN,
+    "bool": BOOLEAN,
+    "char": CHAR,
+    "character": CHAR,
+    "bpchar": CHAR,
+    "varchar": VARCHAR,
+    "character varying": VARCHAR,
+    "text": TEXT,
+    "date": DATE,
+    "time": TIME,
+    "time without time zone": TIME,
+    "timetz": TIMETZ,
+    "time with time zone": TIMETZ,
+    "timestamp": TIMESTAMP,
+    "timestamp without time zone": TIMESTAMP,
+    "timestamptz": TIMESTAMPTZ,
+    "timestamp with time zone": TIMESTAMPTZ,
+    "interval": INTERVAL,
+    "super": SUPER,
+    "varbyte": VARBYTE,
+    "geometry": GEOMETRY,
+    "geography": GEOGRAPHY,
+}
@@ -34,6 +34,13 @@ class Datatypes(Enum):
     char_array_binary: typing.Callable = type_utils.array_recv_binary
     oid_array: typing.Callable = type_utils.int_array_recv
     oid_array_binary: typing.Callable = type_utils.array_recv_binary
+    oid_array_binary_vector: typing.Callable = type_utils.oid_vector_recv
+    aclitem_array_binary_1d: typing.Callable = type_utils.array_recv_binary_1d
+    int2vector: typing.Callable = type_utils.vector_in
+    int2vector_binary: typing.Callable = type_utils.int2_vector_recv
+    oidvector_binary: typing.Callable = type_utils.oid_vector_recv
+    xid: typing.Callable = type_utils.int_in
+    xid_binary: typing.Callable = type_utils.oid_recv
     text_array: typing.Callable = type_utils.array_recv_text
     text_array_binary: typing.Callable = type_utils.array_recv_binary
     geometry: typing.Callable = type_utils.text_recv
@@ -293,6 +300,9 @@ test_data: typing.Dict[Datatypes, typing.List[typing.Tuple]] = {
             14,
             [23, 1043, 1043],
         ),
+        (b"\x00\x01\x00\x00\x00\x0b{23,NULL,5}", 6, 11, [23, None, 5]),
+        (b"\x00\x01\x00\x00\x00\x02{}", 6, 2, []),
+        (b"\x00\x01\x00\x00\x00\x0b{{1,2},{3}}", 6, 11, [[1, 2], [3]]),
     ],
     Datatypes.oid_array_binary: [
         (
@@ -308,6 +318,57 @@ test_data: typing.Dict[Datatypes, typing.List[typing.Tuple]] = {
             [23, 1043, 1043],
         ),
     ],
+    Datatypes.oid_array_binary_vector: [
+        (
+            b"\x00\x01\x00\x00\x00\x1c\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x04\x00\x00\x06\xa4",
+            6,
+            28,
+            [1700],
+        ),
+        (
+            b"\x00\x01\x00\x00\x00,\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x00\x04\x00\x00\x00\x17\x00\x00\x00\x04\x00\x00\x04\x13\x00\x00\x00\x04\x00\x00\x04\x13",
+            6,
+            44,
+            [23, 1043, 1043],
+        ),
+        (  # NULL element falls back to array_recv_binary
+            b"\x00\x01\x00\x00\x00(\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x1a\x00\x00\x00\x03\x00\x00\x00\x01\x00\x00\x00\x04\x00\x00\x00\x17\xff\xff\xff\xff\x00\x00\x00\x04\x00\x00\x04\x13",
+            6,
+            40,
+            [23, None, 1043],
+        ),
+        (b"\x00\x01\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x1a", 6, 12, []),
+    ],
+    Datatypes.aclitem_array_binary_1d: [
+        (
+            b"\x00\x01\x00\x00\x00,\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x04\x09\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x14rdsdb=arwdRxtD/rdsdb",
+            6,
+            44,
+            ["rdsdb=arwdRxtD/rdsdb"],
+        ),
+    ],
+    Datatypes.int2vector: [
+        (b"\x00\x01\x00\x00\x00\x051 2 3", 6, 5, [1, 2, 3]),
+        (b"\x00\x01\x00\x00\x00\x00", 6, 0, []),
+    ],
+    Datatypes.int2vector_binary: [
+        (
+            b"\x00\x01\x00\x00\x00&\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x15\x00\x00\x00\x03\x00\x00\x00\x00\x00\x00\x00\x02\x00\x01\x00\x00\x00\x02\x00\x02\x00\x00\x00\x02\x00\x03",
+            6,
+            38,
+            [1, 2, 3],
+        ),
+    ],
+    Datatypes.oidvector_binary: [
+        (
+            b"\x00\x01\x00\x00\x00$\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x00\x1a\x00\x00\x00\x02\x00\x00\x00\x00\x00\x00\x00\x04\x00\x00\x00\x17\x00\x00\x00\x04\xff\xff\xff\xfe",
+            6,
+            36,
+            [23, 4294967294],
+        ),
+    ],
+    Datatypes.xid: [(b"\x00\x01\x00\x00\x00\x0a4294967294", 6, 10, 4294967294)],
+    Datatypes.xid_binary: [(b"\x00\x01\x00\x00\x00\x04\xff\xff\xff\xfe", 6, 4, 4294967294)],
     Datatypes.text_array: [(b"\x00\x01\x00\x00\x00\x0e{typid,typmod}", 6, 14, ["typid", "typmod"])],
     Datatypes.text_array_binary: [
         (
@@ -0,0 +1,289 @@
+import asyncio
+import typing
+
+import pytest  # type: ignore
+
+import redshift_connector.aio
+from redshift_connector import InterfaceError, ProgrammingError
+from redshift_connector.utils.type_utils import INTEGER, h_pack, i_pack, i_unpack
+
+
+def message(code: bytes, body: bytes = b"") -> bytes:
+    return code + i_pack(len(body) + 4) + body
+
+
+def row_description(name: bytes) -> bytes:
+    return message(
+        b"T", h_pack(1) + name + b"\x00" + i_pack(0) + h_pack(0) + i_pack(INTEGER) + h_pack(4) + i_pack(-1) + h_pack(0)
+    )
+
+
+def data_row(value: int) -> bytes:
+    # integers are received in binary format
+    return message(b"D", h_pack(1) + i_pack(4) + i_pack(value))
+
+
+class FakeServer:
+    """
+    Answers a connection over the extended query protocol. SELECT statements return the rows 1, 2 and 3, COPY
+    statements exchange COPY data and other statements insert one row, except those containing ``fail``. The
+    rows of SELECT statements containing ``slow`` are returned after a delay.
+    """
+
+    def __init__(self) -> None:
+        self.statements: typing.Dict[bytes, bytes] = {}
+        self.executed: typing.List[bytes] = []
+        self.copied: bytearray = bytearray()
+        self.closed: typing.List[bytes] = []
+        self.startup: typing.Optional[bytes] = None
+        self.server: typing.Any = None
+
+    async def start(self) -> int:
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        length: int = i_unpack(await reader.readexactly(4))[0]
+        self.startup = await reader.readexactly(length - 4)
+        writer.write(message(b"R", i_pack(0)) + message(b"K", i_pack(1) + i_pack(2)) + message(b"Z", b"I"))
+        status: bytes = b"I"
+        failed: bool = False
+        statement: bytes = b""
+        while True:
+            code: bytes = await reader.readexactly(1)
+            body: bytes = await reader.readexactly(i_unpack(await reader.readexactly(4))[0] - 4)
+            if code == b"X":
+                writer.close()
+                return
+            if code == b"S":
+                writer.write(message(b"Z", status))
+                failed = False
+            elif failed or code == b"H":
+                pass
+            elif code == b"P":
+                name, query = body.split(b"\x00")[:2]
+                self.statements[name] = query
+                writer.write(message(b"1"))
+            elif code == b"D":
+                query = self.statements[body[1:-1]]
+                writer.write(row_description(b"n") if query.startswith(b"SELECT") else message(b"n"))
+            elif code == b"B":
+                statement = self.statements[body[1:].split(b"\x00")[0]]
+                writer.write(message(b"2"))
+            elif code == b"C":
+                self.closed.append(body[1:-1])
+                writer.write(message(b"3"))
+            elif code == b"E":
+                self.executed.append(statement)
+                if b"fail" in statement:
+                    failed = True
+                    writer.write(message(b"E", b"SERROR\x00C42000\x00Mfailed\x00\x00"))
+                elif statement.startswith(b"SELECT"):
+                    if b"slow" in statement:
+                        await asyncio.sleep(0.2)
+                    writer.write(b"".join(data_row(v) for v in (1, 2, 3)) + message(b"C", b"SELECT 3\x00"))
+                elif statement.startswith(b"COPY") and b"STDIN" in statement:
+                    writer.write(message(b"G", b"\x00" + h_pack(0)))
+                    await writer.drain()
+                    while True:
+                        code = await reader.readexactly(1)
+                        body = await reader.readexactly(i_unpack(await reader.readexactly(4))[0] - 4)
+                        if code == b"c":
+                            break
+                        self.copied.extend(body)
+                    writer.write(message(b"C", "COPY {}\x00".format(self.copied.count(b"\n")).encode()))
+                elif statement.startswith(b"COPY"):
+                    writer.write(message(b"H", b"\x00" + h_pack(0)))
+                    writer.write(message(b"d", b"a\n") + message(b"d", b"b\n") + message(b"c"))
+                    writer.write(message(b"C", b"COPY 2\x00"))
+                else:
+                    if statement == b"begin transaction":
+                        status = b"T"
+                    elif statement in (b"commit", b"rollback"):
+                        status = b"I"
+                    writer.write(message(b"C", b"INSERT 0 1\x00"))
+            await writer.drain()
+
+
+def run(test: typing.Callable[[FakeServer, int], typing.Awaitable[None]]) -> FakeServer:
+    server: FakeServer = FakeServer()
+
+    async def main() -> None:
+        port: int = await server.start()
+        try:
+            await test(server, port)
+        finally:
+            await server.stop()
+
+    asyncio.run(main())
+    return server
+
+
+async def connect(port: int, **kwargs) -> redshift_connector.aio.Connection:
+    return await redshift_connector.aio.connect(
+        host="127.0.0.1", port=port, user="awsuser", password="secret", database="dev", ssl=False, **kwargs
+    )
+
+
+def test_aio_connect_sends_startup_message():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port, application_name="aio") as conn:
+            assert not conn.closed
+            assert conn.in_transaction is False
+        assert conn.closed
+
+    server: FakeServer = run(test)
+    assert b"user\x00awsuser\x00" in typing.cast(bytes, server.startup)
+    assert b"application_name\x00aio\x00" in typing.cast(bytes, server.startup)
+
+
+def test_aio_execute_and_fetch():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            cursor = conn.cursor()
+            await cursor.execute("SELECT n FROM t")
+            assert cursor.description[0][0] == b"n"
+            assert await cursor.fetchone() == [1]
+            assert await cursor.fetchall() == ([2], [3])
+
+            await cursor.execute("SELECT n FROM t")
+            assert [row async for row in cursor] == [[1], [2], [3]]
+            assert conn.in_transaction
+            await conn.commit()
+            assert not conn.in_transaction
+
+    server: FakeServer = run(test)
+    # the statement is parsed once and the transaction is begun once
+    assert list(server.statements.values()).count(b"SELECT n FROM t") == 1
+    assert server.executed == [b"begin transaction", b"SELECT n FROM t", b"SELECT n FROM t", b"commit"]
+
+
+def test_aio_executemany_sums_rowcount():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            await cursor.executemany("INSERT INTO t VALUES (%s)", [[1], [2], [3]])
+            assert cursor.rowcount == 3
+
+    assert run(test).executed == [b"INSERT INTO t VALUES ($1)"] * 3
+
+
+def test_aio_evicted_statements_are_closed_before_next_statement():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port, max_prepared_statements=1) as conn:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            for n in (1, 2, 3):
+                await cursor.execute("SELECT {} FROM t".format(n))
+            # the statements evicted from the full cache are queued until the next statement
+            assert server.closed == []
+            await cursor.execute("SELECT 4 FROM t")
+            assert [server.statements[name] for name in server.closed] == [b"SELECT 1 FROM t", b"SELECT 2 FROM t"]
+
+    run(test)
+
+
+def test_aio_error_leaves_connection_usable():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            conn.autocommit = True
+            cursor = conn.cursor()
+            with pytest.raises(ProgrammingError, match="failed"):
+                await cursor.execute("INSERT INTO fail VALUES (1)")
+            await cursor.execute("INSERT INTO t VALUES (1)")
+            assert cursor.rowcount == 1
+
+    run(test)
+
+
+def test_aio_concurrent_connections_and_cursors():
+    async def test(server: FakeServer, port: int) -> None:
+        conns = await asyncio.gather(*(connect(port) for _ in range(3)))
+
+        async def select(conn) -> typing.Tuple:
+            cursor = conn.cursor()
+            await cursor.execute("SELECT n FROM t")
+            return await cursor.fetchall()
+
+        # statements of the cursors of one connection are executed one at a time
+        results = await asyncio.gather(*(select(conn) for conn in conns for _ in range(2)))
+        assert results == [([1], [2], [3])] * 6
+        for conn in conns:
+            await conn.close()
+
+    run(test)
+
+
+def test_aio_copy_in_async_iterable():
+    async def rows() -> typing.AsyncIterator[typing.List]:
+        for i in range(5):
+            yield [i, "x,y" if i == 0 else None]
+
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            stats = await conn.cursor().copy_in("COPY t FROM STDIN CSV", rows(), frame_size=8)
+            assert stats.rows == 5
+
+    assert bytes(run(test).copied) == b'0,"x,y"\n1,\n2,\n3,\n4,\n'
+
+
+def test_aio_copy_in_chunks():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            stats = await conn.cursor().copy_in("COPY t FROM STDIN", [b"a\n", b"b\n"])
+            assert stats.bytes == 4
+
+    assert bytes(run(test).copied) == b"a\nb\n"
+
+
+def test_aio_copy_out_chunks():
+    async def test(server: FakeServer, port: int) -> None:
+        async with await connect(port) as conn:
+            cursor = conn.cursor()
+            assert [chunk async for chunk in cursor.copy_out_chunks("COPY t TO STDOUT")] == [b"a\n", b"b\n"]
+            # the connection is usable once the COPY data has been read
+            await cursor.execute("SELECT n FROM t")
+            assert await cursor.fetchmany(2) == ([1], [2])
+
+    run(test)
+
+
+def test_aio_cancelled_statement_closes_connection():
+    async def test(server: FakeServer, port: int) -> None:
+        conn = await connect(port)
+        conn.autocommit = True
+        cursor = conn.cursor()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(cursor.execute("SELECT slow FROM t"), 0.05)
+        # the response of the cancelled statement would otherwise be read as the response of the next statement
+        assert conn.closed
+        with pytest.raises(InterfaceError, match="connection is closed"):
+            await cursor.execute("INSERT INTO t VALUES (1)")
+
+    run(test)
+
+
+def test_aio_closed_connection_and_cursor():
+    async def test(server: FakeServer, port: int) -> None:
+        conn = await connect(port)
+        cursor = conn.cursor()
+        cursor.close()
+        with pytest.raises(InterfaceError, match="Cursor closed"):
+            await cursor.execute("SELECT 1")
+        await conn.close()
+        with pytest.raises(InterfaceError, match="connection is closed"):
+            await conn.cursor().execute("SELECT 1")
+        with pytest.raises(InterfaceError, match="connection is closed"):
+            await conn.close()
+
+    run(test)
+
+
+def test_aio_connect_rejects_unknown_argument():
+    with pytest.raises(InterfaceError, match="unexpected keyword argument"):
+        asyncio.run(redshift_connector.aio.connect(hots="localhost"))
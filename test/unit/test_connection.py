@@ -1,7 +1,11 @@
+import io
+import threading
+import time
 import typing
 from collections import deque
 from decimal import Decimal
-from unittest.mock import patch
+from io import BytesIO
+from unittest.mock import MagicMock, patch
 
 import pytest  # type: ignore
 
@@ -13,6 +17,7 @@ from redshift_connector import (
     InterfaceError,
     ProgrammingError,
 )
+from redshift_connector.column_descriptor import ColumnDescriptor
 from redshift_connector.config import (
     ClientProtocolVersion,
     max_int2,
@@ -22,6 +27,22 @@ from redshift_connector.config import (
     min_int4,
     min_int8,
 )
+from redshift_connector.core import (
+    BIND,
+    EXECUTE_MSG,
+    FLUSH_MSG,
+    SYNC_MSG,
+    TERMINATE_MSG,
+    make_ssl_context,
+    session_options,
+)
+from redshift_connector.protocol import ZERO_COPY_SIZE
+from redshift_connector.utils.copy_util import (
+    CopyInSource,
+    CopyOutIterator,
+    CopyOutStream,
+)
+from redshift_connector.utils.type_utils import i_pack, ihihih_pack, numeric_in_binary
 from redshift_connector.utils.type_utils import pg_types as PG_TYPES
 from redshift_connector.utils.type_utils import py_types as PY_TYPES
 
@@ -144,6 +165,147 @@ def test_handle_copy_done():
     assert mock_connection._copy_done is True
 
 
+def test_handle_copy_in_response_coalesces_frames():
+    mock_connection: Connection = Connection.__new__(Connection)
+    writes: typing.List[bytes] = []
+    flushes: typing.List[int] = []
+    mock_connection._write = lambda data: writes.append(bytes(data))
+    mock_connection._flush = lambda: flushes.append(len(writes))
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.stream = CopyInSource(([i, "x"] for i in range(100)), frame_size=256)
+
+    mock_connection.handle_COPY_IN_RESPONSE(b"\x00\x00\x02\x00\x00\x00\x00", mock_cursor)
+
+    frames: typing.List[bytes] = writes[1:-2:2]
+    assert all(
+        header[:1] == b"d" and int.from_bytes(header[1:5], "big") == len(frame) + 4
+        for header, frame in zip(writes[:-2:2], frames)
+    )
+    assert b"".join(frames) == "".join("{},x\n".format(i) for i in range(100)).encode()
+    assert len(frames) == 2
+    # data is flushed once, after CopyDone and Sync
+    assert flushes == [len(writes)]
+    assert mock_cursor.copy_stats.rows == 100
+    assert mock_cursor.copy_stats.bytes == sum(len(f) for f in frames)
+
+
+def test_handle_copy_in_response_reads_file():
+    mock_connection: Connection = Connection.__new__(Connection)
+    writes: typing.List[bytes] = []
+    mock_connection._write = lambda data: writes.append(bytes(data))
+    mock_connection._flush = lambda: None
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.stream = BytesIO(b"1,a\n2,b\n")
+
+    mock_connection.handle_COPY_IN_RESPONSE(b"\x00\x00\x02\x00\x00\x00\x00", mock_cursor)
+    assert writes[1] == b"1,a\n2,b\n"
+    assert mock_cursor.copy_stats.bytes == 8
+
+
+def make_copy_out_connection(messages: typing.List[typing.Tuple[bytes, bytes]]) -> typing.Tuple[Connection, BytesIO]:
+    data: BytesIO = BytesIO(b"".join(code + (len(body) + 4).to_bytes(4, "big") + body for code, body in messages))
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._read = data.read
+    mock_connection._commands_with_count = (b"COPY",)
+    mock_connection.message_types = {
+        b"H": mock_connection.handle_COPY_OUT_RESPONSE,
+        b"d": mock_connection.handle_COPY_DATA,
+        b"c": mock_connection.handle_COPY_DONE,
+        b"C": mock_connection.handle_COMMAND_COMPLETE,
+        b"Z": mock_connection.handle_READY_FOR_QUERY,
+    }
+    return mock_connection, data
+
+
+copy_out_messages: typing.List[typing.Tuple[bytes, bytes]] = [
+    (b"H", b"\x00\x00\x02\x00\x00\x00\x00"),
+    (b"d", b"1\ta\n"),
+    (b"d", b"2\tb\n"),
+    (b"d", b"3\tc\n"),
+    (b"c", b""),
+    (b"C", b"COPY 3\x00"),
+    (b"Z", b"I"),
+]
+
+
+def test_copy_out_data_yields_copy_data_as_read():
+    mock_connection, data = make_copy_out_connection(copy_out_messages)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.stream = CopyOutStream()
+    mock_cursor._row_count = -1
+
+    mock_connection.handle_messages(mock_cursor)
+    # reading stops once the copy starts
+    assert mock_connection._copy_out_pending is True
+    assert data.tell() == 12
+
+    chunks = mock_connection.copy_out_data(mock_cursor)
+    assert next(chunks) == b"1\ta\n"
+    assert data.tell() == 12 + 9
+    assert list(chunks) == [b"2\tb\n", b"3\tc\n"]
+    assert mock_cursor._row_count == 3
+    assert mock_connection._copy_out_pending is False
+    assert mock_connection.in_transaction is False
+
+
+def test_copy_out_data_discards_remaining_data_when_closed():
+    mock_connection, data = make_copy_out_connection(copy_out_messages)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.stream = CopyOutStream()
+    mock_cursor._row_count = -1
+
+    mock_connection.handle_messages(mock_cursor)
+    chunks = mock_connection.copy_out_data(mock_cursor)
+    assert next(chunks) == b"1\ta\n"
+    chunks.close()
+    assert data.read() == b""
+    assert mock_connection._copy_out_pending is False
+
+
+def test_statement_while_copy_out_data_is_pending_raises(mocker):
+    mock_connection, data = make_copy_out_connection(copy_out_messages)
+    writes: typing.List[bytes] = []
+    mock_connection._write = lambda d: writes.append(bytes(d))
+    mock_connection._flush = lambda: None
+    mock_connection.autocommit = True
+    mock_connection.in_transaction = False
+    mock_connection.max_result_memory = None
+    mock_connection.spill_results = True
+    mock_connection._sock = MagicMock()
+    mock_cursor: Cursor = Cursor(mock_connection, "format")
+    execute: typing.Callable = Cursor.execute
+
+    def start_copy(cursor: Cursor, operation: str, args=None, stream=None) -> None:
+        cursor.stream = stream
+        mock_connection.handle_messages(cursor)
+
+    mocker.patch.object(Cursor, "execute", autospec=True, side_effect=start_copy)
+    chunks: CopyOutIterator = mock_cursor.copy_out_chunks("COPY book TO STDOUT")
+
+    # the server is still sending the COPY data, so nothing may be sent until it has been read
+    with pytest.raises(InterfaceError, match="TO STDOUT is pending"):
+        execute(mock_cursor, "select 1")
+    with pytest.raises(InterfaceError, match="TO STDOUT is pending"):
+        mock_connection.ping()
+    assert writes == []
+    assert list(chunks) == [b"1\ta\n", b"2\tb\n", b"3\tc\n"]
+    assert mock_connection._copy_out_pending is False
+
+
+def test_copy_out_iterator_discards_remaining_data_when_closed_before_reading():
+    mock_connection, data = make_copy_out_connection(copy_out_messages)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.stream = CopyOutStream()
+    mock_cursor._row_count = -1
+
+    mock_connection.handle_messages(mock_cursor)
+    chunks: CopyOutIterator = CopyOutIterator(mock_connection.copy_out_data(mock_cursor))
+    chunks.close()
+    assert data.read() == b""
+    assert mock_connection._copy_out_pending is False
+    assert list(chunks) == []
+
+
 test_inspect_int_vals: typing.List[typing.Tuple[int, typing.Tuple[int, int, typing.Callable]]] = [
     (min_int2 - 1, PY_TYPES[23]),
     (min_int2, PY_TYPES[23]),
@@ -328,3 +490,494 @@ def test_client_os_version_is_not_present():
 
     with patch("platform.platform", side_effect=Exception("not for you")):
         assert mock_connection.client_os_version == "unknown"
+
+
+test_row_description_dbapi_data: typing.List[typing.Tuple[bytes, typing.Tuple]] = [
+    (  # numeric(10, 2)
+        b"\x00\x01n\x00" + ihihih_pack(0, 0, 1700, -1, ((10 << 16) | 2) + 4, 0),
+        (b"n", 1700, 12, None, 10, 2, None),
+    ),
+    (  # varchar(256)
+        b"\x00\x01v\x00" + ihihih_pack(0, 0, 1043, -1, 256 + 4, 0),
+        (b"v", 1043, 256, 256, 256, None, None),
+    ),
+    (  # int4
+        b"\x00\x01i\x00" + ihihih_pack(0, 0, 23, 4, -1, 1),
+        (b"i", 23, 11, 4, 10, 0, None),
+    ),
+    (  # unknown type modifier
+        b"\x00\x01n\x00" + ihihih_pack(0, 0, 1700, -1, -1, 0),
+        (b"n", 1700, None, None, None, None, None),
+    ),
+]
+
+
+@pytest.mark.parametrize("_input", test_row_description_dbapi_data)
+def test_handle_row_description_dbapi_description(_input):
+    data, exp_description = _input
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._client_protocol_version = ClientProtocolVersion.BASE_SERVER.value
+    mock_connection.pg_types = dict(PG_TYPES)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {"row_desc": []}
+
+    mock_connection.handle_ROW_DESCRIPTION(data, mock_cursor)
+    assert isinstance(mock_cursor.ps["row_desc"][0], ColumnDescriptor)
+    assert mock_cursor.ps["row_desc"][0].to_description() == exp_description
+
+
+def test_handle_row_description_extended_metadata_null_ok():
+    data, _ = test_row_description_extended_metadata[0]
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._client_protocol_version = ClientProtocolVersion.EXTENDED_RESULT_METADATA.value
+    mock_connection.pg_types = dict(PG_TYPES)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {"row_desc": []}
+
+    mock_connection.handle_ROW_DESCRIPTION(data, mock_cursor)
+    assert mock_cursor.ps["row_desc"][0].null_ok is True
+    assert mock_cursor.ps["row_desc"][0]["column_name"] == b"proname"
+
+
+@pytest.mark.parametrize("protocol", ClientProtocolVersion.list())
+def test_build_row_decoders_numeric_scale(protocol):
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._client_protocol_version = protocol
+    col: ColumnDescriptor = ColumnDescriptor(b"n", 0, 0, 1700, -1, ((10 << 16) | 2) + 4, 1)
+    col.func = numeric_in_binary
+
+    decoders = mock_connection._build_row_decoders([col])
+
+    if protocol == ClientProtocolVersion.BINARY:
+        assert decoders == [(numeric_in_binary, 2)]
+    else:
+        assert decoders == [(numeric_in_binary,)]
+
+
+def test_ping_sends_sync_and_reads_ready_for_query():
+    mock_connection: Connection = Connection.__new__(Connection)
+    writes: typing.List[bytes] = []
+    mock_connection._write = lambda data: writes.append(bytes(data))
+    mock_connection._flush = lambda: None
+    mock_connection._read = BytesIO(b"Z\x00\x00\x00\x05I").read
+    mock_connection._cursor = Cursor.__new__(Cursor)
+    mock_connection.message_types = {b"Z": mock_connection.handle_READY_FOR_QUERY}
+
+    mock_connection.ping()
+
+    assert writes == [b"S\x00\x00\x00\x04"]
+    assert mock_connection.in_transaction is False
+
+
+def test_ping_broken_connection_raises():
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._write = lambda data: None
+    mock_connection._flush = lambda: None
+    mock_connection._read = BytesIO(b"").read
+    mock_connection._cursor = Cursor.__new__(Cursor)
+
+    with pytest.raises(InterfaceError, match="connection is broken"):
+        mock_connection.ping()
+
+
+def test_make_ssl_context_is_created_once_per_sslmode(mocker):
+    mocker.patch.dict("redshift_connector.core._ssl_contexts", clear=True)
+    load_verify_locations = mocker.patch("ssl.SSLContext.load_verify_locations")
+
+    context = make_ssl_context("verify-ca")
+    assert make_ssl_context("verify-ca") is context
+    assert context.check_hostname is False
+
+    full = make_ssl_context("verify-full")
+    assert full is not context
+    assert full.check_hostname is True
+    assert load_verify_locations.call_count == 2
+
+
+def ready_server_stream(ready_count: int = 1) -> io.BufferedRWPair:
+    # AuthenticationOk, BackendKeyData and ReadyForQuery, followed by a ReadyForQuery for each Sync
+    response: bytes = b"R" + i_pack(8) + i_pack(0) + b"K" + i_pack(12) + i_pack(1) + i_pack(2)
+    response += (b"Z" + i_pack(5) + b"I") * ready_count
+    return io.BufferedRWPair(io.BytesIO(response), io.BytesIO())  # type: ignore
+
+
+def test_connect_resumes_tls_session_of_last_connection_to_server(mocker):
+    mocker.patch.dict("redshift_connector.core._tls_sessions", clear=True)
+    usock = mocker.patch("socket.socket").return_value
+    usock.recv.return_value = b"S"
+    context = mocker.patch("redshift_connector.core.make_ssl_context").return_value
+    sessions: typing.List[object] = [object(), object()]
+
+    def wrap_socket(sock, session=None, **kwargs):
+        wrapped = MagicMock()
+        wrapped.makefile.return_value = ready_server_stream()
+        wrapped.session = sessions.pop(0)
+        wrapped.session_reused = session is not None
+        return wrapped
+
+    context.wrap_socket.side_effect = wrap_socket
+
+    first: Connection = Connection(user="awsuser", password="secret", database="dev", host="h1")
+    assert context.wrap_socket.call_args[1]["session"] is None
+    assert first.connect_stats.tls_session_reused is False
+    first_session = first._usock.session
+
+    second: Connection = Connection(user="awsuser", password="secret", database="dev", host="h1")
+    assert context.wrap_socket.call_args[1]["session"] is first_session
+    assert second.connect_stats.tls_session_reused is True
+    assert second.connect_stats.seconds >= second.connect_stats.tls_seconds >= 0
+
+    # sessions are not shared between servers
+    sessions.append(object())
+    Connection(user="awsuser", password="secret", database="dev", host="h2")
+    assert context.wrap_socket.call_args[1]["session"] is None
+
+
+@pytest.fixture
+def server_socket(mocker):
+    usock = mocker.patch("socket.socket").return_value
+    usock.makefile.side_effect = lambda mode: ready_server_stream(ready_count=3)
+    return usock
+
+
+def test_lazy_connection_connects_when_first_used(server_socket):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, lazy=True)
+    server_socket.connect.assert_not_called()
+    assert conn.in_transaction is False
+
+    conn.ping()
+    server_socket.connect.assert_called_once_with(("localhost", 5439))
+    conn.ping()
+    server_socket.connect.assert_called_once()
+
+
+def test_lazy_connection_cursor_executes_before_connecting(server_socket, mocker):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, lazy=True)
+    mocker.patch.object(Connection, "execute", side_effect=lambda cursor, operation, vals: conn.ping())
+
+    conn.cursor().execute("select 1")
+    server_socket.connect.assert_called_once()
+
+
+def test_lazy_connection_closed_unused_never_connects(server_socket):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, lazy=True)
+    cursor: Cursor = conn.cursor()
+    conn.close()
+
+    server_socket.connect.assert_not_called()
+    with pytest.raises(InterfaceError, match="connection is closed"):
+        cursor.execute("select 1")
+    with pytest.raises(InterfaceError, match="connection is closed"):
+        conn.ping()
+    with pytest.raises(InterfaceError, match="connection is closed"):
+        conn.close()
+
+
+def test_lazy_connection_connects_again_after_failure(server_socket):
+    server_socket.connect.side_effect = [OSError("unreachable"), None]
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, lazy=True)
+
+    with pytest.raises(InterfaceError, match="communication error"):
+        conn.ping()
+    conn.ping()
+    assert server_socket.connect.call_count == 2
+
+
+def test_background_connect_starts_connecting_when_created(server_socket):
+    connecting: threading.Event = threading.Event()
+    server_socket.connect.side_effect = lambda address: connecting.set()
+    conn: Connection = Connection(
+        user="awsuser", password="secret", database="dev", ssl=False, lazy=True, background_connect=True
+    )
+
+    assert connecting.wait(5)
+    conn.ping()
+    conn.close()
+    server_socket.connect.assert_called_once()
+
+
+class SlowServerStream:
+    """
+    A server which answers the start-up message only once it is released.
+    """
+
+    def __init__(self) -> None:
+        self.released: threading.Event = threading.Event()
+        self.started: threading.Event = threading.Event()
+        self.sent: BytesIO = BytesIO()
+        self._responses: io.BufferedRWPair = ready_server_stream(ready_count=2)
+
+    def write(self, data: bytes) -> int:
+        return self.sent.write(data)
+
+    def flush(self) -> None:
+        self.started.set()
+
+    def read(self, size: int) -> bytes:
+        self.released.wait(5)
+        return self._responses.read(size)
+
+    def read1(self, size: int) -> bytes:
+        self.released.wait(5)
+        return self._responses.read1(size)
+
+    def close(self) -> None:
+        pass
+
+
+def test_background_connect_first_use_waits_for_start_up(server_socket):
+    server: SlowServerStream = SlowServerStream()
+    server_socket.makefile.side_effect = lambda mode: server
+    conn: Connection = Connection(
+        user="awsuser", password="secret", database="dev", ssl=False, lazy=True, background_connect=True
+    )
+    assert server.started.wait(5)
+    start_up: bytes = server.sent.getvalue()
+
+    errors: typing.List[Exception] = []
+
+    def use() -> None:
+        try:
+            conn.ping()
+        except Exception as e:
+            errors.append(e)
+
+    user: threading.Thread = threading.Thread(target=use)
+    user.start()
+    time.sleep(0.1)
+    # nothing is sent while the connection is authenticating
+    assert server.sent.getvalue() == start_up
+
+    server.released.set()
+    user.join(5)
+    assert not user.is_alive()
+    assert errors == []
+    assert server.sent.getvalue() == start_up + SYNC_MSG
+    assert conn._lazy_open is None
+
+
+def test_session_options():
+    assert (
+        session_options(
+            {"search_path": "sales, public", "enable_result_cache_for_session": False, "myapp.dir": "c:\\a"}
+        )
+        == "-c search_path=sales,\\ public -c enable_result_cache_for_session=off -c myapp.dir=c:\\\\a"
+    )
+
+
+@pytest.mark.parametrize("name", ["statement_timeout=0 -c x", "", 1])
+def test_session_options_rejects_invalid_names(name):
+    with pytest.raises(InterfaceError, match="Invalid session setting"):
+        session_options({name: "1"})
+
+
+def settings_server_stream(statuses: typing.Dict[bytes, bytes], sent: BytesIO) -> io.BufferedRWPair:
+    # AuthenticationOk, a ParameterStatus for each of statuses and ReadyForQuery
+    response: bytes = b"R" + i_pack(8) + i_pack(0)
+    for key, value in statuses.items():
+        response += b"S" + i_pack(len(key) + len(value) + 6) + key + b"\x00" + value + b"\x00"
+    response += b"Z" + i_pack(5) + b"I"
+    return io.BufferedRWPair(io.BytesIO(response), sent)  # type: ignore
+
+
+def test_session_settings_are_sent_in_startup_message(mocker):
+    usock = mocker.patch("socket.socket").return_value
+    sent: BytesIO = BytesIO()
+    usock.makefile.return_value = settings_server_stream({b"TimeZone": b"UTC", b"DateStyle": b"ISO, MDY"}, sent)
+    settings: typing.Dict[str, typing.Any] = {"timezone": "utc", "DateStyle": "iso", "statement_timeout": 60000}
+
+    conn: Connection = Connection(
+        user="awsuser", password="secret", database="dev", ssl=False, session_settings=settings
+    )
+
+    assert b"options\x00-c timezone=utc -c DateStyle=iso -c statement_timeout=60000\x00" in sent.getvalue()
+    assert (b"TimeZone", b"UTC") in conn.parameter_statuses
+
+
+class KeptBytesIO(BytesIO):
+    # keeps the bytes sent once the connection closes its socket file
+    def close(self) -> None:
+        pass
+
+
+def test_session_settings_not_used_by_server_raise(mocker):
+    usock = mocker.patch("socket.socket").return_value
+    sent: KeptBytesIO = KeptBytesIO()
+    usock.makefile.return_value = settings_server_stream({b"TimeZone": b"America/New_York"}, sent)
+
+    with pytest.raises(InterfaceError, match="timezone"):
+        Connection(user="awsuser", password="secret", database="dev", ssl=False, session_settings={"timezone": "UTC"})
+    # the session which was started is ended and the socket closed
+    assert sent.getvalue().endswith(TERMINATE_MSG)
+    usock.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "value, option",
+    [
+        ("sales, public", "-c search_path=sales,\\ public"),
+        ('"$user",public', '-c search_path="$user",public'),
+        ("sales,  my schema", "-c search_path=sales,\\ \\ my\\ schema"),
+        ("c:\\my dir", "-c search_path=c:\\\\my\\ dir"),
+    ],
+)
+def test_session_options_escapes_spaces_in_values(value, option):
+    assert session_options({"search_path": value}) == option
+
+
+def test_session_settings_with_spaces_and_commas_match_reported_value(mocker):
+    usock = mocker.patch("socket.socket").return_value
+    sent: BytesIO = BytesIO()
+    usock.makefile.return_value = settings_server_stream({b"search_path": b"sales, my schema"}, sent)
+
+    Connection(
+        user="awsuser",
+        password="secret",
+        database="dev",
+        ssl=False,
+        session_settings={"search_path": "sales,my schema"},
+    )
+    assert b"options\x00-c search_path=sales,my\\ schema\x00" in sent.getvalue()
+
+
+def test_execute_sends_one_sync_terminated_batch_without_flush():
+    mock_connection: Connection = Connection.__new__(Connection)
+    writes: typing.List[bytes] = []
+    mock_connection._write = writes.append
+    mock_connection._flush = lambda: None
+    mock_connection.handle_messages = lambda cursor: None
+    ps: typing.Dict[str, typing.Any] = {
+        "bind_1": b"\x00s\x00\x00\x00\x00\x01",
+        "bind_2": b"\x00\x00",
+        "param_funcs": (bytes,),
+    }
+    large: bytes = b"x" * ZERO_COPY_SIZE
+
+    mock_connection._send_message(BIND, mock_connection.bind_parts(ps, (large,)))
+    mock_connection.send_EXECUTE(Cursor.__new__(Cursor))
+    mock_connection._write(SYNC_MSG)
+
+    data: bytes = b"".join(writes)
+    assert (
+        data
+        == BIND
+        + i_pack(len(large) + 17)
+        + b"\x00s\x00\x00\x00\x00\x01"
+        + i_pack(len(large))
+        + large
+        + b"\x00\x00"
+        + EXECUTE_MSG
+        + SYNC_MSG
+    )
+    assert FLUSH_MSG not in data
+    # the parameter value is written on its own, so it isn't copied
+    assert any(write is large for write in writes)
+
+
+def test_send_buffers_sends_vectors_until_complete():
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._sock = MagicMock()
+    sent: typing.List[bytes] = []
+
+    def sendmsg(buffers) -> int:
+        # sends at most 1000 bytes at once
+        data: bytes = b"".join(bytes(b) for b in buffers)[:1000]
+        sent.append(data)
+        return len(data)
+
+    mock_connection._sendmsg = sendmsg
+    buffers: typing.List[typing.Union[bytes, bytearray]] = [bytearray(b"a" * 10), b"b" * 2500, bytearray(b"c" * 5)]
+    mock_connection._send_buffers(buffers)
+
+    assert b"".join(sent) == b"a" * 10 + b"b" * 2500 + b"c" * 5
+    assert len(sent) == 3
+    mock_connection._sock.flush.assert_called_once()
+    mock_connection._sock.write.assert_not_called()
+
+
+def test_thread_safe_connection_serializes_statements_of_cursors(server_socket, mocker):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, thread_safe=True)
+    conn.autocommit = True
+    running: typing.List[str] = []
+    overlapped: typing.List[bool] = []
+
+    def execute(cursor, operation, vals) -> None:
+        running.append(operation)
+        overlapped.append(len(running) > 1)
+        time.sleep(0.01)
+        running.remove(operation)
+
+    mocker.patch.object(Connection, "execute", side_effect=execute)
+    threads: typing.List[threading.Thread] = [
+        threading.Thread(target=lambda i=i: [conn.cursor().execute("select {}".format(i)) for _ in range(5)])
+        for i in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(overlapped) == 20
+    assert not any(overlapped)
+
+
+def test_connection_is_not_locked_unless_thread_safe(server_socket):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False)
+    assert conn._lock is None
+
+
+def test_thread_safe_copy_out_chunks_holds_connection_until_exhausted(server_socket, mocker):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, thread_safe=True)
+    mocker.patch.object(Cursor, "_Cursor__copy_out_chunks", return_value=iter([b"1\n", b"2\n"]))
+    acquired: typing.List[bool] = []
+
+    def try_acquire() -> None:
+        lock = typing.cast(typing.Any, conn._lock)
+        acquired.append(lock.acquire(blocking=False))
+        if acquired[-1]:
+            lock.release()
+
+    chunks = conn.cursor().copy_out_chunks("copy book to stdout")
+    assert next(chunks) == b"1\n"
+    thread: threading.Thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+
+    assert list(chunks) == [b"2\n"]
+    thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+    assert acquired == [False, True]
+
+
+@pytest.mark.parametrize("drop", [False, True])
+def test_thread_safe_copy_out_chunks_releases_connection_when_closed_before_reading(server_socket, mocker, drop):
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, thread_safe=True)
+    closed: typing.List[bool] = []
+
+    def copy_out_data(operation, args) -> typing.Iterator[bytes]:
+        try:
+            yield b"1\n"
+        finally:
+            closed.append(True)
+
+    mocker.patch.object(Cursor, "_Cursor__copy_out_chunks", side_effect=copy_out_data)
+    acquired: typing.List[bool] = []
+
+    def try_acquire() -> None:
+        lock = typing.cast(typing.Any, conn._lock)
+        acquired.append(lock.acquire(blocking=False))
+        if acquired[-1]:
+            lock.release()
+
+    chunks: typing.Optional[CopyOutIterator] = conn.cursor().copy_out_chunks("copy book to stdout")
+    if drop:
+        chunks = None
+    else:
+        typing.cast(CopyOutIterator, chunks).close()
+    thread: threading.Thread = threading.Thread(target=try_acquire)
+    thread.start()
+    thread.join()
+    assert acquired == [True]
+    # the remaining data is discarded
+    assert closed == [True]
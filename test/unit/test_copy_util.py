@@ -0,0 +1,70 @@
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from io import BytesIO
+
+import pytest  # type: ignore
+
+from redshift_connector.utils.copy_util import CopyInSource, CopyStats, text_copy_fields
+
+
+def read_all(source: CopyInSource) -> typing.List[bytes]:
+    return [bytes(frame) for frame in source.frames()]
+
+
+def test_rows_are_written_as_csv():
+    source: CopyInSource = CopyInSource(
+        [
+            [1, "plain", None, ""],
+            [Decimal("1.5"), 'with "quotes"', "a,b", "line\nbreak"],
+            [True, date(2020, 1, 2), datetime(2020, 1, 2, 3, 4, 5), "ünï"],
+        ]
+    )
+    assert b"".join(read_all(source)).decode("utf-8") == (
+        '1,plain,,""\n' '1.5,"with ""quotes""","a,b","line\nbreak"\n' "true,2020-01-02,2020-01-02 03:04:05,ünï\n"
+    )
+    assert source.rows == 3
+
+
+def test_delimiter_controls_quoting():
+    source: CopyInSource = CopyInSource([["a,b", "c|d"]], delimiter="|")
+    assert read_all(source) == [b'a,b|"c|d"\n']
+
+
+@pytest.mark.parametrize("frame_size", [1, 10, 1024])
+def test_frames_are_coalesced(frame_size):
+    chunks: typing.List[typing.Any] = [b"ab", "cd", [1, 2], b"ef", [3, 4]]
+    source: CopyInSource = CopyInSource(chunks, frame_size=frame_size)
+    frames: typing.List[bytes] = read_all(source)
+    assert b"".join(frames) == b"abcd1,2\nef3,4\n"
+    assert source.bytes == 14
+    assert source.rows == 2
+    if frame_size == 1024:
+        assert len(frames) == 1
+
+
+def test_file_is_read_in_frames():
+    source: CopyInSource = CopyInSource(BytesIO(b"x" * 25), frame_size=10)
+    assert [len(frame) for frame in read_all(source)] == [10, 10, 5]
+    assert source.bytes == 25
+    assert source.rows == 0
+
+
+def test_copy_stats_rates():
+    stats: CopyStats = CopyStats(100, 2000, 2.0)
+    assert stats.rows_per_second == 50.0
+    assert stats.bytes_per_second == 1000.0
+    assert CopyStats(1, 1, 0.0).rows_per_second == 0.0
+
+
+@pytest.mark.parametrize(
+    "line, delimiter, exp_fields",
+    [
+        ("1\ta\n", "\t", ["1", "a"]),
+        ("1\t\\N\t\n", "\t", ["1", None, ""]),
+        ("a\\tb\tc\\\\\td\\ne\n", "\t", ["a\tb", "c\\", "d\ne"]),
+        ("a\\|b|\\101\\x42\n", "|", ["a|b", "AB"]),
+    ],
+)
+def test_text_copy_fields(line, delimiter, exp_fields):
+    assert text_copy_fields(line, delimiter) == exp_fields
@@ -1,12 +1,35 @@
 import typing
-from io import StringIO
-from math import ceil
-from test.utils import pandas_only
+from collections import deque
+from datetime import datetime
+from decimal import Decimal
+from io import BytesIO, StringIO
+from test.utils import numpy_only, pandas_only, pyarrow_only
 from unittest.mock import Mock, PropertyMock, mock_open, patch
 
 import pytest  # type: ignore
 
-from redshift_connector import Connection, Cursor, InterfaceError
+from redshift_connector import Connection, Cursor, InterfaceError, ProgrammingError
+from redshift_connector.column_descriptor import ColumnDescriptor
+from redshift_connector.utils.copy_util import CopyInSource, CopyStats
+from redshift_connector.utils.result_buffer import ROW_OVERHEAD_BYTES, ResultBuffer
+from redshift_connector.utils.type_utils import (
+    bool_recv,
+    d_pack,
+    date_in,
+    date_recv_binary,
+    float8_recv,
+    h_pack,
+    i_pack,
+    int4_recv,
+    int8_recv,
+    numeric_in,
+    numeric_in_binary,
+    py_types,
+    q_pack,
+    text_recv,
+    timestamp_recv_integer,
+    timestamptz_recv_integer,
+)
 
 IS_SINGLE_DATABASE_METADATA_TOGGLE: typing.List[bool] = [True, False]
 
@@ -59,6 +82,47 @@ def test_execute_no_connection_raises_interface_error():
         mock_cursor.execute("blah")
 
 
+def make_result_cursor(max_result_memory: int, spill_results: bool) -> Cursor:
+    mock_cursor: Cursor = make_arrow_cursor()
+    mock_cursor._c = Mock()
+    mock_cursor._c.in_transaction = True
+    mock_cursor.max_result_memory = max_result_memory
+    mock_cursor.spill_results = spill_results
+
+    def execute(cursor, operation, args):
+        cursor._cached_rows.clear()
+        for row in arrow_rows * 100:
+            cursor._cached_rows.append(row)
+
+    mock_cursor._c.execute.side_effect = execute
+    return mock_cursor
+
+
+def test_execute_spills_rows_beyond_max_result_memory():
+    mock_cursor: Cursor = make_result_cursor(1000, True)
+    mock_cursor.execute("select * from book")
+
+    assert mock_cursor._cached_rows.spilled
+    assert len(mock_cursor.fetchmany(2)) == 2
+    rows: typing.List = [mock_cursor.fetchone()] + list(mock_cursor)
+    assert len(rows) == 298
+    assert rows[-1][0] is None and rows[-1][1] == "b"
+    mock_cursor.close()
+
+
+def test_execute_raises_when_result_exceeds_max_result_memory():
+    mock_cursor: Cursor = make_result_cursor(1000, False)
+    with pytest.raises(InterfaceError, match="exceeds max_result_memory of 1000 bytes"):
+        mock_cursor.execute("select * from book")
+    assert len(mock_cursor._cached_rows) == 0
+
+    # without a limit rows are held in a deque
+    mock_cursor.max_result_memory = None
+    mock_cursor.execute("select * from book")
+    assert isinstance(mock_cursor._cached_rows, deque)
+    assert len(mock_cursor.fetchall()) == 300
+
+
 get_procedure_arg_data: typing.List[typing.Tuple[typing.Optional[str], ...]] = [
     ("apples", "blueberries", "oranges"),
     (None, "laffytaffy", "gobstoppers"),
@@ -274,22 +338,24 @@ def test_insert_data_column_names_indexes_mismatch_raises(indexes, names, mocker
         )
 
 
+insert_bulk_columns = (["col1", "integer"], ["col2", "bigint"], ["col3", "character varying"])
+
 insert_bulk_data = [
     (
         [0],
         ["col1"],
-        ("INSERT INTO  test_table (col1) VALUES (%s), (%s), (%s);", ["1", "2", "-1"]),
+        ("INSERT INTO test_table (col1) VALUES (%s), (%s), (%s)", ["1", "2", "-1"]),
     ),
     (
         [1],
         ["col2"],
-        ("INSERT INTO  test_table (col2) VALUES (%s), (%s), (%s);", ["3", "5", "7"]),
+        ("INSERT INTO test_table (col2) VALUES (%s), (%s), (%s)", ["3", "5", "7"]),
     ),
     (
         [2],
         ["col3"],
         (
-            "INSERT INTO  test_table (col3) VALUES (%s), (%s), (%s);",
+            "INSERT INTO test_table (col3) VALUES (%s), (%s), (%s)",
             ["foo", "bar", "baz"],
         ),
     ),
@@ -297,7 +363,7 @@ insert_bulk_data = [
         [0, 1],
         ["col1", "col2"],
         (
-            "INSERT INTO  test_table (col1, col2) VALUES (%s, %s), (%s, %s), (%s, %s);",
+            "INSERT INTO test_table (col1, col2) VALUES (%s, %s), (%s, %s), (%s, %s)",
             ["1", "3", "2", "5", "-1", "7"],
         ),
     ),
@@ -305,7 +371,7 @@ insert_bulk_data = [
         [0, 2],
         ["col1", "col3"],
         (
-            "INSERT INTO  test_table (col1, col3) VALUES (%s, %s), (%s, %s), (%s, %s);",
+            "INSERT INTO test_table (col1, col3) VALUES (%s, %s), (%s, %s), (%s, %s)",
             ["1", "foo", "2", "bar", "-1", "baz"],
         ),
     ),
@@ -313,7 +379,7 @@ insert_bulk_data = [
         [1, 2],
         ["col2", "col3"],
         (
-            "INSERT INTO  test_table (col2, col3) VALUES (%s, %s), (%s, %s), (%s, %s);",
+            "INSERT INTO test_table (col2, col3) VALUES (%s, %s), (%s, %s), (%s, %s)",
             ["3", "foo", "5", "bar", "7", "baz"],
         ),
     ),
@@ -321,7 +387,7 @@ insert_bulk_data = [
         [0, 1, 2],
         ["col1", "col2", "col3"],
         (
-            "INSERT INTO  test_table (col1, col2, col3) VALUES (%s, %s, %s), (%s, %s, %s), (%s, %s, %s);",
+            "INSERT INTO test_table (col1, col2, col3) VALUES (%s, %s, %s), (%s, %s, %s), (%s, %s, %s)",
             ["1", "3", "foo", "2", "5", "bar", "-1", "7", "baz"],
         ),
     ),
@@ -331,9 +397,10 @@ insert_bulk_data = [
 @patch("builtins.open", new_callable=mock_open)
 @pytest.mark.parametrize("indexes,names,exp_execute_args", insert_bulk_data)
 def test_insert_data_column_stmt(mocked_csv, indexes, names, exp_execute_args, mocker):
-    # mock fetchone to return "True" to ensure the table_name and column_name
-    # validation steps pass
+    # mock fetchone to return "True" to ensure the table_name validation step passes,
+    # and fetchall to return the columns of the table
     mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=insert_bulk_columns)
     mock_cursor: Cursor = Cursor.__new__(Cursor)
 
     # spy on the execute method, so we can check value of sql_query
@@ -362,9 +429,10 @@ def test_insert_data_column_stmt(mocked_csv, indexes, names, exp_execute_args, m
 @pytest.mark.parametrize("batch_size", [1, 2, 3, 4])
 @patch("builtins.open", new_callable=mock_open)
 def test_insert_data_uses_batch_size(mocked_csv, batch_size, mocker):
-    # mock fetchone to return "True" to ensure the table_name and column_name
-    # validation steps pass
+    # mock fetchone to return "True" to ensure the table_name validation step passes,
+    # and fetchall to return the columns of the table
     mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=insert_bulk_columns)
     mock_cursor: Cursor = Cursor.__new__(Cursor)
 
     # spy on the execute method, so we can check value of sql_query
@@ -392,4 +460,931 @@ def test_insert_data_uses_batch_size(mocked_csv, batch_size, mocker):
         if len(call[1]) == 2 and "INSERT INTO" in call[1][0]:
             actual_insert_stmts_executed += 1
 
-    assert actual_insert_stmts_executed == ceil(3 / batch_size)
+    # full batches followed by batches holding a power of two number of rows
+    assert actual_insert_stmts_executed == 3 // batch_size + bin(3 % batch_size).count("1")
+
+
+def test_get_description_cached_on_prepared_statement():
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {"row_desc": [ColumnDescriptor(b"a", 0, 0, 23, 4, -1, 1)]}
+
+    description = mock_cursor._getDescription()
+    assert description == [(b"a", 23, 11, 4, 10, 0, None)]
+    assert mock_cursor.ps["description"] is description
+    assert mock_cursor._getDescription() is description
+
+
+def test_get_description_no_columns():
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {"row_desc": []}
+    assert mock_cursor._getDescription() is None
+
+
+def make_data_row(*values: typing.Optional[bytes]) -> bytes:
+    row: bytes = h_pack(len(values))
+    for value in values:
+        row += i_pack(-1) if value is None else i_pack(len(value)) + value
+    return row
+
+
+def make_arrow_cursor(*rows: bytes) -> Cursor:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {
+        "row_desc": [
+            ColumnDescriptor(b"id", 0, 0, 23, 4, -1, 1),
+            ColumnDescriptor(b"name", 0, 0, 1043, -1, 24, 0),
+            ColumnDescriptor(b"created", 0, 0, 1114, 8, -1, 1),
+            ColumnDescriptor(b"price", 0, 0, 1700, -1, ((10 << 16) | 2) + 4, 1),
+        ],
+        "row_decoders": [(int4_recv,), (text_recv,), (timestamp_recv_integer,), (numeric_in_binary, 2)],
+    }
+    mock_cursor._cached_rows = deque(rows)
+    return mock_cursor
+
+
+arrow_rows: typing.List[bytes] = [
+    make_data_row(i_pack(1), "é".encode("utf8"), q_pack(86400000000), q_pack(12345)),
+    make_data_row(i_pack(2), None, None, None),
+    make_data_row(None, b"b", q_pack(-1), q_pack(-5)),
+]
+
+
+@pyarrow_only
+def test_fetch_arrow_table():
+    import pyarrow  # type: ignore
+
+    table = make_arrow_cursor(*arrow_rows).fetch_arrow_table()
+
+    assert table.schema == pyarrow.schema(
+        [
+            ("id", pyarrow.int32()),
+            ("name", pyarrow.string()),
+            ("created", pyarrow.timestamp("us")),
+            ("price", pyarrow.decimal128(10, 2)),
+        ]
+    )
+    assert table.to_pydict() == {
+        "id": [1, 2, None],
+        "name": ["é", None, "b"],
+        "created": [datetime(2000, 1, 2), None, datetime(1999, 12, 31, 23, 59, 59, 999999)],
+        "price": [Decimal("123.45"), None, Decimal("-0.05")],
+    }
+
+
+@pyarrow_only
+def test_fetch_arrow_table_numeric_without_precision_is_string():
+    import pyarrow  # type: ignore
+
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {
+        "row_desc": [ColumnDescriptor(b"amount", 0, 0, 1700, -1, -1, 0)],
+        "row_decoders": [(numeric_in,)],
+    }
+    mock_cursor._cached_rows = deque([make_data_row(b"1.50"), make_data_row(None), make_data_row(b"-7")])
+
+    table = mock_cursor.fetch_arrow_table()
+    assert table.schema == pyarrow.schema([("amount", pyarrow.string())])
+    assert table.to_pydict() == {"amount": ["1.50", None, "-7"]}
+
+
+@pyarrow_only
+def test_fetch_arrow_table_matches_fetchall():
+    expected = make_arrow_cursor(*arrow_rows).fetchall()
+    table = make_arrow_cursor(*arrow_rows).fetch_arrow_table()
+    assert [list(row.values()) for row in table.to_pylist()] == [list(row) for row in expected]
+
+
+@pyarrow_only
+def test_fetch_arrow_table_num_consumes_rows():
+    mock_cursor: Cursor = make_arrow_cursor(*arrow_rows)
+
+    assert mock_cursor.fetch_arrow_table(2).num_rows == 2
+    assert mock_cursor.fetchall() == ([None, "b", datetime(1999, 12, 31, 23, 59, 59, 999999), Decimal("-0.05")],)
+
+
+@pyarrow_only
+def test_fetch_arrow_table_no_rows():
+    table = make_arrow_cursor().fetch_arrow_table()
+    assert table.num_rows == 0
+    assert table.column_names == ["id", "name", "created", "price"]
+
+
+@pyarrow_only
+@pytest.mark.parametrize("batch_size, exp_sizes", [(1, [1, 1, 1]), (2, [2, 1]), (65536, [3])])
+def test_fetch_arrow_batches(batch_size, exp_sizes):
+    batches = list(make_arrow_cursor(*arrow_rows).fetch_arrow_batches(batch_size))
+    assert [batch.num_rows for batch in batches] == exp_sizes
+    assert len({batch.schema for batch in batches}) == 1
+
+
+@pyarrow_only
+@pytest.mark.parametrize("ps, exp_msg", [(None, "A query hasn't been issued."), ({"row_desc": []}, "no result set")])
+def test_fetch_arrow_table_without_result_set_raises(ps, exp_msg):
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = ps
+    mock_cursor._cached_rows = deque()
+    with pytest.raises(ProgrammingError, match=exp_msg):
+        mock_cursor.fetch_arrow_table()
+
+
+def make_dataframe_cursor(*rows: bytes) -> Cursor:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {
+        "row_desc": [
+            ColumnDescriptor(b"id", 0, 0, 20, 8, -1, 1),
+            ColumnDescriptor(b"ratio", 0, 0, 701, 8, -1, 1),
+            ColumnDescriptor(b"flag", 0, 0, 16, 1, -1, 1),
+            ColumnDescriptor(b"created", 0, 0, 1184, 8, -1, 1),
+            ColumnDescriptor(b"code", 0, 0, 1042, -1, 5, 0),
+            ColumnDescriptor(b"name", 0, 0, 1043, -1, 24, 0),
+            ColumnDescriptor(b"price", 0, 0, 1700, -1, ((10 << 16) | 2) + 4, 1),
+        ],
+        "row_decoders": [
+            (int8_recv,),
+            (float8_recv,),
+            (bool_recv,),
+            (timestamptz_recv_integer,),
+            (text_recv,),
+            (text_recv,),
+            (numeric_in_binary, 2),
+        ],
+    }
+    mock_cursor._cached_rows = deque(rows)
+    return mock_cursor
+
+
+dataframe_rows: typing.List[bytes] = [
+    make_data_row(q_pack(1), d_pack(0.5), b"\x01", q_pack(86400000000), b"a", b"x", q_pack(12345)),
+    make_data_row(None, None, None, None, None, None, None),
+    make_data_row(q_pack(3), d_pack(-1.5), b"\x00", q_pack(0), b"a", b"z", q_pack(1)),
+]
+
+
+@pandas_only
+def test_fetch_dataframe_uses_row_description_dtypes():
+    df = make_dataframe_cursor(*dataframe_rows).fetch_dataframe()
+
+    assert list(df.columns) == ["id", "ratio", "flag", "created", "code", "name", "price"]
+    assert [str(dtype) for dtype in df.dtypes] == [
+        "Int64",
+        "float64",
+        "boolean",
+        "datetime64[us, UTC]",
+        "category",
+        "string",
+        "object",
+    ]
+    assert df["id"].isna().tolist() == [False, True, False]
+    assert df["created"][0].isoformat() == "2000-01-02T00:00:00+00:00"
+    assert df["created"].isna().tolist() == [False, True, False]
+    assert df["price"].tolist() == [Decimal("123.45"), None, Decimal("0.01")]
+
+
+@pandas_only
+def test_fetch_dataframe_dtypes_do_not_depend_on_protocol():
+    def make_cursor(date_decoder: typing.Tuple, numeric_decoder: typing.Tuple, *rows: bytes) -> Cursor:
+        mock_cursor: Cursor = Cursor.__new__(Cursor)
+        mock_cursor.ps = {
+            "row_desc": [
+                ColumnDescriptor(b"day", 0, 0, 1082, 4, -1, 1),
+                ColumnDescriptor(b"price", 0, 0, 1700, -1, ((10 << 16) | 2) + 4, 1),
+            ],
+            "row_decoders": [date_decoder, numeric_decoder],
+        }
+        mock_cursor._cached_rows = deque(rows)
+        return mock_cursor
+
+    binary = make_cursor(
+        (date_recv_binary,), (numeric_in_binary, 2), make_data_row(i_pack(1), q_pack(12345)), make_data_row(None, None)
+    ).fetch_dataframe()
+    text = make_cursor(
+        (date_in,), (numeric_in,), make_data_row(b"2000-01-02", b"123.45"), make_data_row(None, None)
+    ).fetch_dataframe()
+
+    assert [str(dtype) for dtype in text.dtypes] == [str(dtype) for dtype in binary.dtypes]
+    assert str(text.dtypes["day"]) == "datetime64[s]"
+    assert text["day"].tolist() == binary["day"].tolist()
+    assert text["price"].tolist() == binary["price"].tolist() == [Decimal("123.45"), None]
+
+
+@pandas_only
+def test_fetch_dataframe_matches_fetchall():
+    expected = make_dataframe_cursor(*dataframe_rows).fetchall()
+    df = make_dataframe_cursor(*dataframe_rows).fetch_dataframe()
+
+    assert df.iloc[0, 0] == expected[0][0]
+    assert df.iloc[0, 3].to_pydatetime() == expected[0][3]
+    assert df.iloc[2, 5] == expected[2][5]
+
+
+@pandas_only
+def test_fetch_dataframe_num_consumes_rows():
+    mock_cursor: Cursor = make_dataframe_cursor(*dataframe_rows)
+
+    assert len(mock_cursor.fetch_dataframe(2)) == 2
+    assert len(mock_cursor.fetchall()) == 1
+    assert mock_cursor.fetch_dataframe() is None
+
+
+@pandas_only
+@pytest.mark.parametrize("chunksize, exp_sizes", [(1, [1, 1, 1]), (2, [2, 1]), (100000, [3])])
+def test_fetch_dataframe_batches(chunksize, exp_sizes):
+    batches = list(make_dataframe_cursor(*dataframe_rows).fetch_dataframe_batches(chunksize))
+
+    assert [len(batch) for batch in batches] == exp_sizes
+    assert all(list(map(str, batch.dtypes)) == list(map(str, batches[0].dtypes)) for batch in batches)
+
+
+@pandas_only
+def test_fetch_dataframe_batches_no_query_raises():
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = None
+    with pytest.raises(ProgrammingError, match="A query hasn't been issued."):
+        mock_cursor.fetch_dataframe_batches()
+
+
+def make_numpy_cursor(*rows: bytes) -> Cursor:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.ps = {
+        "row_desc": [
+            ColumnDescriptor(b"id", 0, 0, 20, 8, -1, 1),
+            ColumnDescriptor(b"ratio", 0, 0, 701, 8, -1, 1),
+            ColumnDescriptor(b"flag", 0, 0, 16, 1, -1, 1),
+            ColumnDescriptor(b"created", 0, 0, 1114, 8, -1, 1),
+            ColumnDescriptor(b"id", 0, 0, 1082, 4, -1, 1),
+        ],
+        "row_decoders": [(int8_recv,), (float8_recv,), (bool_recv,), (timestamp_recv_integer,), (date_recv_binary,)],
+    }
+    mock_cursor._cached_rows = deque(rows)
+    return mock_cursor
+
+
+numpy_rows: typing.List[bytes] = [
+    make_data_row(q_pack(1), d_pack(0.5), b"\x01", q_pack(86400000000), i_pack(1)),
+    make_data_row(q_pack(-2), d_pack(-1.5), b"\x00", q_pack(-1), i_pack(-1)),
+]
+numpy_row_with_nulls: bytes = make_data_row(None, None, None, None, None)
+
+
+@numpy_only
+@pytest.mark.parametrize("rows", [numpy_rows, numpy_rows + [numpy_row_with_nulls]])
+def test_fetch_numpy_array_structured(rows, mocker):
+    import numpy  # type: ignore
+
+    spy = mocker.spy(numpy, "frombuffer")
+    result = make_numpy_cursor(*rows).fetch_numpy_array(structured=True)
+
+    # the second column labelled "id" is renamed as field names must be unique
+    assert result.dtype == numpy.dtype(
+        [("id", "i8"), ("ratio", "f8"), ("flag", "?"), ("created", "M8[us]"), ("f4", "M8[D]")]
+    )
+    assert result["id"][:2].tolist() == [1, -2]
+    assert result["ratio"][:2].tolist() == [0.5, -1.5]
+    assert result["flag"][:2].tolist() == [True, False]
+    assert result["created"][:2].tolist() == [datetime(2000, 1, 2), datetime(1999, 12, 31, 23, 59, 59, 999999)]
+    assert [str(d) for d in result["f4"][:2]] == ["2000-01-02", "1999-12-31"]
+    # the fixed width layout is only usable when no NULL values are present
+    assert spy.call_count == (1 if len(rows) == 2 else 0)
+    assert result.mask.tolist()[2:] == [(True, True, True, True, True)] * (len(rows) - 2)
+
+
+@numpy_only
+def test_fetch_numpy_array_unstructured_unchanged():
+    result = make_numpy_cursor(*numpy_rows).fetch_numpy_array()
+    assert result.shape == (2, 5)
+
+
+@numpy_only
+def test_fetch_into_fills_buffers_in_place():
+    import numpy  # type: ignore
+
+    mock_cursor: Cursor = make_numpy_cursor(*numpy_rows, numpy_row_with_nulls)
+    buffers = [
+        numpy.zeros(2, "i8"),
+        numpy.zeros(2, "f8"),
+        numpy.zeros(2, "?"),
+        numpy.zeros(2, "M8[us]"),
+        numpy.zeros(2, "M8[D]"),
+    ]
+
+    assert mock_cursor.fetch_into(buffers) == 2
+    assert buffers[0].tolist() == [1, -2]
+    assert buffers[3][0] == numpy.datetime64("2000-01-02")
+    assert len(mock_cursor._cached_rows) == 1
+
+    masks = [numpy.zeros(2, "?") for _ in buffers]
+    assert mock_cursor.fetch_into(buffers, masks) == 1
+    assert all(mask.tolist() == [True, False] for mask in masks)
+    assert numpy.isnan(buffers[1][0])
+    assert mock_cursor.fetch_into(buffers, masks) == 0
+
+
+@numpy_only
+def test_fetch_into_null_without_mask_raises():
+    import numpy  # type: ignore
+
+    mock_cursor: Cursor = make_numpy_cursor(numpy_row_with_nulls)
+    buffers = [numpy.zeros(1, dtype) for dtype in ("i8", "f8", "?", "M8[us]", "M8[D]")]
+
+    with pytest.raises(InterfaceError, match="Column id contains NULL values"):
+        mock_cursor.fetch_into(buffers)
+    assert len(mock_cursor._cached_rows) == 1
+
+
+@numpy_only
+def test_fetch_into_buffer_count_mismatch_raises():
+    import numpy  # type: ignore
+
+    with pytest.raises(InterfaceError, match="requires 5 buffers"):
+        make_numpy_cursor(*numpy_rows).fetch_into([numpy.zeros(2)])
+
+
+@pandas_only
+def test_write_dataframe_batches_rows(mocker):
+    import numpy  # type: ignore
+    import pandas  # type: ignore
+
+    df = pandas.DataFrame(
+        {
+            "id": pandas.array([1, None, 3, 4, 5], dtype="Int64"),
+            "ratio": [0.5, numpy.nan, 1.0, 2.0, 3.0],
+            "flag": [True, False, True, False, True],
+            "created": pandas.to_datetime(
+                ["2020-01-01 10:00", None, "2020-01-03 00:00", "2020-01-04 00:00", "2020-01-05 00:00"]
+            ),
+            "name": ["a", None, "c", pandas.NA, "e"],
+        }
+    )
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.paramstyle = "qmark"
+    mock_cursor._input_oids = None
+    mocker.patch("redshift_connector.Cursor._Cursor__is_valid_table", return_value=True)
+    calls: typing.List[typing.Tuple[str, typing.List]] = []
+
+    def execute(operation, args):
+        calls.append((operation, args))
+        mock_cursor._row_count = len(args) // 5
+
+    mocker.patch("redshift_connector.Cursor.execute", side_effect=execute)
+    mock_cursor.write_dataframe(df, "book", batch_size=4)
+
+    assert [len(args) // 5 for _, args in calls] == [4, 1]
+    assert calls[0][0].startswith("INSERT INTO book VALUES (%s, %s, %s, %s, %s), ")
+    assert calls[0][1][:10] == ["1", "0.5", "true", "2020-01-01 10:00:00.000000", "a", None, None, "false", None, None]
+    assert calls[1][1] == ["5", "3.0", "true", "2020-01-05 00:00:00.000000", "e"]
+    assert mock_cursor.rowcount == 5
+    assert mock_cursor.paramstyle == "qmark"
+
+
+@pandas_only
+def test_write_dataframe_empty_does_not_execute(mocker):
+    import pandas  # type: ignore
+
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mocker.patch("redshift_connector.Cursor._Cursor__is_valid_table", return_value=True)
+    spy = mocker.patch("redshift_connector.Cursor.execute")
+    mock_cursor.write_dataframe(pandas.DataFrame({"a": []}), "book")
+    assert spy.call_count == 0
+
+
+def make_upsert_cursor(mocker, autocommit: bool) -> typing.Tuple[Cursor, typing.List[typing.Tuple[str, typing.Any]]]:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.paramstyle = "qmark"
+    mock_cursor._input_oids = None
+    mock_cursor._c = Mock()
+    mock_cursor._c.autocommit = autocommit
+    mocker.patch("redshift_connector.Cursor._Cursor__is_valid_table", return_value=True)
+    # the columns of the table in the catalog
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=(["id", "integer"], ["name", "character varying"]))
+    calls: typing.List[typing.Tuple[str, typing.Any]] = []
+
+    def execute(operation, args=None):
+        if operation.startswith("select column_name"):
+            return
+        calls.append((operation, args))
+        mock_cursor._row_count = len(args) // 2 if args else 0
+
+    mocker.patch("redshift_connector.Cursor.execute", side_effect=execute)
+    return mock_cursor, calls
+
+
+@pytest.mark.parametrize("autocommit", [True, False])
+def test_upsert_rows_merges_staged_rows(mocker, autocommit):
+    mock_cursor, calls = make_upsert_cursor(mocker, autocommit)
+    mock_cursor.upsert_rows(
+        ([i, "v{}".format(i)] for i in range(5)), "book", ["id"], columns=["id", "name"], batch_size=4
+    )
+
+    operations: typing.List[str] = [op for op, _ in calls]
+    if autocommit:
+        assert operations[0] == "begin transaction" and operations[-1] == "commit"
+        operations = operations[1:-1]
+    stage: str = operations[0].split()[3]
+    assert operations[0] == "CREATE TEMP TABLE {} (LIKE book)".format(stage)
+    assert operations[1].startswith("INSERT INTO {} (id, name) VALUES (%s, %s), ".format(stage))
+    assert [args for _, args in calls if args] == [[0, "v0", 1, "v1", 2, "v2", 3, "v3"], [4, "v4"]]
+    assert operations[3] == (
+        "MERGE INTO book USING {0} ON book.id = {0}.id WHEN MATCHED THEN UPDATE SET name = {0}.name "
+        "WHEN NOT MATCHED THEN INSERT (id, name) VALUES ({0}.id, {0}.name)".format(stage)
+    )
+    assert operations[4] == "DROP TABLE {}".format(stage)
+    assert len(operations) == 5
+    assert mock_cursor.rowcount == 5
+    assert mock_cursor.paramstyle == "qmark"
+    mock_cursor._c.commit.assert_not_called()
+
+
+def test_upsert_rows_rolls_back_on_error(mocker):
+    mock_cursor, calls = make_upsert_cursor(mocker, True)
+
+    def execute(operation, args=None):
+        if operation.startswith("select column_name"):
+            return
+        calls.append((operation, args))
+        if operation.startswith("MERGE"):
+            raise ProgrammingError("merge failed")
+
+    mocker.patch("redshift_connector.Cursor.execute", side_effect=execute)
+    with pytest.raises(ProgrammingError, match="merge failed"):
+        mock_cursor.upsert_rows([[1, "a"]], "book", ["id"])
+    mock_cursor._c.rollback.assert_called_once()
+    assert not any(op == "commit" for op, _ in calls)
+
+
+def test_upsert_rows_validates_key_columns(mocker):
+    mock_cursor, calls = make_upsert_cursor(mocker, False)
+    with pytest.raises(InterfaceError, match="At least one key column"):
+        mock_cursor.upsert_rows([[1, "a"]], "book", [])
+    with pytest.raises(InterfaceError, match="Key column author"):
+        mock_cursor.upsert_rows([[1, "a"]], "book", ["author"], columns=["id", "name"])
+    mock_cursor.upsert_rows([], "book", ["id"])
+    assert calls == []
+
+
+@pytest.mark.parametrize(
+    "key_columns, columns", [(["id"], ["id", "name = 'x'; DROP TABLE book; --"]), (["id) OR (1 = 1"], None)]
+)
+def test_upsert_rows_rejects_columns_not_in_table(mocker, key_columns, columns):
+    mock_cursor, calls = make_upsert_cursor(mocker, True)
+    with pytest.raises(InterfaceError, match="Invalid column name"):
+        mock_cursor.upsert_rows([[1, "a"]], "book", key_columns, columns=columns)
+    assert calls == []
+
+
+@pandas_only
+def test_upsert_dataframe_rejects_label_not_in_table(mocker):
+    import pandas  # type: ignore
+
+    mock_cursor, calls = make_upsert_cursor(mocker, True)
+    df = pandas.DataFrame({"id": [1], "name) SELECT * FROM secret; --": ["a"]})
+    with pytest.raises(InterfaceError, match="Invalid column name"):
+        mock_cursor.upsert_dataframe(df, "book", ["id"])
+    assert calls == []
+
+
+@pandas_only
+def test_upsert_dataframe_uses_labels_as_columns(mocker):
+    import pandas  # type: ignore
+
+    mock_cursor, calls = make_upsert_cursor(mocker, False)
+    mock_cursor.upsert_dataframe(pandas.DataFrame({"id": [1, 2], "name": ["a", None]}), "book", ["id"], use_merge=False)
+
+    operations: typing.List[str] = [op for op, _ in calls]
+    stage: str = operations[0].split()[3]
+    assert operations[1].startswith("INSERT INTO {} (id, name) VALUES ".format(stage))
+    assert calls[1][1] == ["1", "a", "2", None]
+    assert operations[2:] == [
+        "DELETE FROM book USING {0} WHERE book.id = {0}.id".format(stage),
+        "INSERT INTO book (id, name) SELECT id, name FROM {}".format(stage),
+        "DROP TABLE {}".format(stage),
+    ]
+
+
+def test_copy_in_reports_server_row_count(mocker):
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+
+    def execute(operation, args=None, stream=None):
+        assert isinstance(stream, CopyInSource) and stream.frame_size == 64
+        mock_cursor.copy_stats = CopyStats(0, 10, 0.5)
+        mock_cursor._row_count = 2
+
+    mocker.patch("redshift_connector.Cursor.execute", side_effect=execute)
+    stats: CopyStats = mock_cursor.copy_in("COPY book FROM STDIN CSV", [b"a,b\n", b"c,d\n"], frame_size=64)
+    assert stats.rows == 2
+    assert stats.bytes_per_second == 20.0
+
+
+@pytest.mark.parametrize(
+    "csv, chunks, exp_rows",
+    [
+        (False, [b"1\t\\N\n", b"2\tb\\tc\n"], [["1", None], ["2", "b\tc"]]),
+        (True, [b'1,"a,b"\n', b'2,"multi\nline"\n'], [["1", "a,b"], ["2", "multi\nline"]]),
+    ],
+)
+def test_copy_out_rows_decodes_rows(mocker, csv, chunks, exp_rows):
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    closed: typing.List[bool] = []
+
+    def copy_out_chunks(operation, args):
+        try:
+            yield from chunks
+        finally:
+            closed.append(True)
+
+    mocker.patch("redshift_connector.Cursor.copy_out_chunks", side_effect=copy_out_chunks)
+    rows = mock_cursor.copy_out_rows("COPY (select 1) TO STDOUT", csv=csv)
+    assert next(rows) == exp_rows[0]
+    rows.close()
+    # closing the rows closes the underlying chunks
+    assert closed == [True]
+    assert list(mock_cursor.copy_out_rows("COPY (select 1) TO STDOUT", csv=csv)) == exp_rows
+
+
+def test_copy_out_rows_closed_before_reading_closes_chunks(mocker):
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    chunks: Mock = Mock()
+    mocker.patch("redshift_connector.Cursor.copy_out_chunks", return_value=chunks)
+    mock_cursor.copy_out_rows("COPY (select 1) TO STDOUT").close()
+    chunks.close.assert_called_once_with()
+
+
+def test_copy_out_chunks_requires_copy_to_stdout(mocker):
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock()
+    mock_cursor._c._copy_out_pending = False
+    mocker.patch("redshift_connector.Cursor.execute")
+    with pytest.raises(InterfaceError, match="COPY ... TO STDOUT"):
+        mock_cursor.copy_out_chunks("select 1")
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_export_csv(tmp_path, compression):
+    import gzip
+
+    path = tmp_path / "out.csv"
+    mock_cursor: Cursor = make_arrow_cursor(*arrow_rows)
+    assert mock_cursor.export(path, compression=compression, chunk_size=2) == 3
+    assert len(mock_cursor._cached_rows) == 0
+
+    raw: bytes = gzip.decompress(path.read_bytes()) if compression else path.read_bytes()
+    assert raw.decode("utf-8") == (
+        "id,name,created,price\n" "1,é,2000-01-02 00:00:00,123.45\n" "2,,,\n" ",b,1999-12-31 23:59:59.999999,-0.05\n"
+    )
+
+
+def test_export_reads_spilled_rows_in_chunks(tmp_path):
+    path = tmp_path / "out.csv"
+    mock_cursor: Cursor = make_arrow_cursor()
+    rows: ResultBuffer = ResultBuffer(max_memory=len(arrow_rows[0]) + ROW_OVERHEAD_BYTES)
+    for data in arrow_rows:
+        rows.append(data)
+    assert rows.spilled
+    mock_cursor._cached_rows = rows
+
+    assert mock_cursor.export(path, chunk_size=1) == 3
+    assert len(rows) == 0
+    assert path.read_text("utf-8").splitlines()[1:] == [
+        "1,é,2000-01-02 00:00:00,123.45",
+        "2,,,",
+        ",b,1999-12-31 23:59:59.999999,-0.05",
+    ]
+
+
+def test_export_jsonl(tmp_path):
+    import json
+
+    path = tmp_path / "out.jsonl"
+    assert make_arrow_cursor(*arrow_rows).export(path, format="jsonl", chunk_size=1) == 3
+    lines: typing.List[typing.Dict] = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+    assert lines == [
+        {"id": 1, "name": "é", "created": "2000-01-02T00:00:00", "price": "123.45"},
+        {"id": 2, "name": None, "created": None, "price": None},
+        {"id": None, "name": "b", "created": "1999-12-31T23:59:59.999999", "price": "-0.05"},
+    ]
+
+
+@pyarrow_only
+def test_export_parquet(tmp_path):
+    import pyarrow.parquet as pq  # type: ignore
+
+    path = tmp_path / "out.parquet"
+    assert make_arrow_cursor(*arrow_rows).export(path, format="parquet", chunk_size=2) == 3
+    parquet_file = pq.ParquetFile(path)
+    # one row group per chunk
+    assert parquet_file.num_row_groups == 2
+    table = parquet_file.read()
+    assert table.column("id").to_pylist() == [1, 2, None]
+    assert table.column("price").to_pylist() == [Decimal("123.45"), None, Decimal("-0.05")]
+
+
+def test_export_validates_arguments(tmp_path):
+    mock_cursor: Cursor = make_arrow_cursor(*arrow_rows)
+    with pytest.raises(InterfaceError, match="Invalid export format"):
+        mock_cursor.export(tmp_path / "out.xml", format="xml")
+    with pytest.raises(InterfaceError, match="Invalid compression"):
+        mock_cursor.export(tmp_path / "out.csv", compression="lz4")
+    with pytest.raises(InterfaceError, match="chunk_size"):
+        mock_cursor.export(tmp_path / "out.csv", chunk_size=0)
+
+
+def test_export_null_text(tmp_path):
+    path = tmp_path / "out.csv"
+    rows: typing.List[bytes] = [make_data_row(i_pack(1), b"", None, None)]
+    assert make_arrow_cursor(*rows).export(path, null="\\N", header=False) == 1
+    # an empty string and NULL are told apart
+    assert path.read_text("utf-8") == "1,,\\N,\\N\n"
+
+
+def make_streamed_export_cursor(
+    messages: typing.List[typing.Tuple[bytes, bytes]], mocker
+) -> typing.Tuple[Cursor, BytesIO]:
+    data: BytesIO = BytesIO(b"".join(code + (len(body) + 4).to_bytes(4, "big") + body for code, body in messages))
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection._sock = Mock()
+    mock_connection._read = data.read
+    mock_connection.autocommit = True
+    mock_connection.in_transaction = False
+    mock_connection._commands_with_count = (b"SELECT",)
+    mock_connection.message_types = {
+        b"2": mock_connection.handle_BIND_COMPLETE,
+        b"C": mock_connection.handle_COMMAND_COMPLETE,
+        b"Z": mock_connection.handle_READY_FOR_QUERY,
+    }
+    mock_cursor: Cursor = make_arrow_cursor()
+    ps = mock_cursor.ps
+    mock_cursor.ps = None
+    mock_cursor._c = mock_connection
+
+    def send_execution(cursor, operation, vals):
+        cursor.ps = ps
+        cursor._row_count = -1
+        cursor._redshift_row_count = -1
+
+    mocker.patch.object(mock_connection, "_send_execution", side_effect=send_execution)
+    return mock_cursor, data
+
+
+streamed_export_messages: typing.List[typing.Tuple[bytes, bytes]] = (
+    [(b"2", b"")] + [(b"D", row) for row in arrow_rows] + [(b"C", b"SELECT 3\x00"), (b"Z", b"I")]
+)
+
+
+def test_export_operation_writes_rows_as_received(tmp_path, mocker):
+    path = tmp_path / "out.csv"
+    mock_cursor, data = make_streamed_export_cursor(streamed_export_messages, mocker)
+    decoded: typing.List[int] = []
+    decode_row = mock_cursor._decode_row
+
+    def spy(row):
+        # the position in the socket when each row is decoded
+        decoded.append(data.tell())
+        return decode_row(row)
+
+    mocker.patch.object(mock_cursor, "_decode_row", side_effect=spy)
+    assert mock_cursor.export(path, chunk_size=1, operation="select 1") == 3
+
+    assert path.read_text("utf-8").splitlines()[1:] == [
+        "1,é,2000-01-02 00:00:00,123.45",
+        "2,,,",
+        ",b,1999-12-31 23:59:59.999999,-0.05",
+    ]
+    # the rows are decoded before the rows which follow are read, not held by the cursor
+    assert decoded == sorted(set(decoded))
+    assert decoded[-1] < len(data.getvalue())
+    assert len(mock_cursor._cached_rows) == 0
+    assert mock_cursor.redshift_rowcount == 3
+
+
+def test_export_operation_drains_response_when_writing_fails(tmp_path, mocker):
+    mock_cursor, data = make_streamed_export_cursor(streamed_export_messages, mocker)
+    mocker.patch.object(mock_cursor, "_decode_row", side_effect=ValueError("bad row"))
+    with pytest.raises(ValueError, match="bad row"):
+        mock_cursor.export(tmp_path / "out.csv", operation="select 1")
+    # the connection has read the whole response and can be reused
+    assert data.tell() == len(data.getvalue())
+
+
+def test_setinputsizes_declares_parameter_types():
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_connection.py_types = {str: (705, 0, None), type(None): (-1, 1, None)}
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = mock_connection
+
+    mock_cursor.setinputsizes("Integer", str, None)
+    assert mock_cursor._input_oids == (23, 705, None)
+
+    params = mock_connection.make_params((1, None, None), mock_cursor._input_oids)
+    assert params[0][:2] == (23, 0) and params[1][:2] == (705, 0)
+    assert params[0][2](1) == b"1"
+    assert params[2][0] == -1
+
+    mock_cursor.setinputsizes()
+    assert mock_cursor._input_oids is None
+
+    # an int is the maximum size of the parameter, not its type
+    mock_cursor.setinputsizes(25, 10)
+    assert mock_cursor._input_oids is None
+    mock_cursor.setinputsizes([25, "date"])
+    assert mock_cursor._input_oids == (None, 1082)
+
+    with pytest.raises(InterfaceError, match="is not mapped"):
+        mock_cursor.setinputsizes(complex)
+    with pytest.raises(InterfaceError, match="type name"):
+        mock_cursor.setinputsizes("integr")
+
+
+@pytest.mark.parametrize("value", [b"\x01ab", bytearray(b"\x01ab"), memoryview(b"\x01ab")])
+def test_setinputsizes_sends_bytes_as_hex(value):
+    mock_connection: Connection = Connection.__new__(Connection)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = mock_connection
+
+    mock_cursor.setinputsizes("varbyte", "boolean")
+    params = mock_connection.make_params((value, True), mock_cursor._input_oids)
+    assert params[0][:2] == (6551, 0)
+    assert params[0][2](value) == b"016162"
+    assert params[1][2](True) == b"true"
+
+
+def test_setinputsizes_applies_to_next_execute_only():
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock(in_transaction=True)
+    mock_cursor._c.py_types = {}
+    declared: typing.List = []
+    mock_cursor._c.execute.side_effect = lambda cursor, operation, args: declared.append(cursor._input_oids)
+
+    mock_cursor.setinputsizes("bigint", None)
+    mock_cursor.execute("select %s, %s", (1, 2))
+    mock_cursor.execute("select %s, %s", (1, 2))
+    assert declared == [(20, None), None]
+    assert mock_cursor._input_oids is None
+
+
+def test_setinputsizes_applies_to_each_parameter_set_of_executemany(mocker):
+    mock_cursor, _ = make_executemany_cursor(mocker, "format")
+    declared: typing.List = []
+    mocker.patch(
+        "redshift_connector.Cursor.execute",
+        side_effect=lambda operation, args: declared.append(mock_cursor._input_oids),
+    )
+    mock_cursor._row_count = mock_cursor._redshift_row_count = 1
+
+    mock_cursor.setinputsizes("bigint")
+    mock_cursor.executemany("update t set a = %s where b = %s", [(1, 2), (3, 4)])
+    assert declared == [(20,), (20,)]
+
+    # the declaration is repeated for each row of a multi-row insert
+    declared.clear()
+    mock_cursor.setinputsizes("bigint")
+    mock_cursor.executemany("insert into t values (%s, %s)", [(1, 2), (3, 4)])
+    assert declared == [(20, None, 20, None)]
+    assert mock_cursor._input_oids is None
+
+
+@patch("builtins.open", new_callable=mock_open)
+def test_insert_data_validates_columns_in_one_query(mocked_csv, mocker):
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=insert_bulk_columns)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    spy = mocker.spy(mock_cursor, "execute")
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+    mocked_csv.side_effect = [StringIO("col1,col2,col3\n1,,foo\n 2 ,5,\n")]
+    progress: typing.List[int] = []
+
+    mock_cursor.insert_data_bulk(
+        filename="mocked_csv",
+        table_name="test_table",
+        parameter_indices=[0, 1, 2],
+        column_names=["col1", "col2", "col3"],
+        delimiter=",",
+        batch_size=2,
+        progress=lambda rows, rate: progress.append(rows),
+    )
+
+    catalog_queries = [c for c in spy.mock_calls if "information_schema.columns" in c[1][0]]
+    assert len(catalog_queries) == 1
+    # integer values are validated and empty values of non-character columns are NULL
+    assert spy.call_args[0][1] == ["1", None, "foo", "2", "5", ""]
+    assert mock_cursor._input_oids is None
+    assert progress == [2]
+
+
+@patch("builtins.open", new_callable=mock_open)
+def test_insert_data_invalid_column_raises(mocked_csv, mocker):
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=insert_bulk_columns)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+
+    with pytest.raises(InterfaceError, match="Invalid column name: col4 specified for table: test_table"):
+        mock_cursor.insert_data_bulk("mocked_csv", "test_table", [0, 1], ["col1", "col4"], ",")
+
+
+@patch("builtins.open", new_callable=mock_open)
+def test_insert_data_invalid_value_raises(mocked_csv, mocker):
+    mocker.patch("redshift_connector.Cursor.fetchone", return_value=[1])
+    mocker.patch("redshift_connector.Cursor.fetchall", return_value=insert_bulk_columns)
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock()
+    mock_cursor.paramstyle = "qmark"
+    mocked_csv.side_effect = [StringIO("col1,col2,col3\n1,3,foo\nabc,5,bar\n")]
+
+    with pytest.raises(InterfaceError, match="Invalid integer value 'abc' on line 3 of mocked_csv"):
+        mock_cursor.insert_data_bulk("mocked_csv", "test_table", [0, 1, 2], ["col1", "col2", "col3"], ",")
+
+
+def make_executemany_cursor(mocker, paramstyle: str, page_size: int = 4):
+    types_connection: Connection = Connection.__new__(Connection)
+    types_connection.py_types = dict(py_types)
+    types_connection.inspect_funcs = {int: types_connection.inspect_int}
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor._c = Mock(executemany_page_size=page_size)
+    mock_cursor._c.make_params.side_effect = types_connection.make_params
+    mock_cursor.paramstyle = paramstyle
+    calls: typing.List[typing.Tuple[str, typing.List, str]] = []
+
+    def execute(operation, args):
+        calls.append((operation, list(args), mock_cursor.paramstyle))
+        mock_cursor._row_count = mock_cursor._redshift_row_count = max(len(calls[-1][1]) // 2, 1)
+
+    mocker.patch("redshift_connector.Cursor.execute", side_effect=execute)
+    return mock_cursor, calls
+
+
+@pytest.mark.parametrize(
+    "paramstyle, operation, param_sets",
+    [
+        ("format", "insert into t (a, b) values (%s, %s)", [(i, str(i)) for i in range(7)]),
+        ("qmark", "INSERT INTO t VALUES (?, ?);", [[i, str(i)] for i in range(7)]),
+        ("named", "insert into t values (:a, :b)", [{"a": i, "b": str(i)} for i in range(7)]),
+        ("pyformat", "insert into t values (%(a)s, %(b)s)", ({"a": i, "b": str(i)} for i in range(7))),
+    ],
+)
+def test_executemany_rewrites_single_row_insert(paramstyle, operation, param_sets, mocker):
+    mock_cursor, calls = make_executemany_cursor(mocker, paramstyle)
+
+    mock_cursor.executemany(operation, param_sets)
+
+    # pages of 4 rows followed by power of two tails
+    assert [len(args) // 2 for _, args, _ in calls] == [4, 2, 1]
+    assert calls[1][0].lower().endswith("values ($1, $2), ($3, $4)")
+    assert calls[0][1] == [0, "0", 1, "1", 2, "2", 3, "3"]
+    assert all(style == "numeric" for _, _, style in calls)
+    assert mock_cursor.paramstyle == paramstyle
+    assert mock_cursor.rowcount == 7
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        "update t set a = %s where b = %s",
+        "insert into t values (%s, 'x')",
+        "insert into t select %s, %s",
+        "insert into t values (%s, %s) -- comment",
+    ],
+)
+def test_executemany_other_statements_not_rewritten(operation, mocker):
+    mock_cursor, calls = make_executemany_cursor(mocker, "format")
+
+    mock_cursor.executemany(operation, [(1, 2), (3, 4)])
+    assert [c[0] for c in calls] == [operation, operation]
+
+
+def test_executemany_rewrite_disabled(mocker):
+    mock_cursor, calls = make_executemany_cursor(mocker, "format", page_size=1)
+
+    mock_cursor.executemany("insert into t values (%s, %s)", [(1, 2), (3, 4)])
+    assert len(calls) == 2
+
+
+def test_executemany_rewrite_batches_rows_with_same_parameter_types(mocker):
+    mock_cursor, calls = make_executemany_cursor(mocker, "format")
+    param_sets: typing.List[typing.Tuple] = [
+        (1, "a"),
+        (2, "b"),
+        (None, "c"),
+        (Decimal("1.5"), "d"),
+        (100000, "e"),
+        (3, "f"),
+        (4, "g"),
+    ]
+
+    mock_cursor.executemany("insert into t values (%s, %s)", param_sets)
+    # int2, NULL, numeric and int4 values aren't bound by the same statement
+    assert [args for _, args, _ in calls] == [
+        [1, "a", 2, "b"],
+        [None, "c"],
+        [Decimal("1.5"), "d"],
+        [100000, "e"],
+        [3, "f", 4, "g"],
+    ]
+    assert mock_cursor.rowcount == 7
+
+
+def test_executemany_rewrite_repeated_parameter(mocker):
+    mock_cursor, calls = make_executemany_cursor(mocker, "named")
+
+    mock_cursor.executemany("insert into t values (:a, :a, :b)", [{"a": 1, "b": 2}, {"a": 3, "b": 4}])
+    assert calls == [("insert into t values ($1, $1, $2), ($3, $3, $4)", [1, 2, 3, 4], "numeric")]
@@ -0,0 +1,130 @@
+import socket
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector import InterfaceError, _validate_and_authenticate
+from redshift_connector.endpoints import EndpointSelector, parse_endpoints
+from redshift_connector.redshift_property import RedshiftProperty
+
+A: typing.Tuple[str, int] = ("a.example.com", 5439)
+B: typing.Tuple[str, int] = ("b.example.com", 5439)
+C: typing.Tuple[str, int] = ("c.example.com", 5440)
+
+
+@pytest.fixture
+def clock(mocker) -> typing.List[float]:
+    now: typing.List[float] = [1000.0]
+    mocker.patch("redshift_connector.endpoints.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def test_parse_endpoints():
+    assert parse_endpoints(["a.example.com", "b.example.com:5439", ("c.example.com", "5440")], 5439) == [A, B, C]
+
+
+@pytest.mark.parametrize("endpoints", [[], ["a.example.com:port"], [("a.example.com",)], [5439]])
+def test_parse_endpoints_rejects_invalid(endpoints):
+    with pytest.raises(InterfaceError):
+        parse_endpoints(endpoints, 5439)
+
+
+def test_candidates_round_robin():
+    selector: EndpointSelector = EndpointSelector()
+    assert [selector.candidates([A, B, C], "round_robin")[0] for _ in range(4)] == [A, B, C, A]
+
+
+def test_candidates_least_latency_tries_unmeasured_endpoints_first():
+    selector: EndpointSelector = EndpointSelector()
+    selector.connected(A, 0.2)
+    selector.connected(B, 0.1)
+    assert selector.candidates([A, B, C], "least_latency") == [C, B, A]
+
+    # the latency is averaged over connections
+    selector.connected(B, 1.0)
+    selector.connected(C, 0.15)
+    assert selector.candidates([A, B, C], "least_latency") == [C, A, B]
+
+
+def test_candidates_try_failed_endpoints_last_until_cooldown_ends(clock):
+    selector: EndpointSelector = EndpointSelector()
+    selector.failed(A, 30)
+    clock[0] += 10
+    selector.failed(B, 30)
+
+    assert selector.candidates([A, B, C], "least_latency") == [C, A, B]
+    clock[0] += 21
+    assert selector.candidates([A, B, C], "least_latency") == [A, C, B]
+
+
+def test_resolve_caches_addresses_until_ttl_or_failure(mocker, clock):
+    getaddrinfo = mocker.patch(
+        "socket.getaddrinfo", return_value=[(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 5439))]
+    )
+    selector: EndpointSelector = EndpointSelector()
+
+    assert selector.resolve(A, 0) == [A]
+    getaddrinfo.assert_not_called()
+
+    assert selector.resolve(A, 60) == [("10.0.0.1", 5439)]
+    assert selector.resolve(A, 60) == [("10.0.0.1", 5439)]
+    assert getaddrinfo.call_count == 1
+
+    clock[0] += 61
+    selector.resolve(A, 60)
+    assert getaddrinfo.call_count == 2
+
+    selector.failed(A, 30)
+    selector.resolve(A, 60)
+    assert getaddrinfo.call_count == 3
+
+
+def test_connect_fails_over_to_next_endpoint(mocker):
+    sockets: typing.List[typing.Any] = []
+
+    def connect(address: typing.Tuple[str, int]) -> None:
+        if address != B:
+            raise socket.timeout("timed out")
+
+    def new_socket(*args):
+        sock = mocker.MagicMock()
+        sock.connect.side_effect = connect
+        sockets.append(sock)
+        return sock
+
+    mocker.patch("socket.socket", side_effect=new_socket)
+    selector: EndpointSelector = EndpointSelector()
+
+    sock, endpoint = selector.connect([A, B], "round_robin", None, 60, 1, 30, 0)
+
+    assert endpoint == B
+    assert sock is sockets[1]
+    sockets[0].settimeout.assert_called_once_with(1)
+    sockets[0].close.assert_called_once()
+    # the connected socket uses the timeout of the connection
+    assert sock.settimeout.call_args_list == [mocker.call(1), mocker.call(60)]
+    # the failed endpoint is tried last by the next connection
+    assert selector.candidates([A, B], "round_robin") == [B, A]
+
+
+def test_connect_raises_when_no_endpoint_connects(mocker):
+    mocker.patch("socket.socket").return_value.connect.side_effect = ConnectionRefusedError()
+    selector: EndpointSelector = EndpointSelector()
+
+    with pytest.raises(InterfaceError, match="communication error"):
+        selector.connect([A, B], "round_robin", None, None, None, 30, 0)
+
+
+def test_validate_uses_first_endpoint_as_host():
+    info: RedshiftProperty = RedshiftProperty()
+    info.put("endpoints", ["a.example.com", "c.example.com:5440"])
+    _validate_and_authenticate(info)
+    assert info.endpoints == [A, C]
+    assert (info.host, info.port) == A
+
+
+def test_validate_rejects_unknown_load_balance():
+    info: RedshiftProperty = RedshiftProperty()
+    info.put("load_balance", "random")
+    with pytest.raises(InterfaceError, match="load_balance"):
+        _validate_and_authenticate(info)
@@ -0,0 +1,119 @@
+import typing
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+from redshift_connector import Cursor
+from redshift_connector.utils.insert_util import (
+    MAX_BIND_PARAMETERS,
+    MultiRowInsert,
+    batch_shape,
+    declared_type_oid,
+    text_coercer,
+    upsert_statements,
+)
+from redshift_connector.utils.type_utils import INTEGER, UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "num_rows, max_rows, exp_shape",
+    [(1000, 1000, 1000), (5000, 1000, 1000), (999, 1000, 512), (3, 1000, 2), (1, 1000, 1), (7, 5, 5)],
+)
+def test_batch_shape(num_rows, max_rows, exp_shape):
+    assert batch_shape(num_rows, max_rows) == exp_shape
+
+
+def make_cursor() -> typing.Tuple[Cursor, typing.List[typing.Tuple[str, typing.List, typing.Tuple]]]:
+    mock_cursor: Cursor = Cursor.__new__(Cursor)
+    mock_cursor.paramstyle = "qmark"
+    mock_cursor._input_oids = None
+    calls: typing.List[typing.Tuple[str, typing.List, typing.Tuple]] = []
+
+    def execute(operation, args):
+        calls.append((operation, args, mock_cursor._input_oids))
+        mock_cursor._row_count = len(args) // 2
+
+    mock_cursor.execute = MagicMock(side_effect=execute)  # type: ignore
+    return mock_cursor, calls
+
+
+def test_multirow_insert_uses_fixed_batch_shapes():
+    mock_cursor, calls = make_cursor()
+    writer: MultiRowInsert = MultiRowInsert(mock_cursor, "t", ["a", "b"], 2, max_rows=4)
+
+    assert writer.execute(([str(i), None] for i in range(11))) == 11
+    assert [len(args) // 2 for _, args, _ in calls] == [4, 4, 2, 1]
+    assert calls[0][0] == "INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s), (%s, %s)"
+    assert calls[-1][0] == "INSERT INTO t (a, b) VALUES (%s, %s)"
+    assert calls[0][1][:4] == ["0", None, "1", None]
+    # NULL values do not change the parameter types, so statements are reused
+    assert all(oids == (UNKNOWN,) * len(args) for _, args, oids in calls)
+    # the cursor's paramstyle and parameter types are restored
+    assert mock_cursor.paramstyle == "qmark"
+    assert mock_cursor._input_oids is None
+
+
+def test_multirow_insert_respects_byte_budget():
+    mock_cursor, calls = make_cursor()
+    writer: MultiRowInsert = MultiRowInsert(mock_cursor, "t", None, 2, max_rows=100, max_batch_bytes=100)
+
+    writer.execute([("x" * 20, "y" * 20)] * 5)
+    assert calls[0][0].startswith("INSERT INTO t VALUES ")
+    assert [len(args) // 2 for _, args, _ in calls] == [2, 2, 1]
+
+
+def test_multirow_insert_limits_bind_parameters():
+    mock_cursor, _ = make_cursor()
+    assert MultiRowInsert(mock_cursor, "t", None, 1000, max_rows=1000).max_rows == MAX_BIND_PARAMETERS // 1000
+
+
+def test_multirow_insert_reports_progress():
+    mock_cursor, _ = make_cursor()
+    progress: typing.List[int] = []
+    MultiRowInsert(mock_cursor, "t", None, 2, max_rows=4).execute([("1", "2")] * 10, progress.append)
+    assert progress == [4, 8, 10]
+
+
+@pytest.mark.parametrize(
+    "data_type, value, exp_value",
+    [
+        ("integer", " 42 ", "42"),
+        ("integer", "", None),
+        ("numeric", "1.50", "1.50"),
+        ("double precision", "1e3", "1000.0"),
+        ("boolean", "Yes", "true"),
+        ("boolean", "0", "false"),
+        ("date", " 2020-01-01", "2020-01-01"),
+        ("date", " ", None),
+        ("character varying", "", ""),
+        ("character varying", " a ", " a "),
+    ],
+)
+def test_text_coercer(data_type, value, exp_value):
+    assert text_coercer(data_type)(value) == exp_value
+
+
+@pytest.mark.parametrize("data_type, value", [("integer", "1.5"), ("numeric", "abc"), ("boolean", "maybe")])
+def test_text_coercer_invalid_value_raises(data_type, value):
+    with pytest.raises((ValueError, ArithmeticError)):
+        text_coercer(data_type)(value)
+
+
+def test_declared_type_oid():
+    assert declared_type_oid("integer") == INTEGER
+    assert declared_type_oid("character varying") == UNKNOWN
+
+
+def test_upsert_statements():
+    assert upsert_statements("s.t", "stage", ["a", "b"], None) == [
+        "MERGE INTO s.t USING stage ON s.t.a = stage.a AND s.t.b = stage.b REMOVE DUPLICATES"
+    ]
+    # keys are assigned to themselves when there is no other column to update
+    assert upsert_statements("t", "stage", ["a"], ["a"]) == [
+        "MERGE INTO t USING stage ON t.a = stage.a WHEN MATCHED THEN UPDATE SET a = stage.a "
+        "WHEN NOT MATCHED THEN INSERT (a) VALUES (stage.a)"
+    ]
+    assert upsert_statements("t", "stage", ["a"], None, use_merge=False) == [
+        "DELETE FROM t USING stage WHERE t.a = stage.a",
+        "INSERT INTO t SELECT * FROM stage",
+    ]
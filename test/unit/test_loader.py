@@ -0,0 +1,197 @@
+import threading
+import typing
+from test.utils import pandas_only
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+from redshift_connector import Cursor, InterfaceError, LoadMetrics, ParallelLoader
+
+
+class FakeServer:
+    """
+    Records the statements executed through connections returned by ``connect``, except the catalog queries,
+    which find the table ``t`` with the columns ``a`` and ``b``.
+    """
+
+    def __init__(self, fail_table: typing.Optional[str] = None) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.statements: typing.List[typing.Tuple[str, typing.Optional[typing.List]]] = []
+        self.connections: typing.List[MagicMock] = []
+        self.fail_table: typing.Optional[str] = fail_table
+
+    def make_cursor(self) -> Cursor:
+        cursor: Cursor = Cursor.__new__(Cursor)
+        cursor.paramstyle = "format"
+        cursor._input_oids = None
+        cursor._row_count = -1
+
+        def execute(operation, args=None):
+            if operation.startswith("select "):
+                found: bool = args[0] == "t"
+                cursor.fetchone = MagicMock(return_value=[1] if found else None)  # type: ignore
+                cursor.fetchall = MagicMock(return_value=(["a", "varchar"], ["b", "varchar"]) if found else ())  # type: ignore
+                return
+            if self.fail_table is not None and operation.startswith("INSERT INTO {} ".format(self.fail_table)):
+                raise InterfaceError("insert failed")
+            with self.lock:
+                self.statements.append((operation, args))
+            cursor._row_count = len(args) // 2 if args else 6
+
+        cursor.execute = MagicMock(side_effect=execute)  # type: ignore
+        cursor.__enter__ = MagicMock(return_value=cursor)  # type: ignore
+        return cursor
+
+    def connect(self, **kwargs) -> MagicMock:
+        conn: MagicMock = MagicMock()
+        conn.kwargs = kwargs
+        conn.cursor.side_effect = self.make_cursor
+        with self.lock:
+            self.connections.append(conn)
+        return conn
+
+    def inserted_rows(self, table: str) -> typing.List[typing.Tuple]:
+        rows: typing.List[typing.Tuple] = []
+        for operation, args in self.statements:
+            if operation.startswith("INSERT INTO {} ".format(table)) and args is not None:
+                rows.extend(zip(args[::2], args[1::2]))
+        return rows
+
+
+@pytest.fixture
+def server(mocker) -> FakeServer:
+    fake: FakeServer = FakeServer()
+    mocker.patch("redshift_connector.connect", side_effect=fake.connect)
+    return fake
+
+
+def test_load_rows_distributes_across_workers(server):
+    rows: typing.List[typing.List[str]] = [[str(i), "v{}".format(i)] for i in range(50)]
+    loader: ParallelLoader = ParallelLoader({"host": "h"}, workers=3, batch_size=4)
+
+    metrics: LoadMetrics = loader.load(iter(rows), "t", columns=["a", "b"])
+
+    assert metrics.rows == 50
+    assert sum(metrics.worker_rows) == 50
+    assert len(metrics.worker_seconds) == 3
+    assert sorted(server.inserted_rows("t"), key=lambda r: int(r[0])) == [tuple(r) for r in rows]
+    assert all(op.startswith("INSERT INTO t (a, b) VALUES ") for op, _ in server.statements)
+    # a connection checking the table and one connection per worker, each worker committing its rows
+    assert len(server.connections) == 4
+    for conn in server.connections:
+        assert conn.kwargs == {"host": "h"}
+        conn.close.assert_called_once()
+    for conn in server.connections[1:]:
+        conn.commit.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "table, columns, exp_msg",
+    [
+        ("t; DROP TABLE t", None, "Invalid table name"),
+        ("t", ["a", "b) SELECT * FROM secret; --"], "Invalid column name"),
+    ],
+)
+def test_load_rejects_table_or_column_not_in_catalog(server, table, columns, exp_msg):
+    loader: ParallelLoader = ParallelLoader({}, workers=2, batch_size=2)
+    with pytest.raises(InterfaceError, match=exp_msg):
+        loader.load([["1", "x"]], table, columns=columns, staging=True)
+    # nothing but the catalog queries was executed, by the only connection
+    assert server.statements == []
+    assert len(server.connections) == 1
+    server.connections[0].close.assert_called_once()
+
+
+@pytest.mark.parametrize("num_rows, exp_msg", [(10, "exited before reading all rows"), (1, "exited without reporting")])
+def test_load_worker_exiting_unexpectedly_raises(server, mocker, num_rows, exp_msg):
+    mocker.patch("redshift_connector.loader._QUEUE_TIMEOUT", 0.01)
+    # a worker which exits without reading its rows or reporting its result, as a process which is killed
+    mocker.patch("redshift_connector.loader._load_worker")
+    loader: ParallelLoader = ParallelLoader({}, workers=1, batch_size=1, queue_depth=1)
+
+    with pytest.raises(InterfaceError, match="worker 0.*{}".format(exp_msg)):
+        loader.load([[str(i), str(i)] for i in range(num_rows)], "t")
+
+
+def test_load_csv_skips_header(server, tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a|b\n1|x\n2|y\n3|\n")
+    loader: ParallelLoader = ParallelLoader({}, workers=2, batch_size=2)
+
+    metrics: LoadMetrics = loader.load(str(path), "t", delimiter="|")
+
+    assert metrics.rows == 3
+    assert sorted(server.inserted_rows("t")) == [("1", "x"), ("2", "y"), ("3", "")]
+    assert all(op.startswith("INSERT INTO t VALUES ") for op, _ in server.statements)
+
+
+def test_load_empty_source(server):
+    metrics: LoadMetrics = ParallelLoader({}).load([], "t")
+    assert metrics.rows == 0
+    assert server.connections == []
+
+
+def test_load_staging_merges_in_one_statement(server):
+    rows: typing.List[typing.List[str]] = [[str(i), str(i)] for i in range(10)]
+    loader: ParallelLoader = ParallelLoader({}, workers=2, batch_size=3)
+
+    metrics: LoadMetrics = loader.load(rows, "t", columns=["a", "b"], staging=True)
+
+    operations: typing.List[str] = [op for op, _ in server.statements]
+    creates: typing.List[str] = [op for op in operations if op.startswith("CREATE TABLE")]
+    assert len(creates) == 2
+    stages: typing.List[str] = [op.split()[2] for op in creates]
+    assert all(op.endswith("(LIKE t)") for op in creates)
+    assert len(server.inserted_rows(stages[0])) + len(server.inserted_rows(stages[1])) == 10
+    assert server.inserted_rows("t") == []
+    merges: typing.List[str] = [op for op in operations if op.startswith("INSERT INTO t ")]
+    assert merges == [
+        "INSERT INTO t (a, b) SELECT a, b FROM {} UNION ALL SELECT a, b FROM {}".format(stages[0], stages[1])
+    ]
+    assert sorted(op for op in operations if op.startswith("DROP TABLE")) == sorted(
+        "DROP TABLE IF EXISTS {}".format(s) for s in stages
+    )
+    # the row count of the merge statement
+    assert metrics.rows == 6
+
+
+def test_load_worker_failure_raises(mocker):
+    fake: FakeServer = FakeServer(fail_table="t")
+    mocker.patch("redshift_connector.connect", side_effect=fake.connect)
+    loader: ParallelLoader = ParallelLoader({}, workers=2, batch_size=2, queue_depth=1)
+
+    with pytest.raises(InterfaceError, match="insert failed"):
+        loader.load(([str(i), str(i)] for i in range(100)), "t")
+    # a failed worker keeps reading chunks until the end of the input, so the load does not block
+    assert any(not conn.commit.called for conn in fake.connections)
+    for conn in fake.connections:
+        conn.close.assert_called_once()
+
+
+def test_load_staging_failure_drops_staging_tables(mocker):
+    fake: FakeServer = FakeServer(fail_table="t")
+    mocker.patch("redshift_connector.connect", side_effect=fake.connect)
+    loader: ParallelLoader = ParallelLoader({}, workers=2, batch_size=2)
+
+    with pytest.raises(InterfaceError, match="insert failed"):
+        loader.load([["1", "1"], ["2", "2"], ["3", "3"]], "t", staging=True)
+    drops: typing.List[str] = [op for op, _ in fake.statements if op.startswith("DROP TABLE")]
+    assert len(drops) == 2
+
+
+@pandas_only
+def test_load_dataframe(server):
+    import pandas  # type: ignore
+
+    df = pandas.DataFrame({"a": [1, 2, None], "b": ["x", None, "z"]})
+    metrics: LoadMetrics = ParallelLoader({}, workers=2).load(df, "t", columns=["a", "b"])
+
+    assert metrics.rows == 3
+    assert sorted(server.inserted_rows("t"), key=lambda r: r[0] or "") == [(None, "z"), ("1.0", "x"), ("2.0", None)]
+
+
+def test_loader_rejects_invalid_settings():
+    with pytest.raises(InterfaceError, match="workers"):
+        ParallelLoader({}, workers=0)
+    with pytest.raises(InterfaceError, match="batch_size"):
+        ParallelLoader({}, batch_size=0)
@@ -0,0 +1,194 @@
+import threading
+import typing
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+from redshift_connector import ConnectionPool, InterfaceError
+from redshift_connector.iam_helper import IamHelper
+
+
+class FakeConnections:
+    """
+    Creates mock connections in place of ``redshift_connector.connect``.
+    """
+
+    def __init__(self) -> None:
+        self.opened: typing.List[MagicMock] = []
+        self.failures: typing.List[Exception] = []
+
+    def connect(self, **kwargs) -> MagicMock:
+        if self.failures:
+            raise self.failures.pop(0)
+        conn: MagicMock = MagicMock()
+        conn.kwargs = kwargs
+        conn.autocommit = False
+        conn.in_transaction = False
+        self.opened.append(conn)
+        return conn
+
+
+@pytest.fixture
+def fake(mocker) -> FakeConnections:
+    connections: FakeConnections = FakeConnections()
+    mocker.patch("redshift_connector.connect", side_effect=connections.connect)
+    return connections
+
+
+@pytest.fixture
+def clock(mocker) -> typing.List[float]:
+    now: typing.List[float] = [1000.0]
+    mocker.patch("redshift_connector.pool.time.monotonic", side_effect=lambda: now[0])
+    return now
+
+
+def test_pool_reuses_connections(fake):
+    pool: ConnectionPool = ConnectionPool({"host": "h"}, max_size=2)
+
+    with pool.connection() as conn:
+        assert conn.kwargs == {"host": "h"}
+    with pool.connection() as again:
+        assert again is conn
+
+    assert len(fake.opened) == 1
+    assert pool.size == 1
+    assert pool.idle == 1
+
+
+def test_pool_opens_min_size_connections(fake):
+    pool: ConnectionPool = ConnectionPool({}, min_size=3, max_size=5)
+    assert len(fake.opened) == 3
+    assert pool.idle == 3
+
+
+def test_pool_checkout_times_out_when_exhausted(fake):
+    pool: ConnectionPool = ConnectionPool({}, max_size=1)
+    pool.getconn()
+
+    with pytest.raises(InterfaceError, match="Timed out"):
+        pool.getconn(timeout=0.01)
+
+
+def test_pool_waiting_checkout_receives_returned_connection(fake):
+    pool: ConnectionPool = ConnectionPool({}, max_size=1)
+    conn = pool.getconn()
+    received: typing.List[typing.Any] = []
+
+    waiter: threading.Thread = threading.Thread(target=lambda: received.append(pool.getconn(timeout=5)))
+    waiter.start()
+    pool.putconn(conn)
+    waiter.join()
+
+    assert received == [conn]
+    assert len(fake.opened) == 1
+
+
+def test_pool_rolls_back_and_restores_autocommit_on_return(fake):
+    pool: ConnectionPool = ConnectionPool({}, reset_session=True)
+    conn = pool.getconn()
+    conn.in_transaction = True
+    conn.autocommit = True
+
+    pool.putconn(conn)
+
+    conn.rollback.assert_called_once()
+    assert conn.autocommit is False
+    conn.cursor.return_value.__enter__.return_value.execute.assert_called_once_with("RESET ALL")
+
+
+def test_pool_discards_connection_which_cannot_be_reset(fake):
+    pool: ConnectionPool = ConnectionPool({})
+    conn = pool.getconn()
+    conn.in_transaction = True
+    conn.rollback.side_effect = InterfaceError("connection is closed")
+
+    pool.putconn(conn)
+
+    conn.close.assert_called_once()
+    assert pool.size == 0
+
+
+def test_pool_pings_idle_connections_and_replaces_broken(fake, clock):
+    pool: ConnectionPool = ConnectionPool({}, ping_after=5)
+    conn = pool.getconn()
+    pool.putconn(conn)
+
+    assert pool.getconn() is conn
+    conn.ping.assert_not_called()
+    pool.putconn(conn)
+
+    clock[0] += 10
+    conn.ping.side_effect = InterfaceError("connection is broken")
+    replacement = pool.getconn()
+
+    assert replacement is not conn
+    conn.close.assert_called_once()
+    assert pool.size == 1
+
+
+def test_pool_closes_connections_past_max_lifetime(fake, clock):
+    pool: ConnectionPool = ConnectionPool({}, max_lifetime=60, ping_after=1000)
+    conn = pool.getconn()
+    clock[0] += 61
+    pool.putconn(conn)
+
+    conn.close.assert_called_once()
+    assert pool.getconn() is not conn
+
+
+def test_pool_evicts_idle_connections_beyond_min_size(fake, clock):
+    pool: ConnectionPool = ConnectionPool({}, min_size=1, max_idle=30, ping_after=1000)
+    first = pool.getconn()
+    second = pool.getconn()
+    pool.putconn(first)
+    pool.putconn(second)
+    clock[0] += 31
+
+    assert pool.getconn() is second
+    # the connection idle for longer than max_idle is closed, leaving min_size connections
+    first.close.assert_called_once()
+    assert pool.size == 1
+
+
+def test_pool_reconnects_with_new_iam_credentials(fake, mocker):
+    mocker.patch.dict(IamHelper.credentials_cache, {"key": {}}, clear=True)
+    fake.failures.append(InterfaceError({"S": "FATAL", "C": "28000", "M": "password authentication failed"}))
+    pool: ConnectionPool = ConnectionPool({"iam": True})
+
+    pool.getconn()
+
+    assert IamHelper.credentials_cache == {}
+    assert len(fake.opened) == 1
+
+
+def test_pool_connect_error_releases_slot(fake):
+    fake.failures.append(InterfaceError("unreachable"))
+    pool: ConnectionPool = ConnectionPool({}, max_size=1)
+
+    with pytest.raises(InterfaceError, match="unreachable"):
+        pool.getconn()
+    assert pool.size == 0
+    pool.getconn()
+
+
+def test_pool_rejects_foreign_connection(fake):
+    pool: ConnectionPool = ConnectionPool({})
+    with pytest.raises(InterfaceError, match="does not belong"):
+        pool.putconn(MagicMock())
+
+
+def test_pool_close(fake):
+    pool: ConnectionPool = ConnectionPool({})
+    idle = pool.getconn()
+    in_use = pool.getconn()
+    pool.putconn(idle)
+
+    pool.close()
+
+    idle.close.assert_called_once()
+    in_use.close.assert_not_called()
+    with pytest.raises(InterfaceError, match="closed"):
+        pool.getconn()
+    pool.putconn(in_use)
+    in_use.close.assert_called_once()
+    assert pool.size == 0
@@ -0,0 +1,245 @@
+import typing
+from io import BytesIO
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+from redshift_connector import (
+    Connection,
+    Cursor,
+    DataError,
+    InterfaceError,
+    PreparedStatement,
+    ProgrammingError,
+)
+from redshift_connector.config import ClientProtocolVersion
+from redshift_connector.utils.type_utils import BIGINT, INTEGER, UNKNOWN, i_unpack
+from redshift_connector.utils.type_utils import py_types as PY_TYPES
+
+
+def message(code: bytes, body: bytes = b"") -> bytes:
+    return code + (len(body) + 4).to_bytes(4, "big") + body
+
+
+class FakeServer:
+    """
+    Answers the extended query messages written to a connection when it is flushed. Each Execute inserts one row,
+    and an Execute whose first parameter is ``fail`` returns an error.
+    """
+
+    def __init__(self) -> None:
+        self.messages: typing.List[typing.Tuple[bytes, bytes]] = []
+        self.round_trips: int = 0
+        self._written: bytearray = bytearray()
+        self._responses: BytesIO = BytesIO()
+
+    def write(self, data: bytes) -> None:
+        self._written.extend(data)
+
+    def flush(self) -> None:
+        responses: bytearray = bytearray()
+        failed: bool = False
+        self.round_trips += 1
+        while self._written:
+            code: bytes = bytes(self._written[:1])
+            length: int = i_unpack(self._written[1:5])[0]
+            body: bytes = bytes(self._written[5 : 1 + length])
+            del self._written[: 1 + length]
+            if code == b"H":
+                continue
+            self.messages.append((code, body))
+            if code == b"S":
+                responses.extend(message(b"Z", b"I"))
+                failed = False
+            elif failed:
+                continue
+            elif code == b"P":
+                responses.extend(message(b"1"))
+            elif code == b"D":
+                responses.extend(message(b"n"))
+            elif code == b"C":
+                responses.extend(message(b"3"))
+            elif code == b"B":
+                failed = b"fail" in body
+                if failed:
+                    responses.extend(message(b"E", b"SERROR\x00C42000\x00Mfailed\x00\x00"))
+                else:
+                    responses.extend(message(b"2"))
+            elif code == b"E":
+                responses.extend(message(b"C", b"INSERT 0 1\x00"))
+        self._responses = BytesIO(bytes(responses))
+
+    def read(self, size: int) -> bytes:
+        return self._responses.read(size)
+
+    def sent(self, code: bytes) -> typing.List[bytes]:
+        return [body for c, body in self.messages if c == code]
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+def cursor(server) -> Cursor:
+    conn: Connection = Connection.__new__(Connection)
+    conn._sock = MagicMock()
+    conn._write = server.write
+    conn._flush = server.flush
+    conn._read = server.read
+    conn.autocommit = True
+    conn.in_transaction = False
+    conn.max_result_memory = None
+    conn.spill_results = True
+    conn._commands_with_count = (b"INSERT",)
+    conn._client_protocol_version = ClientProtocolVersion.BINARY
+    conn.py_types = dict(PY_TYPES)
+    conn.inspect_funcs = {int: conn.inspect_int}
+    conn.message_types = {
+        b"1": conn.handle_PARSE_COMPLETE,
+        b"2": conn.handle_BIND_COMPLETE,
+        b"3": conn.handle_CLOSE_COMPLETE,
+        b"n": conn.handle_NO_DATA,
+        b"C": conn.handle_COMMAND_COMPLETE,
+        b"E": conn.handle_ERROR_RESPONSE,
+        b"Z": conn.handle_READY_FOR_QUERY,
+    }
+    conn._cursor = Cursor(conn, "format")
+    return Cursor(conn, "format")
+
+
+def test_prepare_parses_on_first_execution(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s, %s)")
+    assert server.messages == []
+
+    statement.execute((1, "a"))
+    statement.execute((2, "b"))
+
+    # the statement is parsed once, with the types of the values of the first execution
+    parses: typing.List[bytes] = server.sent(b"P")
+    assert len(parses) == 1
+    assert b"INSERT INTO t VALUES ($1, $2)\x00" in parses[0]
+    assert parses[0].endswith(b"\x00\x02" + BIGINT.to_bytes(4, "big") + UNKNOWN.to_bytes(4, "big"))
+    binds: typing.List[bytes] = server.sent(b"B")
+    assert len(binds) == 2
+    assert b"\x00\x00\x00\x01b" in binds[1]
+    assert cursor.rowcount == 1
+
+
+def test_prepare_with_types_parses_immediately(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)", types=[INTEGER])
+
+    assert len(server.sent(b"P")) == 1
+    statement.execute([7])
+    # declared types are sent as text
+    assert server.sent(b"B")[0].endswith(b"\x00\x01\x00\x00\x00\x017\x00\x00")
+
+
+def test_prepare_null_first_value_is_sent_as_text(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+
+    statement.execute([None])
+    statement.execute([5])
+
+    assert server.sent(b"P")[0].endswith(UNKNOWN.to_bytes(4, "big"))
+    assert server.sent(b"B")[1].endswith(b"\x00\x00\x00\x015\x00\x00")
+
+
+def test_prepared_int_parameter_accepts_larger_later_values(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+
+    statement.execute([1])
+    statement.execute([100000])
+    statement.execute([2**40])
+
+    assert len(server.sent(b"P")) == 1
+    assert server.sent(b"B")[2].endswith(b"\x00\x00\x00\x08" + (2**40).to_bytes(8, "big") + b"\x00\x00")
+
+
+def test_prepared_value_which_cannot_be_sent_raises_data_error(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+    statement.execute([1])
+
+    with pytest.raises(DataError, match="parameter 1"):
+        statement.executemany([[2], [2**70]])
+    # no execution of the failed batch was sent
+    assert len(server.sent(b"B")) == 1
+    statement.execute([3])
+    assert cursor.rowcount == 1
+
+
+@pytest.mark.parametrize("args", [[3], [3, 4, 5]])
+def test_prepared_wrong_number_of_values_raises(cursor, server, args):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s, %s)")
+    statement.execute([1, 2])
+
+    with pytest.raises(ProgrammingError, match="takes 2 parameters, but {} were given".format(len(args))):
+        statement.executemany([[3, 4], args])
+    # nothing of the failed batch was sent
+    assert len(server.sent(b"B")) == 1
+    statement.execute([3, 4])
+    assert cursor.rowcount == 1
+
+
+def test_prepared_executemany_pipelines_executions(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+    statement.execute([0])
+    server.round_trips = 0
+
+    statement.executemany([i] for i in range(2500))
+
+    assert len(server.sent(b"P")) == 1
+    assert len(server.sent(b"B")) == 2501
+    # one round trip per 1000 executions
+    assert server.round_trips == 3
+    assert cursor.rowcount == 2500
+
+
+def test_prepared_executemany_empty(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+    statement.executemany([])
+    assert server.messages == []
+    assert cursor.rowcount == 0
+
+
+def test_prepared_execute_error_skips_batch(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+
+    with pytest.raises(ProgrammingError, match="failed"):
+        statement.executemany([["a"], ["fail"], ["c"]])
+    # the connection can be used after the error
+    statement.execute(["d"])
+    assert cursor.rowcount == 1
+
+
+def test_prepared_named_paramstyle(cursor, server):
+    cursor.paramstyle = "named"
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (:b, :a)")
+
+    statement.execute({"a": "x", "b": "y"})
+
+    assert server.sent(b"B")[0].endswith(b"\x00\x00\x00\x01y\x00\x00\x00\x01x\x00\x00")
+
+
+def test_prepared_close(cursor, server):
+    statement: PreparedStatement = cursor.prepare("INSERT INTO t VALUES (%s)")
+    statement.execute([1])
+    name: bytes = server.sent(b"P")[0].split(b"\x00")[0]
+    assert name.startswith(b"redshift_connector_prepared_")
+
+    with statement:
+        pass
+
+    assert statement.closed
+    assert server.sent(b"C") == [b"S" + name + b"\x00"]
+    statement.close()
+    assert len(server.sent(b"C")) == 1
+    with pytest.raises(InterfaceError, match="prepared statement is closed"):
+        statement.execute([1])
+
+
+def test_prepare_closed_cursor_raises(cursor):
+    cursor.close()
+    with pytest.raises(InterfaceError, match="Cursor closed"):
+        cursor.prepare("SELECT 1")
@@ -0,0 +1,126 @@
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector.protocol import ZERO_COPY_SIZE, Protocol
+
+
+def message(code: bytes, body: bytes = b"") -> bytes:
+    return code + (len(body) + 4).to_bytes(4, "big") + body
+
+
+MESSAGES: typing.List[typing.Tuple[bytes, bytes]] = [
+    (b"1", b""),
+    (b"D", b"\x00\x01\x00\x00\x00\x03abc"),
+    (b"C", b"SELECT 1\x00"),
+    (b"Z", b"I"),
+]
+DATA: bytes = b"".join(message(code, body) for code, body in MESSAGES)
+
+
+def received(protocol: Protocol) -> typing.List[typing.Tuple[bytes, bytes]]:
+    messages: typing.List[typing.Tuple[bytes, bytes]] = []
+    while True:
+        msg = protocol.next_message()
+        if msg is None:
+            return messages
+        messages.append(msg)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 7, len(DATA)])
+def test_protocol_frames_messages_split_across_chunks(chunk_size):
+    protocol: Protocol = Protocol()
+    messages: typing.List[typing.Tuple[bytes, bytes]] = []
+    for i in range(0, len(DATA), chunk_size):
+        protocol.receive(DATA[i : i + chunk_size])
+        messages.extend(received(protocol))
+
+    assert messages == MESSAGES
+    assert protocol.buffered == 0
+
+
+def test_protocol_bytes_needed_reads_exact_messages():
+    protocol: Protocol = Protocol()
+    data: bytes = DATA
+    messages: typing.List[typing.Tuple[bytes, bytes]] = []
+    reads: typing.List[int] = []
+    while data:
+        needed: int = protocol.bytes_needed()
+        reads.append(needed)
+        protocol.receive(data[:needed])
+        data = data[needed:]
+        messages.extend(received(protocol))
+
+    assert messages == MESSAGES
+    # the header of each message, then its content if it has one
+    assert reads == [5, 5, 9, 5, 9, 5, 1]
+
+
+def test_protocol_bytes_needed_read_ahead_stops_at_ready_for_query():
+    protocol: Protocol = Protocol()
+    data: bytes = DATA
+    reads: typing.List[int] = []
+    while data:
+        needed: int = protocol.bytes_needed(read_ahead=True)
+        reads.append(needed)
+        protocol.receive(data[:needed])
+        data = data[needed:]
+        received(protocol)
+
+    # the content of each message is read with the header of the next, except after ReadyForQuery
+    assert reads == [5, 5, 14, 14, 1]
+
+
+def test_protocol_content_is_not_copied_when_read_exactly():
+    protocol: Protocol = Protocol()
+    body: bytes = b"\x00\x01\x00\x00\x00\x03abc"
+    protocol.receive(b"D" + (len(body) + 4).to_bytes(4, "big"))
+    assert protocol.next_message() is None
+    protocol.receive(body)
+    assert protocol.next_message()[1] is body
+
+
+def test_protocol_outgoing_data():
+    protocol: Protocol = Protocol()
+    protocol.send_message(b"P", b"abc")
+    protocol.write(b"S\x00\x00\x00\x04")
+
+    assert protocol.data_to_send() == message(b"P", b"abc") + message(b"S")
+    assert protocol.data_to_send() == b""
+
+
+def test_protocol_bytes_to_send():
+    protocol: Protocol = Protocol()
+    protocol.write(b"abc")
+    assert protocol.bytes_to_send == 3
+    protocol.data_to_send()
+    assert protocol.bytes_to_send == 0
+
+
+def test_protocol_large_bytes_are_sent_without_copying():
+    protocol: Protocol = Protocol()
+    large: bytes = b"x" * ZERO_COPY_SIZE
+    protocol.send_message(b"B", large)
+    protocol.write(bytearray(b"E\x00\x00\x00\x04"))
+    assert protocol.bytes_to_send == len(large) + 10
+
+    buffers = protocol.buffers_to_send()
+    assert len(buffers) == 3 and buffers[1] is large
+    assert b"".join(buffers) == message(b"B", large) + message(b"E")
+    assert protocol.buffers_to_send() == []
+
+    protocol.send_message(b"B", large)
+    assert protocol.data_to_send() == message(b"B", large)
+    assert protocol.bytes_to_send == 0
+
+
+def test_protocol_messages_can_be_abandoned():
+    protocol: Protocol = Protocol()
+    protocol.receive(DATA[:-3])
+
+    for code, _ in protocol.messages():
+        if code == b"D":
+            break
+    assert list(protocol.messages()) == MESSAGES[2:3]
+    protocol.receive(DATA[-3:])
+    assert protocol.next_message() == MESSAGES[3]
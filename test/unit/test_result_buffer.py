@@ -0,0 +1,52 @@
+import typing
+
+import pytest  # type: ignore
+
+from redshift_connector.utils.result_buffer import ROW_OVERHEAD_BYTES, ResultBuffer
+
+rows: typing.List[bytes] = [bytes([i]) * (i + 1) for i in range(10)]
+
+
+def test_rows_within_budget_stay_in_memory():
+    buffer: ResultBuffer = ResultBuffer(max_memory=10 * (10 + ROW_OVERHEAD_BYTES))
+    for row in rows:
+        buffer.append(row)
+    assert not buffer.spilled
+    assert len(buffer) == 10
+    assert [buffer.popleft() for _ in range(10)] == rows
+    assert len(buffer) == 0
+    with pytest.raises(IndexError):
+        buffer.popleft()
+
+
+def test_rows_beyond_budget_are_spilled_in_order():
+    buffer: ResultBuffer = ResultBuffer(max_memory=3 * (3 + ROW_OVERHEAD_BYTES))
+    for row in rows:
+        buffer.append(row)
+    assert buffer.spilled
+    assert len(buffer) == 10
+    # iteration does not consume rows
+    assert list(buffer) == rows
+    assert buffer.popleft() == rows[0]
+    assert list(buffer) == rows[1:]
+    assert [buffer.popleft() for _ in range(9)] == rows[1:]
+    assert not buffer
+
+    # the temporary file is reused once emptied
+    buffer.append(b"x" * 500)
+    buffer.append(b"y")
+    assert list(buffer) == [b"x" * 500, b"y"]
+    assert buffer.popleft() == b"x" * 500
+    buffer.clear()
+    assert len(buffer) == 0 and not buffer.spilled
+
+
+def test_rows_beyond_budget_without_spill_set_overflowed():
+    buffer: ResultBuffer = ResultBuffer(max_memory=2 * (2 + ROW_OVERHEAD_BYTES), spill=False)
+    for row in rows:
+        buffer.append(row)
+    assert buffer.overflowed
+    assert not buffer.spilled
+    assert list(buffer) == rows[:2]
+    buffer.clear()
+    assert not buffer.overflowed
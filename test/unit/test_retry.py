@@ -0,0 +1,296 @@
+import copy
+import io
+import typing
+from unittest.mock import MagicMock
+
+import pytest  # type: ignore
+
+from redshift_connector import Connection, InterfaceError, ProgrammingError, RetryPolicy
+from redshift_connector.redshift_property import RedshiftProperty
+from redshift_connector.retry import (
+    is_connection_error,
+    is_idempotent_read,
+    is_serialization_failure,
+)
+from redshift_connector.utils import i_pack
+
+SERIALIZATION_FAILURE: ProgrammingError = ProgrammingError({"S": "ERROR", "C": "40001", "M": "serializable isolation"})
+
+
+@pytest.fixture(autouse=True)
+def sleep(mocker):
+    return mocker.patch("redshift_connector.retry.time.sleep")
+
+
+@pytest.mark.parametrize(
+    "operation, expected",
+    [
+        ("select * from book", True),
+        ("  SELECT 1", True),
+        ("with t as (select 1) select * from t", True),
+        ("show search_path", True),
+        ("select * into new_book from book", False),
+        ("with t as (delete from book returning *) select * from t", False),
+        ("insert into book values (1)", False),
+        ("update book set title = 'x'", False),
+        ("selection", False),
+        (None, False),
+    ],
+)
+def test_is_idempotent_read(operation, expected):
+    assert is_idempotent_read(operation) is expected
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (BrokenPipeError(), True),
+        (InterfaceError("communication error", OSError()), True),
+        (InterfaceError("connection is broken: the server closed the connection"), True),
+        (InterfaceError("connection is closed"), False),
+        (SERIALIZATION_FAILURE, False),
+    ],
+)
+def test_is_connection_error(error, expected):
+    assert is_connection_error(error) is expected
+
+
+def test_is_serialization_failure():
+    assert is_serialization_failure(SERIALIZATION_FAILURE) is True
+    assert is_serialization_failure(ProgrammingError({"C": "42P01"})) is False
+    assert is_serialization_failure(InterfaceError("communication error")) is False
+
+
+def failing(*errors: Exception) -> MagicMock:
+    # fails with each of errors in turn, then returns "done"
+    return MagicMock(side_effect=list(errors) + ["done"])
+
+
+def test_run_reconnects_after_connection_error(sleep):
+    policy: RetryPolicy = RetryPolicy(initial_backoff=1)
+    conn: MagicMock = MagicMock()
+    operation: MagicMock = failing(BrokenPipeError())
+
+    assert policy.run(conn, operation) == "done"
+    conn._reconnect.assert_called_once()
+    conn.rollback.assert_not_called()
+    assert 0 <= sleep.call_args[0][0] <= 1
+    assert policy.counters == {
+        "attempts": 2,
+        "retries": 1,
+        "reconnects": 1,
+        "serialization_failures": 0,
+        "exhausted": 0,
+        "gave_up": 0,
+    }
+
+
+def test_run_retries_when_reconnecting_fails(sleep):
+    policy: RetryPolicy = RetryPolicy(max_attempts=5)
+    conn: MagicMock = MagicMock()
+    conn._reconnect.side_effect = [InterfaceError("communication error", OSError()), None]
+    operation: MagicMock = failing(BrokenPipeError())
+
+    assert policy.run(conn, operation) == "done"
+    assert conn._reconnect.call_count == 2
+    assert operation.call_count == 2
+    assert sleep.call_count == 2
+    assert policy.counters == {
+        "attempts": 3,
+        "retries": 2,
+        "reconnects": 1,
+        "serialization_failures": 0,
+        "exhausted": 0,
+        "gave_up": 0,
+    }
+
+
+def test_run_gives_up_when_reconnecting_keeps_failing():
+    policy: RetryPolicy = RetryPolicy(max_attempts=3)
+    conn: MagicMock = MagicMock()
+    conn._reconnect.side_effect = InterfaceError("communication error", OSError())
+
+    with pytest.raises(InterfaceError, match="communication error"):
+        policy.run(conn, failing(BrokenPipeError()))
+    assert conn._reconnect.call_count == 2
+    assert (policy.attempts, policy.retries, policy.gave_up) == (3, 2, 1)
+
+
+def test_run_rolls_back_after_serialization_failure():
+    policy: RetryPolicy = RetryPolicy()
+    conn: MagicMock = MagicMock(in_transaction=True)
+
+    assert policy.run(conn, failing(SERIALIZATION_FAILURE)) == "done"
+    conn.rollback.assert_called_once()
+    conn._reconnect.assert_not_called()
+    assert policy.serialization_failures == 1
+
+
+def test_run_raises_other_errors_without_retrying():
+    policy: RetryPolicy = RetryPolicy()
+    operation: MagicMock = failing(ProgrammingError({"C": "42P01"}))
+
+    with pytest.raises(ProgrammingError):
+        policy.run(MagicMock(), operation)
+    assert operation.call_count == 1
+    assert policy.retries == 0
+
+
+def test_run_gives_up_after_max_attempts():
+    policy: RetryPolicy = RetryPolicy(max_attempts=3)
+    operation: MagicMock = failing(*(BrokenPipeError() for _ in range(3)))
+
+    with pytest.raises(BrokenPipeError):
+        policy.run(MagicMock(), operation)
+    assert operation.call_count == 3
+    assert (policy.retries, policy.gave_up) == (2, 1)
+
+
+def test_run_stops_retrying_when_budget_is_spent():
+    policy: RetryPolicy = RetryPolicy(max_attempts=10, budget=2, budget_ratio=0.5)
+    conn: MagicMock = MagicMock()
+
+    with pytest.raises(BrokenPipeError):
+        policy.run(conn, failing(*(BrokenPipeError() for _ in range(3))))
+    assert (policy.retries, policy.exhausted) == (2, 1)
+
+    # successful operations earn retries back
+    policy.run(conn, lambda: None)
+    policy.run(conn, lambda: None)
+    assert policy.run(conn, failing(BrokenPipeError())) == "done"
+    assert policy.retries == 3
+
+
+def test_backoff_grows_up_to_max_backoff(mocker):
+    mocker.patch("redshift_connector.retry.random.uniform", side_effect=lambda low, high: high)
+    policy: RetryPolicy = RetryPolicy(initial_backoff=0.1, max_backoff=0.5, multiplier=2)
+    assert [policy.backoff(retry) for retry in range(1, 5)] == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+
+def test_policy_is_shared_by_copies_of_properties():
+    policy: RetryPolicy = RetryPolicy()
+    info: RedshiftProperty = RedshiftProperty()
+    info.put("retry_policy", policy)
+    assert copy.deepcopy(info).retry_policy is policy
+
+
+def ready_server_stream() -> io.BufferedRWPair:
+    # AuthenticationOk, BackendKeyData and a ReadyForQuery for the start-up and each Sync
+    response: bytes = b"R" + i_pack(8) + i_pack(0) + b"K" + i_pack(12) + i_pack(1) + i_pack(2)
+    response += (b"Z" + i_pack(5) + b"I") * 3
+    return io.BufferedRWPair(io.BytesIO(response), io.BytesIO())  # type: ignore
+
+
+@pytest.fixture
+def server_socket(mocker):
+    usock = mocker.patch("socket.socket").return_value
+    usock.makefile.side_effect = lambda mode: ready_server_stream()
+    return usock
+
+
+def make_connection(policy: typing.Optional[RetryPolicy]) -> Connection:
+    conn: Connection = Connection(user="awsuser", password="secret", database="dev", ssl=False, retry_policy=policy)
+    conn.autocommit = True
+    return conn
+
+
+def test_cursor_retries_read_on_new_connection(server_socket, mocker):
+    policy: RetryPolicy = RetryPolicy()
+    conn: Connection = make_connection(policy)
+    first_sock = conn._sock
+    execute = mocker.patch.object(Connection, "execute", side_effect=[BrokenPipeError(), None])
+
+    conn.cursor().execute("select * from book")
+    assert execute.call_count == 2
+    assert server_socket.connect.call_count == 2
+    assert conn._sock is not first_sock
+    assert policy.reconnects == 1
+
+
+def test_cursor_retries_read_after_reconnecting_fails(server_socket, mocker):
+    conn: Connection = make_connection(RetryPolicy(max_attempts=5))
+    # the first reconnect fails, and the connection connects again when it is next used
+    server_socket.connect.side_effect = [OSError("unreachable"), None]
+    executions: typing.List[str] = []
+
+    def execute(cursor, operation, vals) -> None:
+        executions.append(operation)
+        if len(executions) == 1:
+            raise BrokenPipeError()
+        conn.ping()
+
+    mocker.patch.object(Connection, "execute", side_effect=execute)
+
+    conn.cursor().execute("select * from book")
+    assert len(executions) == 2
+    # the first connection and the two reconnects
+    assert server_socket.connect.call_count == 3
+    assert conn._lazy_open is None
+
+
+@pytest.mark.parametrize("operation", ["insert into book values (1)", "select * into new_book from book"])
+def test_cursor_does_not_retry_writes(server_socket, mocker, operation):
+    conn: Connection = make_connection(RetryPolicy())
+    mocker.patch.object(Connection, "execute", side_effect=[BrokenPipeError(), None])
+
+    with pytest.raises(BrokenPipeError):
+        conn.cursor().execute(operation)
+    assert server_socket.connect.call_count == 1
+
+
+def test_cursor_does_not_retry_reads_in_transaction(server_socket, mocker):
+    conn: Connection = make_connection(RetryPolicy())
+    conn.in_transaction = True
+    mocker.patch.object(Connection, "execute", side_effect=[BrokenPipeError(), None])
+
+    with pytest.raises(BrokenPipeError):
+        conn.cursor().execute("select * from book")
+
+
+def test_run_in_transaction_retries_transaction(server_socket, mocker):
+    conn: Connection = make_connection(RetryPolicy())
+    statements: typing.List[str] = []
+
+    def execute(cursor, operation, vals) -> None:
+        statements.append(operation)
+        conn.in_transaction = operation not in ("commit", "rollback")
+        if operation == "update book set title = 'x'" and statements.count(operation) == 1:
+            raise SERIALIZATION_FAILURE
+
+    mocker.patch.object(Connection, "execute", side_effect=execute)
+
+    assert conn.run_in_transaction(lambda c: c.cursor().execute("update book set title = 'x'") and "done") == "done"
+    assert statements == [
+        "begin transaction",
+        "update book set title = 'x'",
+        "rollback",
+        "begin transaction",
+        "update book set title = 'x'",
+        "commit",
+    ]
+
+
+def test_run_in_transaction_rolls_back_on_error(server_socket, mocker):
+    conn: Connection = make_connection(None)
+    statements: typing.List[str] = []
+
+    def execute(cursor, operation, vals) -> None:
+        statements.append(operation)
+        conn.in_transaction = operation not in ("commit", "rollback")
+
+    mocker.patch.object(Connection, "execute", side_effect=execute)
+
+    def transaction(c: Connection) -> None:
+        c.cursor().execute("delete from book")
+        raise ValueError("invalid")
+
+    with pytest.raises(ValueError):
+        conn.run_in_transaction(transaction)
+    assert statements == ["begin transaction", "delete from book", "rollback"]
+
+
+def test_run_in_transaction_rejects_open_transaction(server_socket):
+    conn: Connection = make_connection(None)
+    conn.in_transaction = True
+    with pytest.raises(InterfaceError, match="run_in_transaction"):
+        conn.run_in_transaction(lambda c: None)
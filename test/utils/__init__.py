@@ -1 +1 @@
-from .decorators import numpy_only, pandas_only
+from .decorators import numpy_only, pandas_only, pyarrow_only
@@ -22,3 +22,15 @@ def is_pandas_installed() -> bool:
 numpy_only = pytest.mark.skipif(not is_numpy_installed(), reason="requires numpy")
 
 pandas_only = pytest.mark.skipif(not is_pandas_installed(), reason="requires pandas")
+
+
+def is_pyarrow_installed() -> bool:
+    try:
+        import pyarrow  # type: ignore
+
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
+pyarrow_only = pytest.mark.skipif(not is_pyarrow_installed(), reason="requires pyarrow")